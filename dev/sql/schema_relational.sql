@@ -1,7 +1,7 @@
 
 -- schema_relational.sql for initial database setup OpenSlides
 -- Code generated. DO NOT EDIT.
--- MODELS_YML_CHECKSUM = '472dd223307f11a19a864edd93b78230'
+-- MODELS_YML_CHECKSUM = '6911d54cc35b0a3e91d2b342ce3b903a'
 
 
 -- ENUM definitions
@@ -116,15 +116,129 @@ END;
 $sequences_trigger$
 LANGUAGE plpgsql;
 
+-- Marks the transaction deleting a meeting, see delete_meeting().
+CREATE UNLOGGED TABLE os_deleting_meeting_t (
+    xact_id xid8 PRIMARY KEY,
+    meeting_id integer NOT NULL
+);
+
+CREATE FUNCTION os_deleting_meeting() RETURNS boolean AS $os_deleting_meeting$
+-- True while delete_meeting is running in the current transaction. Used by the WHEN
+-- conditions of the triggers skipped for the deleted rows.
+    SELECT EXISTS (SELECT 1 FROM os_deleting_meeting_t WHERE xact_id = pg_current_xact_id_if_assigned());
+$os_deleting_meeting$ LANGUAGE sql STABLE;
+
+-- Range partitioned by day, see maintain_notify_log_partitions().
+-- All entries of a transaction share its now() as timestamp, so adding it
+-- to the unique constraint keeps one entry per operation, fqid and transaction.
 CREATE TABLE os_notify_log_t (
-    id integer PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    id integer GENERATED ALWAYS AS IDENTITY,
     operation varchar(32),
     fqid varchar(256) NOT NULL,
     updated_fields varchar(63)[],
     xact_id xid8,
-    timestamp timestamptz,
-    CONSTRAINT unique_fqid_xact_id_operation UNIQUE (operation,fqid,xact_id)
-);
+    timestamp timestamptz NOT NULL,
+    PRIMARY KEY (id, timestamp),
+    CONSTRAINT unique_fqid_xact_id_operation UNIQUE (operation,fqid,xact_id,timestamp)
+) PARTITION BY RANGE (timestamp);
+
+CREATE TABLE os_notify_log_t_pdefault PARTITION OF os_notify_log_t DEFAULT;
+
+CREATE INDEX os_notify_log_t_timestamp_brin ON os_notify_log_t USING brin (timestamp);
+
+CREATE FUNCTION maintain_notify_log_partitions(
+    retention interval DEFAULT '7 days',
+    premake integer DEFAULT 3,
+    lock_wait interval DEFAULT '1s'
+) RETURNS void
+-- the days of the partitions are UTC days, independent of the TimeZone of the session
+SET TimeZone = 'UTC'
+AS $maintain_notify_log_partitions$
+-- Creates the daily partitions of os_notify_log_t up to premake days ahead and
+-- detaches and drops the partitions ending before now() - retention. Meant to be
+-- called periodically, e.g. daily by a cron job of the backend.
+-- Rows written to the default partition, because the maintenance was not run
+-- in time, are moved into the newly created partitions. Until then the retention
+-- of these rows falls back to a DELETE row by row.
+-- Detaching takes an ACCESS EXCLUSIVE lock on os_notify_log_t, which blocks all
+-- writing transactions until the commit. DETACH PARTITION CONCURRENTLY isn't
+-- possible with a default partition nor within a function. To not queue writers
+-- behind a waiting lock, a partition is skipped, if the lock isn't granted within
+-- lock_wait, and detached by the next call.
+DECLARE
+    day date;
+    partition_name TEXT;
+    part RECORD;
+    old_lock_timeout TEXT := current_setting('lock_timeout');
+BEGIN
+    FOR day IN
+        SELECT d::date FROM generate_series(
+            date_trunc('day', now()), date_trunc('day', now()) + premake * interval '1 day', interval '1 day'
+        ) AS d
+    LOOP
+        partition_name := 'os_notify_log_t_p' || to_char(day, 'YYYYMMDD');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+        EXECUTE format('CREATE TABLE %I (LIKE os_notify_log_t INCLUDING DEFAULTS)', partition_name);
+        EXECUTE format(
+            'WITH moved AS (
+                DELETE FROM os_notify_log_t_pdefault WHERE timestamp >= %1$L AND timestamp < %2$L RETURNING *
+            ) INSERT INTO %3$I SELECT * FROM moved',
+            day, day + 1, partition_name
+        );
+        EXECUTE format(
+            'ALTER TABLE os_notify_log_t ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, day, day + 1
+        );
+    END LOOP;
+
+    FOR part IN
+        SELECT c.relname
+        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'os_notify_log_t'::regclass
+            AND c.relname ~ '^os_notify_log_t_p[0-9]{8}$'
+            AND to_date(substring(c.relname from '[0-9]{8}$'), 'YYYYMMDD') + 1 <= now() - retention
+    LOOP
+        BEGIN
+            PERFORM set_config('lock_timeout', (extract(epoch FROM lock_wait) * 1000)::integer::text, true);
+            EXECUTE format('ALTER TABLE os_notify_log_t DETACH PARTITION %I', part.relname);
+            -- the detached table isn't part of os_notify_log_t anymore
+            EXECUTE format('DROP TABLE %I', part.relname);
+        EXCEPTION WHEN lock_not_available THEN
+            RAISE NOTICE 'maintain_notify_log_partitions: % not detached, os_notify_log_t is locked', part.relname;
+        END;
+    END LOOP;
+    PERFORM set_config('lock_timeout', old_lock_timeout, true);
+    DELETE FROM os_notify_log_t_pdefault WHERE timestamp < now() - retention;
+END;
+$maintain_notify_log_partitions$ LANGUAGE plpgsql;
+
+DO $$ BEGIN PERFORM maintain_notify_log_partitions(); END $$;
+
+CREATE INDEX os_notify_log_t_xact_id_idx ON os_notify_log_t (xact_id);
+
+CREATE FUNCTION os_changes_since(last_xact_id xid8, max_transactions integer DEFAULT 100)
+RETURNS TABLE (xact_id xid8, xact_timestamp timestamptz, changes jsonb) AS $os_changes_since$
+-- Returns the logged changes of up to max_transactions transactions following last_xact_id,
+-- one row per transaction in ascending xact_id order. Pass NULL to start with the oldest entry
+-- and the xact_id of the last returned row to fetch the next batch.
+-- The log id is no safe position: ids are drawn at insert time, so a transaction still running
+-- can commit entries with lower ids than already returned ones. Only transactions older than the
+-- xmin of the current snapshot are returned, all of them are finished and no transaction
+-- committing later can get a lower xact_id. A consumer passing the last returned xact_id never
+-- misses nor repeats a transaction.
+    SELECT l.xact_id, min(l.timestamp),
+        jsonb_agg(jsonb_build_object('operation', l.operation, 'fqid', l.fqid, 'fields', l.updated_fields) ORDER BY l.id)
+    FROM os_notify_log_t l
+    WHERE l.xact_id IN (
+        SELECT DISTINCT t.xact_id FROM os_notify_log_t t
+        WHERE (last_xact_id IS NULL OR t.xact_id > last_xact_id)
+            AND t.xact_id < pg_snapshot_xmin(pg_current_snapshot())
+        ORDER BY t.xact_id
+        LIMIT max_transactions
+    )
+    GROUP BY l.xact_id
+    ORDER BY l.xact_id;
+$os_changes_since$ LANGUAGE sql STABLE;
 
 CREATE TABLE version (
     migration_index INTEGER PRIMARY KEY,
@@ -134,125 +248,200 @@ CREATE TABLE version (
 
 -- Log functions
 
-CREATE OR REPLACE PROCEDURE log_field_change(
-    operation_var TEXT,
-    fqid_var TEXT,
-    fields TEXT[]
-) AS
-$log_field_change$
-BEGIN
-    INSERT INTO os_notify_log_t (operation, fqid, xact_id, timestamp, updated_fields)
-    VALUES (operation_var, fqid_var, pg_current_xact_id(), now(), fields)
-    ON CONFLICT (operation, fqid, xact_id) DO UPDATE SET updated_fields = (
-        SELECT ARRAY(
-            SELECT DISTINCT e
-            FROM unnest(COALESCE(os_notify_log_t.updated_fields, '{}'::varchar[])) AS e
-            UNION
-            SELECT DISTINCT e
-            FROM unnest(COALESCE(EXCLUDED.updated_fields, '{}'::varchar[])) AS e
-        )
-    );
-END;
-$log_field_change$ LANGUAGE plpgsql;
-
 CREATE FUNCTION log_modified_models() RETURNS trigger AS $log_modified_trigger$
+-- Statement level trigger reading the transition tables old_table and new_table.
+-- All log entries of the statement are written by one INSERT into os_notify_log_t.
+-- Parameters:
+-- 0. collection of the triggered table, empty for intermediate tables
+-- followed by groups of 4 parameters for every relation logged on the related models:
+-- 1. foreign collection
+-- 2. column of the triggered table referencing the foreign collection
+-- 3. field of the foreign collection to be logged
+-- 4. column of the triggered table holding the value of this field
 DECLARE
-    escaped_table_name varchar;
-    operation_var TEXT;
-    fqid_var TEXT;
-    updated_fields_var varchar(63)[];
-    old_hstore hstore;
-    new_hstore hstore;
+    collection TEXT := TG_ARGV[0];
+    fk_column TEXT;
+    value_column TEXT;
+    old_pairs TEXT;
+    new_pairs TEXT;
+    pairs TEXT;
+    entries TEXT[] := '{}';
+    i INTEGER := 1;
 BEGIN
-    escaped_table_name := TG_ARGV[0];
-    operation_var := LOWER(TG_OP);
-
-    -- Determine fqid (use OLD for deletes)
-    fqid_var := escaped_table_name || '/' || NEW.id;
-    IF (TG_OP = 'DELETE') THEN
-        fqid_var := escaped_table_name || '/' || OLD.id;
+    IF collection <> '' THEN
+        IF (TG_OP = 'UPDATE') THEN
+            entries := entries || format(
+                'SELECT ''update'' AS operation, %L || ''/'' || n.id AS fqid,
+                    akeys((hstore(n) - hstore(o)) || (hstore(o) - hstore(n)))::varchar(63)[] AS fields
+                FROM new_table n JOIN old_table o ON o.id = n.id',
+                collection
+            );
+        ELSE
+            entries := entries || format(
+                'SELECT %L AS operation, %L || ''/'' || id AS fqid, NULL::varchar(63)[] AS fields FROM %I',
+                LOWER(TG_OP),
+                collection,
+                CASE TG_OP WHEN 'INSERT' THEN 'new_table' ELSE 'old_table' END
+            );
+        END IF;
     END IF;
 
-    updated_fields_var := NULL;
-    IF (TG_OP = 'UPDATE') THEN
-        old_hstore := hstore(OLD);
-        new_hstore := hstore(NEW);
-        updated_fields_var := akeys((new_hstore - old_hstore) || (old_hstore - new_hstore));
-    END IF;
+    WHILE i < TG_NARGS LOOP
+        fk_column := TG_ARGV[i+1];
+        value_column := TG_ARGV[i+3];
+        old_pairs := format('SELECT %I AS foreign_id, %I AS value FROM old_table', fk_column, value_column);
+        new_pairs := format('SELECT %I AS foreign_id, %I AS value FROM new_table', fk_column, value_column);
+        IF (TG_OP = 'INSERT') THEN
+            pairs := new_pairs;
+        ELSIF (TG_OP = 'DELETE') THEN
+            pairs := old_pairs;
+        ELSE
+            -- only references missing in one of the transition tables changed
+            pairs := format('(%1$s EXCEPT %2$s) UNION ALL (%2$s EXCEPT %1$s)', old_pairs, new_pairs);
+        END IF;
+        entries := entries || format(
+            'SELECT ''update'' AS operation, %L || ''/'' || foreign_id AS fqid, ARRAY[%L]::varchar(63)[] AS fields
+            FROM (%s) AS pairs WHERE foreign_id IS NOT NULL',
+            TG_ARGV[i],
+            TG_ARGV[i+2],
+            pairs
+        );
+        i := i + 4;
+    END LOOP;
 
-    CALL log_field_change(operation_var, fqid_var, updated_fields_var);
+    -- The transition tables are only visible to statements executed by the trigger function itself.
+    EXECUTE log_field_changes_statement(array_to_string(entries, ' UNION ALL '));
 
     RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
 END;
 $log_modified_trigger$ LANGUAGE plpgsql;
 
+CREATE FUNCTION os_first_call_in_transaction(flag TEXT) RETURNS boolean AS $first_call$
+-- Returns true only for the first call with this flag in the current transaction.
+BEGIN
+    IF current_setting(flag, true) = 'on' THEN
+        RETURN FALSE;
+    END IF;
+    PERFORM set_config(flag, 'on', true);
+    RETURN TRUE;
+END;
+$first_call$ LANGUAGE plpgsql;
+
 CREATE FUNCTION notify_transaction_end() RETURNS trigger AS $notify_trigger$
+-- Queued only once per transaction by the WHEN condition of the notify_transaction_end trigger.
+-- The transaction id and the changes logged so far are send via os_notify:
+-- {"xactId":1,"changes":[{"fqid":"speaker/1","fields":null,"operation":"insert"}]}
+-- Changes exceeding one payload are split into chunks, which additionally carry "chunk" and "chunks".
+-- If more than max_chunks are needed, only {"xactId":1} is send and the changes must be read
+-- from os_notify_log_t.
 DECLARE
-    payload TEXT;
-    body_content_text TEXT;
+    max_payload CONSTANT INTEGER := 7900;  -- pg_notify payloads must be shorter than 8000 bytes
+    max_chunks CONSTANT INTEGER := 8;
+    header TEXT := '{"xactId":' || pg_current_xact_id();
+    change TEXT;
+    chunk TEXT := '';
+    chunks TEXT[] := '{}';
+    i INTEGER;
 BEGIN
-    -- Running the trigger for the first time in a transaction creates the table and after committing the transaction the table is dropped.
-    -- Every next run of the trigger in this transaction raises a notice that the table exists. Setting the log_min_messages to notice increases the noise because of such messages.
-    CREATE LOCAL TEMPORARY TABLE
-    IF NOT EXISTS tbl_notify_counter_tx_once (
-        "id" integer NOT NULL PRIMARY KEY GENERATED ALWAYS AS IDENTITY
-    ) ON COMMIT DROP;
+    -- Changes made after this call, e.g. after SET CONSTRAINTS ALL IMMEDIATE, queue another notify.
+    PERFORM set_config('os.notify_queued', 'off', true);
+    FOR change IN
+        SELECT jsonb_build_object('operation', operation, 'fqid', fqid, 'fields', updated_fields)::text
+        FROM os_notify_log_t
+        WHERE xact_id = pg_current_xact_id() AND timestamp = now()
+        ORDER BY id
+    LOOP
+        -- 64 bytes reserved for header and chunk numbers
+        IF chunk <> '' AND octet_length(chunk) + octet_length(change) + 64 > max_payload THEN
+            chunks := chunks || chunk;
+            chunk := '';
+        END IF;
+        IF octet_length(change) + 64 > max_payload OR cardinality(chunks) >= max_chunks THEN
+            chunks := NULL;
+            EXIT;
+        END IF;
+        chunk := chunk || CASE WHEN chunk = '' THEN '' ELSE ',' END || change;
+    END LOOP;
 
-    -- If running for the first time, the transaction id is send via os_notify.
-    IF NOT EXISTS (SELECT * FROM tbl_notify_counter_tx_once) THEN
-        INSERT INTO tbl_notify_counter_tx_once DEFAULT VALUES;
-        payload := '{"xactId":' ||
-            pg_current_xact_id() ||
-            '}';
-        PERFORM pg_notify('os_notify', payload);
+    IF chunks IS NULL THEN
+        PERFORM pg_notify('os_notify', header || '}');
+    ELSIF cardinality(chunks) = 0 THEN
+        PERFORM pg_notify('os_notify', header || ',"changes":[' || chunk || ']}');
+    ELSE
+        chunks := chunks || chunk;
+        FOR i IN 1..cardinality(chunks) LOOP
+            PERFORM pg_notify(
+                'os_notify',
+                header || ',"chunk":' || i || ',"chunks":' || cardinality(chunks)
+                || ',"changes":[' || chunks[i] || ']}'
+            );
+        END LOOP;
     END IF;
 
     RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
 END;
 $notify_trigger$ LANGUAGE plpgsql;
 
-CREATE OR REPLACE FUNCTION log_modified_related_models()
-RETURNS trigger AS $log_modified_related_trigger$
-DECLARE
-    fqid_var TEXT;
-    ref_column TEXT;
-    fk_field TEXT;
-    foreign_table TEXT;
-    foreign_id TEXT;
-    i INTEGER := 0;
-BEGIN
-
-    WHILE i < TG_NARGS LOOP
-        foreign_table := TG_ARGV[i];
-        ref_column := TG_ARGV[i+1];
-        fk_field := TG_ARGV[i+2];
-
-        IF (TG_OP = 'DELETE') THEN
-            EXECUTE format('SELECT ($1).%I', ref_column) INTO foreign_id USING OLD;
-        ELSE
-            EXECUTE format('SELECT ($1).%I', ref_column) INTO foreign_id USING NEW;
-        END IF;
-
-        IF foreign_id IS NOT NULL THEN
-            fqid_var := foreign_table || '/' || foreign_id;
-            CALL log_field_change('update', fqid_var, ARRAY[fk_field]);
-        END IF;
+-- Fired by the log entries themselves, so the changes of all statements are logged when
+-- the deferred trigger runs, also with staged log entries flushed at commit.
+CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE ON os_notify_log_t
+DEFERRABLE INITIALLY DEFERRED FOR EACH ROW
+WHEN (os_first_call_in_transaction('os.notify_queued'))
+EXECUTE FUNCTION notify_transaction_end();
 
-        --when update there must be a notification for the old foreign_fqid
-        IF (TG_OP = 'UPDATE') THEN
-            EXECUTE format('SELECT ($1).%I', ref_column) INTO foreign_id USING OLD;
-            IF foreign_id IS NOT NULL THEN
-                fqid_var := foreign_table || '/' || foreign_id;
-                CALL log_field_change('update', fqid_var, ARRAY[fk_field]);
-            END IF;
-        END IF;
+-- Log write procedures
 
-        i := i + 3;
-    END LOOP;
+CREATE OR REPLACE PROCEDURE log_field_change(
+    operation_var TEXT,
+    fqid_var TEXT,
+    fields TEXT[]
+) AS
+$log_field_change$
+BEGIN
+    INSERT INTO os_notify_log_t (operation, fqid, xact_id, timestamp, updated_fields)
+    VALUES (operation_var, fqid_var, pg_current_xact_id(), now(), fields)
+    ON CONFLICT (operation, fqid, xact_id, timestamp) DO UPDATE SET updated_fields = (
+        SELECT ARRAY(
+            SELECT DISTINCT e
+            FROM unnest(COALESCE(os_notify_log_t.updated_fields, '{}'::varchar[])) AS e
+            UNION
+            SELECT DISTINCT e
+            FROM unnest(COALESCE(EXCLUDED.updated_fields, '{}'::varchar[])) AS e
+        )
+    );
+END;
+$log_field_change$ LANGUAGE plpgsql;
 
-    RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+CREATE OR REPLACE FUNCTION log_field_changes_statement(
+    entries_query TEXT
+) RETURNS TEXT AS
+$log_field_changes_statement$
+-- Returns the statement writing the entries of entries_query. The query returns the columns
+-- operation, fqid and fields, where fields is NULL for inserts and deletes.
+-- Entries are merged per operation and fqid before the upsert.
+BEGIN
+    RETURN format(
+        'INSERT INTO os_notify_log_t (operation, fqid, xact_id, timestamp, updated_fields)
+        SELECT operation, fqid, pg_current_xact_id(), now(),
+            CASE WHEN bool_or(fields IS NOT NULL) THEN
+                COALESCE(array_agg(DISTINCT field) FILTER (WHERE field IS NOT NULL), ''{}'')
+            END
+        FROM (%s) AS entries LEFT JOIN LATERAL unnest(fields) AS field ON TRUE
+        GROUP BY operation, fqid
+        ON CONFLICT (operation, fqid, xact_id, timestamp) DO UPDATE SET updated_fields = (
+            SELECT ARRAY(
+                SELECT DISTINCT e
+                FROM unnest(COALESCE(os_notify_log_t.updated_fields, ''{}''::varchar[])) AS e
+                UNION
+                SELECT DISTINCT e
+                FROM unnest(COALESCE(EXCLUDED.updated_fields, ''{}''::varchar[])) AS e
+            )
+        )',
+        entries_query
+    );
 END;
-$log_modified_related_trigger$ LANGUAGE plpgsql;
+$log_field_changes_statement$ LANGUAGE plpgsql;
+
 
 CREATE OR REPLACE FUNCTION log_iu_modified_calculated_id_array_field()
 RETURNS trigger AS $log_modified_calculated_id_array_field_trigger$
@@ -374,18 +563,22 @@ $log_modified_calculated_id_array_field_trigger$ LANGUAGE plpgsql;
 
 -- Validation triggers
 
-CREATE OR REPLACE FUNCTION is_timezone( tz TEXT ) RETURNS BOOLEAN as $$
-DECLARE
-    is_valid BOOLEAN;
+CREATE PROCEDURE create_is_timezone_function() AS $create_is_timezone_function$
+-- Creates is_timezone(tz) with the names of pg_timezone_names as array literal, so the
+-- check constraints don't read the time zone database for every row.
+-- Call it again after an update of the time zone database of the server.
 BEGIN
-    IF tz IS NULL THEN
-        RETURN TRUE;
-    END IF;
-
-    SELECT EXISTS (SELECT 1 FROM pg_timezone_names WHERE name=tz) INTO is_valid;
-    RETURN is_valid;
+    EXECUTE format(
+        'CREATE OR REPLACE FUNCTION is_timezone( tz TEXT ) RETURNS BOOLEAN AS %1$L LANGUAGE sql IMMUTABLE',
+        format(
+            'SELECT tz IS NULL OR tz = ANY (%L::text[])',
+            (SELECT array_agg(name ORDER BY name) FROM pg_timezone_names)
+        )
+    );
 END;
-$$ language plpgsql STABLE;
+$create_is_timezone_function$ LANGUAGE plpgsql;
+
+CALL create_is_timezone_function();
 
 CREATE FUNCTION check_unique_ids_pair()
 RETURNS trigger
@@ -707,6 +900,24 @@ END;
 $check_equals_meeting_id_for_meeting$ LANGUAGE plpgsql;
 
 
+-- Storage
+
+CREATE PROCEDURE set_column_compression(table_name regclass, column_name TEXT, compression_method TEXT)
+AS $set_column_compression$
+-- Sets the compression method of a column, see storage in the collection yml.
+-- Keeps the default compression, if the server is built without the method, e.g. lz4.
+BEGIN
+    IF compression_method <> 'default' AND compression_method <> ALL (
+        SELECT unnest(enumvals) FROM pg_settings WHERE name = 'default_toast_compression'
+    ) THEN
+        RAISE NOTICE 'Compression method % is not supported by the server, %.% keeps the default compression',
+            compression_method, table_name, column_name;
+        RETURN;
+    END IF;
+    EXECUTE format('ALTER TABLE %s ALTER COLUMN %I SET COMPRESSION %s', table_name, column_name, compression_method);
+END;
+$set_column_compression$ LANGUAGE plpgsql;
+
 CREATE FUNCTION check_not_null_for_1_1() RETURNS trigger AS $not_null_trigger$
 -- Parameters required for all operation types
 --   0. own_collection – name of the view on which the trigger is defined
@@ -1128,7 +1339,7 @@ CREATE TABLE list_of_speakers_t (
     CONSTRAINT valid_list_of_speakers_content_object_id_part1 CHECK (split_part(content_object_id, '/', 1) IN ('motion','motion_block','assignment','topic','meeting_mediafile')),
     meeting_id integer
         CONSTRAINT required_list_of_speakers_meeting_id NOT NULL
-);
+) WITH (fillfactor = 80, autovacuum_vacuum_scale_factor = 0.05, autovacuum_analyze_scale_factor = 0.02);
 
 
 
@@ -1529,6 +1740,8 @@ This email was generated automatically.',
 
 
 
+CALL set_column_compression('meeting_t', 'welcome_text', 'lz4');
+
 comment on column meeting_t.is_active_in_organization_id is 'Backrelation and boolean flag at once';
 comment on column meeting_t.is_archived_in_organization_id is 'Backrelation and boolean flag at once';
 comment on column meeting_t.list_of_speakers_default_structure_level_time is '0 disables structure level countdowns.';
@@ -1617,6 +1830,8 @@ CREATE TABLE motion_t (
 
 
 
+CALL set_column_compression('motion_t', 'text', 'lz4');
+
 comment on column motion_t.number_value is 'The number value of this motion. This number is auto-generated and read-only.';
 comment on column motion_t.sequential_number is 'The (positive) serial number of this model in its meeting. This number is auto-generated and read-only.';
 comment on column motion_t.marked_forwarded is 'Forwarded amendments can be marked as such. This is just optional, however. Forwarded amendments can also have this field set to false.';
@@ -2029,7 +2244,7 @@ CREATE TABLE poll_t (
         CONSTRAINT unique_poll_global_option_id UNIQUE,
     meeting_id integer
         CONSTRAINT required_poll_meeting_id NOT NULL
-);
+) WITH (fillfactor = 80, autovacuum_vacuum_scale_factor = 0.05, autovacuum_analyze_scale_factor = 0.02);
 
 
 
@@ -2188,7 +2403,7 @@ CREATE TABLE projector_t (
     used_as_default_projector_for_poll_in_meeting_id integer,
     meeting_id integer
         CONSTRAINT required_projector_meeting_id NOT NULL
-);
+) WITH (fillfactor = 70, autovacuum_vacuum_scale_factor = 0.05, autovacuum_analyze_scale_factor = 0.02);
 
 
 
@@ -2245,7 +2460,7 @@ CREATE TABLE speaker_t (
     point_of_order_category_id integer,
     meeting_id integer
         CONSTRAINT required_speaker_meeting_id NOT NULL
-);
+) WITH (fillfactor = 80, autovacuum_vacuum_scale_factor = 0.05, autovacuum_analyze_scale_factor = 0.02);
 
 
 
@@ -2510,7 +2725,7 @@ CREATE TABLE nm_chat_group_read_group_ids_group_t (
     CONSTRAINT pk_nm_chat_group_read_group_ids_group_t PRIMARY KEY (chat_group_id, group_id)
 );
 CREATE INDEX idx_nm_chat_group_read_group_ids_group_t_chat_group_id ON nm_chat_group_read_group_ids_group_t (chat_group_id);
-CREATE INDEX idx_nm_chat_group_read_group_ids_group_t_group_id ON nm_chat_group_read_group_ids_group_t (group_id);
+CREATE INDEX idx_nm_chat_group_read_group_ids_group_t_group_id ON nm_chat_group_read_group_ids_group_t (group_id, chat_group_id);
 
 CREATE TABLE nm_chat_group_write_group_ids_group_t (
     chat_group_id integer
@@ -2526,7 +2741,7 @@ CREATE TABLE nm_chat_group_write_group_ids_group_t (
     CONSTRAINT pk_nm_chat_group_write_group_ids_group_t PRIMARY KEY (chat_group_id, group_id)
 );
 CREATE INDEX idx_nm_chat_group_write_group_ids_group_t_chat_group_id ON nm_chat_group_write_group_ids_group_t (chat_group_id);
-CREATE INDEX idx_nm_chat_group_write_group_ids_group_t_group_id ON nm_chat_group_write_group_ids_group_t (group_id);
+CREATE INDEX idx_nm_chat_group_write_group_ids_group_t_group_id ON nm_chat_group_write_group_ids_group_t (group_id, chat_group_id);
 
 CREATE TABLE nm_committee_manager_ids_user_t (
     committee_id integer
@@ -2542,7 +2757,7 @@ CREATE TABLE nm_committee_manager_ids_user_t (
     CONSTRAINT pk_nm_committee_manager_ids_user_t PRIMARY KEY (committee_id, user_id)
 );
 CREATE INDEX idx_nm_committee_manager_ids_user_t_committee_id ON nm_committee_manager_ids_user_t (committee_id);
-CREATE INDEX idx_nm_committee_manager_ids_user_t_user_id ON nm_committee_manager_ids_user_t (user_id);
+CREATE INDEX idx_nm_committee_manager_ids_user_t_user_id ON nm_committee_manager_ids_user_t (user_id, committee_id);
 
 CREATE TABLE nm_committee_all_child_ids_committee_t (
     all_parent_id integer
@@ -2558,7 +2773,7 @@ CREATE TABLE nm_committee_all_child_ids_committee_t (
     CONSTRAINT pk_nm_committee_all_child_ids_committee_t PRIMARY KEY (all_parent_id, all_child_id)
 );
 CREATE INDEX idx_nm_committee_all_child_ids_committee_t_all_parent_id ON nm_committee_all_child_ids_committee_t (all_parent_id);
-CREATE INDEX idx_nm_committee_all_child_ids_committee_t_all_child_id ON nm_committee_all_child_ids_committee_t (all_child_id);
+CREATE INDEX idx_nm_committee_all_child_ids_committee_t_all_child_id ON nm_committee_all_child_ids_committee_t (all_child_id, all_parent_id);
 
 CREATE TABLE nm_committee_forward_to_committee_ids_committee_t (
     receive_forwardings_from_committee_id integer
@@ -2574,7 +2789,7 @@ CREATE TABLE nm_committee_forward_to_committee_ids_committee_t (
     CONSTRAINT pk_nm_committee_forward_to_committee_ids_committee_t PRIMARY KEY (receive_forwardings_from_committee_id, forward_to_committee_id)
 );
 CREATE INDEX idx_nm_committee_forward_to_committee_ids_committee_t_re9215b1e ON nm_committee_forward_to_committee_ids_committee_t (receive_forwardings_from_committee_id);
-CREATE INDEX idx_nm_committee_forward_to_committee_ids_committee_t_fo5507b60 ON nm_committee_forward_to_committee_ids_committee_t (forward_to_committee_id);
+CREATE INDEX idx_nm_committee_forward_to_committee_ids_committee_t_fo5507b60 ON nm_committee_forward_to_committee_ids_committee_t (forward_to_committee_id, receive_forwardings_from_committee_id);
 
 CREATE TABLE nm_group_meeting_user_ids_meeting_user_t (
     group_id integer
@@ -2590,7 +2805,7 @@ CREATE TABLE nm_group_meeting_user_ids_meeting_user_t (
     CONSTRAINT pk_nm_group_meeting_user_ids_meeting_user_t PRIMARY KEY (group_id, meeting_user_id)
 );
 CREATE INDEX idx_nm_group_meeting_user_ids_meeting_user_t_group_id ON nm_group_meeting_user_ids_meeting_user_t (group_id);
-CREATE INDEX idx_nm_group_meeting_user_ids_meeting_user_t_meeting_user_id ON nm_group_meeting_user_ids_meeting_user_t (meeting_user_id);
+CREATE INDEX idx_nm_group_meeting_user_ids_meeting_user_t_meeting_user_id ON nm_group_meeting_user_ids_meeting_user_t (meeting_user_id, group_id);
 
 CREATE TABLE nm_group_mmagi_meeting_mediafile_t (
     group_id integer
@@ -2606,7 +2821,7 @@ CREATE TABLE nm_group_mmagi_meeting_mediafile_t (
     CONSTRAINT pk_nm_group_mmagi_meeting_mediafile_t PRIMARY KEY (group_id, meeting_mediafile_id)
 );
 CREATE INDEX idx_nm_group_mmagi_meeting_mediafile_t_group_id ON nm_group_mmagi_meeting_mediafile_t (group_id);
-CREATE INDEX idx_nm_group_mmagi_meeting_mediafile_t_meeting_mediafile_id ON nm_group_mmagi_meeting_mediafile_t (meeting_mediafile_id);
+CREATE INDEX idx_nm_group_mmagi_meeting_mediafile_t_meeting_mediafile_id ON nm_group_mmagi_meeting_mediafile_t (meeting_mediafile_id, group_id);
 
 CREATE TABLE nm_group_mmiagi_meeting_mediafile_t (
     group_id integer
@@ -2622,7 +2837,7 @@ CREATE TABLE nm_group_mmiagi_meeting_mediafile_t (
     CONSTRAINT pk_nm_group_mmiagi_meeting_mediafile_t PRIMARY KEY (group_id, meeting_mediafile_id)
 );
 CREATE INDEX idx_nm_group_mmiagi_meeting_mediafile_t_group_id ON nm_group_mmiagi_meeting_mediafile_t (group_id);
-CREATE INDEX idx_nm_group_mmiagi_meeting_mediafile_t_meeting_mediafile_id ON nm_group_mmiagi_meeting_mediafile_t (meeting_mediafile_id);
+CREATE INDEX idx_nm_group_mmiagi_meeting_mediafile_t_meeting_mediafile_id ON nm_group_mmiagi_meeting_mediafile_t (meeting_mediafile_id, group_id);
 
 CREATE TABLE nm_group_read_comment_section_ids_motion_comment_section_t (
     group_id integer
@@ -2638,7 +2853,7 @@ CREATE TABLE nm_group_read_comment_section_ids_motion_comment_section_t (
     CONSTRAINT pk_nm_group_read_comment_section_ids_motion_comment_section_t PRIMARY KEY (group_id, motion_comment_section_id)
 );
 CREATE INDEX idx_nm_group_read_comment_section_ids_motion_comment_secb9c23c0 ON nm_group_read_comment_section_ids_motion_comment_section_t (group_id);
-CREATE INDEX idx_nm_group_read_comment_section_ids_motion_comment_sec520054a ON nm_group_read_comment_section_ids_motion_comment_section_t (motion_comment_section_id);
+CREATE INDEX idx_nm_group_read_comment_section_ids_motion_comment_sec520054a ON nm_group_read_comment_section_ids_motion_comment_section_t (motion_comment_section_id, group_id);
 
 CREATE TABLE nm_group_write_comment_section_ids_motion_comment_section_t (
     group_id integer
@@ -2654,7 +2869,7 @@ CREATE TABLE nm_group_write_comment_section_ids_motion_comment_section_t (
     CONSTRAINT pk_nm_group_write_comment_section_ids_motion_comment_section_t PRIMARY KEY (group_id, motion_comment_section_id)
 );
 CREATE INDEX idx_nm_group_write_comment_section_ids_motion_comment_sed5732f3 ON nm_group_write_comment_section_ids_motion_comment_section_t (group_id);
-CREATE INDEX idx_nm_group_write_comment_section_ids_motion_comment_se3ab0450 ON nm_group_write_comment_section_ids_motion_comment_section_t (motion_comment_section_id);
+CREATE INDEX idx_nm_group_write_comment_section_ids_motion_comment_se3ab0450 ON nm_group_write_comment_section_ids_motion_comment_section_t (motion_comment_section_id, group_id);
 
 CREATE TABLE nm_group_poll_ids_poll_t (
     group_id integer
@@ -2670,7 +2885,7 @@ CREATE TABLE nm_group_poll_ids_poll_t (
     CONSTRAINT pk_nm_group_poll_ids_poll_t PRIMARY KEY (group_id, poll_id)
 );
 CREATE INDEX idx_nm_group_poll_ids_poll_t_group_id ON nm_group_poll_ids_poll_t (group_id);
-CREATE INDEX idx_nm_group_poll_ids_poll_t_poll_id ON nm_group_poll_ids_poll_t (poll_id);
+CREATE INDEX idx_nm_group_poll_ids_poll_t_poll_id ON nm_group_poll_ids_poll_t (poll_id, group_id);
 
 CREATE TABLE nm_meeting_present_user_ids_user_t (
     meeting_id integer
@@ -2686,7 +2901,7 @@ CREATE TABLE nm_meeting_present_user_ids_user_t (
     CONSTRAINT pk_nm_meeting_present_user_ids_user_t PRIMARY KEY (meeting_id, user_id)
 );
 CREATE INDEX idx_nm_meeting_present_user_ids_user_t_meeting_id ON nm_meeting_present_user_ids_user_t (meeting_id);
-CREATE INDEX idx_nm_meeting_present_user_ids_user_t_user_id ON nm_meeting_present_user_ids_user_t (user_id);
+CREATE INDEX idx_nm_meeting_present_user_ids_user_t_user_id ON nm_meeting_present_user_ids_user_t (user_id, meeting_id);
 
 CREATE TABLE gm_meeting_mediafile_attachment_ids_t (
     meeting_mediafile_id integer
@@ -2716,9 +2931,9 @@ CREATE TABLE gm_meeting_mediafile_attachment_ids_t (
 );
 CREATE INDEX idx_gm_meeting_mediafile_attachment_ids_t_meeting_mediafile_id ON gm_meeting_mediafile_attachment_ids_t (meeting_mediafile_id);
 CREATE INDEX idx_gm_meeting_mediafile_attachment_ids_t_attachment_id ON gm_meeting_mediafile_attachment_ids_t (attachment_id);
-CREATE INDEX idx_gm_meeting_mediafile_attachment_ids_t_attachment_id_3c67b77 ON gm_meeting_mediafile_attachment_ids_t (attachment_id_motion_id);
-CREATE INDEX idx_gm_meeting_mediafile_attachment_ids_t_attachment_id_8abf47a ON gm_meeting_mediafile_attachment_ids_t (attachment_id_topic_id);
-CREATE INDEX idx_gm_meeting_mediafile_attachment_ids_t_attachment_id_66fb18e ON gm_meeting_mediafile_attachment_ids_t (attachment_id_assignment_id);
+CREATE INDEX idx_gm_meeting_mediafile_attachment_ids_t_attachment_id_3c67b77 ON gm_meeting_mediafile_attachment_ids_t (attachment_id_motion_id, meeting_mediafile_id);
+CREATE INDEX idx_gm_meeting_mediafile_attachment_ids_t_attachment_id_8abf47a ON gm_meeting_mediafile_attachment_ids_t (attachment_id_topic_id, meeting_mediafile_id);
+CREATE INDEX idx_gm_meeting_mediafile_attachment_ids_t_attachment_id_66fb18e ON gm_meeting_mediafile_attachment_ids_t (attachment_id_assignment_id, meeting_mediafile_id);
 
 CREATE TABLE nm_meeting_user_structure_level_ids_structure_level_t (
     meeting_user_id integer
@@ -2734,7 +2949,7 @@ CREATE TABLE nm_meeting_user_structure_level_ids_structure_level_t (
     CONSTRAINT pk_nm_meeting_user_structure_level_ids_structure_level_t PRIMARY KEY (meeting_user_id, structure_level_id)
 );
 CREATE INDEX idx_nm_meeting_user_structure_level_ids_structure_level_a842d49 ON nm_meeting_user_structure_level_ids_structure_level_t (meeting_user_id);
-CREATE INDEX idx_nm_meeting_user_structure_level_ids_structure_level_abd5dca ON nm_meeting_user_structure_level_ids_structure_level_t (structure_level_id);
+CREATE INDEX idx_nm_meeting_user_structure_level_ids_structure_level_abd5dca ON nm_meeting_user_structure_level_ids_structure_level_t (structure_level_id, meeting_user_id);
 
 CREATE TABLE nm_motion_all_derived_motion_ids_motion_t (
     all_origin_id integer
@@ -2750,7 +2965,7 @@ CREATE TABLE nm_motion_all_derived_motion_ids_motion_t (
     CONSTRAINT pk_nm_motion_all_derived_motion_ids_motion_t PRIMARY KEY (all_origin_id, all_derived_motion_id)
 );
 CREATE INDEX idx_nm_motion_all_derived_motion_ids_motion_t_all_origin_id ON nm_motion_all_derived_motion_ids_motion_t (all_origin_id);
-CREATE INDEX idx_nm_motion_all_derived_motion_ids_motion_t_all_derivee757fda ON nm_motion_all_derived_motion_ids_motion_t (all_derived_motion_id);
+CREATE INDEX idx_nm_motion_all_derived_motion_ids_motion_t_all_derivee757fda ON nm_motion_all_derived_motion_ids_motion_t (all_derived_motion_id, all_origin_id);
 
 CREATE TABLE nm_motion_identical_motion_ids_motion_t (
     identical_motion_id_1 integer
@@ -2766,7 +2981,7 @@ CREATE TABLE nm_motion_identical_motion_ids_motion_t (
     CONSTRAINT pk_nm_motion_identical_motion_ids_motion_t PRIMARY KEY (identical_motion_id_1, identical_motion_id_2)
 );
 CREATE INDEX idx_nm_motion_identical_motion_ids_motion_t_identical_mo6988270 ON nm_motion_identical_motion_ids_motion_t (identical_motion_id_1);
-CREATE INDEX idx_nm_motion_identical_motion_ids_motion_t_identical_moe0b67bf ON nm_motion_identical_motion_ids_motion_t (identical_motion_id_2);
+CREATE INDEX idx_nm_motion_identical_motion_ids_motion_t_identical_moe0b67bf ON nm_motion_identical_motion_ids_motion_t (identical_motion_id_2, identical_motion_id_1);
 
 CREATE TABLE gm_motion_state_extension_reference_ids_t (
     motion_id integer
@@ -2786,7 +3001,7 @@ CREATE TABLE gm_motion_state_extension_reference_ids_t (
 );
 CREATE INDEX idx_gm_motion_state_extension_reference_ids_t_motion_id ON gm_motion_state_extension_reference_ids_t (motion_id);
 CREATE INDEX idx_gm_motion_state_extension_reference_ids_t_state_exte869c61b ON gm_motion_state_extension_reference_ids_t (state_extension_reference_id);
-CREATE INDEX idx_gm_motion_state_extension_reference_ids_t_state_extee77cee3 ON gm_motion_state_extension_reference_ids_t (state_extension_reference_id_motion_id);
+CREATE INDEX idx_gm_motion_state_extension_reference_ids_t_state_extee77cee3 ON gm_motion_state_extension_reference_ids_t (state_extension_reference_id_motion_id, motion_id);
 
 CREATE TABLE gm_motion_recommendation_extension_reference_ids_t (
     motion_id integer
@@ -2806,7 +3021,7 @@ CREATE TABLE gm_motion_recommendation_extension_reference_ids_t (
 );
 CREATE INDEX idx_gm_motion_recommendation_extension_reference_ids_t_m81631d0 ON gm_motion_recommendation_extension_reference_ids_t (motion_id);
 CREATE INDEX idx_gm_motion_recommendation_extension_reference_ids_t_r6488b59 ON gm_motion_recommendation_extension_reference_ids_t (recommendation_extension_reference_id);
-CREATE INDEX idx_gm_motion_recommendation_extension_reference_ids_t_r1489537 ON gm_motion_recommendation_extension_reference_ids_t (recommendation_extension_reference_id_motion_id);
+CREATE INDEX idx_gm_motion_recommendation_extension_reference_ids_t_r1489537 ON gm_motion_recommendation_extension_reference_ids_t (recommendation_extension_reference_id_motion_id, motion_id);
 
 CREATE TABLE nm_motion_state_next_state_ids_motion_state_t (
     previous_state_id integer
@@ -2822,7 +3037,7 @@ CREATE TABLE nm_motion_state_next_state_ids_motion_state_t (
     CONSTRAINT pk_nm_motion_state_next_state_ids_motion_state_t PRIMARY KEY (previous_state_id, next_state_id)
 );
 CREATE INDEX idx_nm_motion_state_next_state_ids_motion_state_t_previoa964ca1 ON nm_motion_state_next_state_ids_motion_state_t (previous_state_id);
-CREATE INDEX idx_nm_motion_state_next_state_ids_motion_state_t_next_state_id ON nm_motion_state_next_state_ids_motion_state_t (next_state_id);
+CREATE INDEX idx_nm_motion_state_next_state_ids_motion_state_t_next_state_id ON nm_motion_state_next_state_ids_motion_state_t (next_state_id, previous_state_id);
 
 CREATE TABLE gm_organization_tag_tagged_ids_t (
     organization_tag_id integer
@@ -2847,8 +3062,8 @@ CREATE TABLE gm_organization_tag_tagged_ids_t (
 );
 CREATE INDEX idx_gm_organization_tag_tagged_ids_t_organization_tag_id ON gm_organization_tag_tagged_ids_t (organization_tag_id);
 CREATE INDEX idx_gm_organization_tag_tagged_ids_t_tagged_id ON gm_organization_tag_tagged_ids_t (tagged_id);
-CREATE INDEX idx_gm_organization_tag_tagged_ids_t_tagged_id_committee_id ON gm_organization_tag_tagged_ids_t (tagged_id_committee_id);
-CREATE INDEX idx_gm_organization_tag_tagged_ids_t_tagged_id_meeting_id ON gm_organization_tag_tagged_ids_t (tagged_id_meeting_id);
+CREATE INDEX idx_gm_organization_tag_tagged_ids_t_tagged_id_committee_id ON gm_organization_tag_tagged_ids_t (tagged_id_committee_id, organization_tag_id);
+CREATE INDEX idx_gm_organization_tag_tagged_ids_t_tagged_id_meeting_id ON gm_organization_tag_tagged_ids_t (tagged_id_meeting_id, organization_tag_id);
 
 CREATE TABLE nm_poll_voted_ids_user_t (
     poll_id integer
@@ -2864,7 +3079,7 @@ CREATE TABLE nm_poll_voted_ids_user_t (
     CONSTRAINT pk_nm_poll_voted_ids_user_t PRIMARY KEY (poll_id, user_id)
 );
 CREATE INDEX idx_nm_poll_voted_ids_user_t_poll_id ON nm_poll_voted_ids_user_t (poll_id);
-CREATE INDEX idx_nm_poll_voted_ids_user_t_user_id ON nm_poll_voted_ids_user_t (user_id);
+CREATE INDEX idx_nm_poll_voted_ids_user_t_user_id ON nm_poll_voted_ids_user_t (user_id, poll_id);
 
 CREATE TABLE gm_tag_tagged_ids_t (
     tag_id integer
@@ -2894,9 +3109,9 @@ CREATE TABLE gm_tag_tagged_ids_t (
 );
 CREATE INDEX idx_gm_tag_tagged_ids_t_tag_id ON gm_tag_tagged_ids_t (tag_id);
 CREATE INDEX idx_gm_tag_tagged_ids_t_tagged_id ON gm_tag_tagged_ids_t (tagged_id);
-CREATE INDEX idx_gm_tag_tagged_ids_t_tagged_id_agenda_item_id ON gm_tag_tagged_ids_t (tagged_id_agenda_item_id);
-CREATE INDEX idx_gm_tag_tagged_ids_t_tagged_id_assignment_id ON gm_tag_tagged_ids_t (tagged_id_assignment_id);
-CREATE INDEX idx_gm_tag_tagged_ids_t_tagged_id_motion_id ON gm_tag_tagged_ids_t (tagged_id_motion_id);
+CREATE INDEX idx_gm_tag_tagged_ids_t_tagged_id_agenda_item_id ON gm_tag_tagged_ids_t (tagged_id_agenda_item_id, tag_id);
+CREATE INDEX idx_gm_tag_tagged_ids_t_tagged_id_assignment_id ON gm_tag_tagged_ids_t (tagged_id_assignment_id, tag_id);
+CREATE INDEX idx_gm_tag_tagged_ids_t_tagged_id_motion_id ON gm_tag_tagged_ids_t (tagged_id_motion_id, tag_id);
 
 
 -- View definitions
@@ -3378,407 +3593,407 @@ CREATE VIEW "vote" AS SELECT * FROM vote_t v;
 
 -- Alter table relations
 ALTER TABLE agenda_item_t ADD CONSTRAINT fk_agenda_item_t_content_object_id_motion_id_motion_t_id FOREIGN KEY(content_object_id_motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_agenda_item_t_content_object_id_motion_id ON agenda_item_t (content_object_id_motion_id);
+CREATE INDEX idx_agenda_item_t_content_object_id_motion_id ON agenda_item_t (content_object_id_motion_id, id);
 ALTER TABLE agenda_item_t ADD CONSTRAINT fk_agenda_item_t_content_object_id_motion_block_id_motiofc82ae2 FOREIGN KEY(content_object_id_motion_block_id) REFERENCES motion_block_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_agenda_item_t_content_object_id_motion_block_id ON agenda_item_t (content_object_id_motion_block_id);
+CREATE INDEX idx_agenda_item_t_content_object_id_motion_block_id ON agenda_item_t (content_object_id_motion_block_id, id);
 ALTER TABLE agenda_item_t ADD CONSTRAINT fk_agenda_item_t_content_object_id_assignment_id_assignmd1e068c FOREIGN KEY(content_object_id_assignment_id) REFERENCES assignment_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_agenda_item_t_content_object_id_assignment_id ON agenda_item_t (content_object_id_assignment_id);
+CREATE INDEX idx_agenda_item_t_content_object_id_assignment_id ON agenda_item_t (content_object_id_assignment_id, id);
 ALTER TABLE agenda_item_t ADD CONSTRAINT fk_agenda_item_t_content_object_id_topic_id_topic_t_id FOREIGN KEY(content_object_id_topic_id) REFERENCES topic_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_agenda_item_t_content_object_id_topic_id ON agenda_item_t (content_object_id_topic_id);
+CREATE INDEX idx_agenda_item_t_content_object_id_topic_id ON agenda_item_t (content_object_id_topic_id, id);
 ALTER TABLE agenda_item_t ADD CONSTRAINT fk_agenda_item_t_parent_id_agenda_item_t_id FOREIGN KEY(parent_id) REFERENCES agenda_item_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_agenda_item_t_parent_id ON agenda_item_t (parent_id);
+CREATE INDEX idx_agenda_item_t_parent_id ON agenda_item_t (parent_id, id);
 ALTER TABLE agenda_item_t ADD CONSTRAINT fk_agenda_item_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_agenda_item_t_meeting_id ON agenda_item_t (meeting_id);
+CREATE INDEX idx_agenda_item_t_meeting_id ON agenda_item_t (meeting_id, id);
 
 ALTER TABLE assignment_t ADD CONSTRAINT fk_assignment_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_assignment_t_meeting_id ON assignment_t (meeting_id);
+CREATE INDEX idx_assignment_t_meeting_id ON assignment_t (meeting_id, id);
 
 ALTER TABLE assignment_candidate_t ADD CONSTRAINT fk_assignment_candidate_t_assignment_id_assignment_t_id FOREIGN KEY(assignment_id) REFERENCES assignment_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_assignment_candidate_t_assignment_id ON assignment_candidate_t (assignment_id);
+CREATE INDEX idx_assignment_candidate_t_assignment_id ON assignment_candidate_t (assignment_id, id);
 ALTER TABLE assignment_candidate_t ADD CONSTRAINT fk_assignment_candidate_t_meeting_user_id_meeting_user_t_id FOREIGN KEY(meeting_user_id) REFERENCES meeting_user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_assignment_candidate_t_meeting_user_id ON assignment_candidate_t (meeting_user_id);
+CREATE INDEX idx_assignment_candidate_t_meeting_user_id ON assignment_candidate_t (meeting_user_id, id);
 ALTER TABLE assignment_candidate_t ADD CONSTRAINT fk_assignment_candidate_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_assignment_candidate_t_meeting_id ON assignment_candidate_t (meeting_id);
+CREATE INDEX idx_assignment_candidate_t_meeting_id ON assignment_candidate_t (meeting_id, id);
 
 ALTER TABLE chat_group_t ADD CONSTRAINT fk_chat_group_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_chat_group_t_meeting_id ON chat_group_t (meeting_id);
+CREATE INDEX idx_chat_group_t_meeting_id ON chat_group_t (meeting_id, id);
 
 ALTER TABLE chat_message_t ADD CONSTRAINT fk_chat_message_t_meeting_user_id_meeting_user_t_id FOREIGN KEY(meeting_user_id) REFERENCES meeting_user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_chat_message_t_meeting_user_id ON chat_message_t (meeting_user_id);
+CREATE INDEX idx_chat_message_t_meeting_user_id ON chat_message_t (meeting_user_id, id);
 ALTER TABLE chat_message_t ADD CONSTRAINT fk_chat_message_t_chat_group_id_chat_group_t_id FOREIGN KEY(chat_group_id) REFERENCES chat_group_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_chat_message_t_chat_group_id ON chat_message_t (chat_group_id);
+CREATE INDEX idx_chat_message_t_chat_group_id ON chat_message_t (chat_group_id, id);
 ALTER TABLE chat_message_t ADD CONSTRAINT fk_chat_message_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_chat_message_t_meeting_id ON chat_message_t (meeting_id);
+CREATE INDEX idx_chat_message_t_meeting_id ON chat_message_t (meeting_id, id);
 
 ALTER TABLE committee_t ADD CONSTRAINT fk_committee_t_default_meeting_id_meeting_t_id FOREIGN KEY(default_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_committee_t_default_meeting_id ON committee_t (default_meeting_id);
+CREATE INDEX idx_committee_t_default_meeting_id ON committee_t (default_meeting_id, id);
 ALTER TABLE committee_t ADD CONSTRAINT fk_committee_t_parent_id_committee_t_id FOREIGN KEY(parent_id) REFERENCES committee_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_committee_t_parent_id ON committee_t (parent_id);
+CREATE INDEX idx_committee_t_parent_id ON committee_t (parent_id, id);
 ALTER TABLE committee_t ADD CONSTRAINT fk_committee_t_organization_id_organization_t_id FOREIGN KEY(organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_committee_t_organization_id ON committee_t (organization_id);
+CREATE INDEX idx_committee_t_organization_id ON committee_t (organization_id, id);
 
 ALTER TABLE gender_t ADD CONSTRAINT fk_gender_t_organization_id_organization_t_id FOREIGN KEY(organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_gender_t_organization_id ON gender_t (organization_id);
+CREATE INDEX idx_gender_t_organization_id ON gender_t (organization_id, id);
 
 ALTER TABLE group_t ADD CONSTRAINT fk_group_t_used_as_motion_poll_default_id_meeting_t_id FOREIGN KEY(used_as_motion_poll_default_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_group_t_used_as_motion_poll_default_id ON group_t (used_as_motion_poll_default_id);
+CREATE INDEX idx_group_t_used_as_motion_poll_default_id ON group_t (used_as_motion_poll_default_id, id);
 ALTER TABLE group_t ADD CONSTRAINT fk_group_t_used_as_assignment_poll_default_id_meeting_t_id FOREIGN KEY(used_as_assignment_poll_default_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_group_t_used_as_assignment_poll_default_id ON group_t (used_as_assignment_poll_default_id);
+CREATE INDEX idx_group_t_used_as_assignment_poll_default_id ON group_t (used_as_assignment_poll_default_id, id);
 ALTER TABLE group_t ADD CONSTRAINT fk_group_t_used_as_topic_poll_default_id_meeting_t_id FOREIGN KEY(used_as_topic_poll_default_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_group_t_used_as_topic_poll_default_id ON group_t (used_as_topic_poll_default_id);
+CREATE INDEX idx_group_t_used_as_topic_poll_default_id ON group_t (used_as_topic_poll_default_id, id);
 ALTER TABLE group_t ADD CONSTRAINT fk_group_t_used_as_poll_default_id_meeting_t_id FOREIGN KEY(used_as_poll_default_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_group_t_used_as_poll_default_id ON group_t (used_as_poll_default_id);
+CREATE INDEX idx_group_t_used_as_poll_default_id ON group_t (used_as_poll_default_id, id);
 ALTER TABLE group_t ADD CONSTRAINT fk_group_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_group_t_meeting_id ON group_t (meeting_id);
+CREATE INDEX idx_group_t_meeting_id ON group_t (meeting_id, id);
 
 ALTER TABLE history_entry_t ADD CONSTRAINT fk_history_entry_t_model_id_user_id_user_t_id FOREIGN KEY(model_id_user_id) REFERENCES user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_history_entry_t_model_id_user_id ON history_entry_t (model_id_user_id);
+CREATE INDEX idx_history_entry_t_model_id_user_id ON history_entry_t (model_id_user_id, id);
 ALTER TABLE history_entry_t ADD CONSTRAINT fk_history_entry_t_model_id_motion_id_motion_t_id FOREIGN KEY(model_id_motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_history_entry_t_model_id_motion_id ON history_entry_t (model_id_motion_id);
+CREATE INDEX idx_history_entry_t_model_id_motion_id ON history_entry_t (model_id_motion_id, id);
 ALTER TABLE history_entry_t ADD CONSTRAINT fk_history_entry_t_model_id_assignment_id_assignment_t_id FOREIGN KEY(model_id_assignment_id) REFERENCES assignment_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_history_entry_t_model_id_assignment_id ON history_entry_t (model_id_assignment_id);
+CREATE INDEX idx_history_entry_t_model_id_assignment_id ON history_entry_t (model_id_assignment_id, id);
 ALTER TABLE history_entry_t ADD CONSTRAINT fk_history_entry_t_position_id_history_position_t_id FOREIGN KEY(position_id) REFERENCES history_position_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_history_entry_t_position_id ON history_entry_t (position_id);
+CREATE INDEX idx_history_entry_t_position_id ON history_entry_t (position_id, id);
 ALTER TABLE history_entry_t ADD CONSTRAINT fk_history_entry_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_history_entry_t_meeting_id ON history_entry_t (meeting_id);
+CREATE INDEX idx_history_entry_t_meeting_id ON history_entry_t (meeting_id, id);
 
 ALTER TABLE history_position_t ADD CONSTRAINT fk_history_position_t_user_id_user_t_id FOREIGN KEY(user_id) REFERENCES user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_history_position_t_user_id ON history_position_t (user_id);
+CREATE INDEX idx_history_position_t_user_id ON history_position_t (user_id, id);
 
 ALTER TABLE list_of_speakers_t ADD CONSTRAINT fk_list_of_speakers_t_content_object_id_motion_id_motion_t_id FOREIGN KEY(content_object_id_motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_list_of_speakers_t_content_object_id_motion_id ON list_of_speakers_t (content_object_id_motion_id);
+CREATE INDEX idx_list_of_speakers_t_content_object_id_motion_id ON list_of_speakers_t (content_object_id_motion_id, id);
 ALTER TABLE list_of_speakers_t ADD CONSTRAINT fk_list_of_speakers_t_content_object_id_motion_block_id_62f90e7 FOREIGN KEY(content_object_id_motion_block_id) REFERENCES motion_block_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_list_of_speakers_t_content_object_id_motion_block_id ON list_of_speakers_t (content_object_id_motion_block_id);
+CREATE INDEX idx_list_of_speakers_t_content_object_id_motion_block_id ON list_of_speakers_t (content_object_id_motion_block_id, id);
 ALTER TABLE list_of_speakers_t ADD CONSTRAINT fk_list_of_speakers_t_content_object_id_assignment_id_as9909666 FOREIGN KEY(content_object_id_assignment_id) REFERENCES assignment_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_list_of_speakers_t_content_object_id_assignment_id ON list_of_speakers_t (content_object_id_assignment_id);
+CREATE INDEX idx_list_of_speakers_t_content_object_id_assignment_id ON list_of_speakers_t (content_object_id_assignment_id, id);
 ALTER TABLE list_of_speakers_t ADD CONSTRAINT fk_list_of_speakers_t_content_object_id_topic_id_topic_t_id FOREIGN KEY(content_object_id_topic_id) REFERENCES topic_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_list_of_speakers_t_content_object_id_topic_id ON list_of_speakers_t (content_object_id_topic_id);
+CREATE INDEX idx_list_of_speakers_t_content_object_id_topic_id ON list_of_speakers_t (content_object_id_topic_id, id);
 ALTER TABLE list_of_speakers_t ADD CONSTRAINT fk_list_of_speakers_t_content_object_id_meeting_mediafilc591d1a FOREIGN KEY(content_object_id_meeting_mediafile_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_list_of_speakers_t_content_object_id_meeting_mediafile_id ON list_of_speakers_t (content_object_id_meeting_mediafile_id);
+CREATE INDEX idx_list_of_speakers_t_content_object_id_meeting_mediafile_id ON list_of_speakers_t (content_object_id_meeting_mediafile_id, id);
 ALTER TABLE list_of_speakers_t ADD CONSTRAINT fk_list_of_speakers_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_list_of_speakers_t_meeting_id ON list_of_speakers_t (meeting_id);
+CREATE INDEX idx_list_of_speakers_t_meeting_id ON list_of_speakers_t (meeting_id, id);
 
 ALTER TABLE mediafile_t ADD CONSTRAINT fk_mediafile_t_published_to_meetings_in_organization_id_471fd9a FOREIGN KEY(published_to_meetings_in_organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_mediafile_t_published_to_meetings_in_organization_id ON mediafile_t (published_to_meetings_in_organization_id);
+CREATE INDEX idx_mediafile_t_published_to_meetings_in_organization_id ON mediafile_t (published_to_meetings_in_organization_id, id);
 ALTER TABLE mediafile_t ADD CONSTRAINT fk_mediafile_t_parent_id_mediafile_t_id FOREIGN KEY(parent_id) REFERENCES mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_mediafile_t_parent_id ON mediafile_t (parent_id);
+CREATE INDEX idx_mediafile_t_parent_id ON mediafile_t (parent_id, id);
 ALTER TABLE mediafile_t ADD CONSTRAINT fk_mediafile_t_owner_id_meeting_id_meeting_t_id FOREIGN KEY(owner_id_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_mediafile_t_owner_id_meeting_id ON mediafile_t (owner_id_meeting_id);
+CREATE INDEX idx_mediafile_t_owner_id_meeting_id ON mediafile_t (owner_id_meeting_id, id);
 ALTER TABLE mediafile_t ADD CONSTRAINT fk_mediafile_t_owner_id_organization_id_organization_t_id FOREIGN KEY(owner_id_organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_mediafile_t_owner_id_organization_id ON mediafile_t (owner_id_organization_id);
+CREATE INDEX idx_mediafile_t_owner_id_organization_id ON mediafile_t (owner_id_organization_id, id);
 
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_is_active_in_organization_id_organization_t_id FOREIGN KEY(is_active_in_organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_is_active_in_organization_id ON meeting_t (is_active_in_organization_id);
+CREATE INDEX idx_meeting_t_is_active_in_organization_id ON meeting_t (is_active_in_organization_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_is_archived_in_organization_id_organization_t_id FOREIGN KEY(is_archived_in_organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_is_archived_in_organization_id ON meeting_t (is_archived_in_organization_id);
+CREATE INDEX idx_meeting_t_is_archived_in_organization_id ON meeting_t (is_archived_in_organization_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_template_for_organization_id_organization_t_id FOREIGN KEY(template_for_organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_template_for_organization_id ON meeting_t (template_for_organization_id);
+CREATE INDEX idx_meeting_t_template_for_organization_id ON meeting_t (template_for_organization_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_motions_default_workflow_id_motion_workflow_t_id FOREIGN KEY(motions_default_workflow_id) REFERENCES motion_workflow_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_motions_default_workflow_id ON meeting_t (motions_default_workflow_id);
+CREATE INDEX idx_meeting_t_motions_default_workflow_id ON meeting_t (motions_default_workflow_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_motions_default_amendment_workflow_id_motio34ae2bf FOREIGN KEY(motions_default_amendment_workflow_id) REFERENCES motion_workflow_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_motions_default_amendment_workflow_id ON meeting_t (motions_default_amendment_workflow_id);
+CREATE INDEX idx_meeting_t_motions_default_amendment_workflow_id ON meeting_t (motions_default_amendment_workflow_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_logo_projector_main_id_meeting_mediafile_t_id FOREIGN KEY(logo_projector_main_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_logo_projector_main_id ON meeting_t (logo_projector_main_id);
+CREATE INDEX idx_meeting_t_logo_projector_main_id ON meeting_t (logo_projector_main_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_logo_projector_header_id_meeting_mediafile_t_id FOREIGN KEY(logo_projector_header_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_logo_projector_header_id ON meeting_t (logo_projector_header_id);
+CREATE INDEX idx_meeting_t_logo_projector_header_id ON meeting_t (logo_projector_header_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_logo_web_header_id_meeting_mediafile_t_id FOREIGN KEY(logo_web_header_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_logo_web_header_id ON meeting_t (logo_web_header_id);
+CREATE INDEX idx_meeting_t_logo_web_header_id ON meeting_t (logo_web_header_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_logo_pdf_header_l_id_meeting_mediafile_t_id FOREIGN KEY(logo_pdf_header_l_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_logo_pdf_header_l_id ON meeting_t (logo_pdf_header_l_id);
+CREATE INDEX idx_meeting_t_logo_pdf_header_l_id ON meeting_t (logo_pdf_header_l_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_logo_pdf_header_r_id_meeting_mediafile_t_id FOREIGN KEY(logo_pdf_header_r_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_logo_pdf_header_r_id ON meeting_t (logo_pdf_header_r_id);
+CREATE INDEX idx_meeting_t_logo_pdf_header_r_id ON meeting_t (logo_pdf_header_r_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_logo_pdf_footer_l_id_meeting_mediafile_t_id FOREIGN KEY(logo_pdf_footer_l_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_logo_pdf_footer_l_id ON meeting_t (logo_pdf_footer_l_id);
+CREATE INDEX idx_meeting_t_logo_pdf_footer_l_id ON meeting_t (logo_pdf_footer_l_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_logo_pdf_footer_r_id_meeting_mediafile_t_id FOREIGN KEY(logo_pdf_footer_r_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_logo_pdf_footer_r_id ON meeting_t (logo_pdf_footer_r_id);
+CREATE INDEX idx_meeting_t_logo_pdf_footer_r_id ON meeting_t (logo_pdf_footer_r_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_logo_pdf_ballot_paper_id_meeting_mediafile_t_id FOREIGN KEY(logo_pdf_ballot_paper_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_logo_pdf_ballot_paper_id ON meeting_t (logo_pdf_ballot_paper_id);
+CREATE INDEX idx_meeting_t_logo_pdf_ballot_paper_id ON meeting_t (logo_pdf_ballot_paper_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_font_regular_id_meeting_mediafile_t_id FOREIGN KEY(font_regular_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_font_regular_id ON meeting_t (font_regular_id);
+CREATE INDEX idx_meeting_t_font_regular_id ON meeting_t (font_regular_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_font_italic_id_meeting_mediafile_t_id FOREIGN KEY(font_italic_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_font_italic_id ON meeting_t (font_italic_id);
+CREATE INDEX idx_meeting_t_font_italic_id ON meeting_t (font_italic_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_font_bold_id_meeting_mediafile_t_id FOREIGN KEY(font_bold_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_font_bold_id ON meeting_t (font_bold_id);
+CREATE INDEX idx_meeting_t_font_bold_id ON meeting_t (font_bold_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_font_bold_italic_id_meeting_mediafile_t_id FOREIGN KEY(font_bold_italic_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_font_bold_italic_id ON meeting_t (font_bold_italic_id);
+CREATE INDEX idx_meeting_t_font_bold_italic_id ON meeting_t (font_bold_italic_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_font_monospace_id_meeting_mediafile_t_id FOREIGN KEY(font_monospace_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_font_monospace_id ON meeting_t (font_monospace_id);
+CREATE INDEX idx_meeting_t_font_monospace_id ON meeting_t (font_monospace_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_font_chyron_speaker_name_id_meeting_mediafile_t_id FOREIGN KEY(font_chyron_speaker_name_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_font_chyron_speaker_name_id ON meeting_t (font_chyron_speaker_name_id);
+CREATE INDEX idx_meeting_t_font_chyron_speaker_name_id ON meeting_t (font_chyron_speaker_name_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_font_projector_h1_id_meeting_mediafile_t_id FOREIGN KEY(font_projector_h1_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_font_projector_h1_id ON meeting_t (font_projector_h1_id);
+CREATE INDEX idx_meeting_t_font_projector_h1_id ON meeting_t (font_projector_h1_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_font_projector_h2_id_meeting_mediafile_t_id FOREIGN KEY(font_projector_h2_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_font_projector_h2_id ON meeting_t (font_projector_h2_id);
+CREATE INDEX idx_meeting_t_font_projector_h2_id ON meeting_t (font_projector_h2_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_committee_id_committee_t_id FOREIGN KEY(committee_id) REFERENCES committee_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_committee_id ON meeting_t (committee_id);
+CREATE INDEX idx_meeting_t_committee_id ON meeting_t (committee_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_reference_projector_id_projector_t_id FOREIGN KEY(reference_projector_id) REFERENCES projector_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_reference_projector_id ON meeting_t (reference_projector_id);
+CREATE INDEX idx_meeting_t_reference_projector_id ON meeting_t (reference_projector_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_list_of_speakers_countdown_id_projector_cou566cfb1 FOREIGN KEY(list_of_speakers_countdown_id) REFERENCES projector_countdown_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_list_of_speakers_countdown_id ON meeting_t (list_of_speakers_countdown_id);
+CREATE INDEX idx_meeting_t_list_of_speakers_countdown_id ON meeting_t (list_of_speakers_countdown_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_poll_countdown_id_projector_countdown_t_id FOREIGN KEY(poll_countdown_id) REFERENCES projector_countdown_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_poll_countdown_id ON meeting_t (poll_countdown_id);
+CREATE INDEX idx_meeting_t_poll_countdown_id ON meeting_t (poll_countdown_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_default_group_id_group_t_id FOREIGN KEY(default_group_id) REFERENCES group_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_default_group_id ON meeting_t (default_group_id);
+CREATE INDEX idx_meeting_t_default_group_id ON meeting_t (default_group_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_admin_group_id_group_t_id FOREIGN KEY(admin_group_id) REFERENCES group_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_admin_group_id ON meeting_t (admin_group_id);
+CREATE INDEX idx_meeting_t_admin_group_id ON meeting_t (admin_group_id, id);
 ALTER TABLE meeting_t ADD CONSTRAINT fk_meeting_t_anonymous_group_id_group_t_id FOREIGN KEY(anonymous_group_id) REFERENCES group_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_t_anonymous_group_id ON meeting_t (anonymous_group_id);
+CREATE INDEX idx_meeting_t_anonymous_group_id ON meeting_t (anonymous_group_id, id);
 
 ALTER TABLE meeting_mediafile_t ADD CONSTRAINT fk_meeting_mediafile_t_mediafile_id_mediafile_t_id FOREIGN KEY(mediafile_id) REFERENCES mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_mediafile_t_mediafile_id ON meeting_mediafile_t (mediafile_id);
+CREATE INDEX idx_meeting_mediafile_t_mediafile_id ON meeting_mediafile_t (mediafile_id, id);
 ALTER TABLE meeting_mediafile_t ADD CONSTRAINT fk_meeting_mediafile_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_mediafile_t_meeting_id ON meeting_mediafile_t (meeting_id);
+CREATE INDEX idx_meeting_mediafile_t_meeting_id ON meeting_mediafile_t (meeting_id, id);
 
 ALTER TABLE meeting_user_t ADD CONSTRAINT fk_meeting_user_t_user_id_user_t_id FOREIGN KEY(user_id) REFERENCES user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_user_t_user_id ON meeting_user_t (user_id);
+CREATE INDEX idx_meeting_user_t_user_id ON meeting_user_t (user_id, id);
 ALTER TABLE meeting_user_t ADD CONSTRAINT fk_meeting_user_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_user_t_meeting_id ON meeting_user_t (meeting_id);
+CREATE INDEX idx_meeting_user_t_meeting_id ON meeting_user_t (meeting_id, id);
 ALTER TABLE meeting_user_t ADD CONSTRAINT fk_meeting_user_t_vote_delegated_to_id_meeting_user_t_id FOREIGN KEY(vote_delegated_to_id) REFERENCES meeting_user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_meeting_user_t_vote_delegated_to_id ON meeting_user_t (vote_delegated_to_id);
+CREATE INDEX idx_meeting_user_t_vote_delegated_to_id ON meeting_user_t (vote_delegated_to_id, id);
 
 ALTER TABLE motion_t ADD CONSTRAINT fk_motion_t_lead_motion_id_motion_t_id FOREIGN KEY(lead_motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_t_lead_motion_id ON motion_t (lead_motion_id);
+CREATE INDEX idx_motion_t_lead_motion_id ON motion_t (lead_motion_id, id);
 ALTER TABLE motion_t ADD CONSTRAINT fk_motion_t_sort_parent_id_motion_t_id FOREIGN KEY(sort_parent_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_t_sort_parent_id ON motion_t (sort_parent_id);
+CREATE INDEX idx_motion_t_sort_parent_id ON motion_t (sort_parent_id, id);
 ALTER TABLE motion_t ADD CONSTRAINT fk_motion_t_origin_id_motion_t_id FOREIGN KEY(origin_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_t_origin_id ON motion_t (origin_id);
+CREATE INDEX idx_motion_t_origin_id ON motion_t (origin_id, id);
 ALTER TABLE motion_t ADD CONSTRAINT fk_motion_t_origin_meeting_id_meeting_t_id FOREIGN KEY(origin_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_t_origin_meeting_id ON motion_t (origin_meeting_id);
+CREATE INDEX idx_motion_t_origin_meeting_id ON motion_t (origin_meeting_id, id);
 ALTER TABLE motion_t ADD CONSTRAINT fk_motion_t_state_id_motion_state_t_id FOREIGN KEY(state_id) REFERENCES motion_state_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_t_state_id ON motion_t (state_id);
+CREATE INDEX idx_motion_t_state_id ON motion_t (state_id, id);
 ALTER TABLE motion_t ADD CONSTRAINT fk_motion_t_recommendation_id_motion_state_t_id FOREIGN KEY(recommendation_id) REFERENCES motion_state_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_t_recommendation_id ON motion_t (recommendation_id);
+CREATE INDEX idx_motion_t_recommendation_id ON motion_t (recommendation_id, id);
 ALTER TABLE motion_t ADD CONSTRAINT fk_motion_t_category_id_motion_category_t_id FOREIGN KEY(category_id) REFERENCES motion_category_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_t_category_id ON motion_t (category_id);
+CREATE INDEX idx_motion_t_category_id ON motion_t (category_id, id);
 ALTER TABLE motion_t ADD CONSTRAINT fk_motion_t_block_id_motion_block_t_id FOREIGN KEY(block_id) REFERENCES motion_block_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_t_block_id ON motion_t (block_id);
+CREATE INDEX idx_motion_t_block_id ON motion_t (block_id, id);
 ALTER TABLE motion_t ADD CONSTRAINT fk_motion_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_t_meeting_id ON motion_t (meeting_id);
+CREATE INDEX idx_motion_t_meeting_id ON motion_t (meeting_id, id);
 
 ALTER TABLE motion_block_t ADD CONSTRAINT fk_motion_block_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_block_t_meeting_id ON motion_block_t (meeting_id);
+CREATE INDEX idx_motion_block_t_meeting_id ON motion_block_t (meeting_id, id);
 
 ALTER TABLE motion_category_t ADD CONSTRAINT fk_motion_category_t_parent_id_motion_category_t_id FOREIGN KEY(parent_id) REFERENCES motion_category_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_category_t_parent_id ON motion_category_t (parent_id);
+CREATE INDEX idx_motion_category_t_parent_id ON motion_category_t (parent_id, id);
 ALTER TABLE motion_category_t ADD CONSTRAINT fk_motion_category_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_category_t_meeting_id ON motion_category_t (meeting_id);
+CREATE INDEX idx_motion_category_t_meeting_id ON motion_category_t (meeting_id, id);
 
 ALTER TABLE motion_change_recommendation_t ADD CONSTRAINT fk_motion_change_recommendation_t_motion_id_motion_t_id FOREIGN KEY(motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_change_recommendation_t_motion_id ON motion_change_recommendation_t (motion_id);
+CREATE INDEX idx_motion_change_recommendation_t_motion_id ON motion_change_recommendation_t (motion_id, id);
 ALTER TABLE motion_change_recommendation_t ADD CONSTRAINT fk_motion_change_recommendation_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_change_recommendation_t_meeting_id ON motion_change_recommendation_t (meeting_id);
+CREATE INDEX idx_motion_change_recommendation_t_meeting_id ON motion_change_recommendation_t (meeting_id, id);
 
 ALTER TABLE motion_comment_t ADD CONSTRAINT fk_motion_comment_t_motion_id_motion_t_id FOREIGN KEY(motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_comment_t_motion_id ON motion_comment_t (motion_id);
+CREATE INDEX idx_motion_comment_t_motion_id ON motion_comment_t (motion_id, id);
 ALTER TABLE motion_comment_t ADD CONSTRAINT fk_motion_comment_t_section_id_motion_comment_section_t_id FOREIGN KEY(section_id) REFERENCES motion_comment_section_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_comment_t_section_id ON motion_comment_t (section_id);
+CREATE INDEX idx_motion_comment_t_section_id ON motion_comment_t (section_id, id);
 ALTER TABLE motion_comment_t ADD CONSTRAINT fk_motion_comment_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_comment_t_meeting_id ON motion_comment_t (meeting_id);
+CREATE INDEX idx_motion_comment_t_meeting_id ON motion_comment_t (meeting_id, id);
 
 ALTER TABLE motion_comment_section_t ADD CONSTRAINT fk_motion_comment_section_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_comment_section_t_meeting_id ON motion_comment_section_t (meeting_id);
+CREATE INDEX idx_motion_comment_section_t_meeting_id ON motion_comment_section_t (meeting_id, id);
 
 ALTER TABLE motion_editor_t ADD CONSTRAINT fk_motion_editor_t_meeting_user_id_meeting_user_t_id FOREIGN KEY(meeting_user_id) REFERENCES meeting_user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_editor_t_meeting_user_id ON motion_editor_t (meeting_user_id);
+CREATE INDEX idx_motion_editor_t_meeting_user_id ON motion_editor_t (meeting_user_id, id);
 ALTER TABLE motion_editor_t ADD CONSTRAINT fk_motion_editor_t_motion_id_motion_t_id FOREIGN KEY(motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_editor_t_motion_id ON motion_editor_t (motion_id);
+CREATE INDEX idx_motion_editor_t_motion_id ON motion_editor_t (motion_id, id);
 ALTER TABLE motion_editor_t ADD CONSTRAINT fk_motion_editor_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_editor_t_meeting_id ON motion_editor_t (meeting_id);
+CREATE INDEX idx_motion_editor_t_meeting_id ON motion_editor_t (meeting_id, id);
 
 ALTER TABLE motion_state_t ADD CONSTRAINT fk_motion_state_t_submitter_withdraw_state_id_motion_state_t_id FOREIGN KEY(submitter_withdraw_state_id) REFERENCES motion_state_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_state_t_submitter_withdraw_state_id ON motion_state_t (submitter_withdraw_state_id);
+CREATE INDEX idx_motion_state_t_submitter_withdraw_state_id ON motion_state_t (submitter_withdraw_state_id, id);
 ALTER TABLE motion_state_t ADD CONSTRAINT fk_motion_state_t_workflow_id_motion_workflow_t_id FOREIGN KEY(workflow_id) REFERENCES motion_workflow_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_state_t_workflow_id ON motion_state_t (workflow_id);
+CREATE INDEX idx_motion_state_t_workflow_id ON motion_state_t (workflow_id, id);
 ALTER TABLE motion_state_t ADD CONSTRAINT fk_motion_state_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_state_t_meeting_id ON motion_state_t (meeting_id);
+CREATE INDEX idx_motion_state_t_meeting_id ON motion_state_t (meeting_id, id);
 
 ALTER TABLE motion_submitter_t ADD CONSTRAINT fk_motion_submitter_t_meeting_user_id_meeting_user_t_id FOREIGN KEY(meeting_user_id) REFERENCES meeting_user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_submitter_t_meeting_user_id ON motion_submitter_t (meeting_user_id);
+CREATE INDEX idx_motion_submitter_t_meeting_user_id ON motion_submitter_t (meeting_user_id, id);
 ALTER TABLE motion_submitter_t ADD CONSTRAINT fk_motion_submitter_t_motion_id_motion_t_id FOREIGN KEY(motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_submitter_t_motion_id ON motion_submitter_t (motion_id);
+CREATE INDEX idx_motion_submitter_t_motion_id ON motion_submitter_t (motion_id, id);
 ALTER TABLE motion_submitter_t ADD CONSTRAINT fk_motion_submitter_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_submitter_t_meeting_id ON motion_submitter_t (meeting_id);
+CREATE INDEX idx_motion_submitter_t_meeting_id ON motion_submitter_t (meeting_id, id);
 
 ALTER TABLE motion_supporter_t ADD CONSTRAINT fk_motion_supporter_t_meeting_user_id_meeting_user_t_id FOREIGN KEY(meeting_user_id) REFERENCES meeting_user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_supporter_t_meeting_user_id ON motion_supporter_t (meeting_user_id);
+CREATE INDEX idx_motion_supporter_t_meeting_user_id ON motion_supporter_t (meeting_user_id, id);
 ALTER TABLE motion_supporter_t ADD CONSTRAINT fk_motion_supporter_t_motion_id_motion_t_id FOREIGN KEY(motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_supporter_t_motion_id ON motion_supporter_t (motion_id);
+CREATE INDEX idx_motion_supporter_t_motion_id ON motion_supporter_t (motion_id, id);
 ALTER TABLE motion_supporter_t ADD CONSTRAINT fk_motion_supporter_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_supporter_t_meeting_id ON motion_supporter_t (meeting_id);
+CREATE INDEX idx_motion_supporter_t_meeting_id ON motion_supporter_t (meeting_id, id);
 
 ALTER TABLE motion_workflow_t ADD CONSTRAINT fk_motion_workflow_t_first_state_id_motion_state_t_id FOREIGN KEY(first_state_id) REFERENCES motion_state_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_workflow_t_first_state_id ON motion_workflow_t (first_state_id);
+CREATE INDEX idx_motion_workflow_t_first_state_id ON motion_workflow_t (first_state_id, id);
 ALTER TABLE motion_workflow_t ADD CONSTRAINT fk_motion_workflow_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_workflow_t_meeting_id ON motion_workflow_t (meeting_id);
+CREATE INDEX idx_motion_workflow_t_meeting_id ON motion_workflow_t (meeting_id, id);
 
 ALTER TABLE motion_working_group_speaker_t ADD CONSTRAINT fk_motion_working_group_speaker_t_meeting_user_id_meetinbc3a7bb FOREIGN KEY(meeting_user_id) REFERENCES meeting_user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_working_group_speaker_t_meeting_user_id ON motion_working_group_speaker_t (meeting_user_id);
+CREATE INDEX idx_motion_working_group_speaker_t_meeting_user_id ON motion_working_group_speaker_t (meeting_user_id, id);
 ALTER TABLE motion_working_group_speaker_t ADD CONSTRAINT fk_motion_working_group_speaker_t_motion_id_motion_t_id FOREIGN KEY(motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_working_group_speaker_t_motion_id ON motion_working_group_speaker_t (motion_id);
+CREATE INDEX idx_motion_working_group_speaker_t_motion_id ON motion_working_group_speaker_t (motion_id, id);
 ALTER TABLE motion_working_group_speaker_t ADD CONSTRAINT fk_motion_working_group_speaker_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_motion_working_group_speaker_t_meeting_id ON motion_working_group_speaker_t (meeting_id);
+CREATE INDEX idx_motion_working_group_speaker_t_meeting_id ON motion_working_group_speaker_t (meeting_id, id);
 
 ALTER TABLE option_t ADD CONSTRAINT fk_option_t_poll_id_poll_t_id FOREIGN KEY(poll_id) REFERENCES poll_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_option_t_poll_id ON option_t (poll_id);
+CREATE INDEX idx_option_t_poll_id ON option_t (poll_id, id);
 ALTER TABLE option_t ADD CONSTRAINT fk_option_t_content_object_id_motion_id_motion_t_id FOREIGN KEY(content_object_id_motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_option_t_content_object_id_motion_id ON option_t (content_object_id_motion_id);
+CREATE INDEX idx_option_t_content_object_id_motion_id ON option_t (content_object_id_motion_id, id);
 ALTER TABLE option_t ADD CONSTRAINT fk_option_t_content_object_id_user_id_user_t_id FOREIGN KEY(content_object_id_user_id) REFERENCES user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_option_t_content_object_id_user_id ON option_t (content_object_id_user_id);
+CREATE INDEX idx_option_t_content_object_id_user_id ON option_t (content_object_id_user_id, id);
 ALTER TABLE option_t ADD CONSTRAINT fk_option_t_content_object_id_poll_candidate_list_id_pold428251 FOREIGN KEY(content_object_id_poll_candidate_list_id) REFERENCES poll_candidate_list_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_option_t_content_object_id_poll_candidate_list_id ON option_t (content_object_id_poll_candidate_list_id);
+CREATE INDEX idx_option_t_content_object_id_poll_candidate_list_id ON option_t (content_object_id_poll_candidate_list_id, id);
 ALTER TABLE option_t ADD CONSTRAINT fk_option_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_option_t_meeting_id ON option_t (meeting_id);
+CREATE INDEX idx_option_t_meeting_id ON option_t (meeting_id, id);
 
 ALTER TABLE organization_t ADD CONSTRAINT fk_organization_t_theme_id_theme_t_id FOREIGN KEY(theme_id) REFERENCES theme_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_organization_t_theme_id ON organization_t (theme_id);
+CREATE INDEX idx_organization_t_theme_id ON organization_t (theme_id, id);
 
 ALTER TABLE organization_tag_t ADD CONSTRAINT fk_organization_tag_t_organization_id_organization_t_id FOREIGN KEY(organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_organization_tag_t_organization_id ON organization_tag_t (organization_id);
+CREATE INDEX idx_organization_tag_t_organization_id ON organization_tag_t (organization_id, id);
 
 ALTER TABLE personal_note_t ADD CONSTRAINT fk_personal_note_t_meeting_user_id_meeting_user_t_id FOREIGN KEY(meeting_user_id) REFERENCES meeting_user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_personal_note_t_meeting_user_id ON personal_note_t (meeting_user_id);
+CREATE INDEX idx_personal_note_t_meeting_user_id ON personal_note_t (meeting_user_id, id);
 ALTER TABLE personal_note_t ADD CONSTRAINT fk_personal_note_t_content_object_id_motion_id_motion_t_id FOREIGN KEY(content_object_id_motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_personal_note_t_content_object_id_motion_id ON personal_note_t (content_object_id_motion_id);
+CREATE INDEX idx_personal_note_t_content_object_id_motion_id ON personal_note_t (content_object_id_motion_id, id);
 ALTER TABLE personal_note_t ADD CONSTRAINT fk_personal_note_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_personal_note_t_meeting_id ON personal_note_t (meeting_id);
+CREATE INDEX idx_personal_note_t_meeting_id ON personal_note_t (meeting_id, id);
 
 ALTER TABLE point_of_order_category_t ADD CONSTRAINT fk_point_of_order_category_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_point_of_order_category_t_meeting_id ON point_of_order_category_t (meeting_id);
+CREATE INDEX idx_point_of_order_category_t_meeting_id ON point_of_order_category_t (meeting_id, id);
 
 ALTER TABLE poll_t ADD CONSTRAINT fk_poll_t_content_object_id_motion_id_motion_t_id FOREIGN KEY(content_object_id_motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_poll_t_content_object_id_motion_id ON poll_t (content_object_id_motion_id);
+CREATE INDEX idx_poll_t_content_object_id_motion_id ON poll_t (content_object_id_motion_id, id);
 ALTER TABLE poll_t ADD CONSTRAINT fk_poll_t_content_object_id_assignment_id_assignment_t_id FOREIGN KEY(content_object_id_assignment_id) REFERENCES assignment_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_poll_t_content_object_id_assignment_id ON poll_t (content_object_id_assignment_id);
+CREATE INDEX idx_poll_t_content_object_id_assignment_id ON poll_t (content_object_id_assignment_id, id);
 ALTER TABLE poll_t ADD CONSTRAINT fk_poll_t_content_object_id_topic_id_topic_t_id FOREIGN KEY(content_object_id_topic_id) REFERENCES topic_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_poll_t_content_object_id_topic_id ON poll_t (content_object_id_topic_id);
+CREATE INDEX idx_poll_t_content_object_id_topic_id ON poll_t (content_object_id_topic_id, id);
 ALTER TABLE poll_t ADD CONSTRAINT fk_poll_t_global_option_id_option_t_id FOREIGN KEY(global_option_id) REFERENCES option_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_poll_t_global_option_id ON poll_t (global_option_id);
+CREATE INDEX idx_poll_t_global_option_id ON poll_t (global_option_id, id);
 ALTER TABLE poll_t ADD CONSTRAINT fk_poll_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_poll_t_meeting_id ON poll_t (meeting_id);
+CREATE INDEX idx_poll_t_meeting_id ON poll_t (meeting_id, id);
 
 ALTER TABLE poll_candidate_t ADD CONSTRAINT fk_poll_candidate_t_poll_candidate_list_id_poll_candidat7fec070 FOREIGN KEY(poll_candidate_list_id) REFERENCES poll_candidate_list_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_poll_candidate_t_poll_candidate_list_id ON poll_candidate_t (poll_candidate_list_id);
+CREATE INDEX idx_poll_candidate_t_poll_candidate_list_id ON poll_candidate_t (poll_candidate_list_id, id);
 ALTER TABLE poll_candidate_t ADD CONSTRAINT fk_poll_candidate_t_user_id_user_t_id FOREIGN KEY(user_id) REFERENCES user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_poll_candidate_t_user_id ON poll_candidate_t (user_id);
+CREATE INDEX idx_poll_candidate_t_user_id ON poll_candidate_t (user_id, id);
 ALTER TABLE poll_candidate_t ADD CONSTRAINT fk_poll_candidate_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_poll_candidate_t_meeting_id ON poll_candidate_t (meeting_id);
+CREATE INDEX idx_poll_candidate_t_meeting_id ON poll_candidate_t (meeting_id, id);
 
 ALTER TABLE poll_candidate_list_t ADD CONSTRAINT fk_poll_candidate_list_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_poll_candidate_list_t_meeting_id ON poll_candidate_list_t (meeting_id);
+CREATE INDEX idx_poll_candidate_list_t_meeting_id ON poll_candidate_list_t (meeting_id, id);
 
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_current_projector_id_projector_t_id FOREIGN KEY(current_projector_id) REFERENCES projector_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_current_projector_id ON projection_t (current_projector_id);
+CREATE INDEX idx_projection_t_current_projector_id ON projection_t (current_projector_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_preview_projector_id_projector_t_id FOREIGN KEY(preview_projector_id) REFERENCES projector_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_preview_projector_id ON projection_t (preview_projector_id);
+CREATE INDEX idx_projection_t_preview_projector_id ON projection_t (preview_projector_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_history_projector_id_projector_t_id FOREIGN KEY(history_projector_id) REFERENCES projector_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_history_projector_id ON projection_t (history_projector_id);
+CREATE INDEX idx_projection_t_history_projector_id ON projection_t (history_projector_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_meeting_id_meeting_t_id FOREIGN KEY(content_object_id_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_meeting_id ON projection_t (content_object_id_meeting_id);
+CREATE INDEX idx_projection_t_content_object_id_meeting_id ON projection_t (content_object_id_meeting_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_motion_id_motion_t_id FOREIGN KEY(content_object_id_motion_id) REFERENCES motion_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_motion_id ON projection_t (content_object_id_motion_id);
+CREATE INDEX idx_projection_t_content_object_id_motion_id ON projection_t (content_object_id_motion_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_meeting_mediafile_id_m09270d6 FOREIGN KEY(content_object_id_meeting_mediafile_id) REFERENCES meeting_mediafile_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_meeting_mediafile_id ON projection_t (content_object_id_meeting_mediafile_id);
+CREATE INDEX idx_projection_t_content_object_id_meeting_mediafile_id ON projection_t (content_object_id_meeting_mediafile_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_list_of_speakers_id_li392b5e1 FOREIGN KEY(content_object_id_list_of_speakers_id) REFERENCES list_of_speakers_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_list_of_speakers_id ON projection_t (content_object_id_list_of_speakers_id);
+CREATE INDEX idx_projection_t_content_object_id_list_of_speakers_id ON projection_t (content_object_id_list_of_speakers_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_motion_block_id_motioncbb3c5b FOREIGN KEY(content_object_id_motion_block_id) REFERENCES motion_block_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_motion_block_id ON projection_t (content_object_id_motion_block_id);
+CREATE INDEX idx_projection_t_content_object_id_motion_block_id ON projection_t (content_object_id_motion_block_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_assignment_id_assignment_t_id FOREIGN KEY(content_object_id_assignment_id) REFERENCES assignment_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_assignment_id ON projection_t (content_object_id_assignment_id);
+CREATE INDEX idx_projection_t_content_object_id_assignment_id ON projection_t (content_object_id_assignment_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_agenda_item_id_agenda_bd5d814 FOREIGN KEY(content_object_id_agenda_item_id) REFERENCES agenda_item_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_agenda_item_id ON projection_t (content_object_id_agenda_item_id);
+CREATE INDEX idx_projection_t_content_object_id_agenda_item_id ON projection_t (content_object_id_agenda_item_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_topic_id_topic_t_id FOREIGN KEY(content_object_id_topic_id) REFERENCES topic_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_topic_id ON projection_t (content_object_id_topic_id);
+CREATE INDEX idx_projection_t_content_object_id_topic_id ON projection_t (content_object_id_topic_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_poll_id_poll_t_id FOREIGN KEY(content_object_id_poll_id) REFERENCES poll_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_poll_id ON projection_t (content_object_id_poll_id);
+CREATE INDEX idx_projection_t_content_object_id_poll_id ON projection_t (content_object_id_poll_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_projector_message_id_p5c0a05e FOREIGN KEY(content_object_id_projector_message_id) REFERENCES projector_message_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_projector_message_id ON projection_t (content_object_id_projector_message_id);
+CREATE INDEX idx_projection_t_content_object_id_projector_message_id ON projection_t (content_object_id_projector_message_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_content_object_id_projector_countdown_id1942f3a FOREIGN KEY(content_object_id_projector_countdown_id) REFERENCES projector_countdown_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_content_object_id_projector_countdown_id ON projection_t (content_object_id_projector_countdown_id);
+CREATE INDEX idx_projection_t_content_object_id_projector_countdown_id ON projection_t (content_object_id_projector_countdown_id, id);
 ALTER TABLE projection_t ADD CONSTRAINT fk_projection_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projection_t_meeting_id ON projection_t (meeting_id);
+CREATE INDEX idx_projection_t_meeting_id ON projection_t (meeting_id, id);
 
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_agenda_itemca4cc75 FOREIGN KEY(used_as_default_projector_for_agenda_item_list_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_agenda_ite41b5bd9 ON projector_t (used_as_default_projector_for_agenda_item_list_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_agenda_ite41b5bd9 ON projector_t (used_as_default_projector_for_agenda_item_list_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_topic_in_me0971ea7 FOREIGN KEY(used_as_default_projector_for_topic_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_topic_in_mab361e8 ON projector_t (used_as_default_projector_for_topic_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_topic_in_mab361e8 ON projector_t (used_as_default_projector_for_topic_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_list_of_spe619d36f FOREIGN KEY(used_as_default_projector_for_list_of_speakers_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_list_of_spb099704 ON projector_t (used_as_default_projector_for_list_of_speakers_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_list_of_spb099704 ON projector_t (used_as_default_projector_for_list_of_speakers_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_current_lose8cefef FOREIGN KEY(used_as_default_projector_for_current_los_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_current_locdd5b27 ON projector_t (used_as_default_projector_for_current_los_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_current_locdd5b27 ON projector_t (used_as_default_projector_for_current_los_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_motion_in_m3a0e1e4 FOREIGN KEY(used_as_default_projector_for_motion_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_motion_in_f66691f ON projector_t (used_as_default_projector_for_motion_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_motion_in_f66691f ON projector_t (used_as_default_projector_for_motion_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_amendment_i4b417bf FOREIGN KEY(used_as_default_projector_for_amendment_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_amendment_2235e12 ON projector_t (used_as_default_projector_for_amendment_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_amendment_2235e12 ON projector_t (used_as_default_projector_for_amendment_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_motion_blocd05a71e FOREIGN KEY(used_as_default_projector_for_motion_block_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_motion_blo7b0c3c8 ON projector_t (used_as_default_projector_for_motion_block_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_motion_blo7b0c3c8 ON projector_t (used_as_default_projector_for_motion_block_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_assignment_ddcffde FOREIGN KEY(used_as_default_projector_for_assignment_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_assignment78622ce ON projector_t (used_as_default_projector_for_assignment_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_assignment78622ce ON projector_t (used_as_default_projector_for_assignment_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_mediafile_i9b33fdb FOREIGN KEY(used_as_default_projector_for_mediafile_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_mediafile_1c31a99 ON projector_t (used_as_default_projector_for_mediafile_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_mediafile_1c31a99 ON projector_t (used_as_default_projector_for_mediafile_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_message_in_21dcbf0 FOREIGN KEY(used_as_default_projector_for_message_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_message_in339958e ON projector_t (used_as_default_projector_for_message_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_message_in339958e ON projector_t (used_as_default_projector_for_message_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_countdown_if9b333e FOREIGN KEY(used_as_default_projector_for_countdown_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_countdown_07665b4 ON projector_t (used_as_default_projector_for_countdown_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_countdown_07665b4 ON projector_t (used_as_default_projector_for_countdown_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_assignment_8b61ac6 FOREIGN KEY(used_as_default_projector_for_assignment_poll_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_assignment5a08584 ON projector_t (used_as_default_projector_for_assignment_poll_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_assignment5a08584 ON projector_t (used_as_default_projector_for_assignment_poll_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_motion_poll5bff78e FOREIGN KEY(used_as_default_projector_for_motion_poll_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_motion_pol0605aa8 ON projector_t (used_as_default_projector_for_motion_poll_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_motion_pol0605aa8 ON projector_t (used_as_default_projector_for_motion_poll_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_used_as_default_projector_for_poll_in_mee417a148 FOREIGN KEY(used_as_default_projector_for_poll_in_meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_used_as_default_projector_for_poll_in_me446bdba ON projector_t (used_as_default_projector_for_poll_in_meeting_id);
+CREATE INDEX idx_projector_t_used_as_default_projector_for_poll_in_me446bdba ON projector_t (used_as_default_projector_for_poll_in_meeting_id, id);
 ALTER TABLE projector_t ADD CONSTRAINT fk_projector_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_t_meeting_id ON projector_t (meeting_id);
+CREATE INDEX idx_projector_t_meeting_id ON projector_t (meeting_id, id);
 
 ALTER TABLE projector_countdown_t ADD CONSTRAINT fk_projector_countdown_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_countdown_t_meeting_id ON projector_countdown_t (meeting_id);
+CREATE INDEX idx_projector_countdown_t_meeting_id ON projector_countdown_t (meeting_id, id);
 
 ALTER TABLE projector_message_t ADD CONSTRAINT fk_projector_message_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_projector_message_t_meeting_id ON projector_message_t (meeting_id);
+CREATE INDEX idx_projector_message_t_meeting_id ON projector_message_t (meeting_id, id);
 
 ALTER TABLE speaker_t ADD CONSTRAINT fk_speaker_t_list_of_speakers_id_list_of_speakers_t_id FOREIGN KEY(list_of_speakers_id) REFERENCES list_of_speakers_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_speaker_t_list_of_speakers_id ON speaker_t (list_of_speakers_id);
+CREATE INDEX idx_speaker_t_list_of_speakers_id ON speaker_t (list_of_speakers_id, id);
 ALTER TABLE speaker_t ADD CONSTRAINT fk_speaker_t_structure_level_list_of_speakers_id_structu559f22d FOREIGN KEY(structure_level_list_of_speakers_id) REFERENCES structure_level_list_of_speakers_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_speaker_t_structure_level_list_of_speakers_id ON speaker_t (structure_level_list_of_speakers_id);
+CREATE INDEX idx_speaker_t_structure_level_list_of_speakers_id ON speaker_t (structure_level_list_of_speakers_id, id);
 ALTER TABLE speaker_t ADD CONSTRAINT fk_speaker_t_meeting_user_id_meeting_user_t_id FOREIGN KEY(meeting_user_id) REFERENCES meeting_user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_speaker_t_meeting_user_id ON speaker_t (meeting_user_id);
+CREATE INDEX idx_speaker_t_meeting_user_id ON speaker_t (meeting_user_id, id);
 ALTER TABLE speaker_t ADD CONSTRAINT fk_speaker_t_point_of_order_category_id_point_of_order_ce6dbc9a FOREIGN KEY(point_of_order_category_id) REFERENCES point_of_order_category_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_speaker_t_point_of_order_category_id ON speaker_t (point_of_order_category_id);
+CREATE INDEX idx_speaker_t_point_of_order_category_id ON speaker_t (point_of_order_category_id, id);
 ALTER TABLE speaker_t ADD CONSTRAINT fk_speaker_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_speaker_t_meeting_id ON speaker_t (meeting_id);
+CREATE INDEX idx_speaker_t_meeting_id ON speaker_t (meeting_id, id);
 
 ALTER TABLE structure_level_t ADD CONSTRAINT fk_structure_level_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_structure_level_t_meeting_id ON structure_level_t (meeting_id);
+CREATE INDEX idx_structure_level_t_meeting_id ON structure_level_t (meeting_id, id);
 
 ALTER TABLE structure_level_list_of_speakers_t ADD CONSTRAINT fk_structure_level_list_of_speakers_t_structure_level_idee3e20c FOREIGN KEY(structure_level_id) REFERENCES structure_level_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_structure_level_list_of_speakers_t_structure_level_id ON structure_level_list_of_speakers_t (structure_level_id);
+CREATE INDEX idx_structure_level_list_of_speakers_t_structure_level_id ON structure_level_list_of_speakers_t (structure_level_id, id);
 ALTER TABLE structure_level_list_of_speakers_t ADD CONSTRAINT fk_structure_level_list_of_speakers_t_list_of_speakers_idbd2794 FOREIGN KEY(list_of_speakers_id) REFERENCES list_of_speakers_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_structure_level_list_of_speakers_t_list_of_speakers_id ON structure_level_list_of_speakers_t (list_of_speakers_id);
+CREATE INDEX idx_structure_level_list_of_speakers_t_list_of_speakers_id ON structure_level_list_of_speakers_t (list_of_speakers_id, id);
 ALTER TABLE structure_level_list_of_speakers_t ADD CONSTRAINT fk_structure_level_list_of_speakers_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_structure_level_list_of_speakers_t_meeting_id ON structure_level_list_of_speakers_t (meeting_id);
+CREATE INDEX idx_structure_level_list_of_speakers_t_meeting_id ON structure_level_list_of_speakers_t (meeting_id, id);
 
 ALTER TABLE tag_t ADD CONSTRAINT fk_tag_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_tag_t_meeting_id ON tag_t (meeting_id);
+CREATE INDEX idx_tag_t_meeting_id ON tag_t (meeting_id, id);
 
 ALTER TABLE theme_t ADD CONSTRAINT fk_theme_t_organization_id_organization_t_id FOREIGN KEY(organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_theme_t_organization_id ON theme_t (organization_id);
+CREATE INDEX idx_theme_t_organization_id ON theme_t (organization_id, id);
 
 ALTER TABLE topic_t ADD CONSTRAINT fk_topic_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_topic_t_meeting_id ON topic_t (meeting_id);
+CREATE INDEX idx_topic_t_meeting_id ON topic_t (meeting_id, id);
 
 ALTER TABLE user_t ADD CONSTRAINT fk_user_t_gender_id_gender_t_id FOREIGN KEY(gender_id) REFERENCES gender_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_user_t_gender_id ON user_t (gender_id);
+CREATE INDEX idx_user_t_gender_id ON user_t (gender_id, id);
 ALTER TABLE user_t ADD CONSTRAINT fk_user_t_home_committee_id_committee_t_id FOREIGN KEY(home_committee_id) REFERENCES committee_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_user_t_home_committee_id ON user_t (home_committee_id);
+CREATE INDEX idx_user_t_home_committee_id ON user_t (home_committee_id, id);
 ALTER TABLE user_t ADD CONSTRAINT fk_user_t_organization_id_organization_t_id FOREIGN KEY(organization_id) REFERENCES organization_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_user_t_organization_id ON user_t (organization_id);
+CREATE INDEX idx_user_t_organization_id ON user_t (organization_id, id);
 
 ALTER TABLE vote_t ADD CONSTRAINT fk_vote_t_option_id_option_t_id FOREIGN KEY(option_id) REFERENCES option_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_vote_t_option_id ON vote_t (option_id);
+CREATE INDEX idx_vote_t_option_id ON vote_t (option_id, id);
 ALTER TABLE vote_t ADD CONSTRAINT fk_vote_t_user_id_user_t_id FOREIGN KEY(user_id) REFERENCES user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_vote_t_user_id ON vote_t (user_id);
+CREATE INDEX idx_vote_t_user_id ON vote_t (user_id, id);
 ALTER TABLE vote_t ADD CONSTRAINT fk_vote_t_delegated_user_id_user_t_id FOREIGN KEY(delegated_user_id) REFERENCES user_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_vote_t_delegated_user_id ON vote_t (delegated_user_id);
+CREATE INDEX idx_vote_t_delegated_user_id ON vote_t (delegated_user_id, id);
 ALTER TABLE vote_t ADD CONSTRAINT fk_vote_t_meeting_id_meeting_t_id FOREIGN KEY(meeting_id) REFERENCES meeting_t(id) INITIALLY DEFERRED;
-CREATE INDEX idx_vote_t_meeting_id ON vote_t (meeting_id);
+CREATE INDEX idx_vote_t_meeting_id ON vote_t (meeting_id, id);
 
 
 
@@ -3842,7 +4057,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_assignment_list_of_speakers_id AFTER INS
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('assignment', 'list_of_speakers_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_assignment_list_of_speakers_id AFTER UPDATE OF content_object_id_assignment_id OR DELETE ON list_of_speakers_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('assignment', 'list_of_speakers_id', 'list_of_speakers', 'content_object_id_assignment_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_1('assignment', 'list_of_speakers_id', 'list_of_speakers', 'content_object_id_assignment_id');
 
 
 -- definition trigger not null for motion.list_of_speakers_id against list_of_speakers.content_object_id_motion_id
@@ -3850,7 +4065,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_motion_list_of_speakers_id AFTER INSERT
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('motion', 'list_of_speakers_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_motion_list_of_speakers_id AFTER UPDATE OF content_object_id_motion_id OR DELETE ON list_of_speakers_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('motion', 'list_of_speakers_id', 'list_of_speakers', 'content_object_id_motion_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_1('motion', 'list_of_speakers_id', 'list_of_speakers', 'content_object_id_motion_id');
 
 
 -- definition trigger not null for motion_block.list_of_speakers_id against list_of_speakers.content_object_id_motion_block_id
@@ -3858,7 +4073,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_motion_block_list_of_speakers_id AFTER I
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('motion_block', 'list_of_speakers_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_motion_block_list_of_speakers_id AFTER UPDATE OF content_object_id_motion_block_id OR DELETE ON list_of_speakers_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('motion_block', 'list_of_speakers_id', 'list_of_speakers', 'content_object_id_motion_block_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_1('motion_block', 'list_of_speakers_id', 'list_of_speakers', 'content_object_id_motion_block_id');
 
 
 -- definition trigger not null for poll_candidate_list.option_id against option.content_object_id_poll_candidate_list_id
@@ -3866,7 +4081,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_poll_candidate_list_option_id AFTER INSE
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('poll_candidate_list', 'option_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_poll_candidate_list_option_id AFTER UPDATE OF content_object_id_poll_candidate_list_id OR DELETE ON option_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('poll_candidate_list', 'option_id', 'option', 'content_object_id_poll_candidate_list_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_1('poll_candidate_list', 'option_id', 'option', 'content_object_id_poll_candidate_list_id');
 
 
 -- definition trigger not null for topic.agenda_item_id against agenda_item.content_object_id_topic_id
@@ -3874,14 +4089,14 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_topic_agenda_item_id AFTER INSERT ON top
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('topic', 'agenda_item_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_topic_agenda_item_id AFTER UPDATE OF content_object_id_topic_id OR DELETE ON agenda_item_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('topic', 'agenda_item_id', 'agenda_item', 'content_object_id_topic_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_1('topic', 'agenda_item_id', 'agenda_item', 'content_object_id_topic_id');
 
 -- definition trigger not null for topic.list_of_speakers_id against list_of_speakers.content_object_id_topic_id
 CREATE CONSTRAINT TRIGGER tr_i_not_null_topic_list_of_speakers_id AFTER INSERT ON topic_t INITIALLY DEFERRED
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('topic', 'list_of_speakers_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_topic_list_of_speakers_id AFTER UPDATE OF content_object_id_topic_id OR DELETE ON list_of_speakers_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('topic', 'list_of_speakers_id', 'list_of_speakers', 'content_object_id_topic_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_1('topic', 'list_of_speakers_id', 'list_of_speakers', 'content_object_id_topic_id');
 
 
 
@@ -3892,7 +4107,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_agenda_item_li
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_agenda_item_list_ids', 'projector_t', 'used_as_default_projector_for_agenda_item_list_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_agenda_item_list_ids AFTER UPDATE OF used_as_default_projector_for_agenda_item_list_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_agenda_item_list_ids', 'projector_t', 'used_as_default_projector_for_agenda_item_list_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_agenda_item_list_ids', 'projector_t', 'used_as_default_projector_for_agenda_item_list_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_topic_ids against projector.used_as_default_projector_for_topic_in_meeting_id
@@ -3900,7 +4115,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_topic_ids AFTE
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_topic_ids', 'projector_t', 'used_as_default_projector_for_topic_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_topic_ids AFTER UPDATE OF used_as_default_projector_for_topic_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_topic_ids', 'projector_t', 'used_as_default_projector_for_topic_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_topic_ids', 'projector_t', 'used_as_default_projector_for_topic_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_list_of_speakers_ids against projector.used_as_default_projector_for_list_of_speakers_in_meeting_id
@@ -3908,7 +4123,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_list_of_speake
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_list_of_speakers_ids', 'projector_t', 'used_as_default_projector_for_list_of_speakers_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_list_of_speakers_ids AFTER UPDATE OF used_as_default_projector_for_list_of_speakers_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_list_of_speakers_ids', 'projector_t', 'used_as_default_projector_for_list_of_speakers_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_list_of_speakers_ids', 'projector_t', 'used_as_default_projector_for_list_of_speakers_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_current_los_ids against projector.used_as_default_projector_for_current_los_in_meeting_id
@@ -3916,7 +4131,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_current_los_id
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_current_los_ids', 'projector_t', 'used_as_default_projector_for_current_los_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_current_los_ids AFTER UPDATE OF used_as_default_projector_for_current_los_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_current_los_ids', 'projector_t', 'used_as_default_projector_for_current_los_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_current_los_ids', 'projector_t', 'used_as_default_projector_for_current_los_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_motion_ids against projector.used_as_default_projector_for_motion_in_meeting_id
@@ -3924,7 +4139,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_motion_ids AFT
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_motion_ids', 'projector_t', 'used_as_default_projector_for_motion_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_motion_ids AFTER UPDATE OF used_as_default_projector_for_motion_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_motion_ids', 'projector_t', 'used_as_default_projector_for_motion_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_motion_ids', 'projector_t', 'used_as_default_projector_for_motion_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_amendment_ids against projector.used_as_default_projector_for_amendment_in_meeting_id
@@ -3932,7 +4147,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_amendment_ids
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_amendment_ids', 'projector_t', 'used_as_default_projector_for_amendment_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_amendment_ids AFTER UPDATE OF used_as_default_projector_for_amendment_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_amendment_ids', 'projector_t', 'used_as_default_projector_for_amendment_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_amendment_ids', 'projector_t', 'used_as_default_projector_for_amendment_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_motion_block_ids against projector.used_as_default_projector_for_motion_block_in_meeting_id
@@ -3940,7 +4155,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_motion_block_i
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_motion_block_ids', 'projector_t', 'used_as_default_projector_for_motion_block_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_motion_block_ids AFTER UPDATE OF used_as_default_projector_for_motion_block_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_motion_block_ids', 'projector_t', 'used_as_default_projector_for_motion_block_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_motion_block_ids', 'projector_t', 'used_as_default_projector_for_motion_block_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_assignment_ids against projector.used_as_default_projector_for_assignment_in_meeting_id
@@ -3948,7 +4163,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_assignment_ids
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_assignment_ids', 'projector_t', 'used_as_default_projector_for_assignment_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_assignment_ids AFTER UPDATE OF used_as_default_projector_for_assignment_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_assignment_ids', 'projector_t', 'used_as_default_projector_for_assignment_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_assignment_ids', 'projector_t', 'used_as_default_projector_for_assignment_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_mediafile_ids against projector.used_as_default_projector_for_mediafile_in_meeting_id
@@ -3956,7 +4171,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_mediafile_ids
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_mediafile_ids', 'projector_t', 'used_as_default_projector_for_mediafile_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_mediafile_ids AFTER UPDATE OF used_as_default_projector_for_mediafile_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_mediafile_ids', 'projector_t', 'used_as_default_projector_for_mediafile_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_mediafile_ids', 'projector_t', 'used_as_default_projector_for_mediafile_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_message_ids against projector.used_as_default_projector_for_message_in_meeting_id
@@ -3964,7 +4179,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_message_ids AF
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_message_ids', 'projector_t', 'used_as_default_projector_for_message_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_message_ids AFTER UPDATE OF used_as_default_projector_for_message_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_message_ids', 'projector_t', 'used_as_default_projector_for_message_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_message_ids', 'projector_t', 'used_as_default_projector_for_message_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_countdown_ids against projector.used_as_default_projector_for_countdown_in_meeting_id
@@ -3972,7 +4187,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_countdown_ids
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_countdown_ids', 'projector_t', 'used_as_default_projector_for_countdown_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_countdown_ids AFTER UPDATE OF used_as_default_projector_for_countdown_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_countdown_ids', 'projector_t', 'used_as_default_projector_for_countdown_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_countdown_ids', 'projector_t', 'used_as_default_projector_for_countdown_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_assignment_poll_ids against projector.used_as_default_projector_for_assignment_poll_in_meeting_id
@@ -3980,7 +4195,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_assignment_pol
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_assignment_poll_ids', 'projector_t', 'used_as_default_projector_for_assignment_poll_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_assignment_poll_ids AFTER UPDATE OF used_as_default_projector_for_assignment_poll_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_assignment_poll_ids', 'projector_t', 'used_as_default_projector_for_assignment_poll_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_assignment_poll_ids', 'projector_t', 'used_as_default_projector_for_assignment_poll_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_motion_poll_ids against projector.used_as_default_projector_for_motion_poll_in_meeting_id
@@ -3988,7 +4203,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_motion_poll_id
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_motion_poll_ids', 'projector_t', 'used_as_default_projector_for_motion_poll_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_motion_poll_ids AFTER UPDATE OF used_as_default_projector_for_motion_poll_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_motion_poll_ids', 'projector_t', 'used_as_default_projector_for_motion_poll_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_motion_poll_ids', 'projector_t', 'used_as_default_projector_for_motion_poll_in_meeting_id');
 
 
 -- definition trigger not null for meeting.default_projector_poll_ids against projector.used_as_default_projector_for_poll_in_meeting_id
@@ -3996,7 +4211,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_default_projector_poll_ids AFTER
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_poll_ids', 'projector_t', 'used_as_default_projector_for_poll_in_meeting_id');
 
 CREATE CONSTRAINT TRIGGER tr_ud_not_null_meeting_default_projector_poll_ids AFTER UPDATE OF used_as_default_projector_for_poll_in_meeting_id OR DELETE ON projector_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_poll_ids', 'projector_t', 'used_as_default_projector_for_poll_in_meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_1_n('meeting_t', 'default_projector_poll_ids', 'projector_t', 'used_as_default_projector_for_poll_in_meeting_id');
 
 
 
@@ -4008,7 +4223,7 @@ CREATE CONSTRAINT TRIGGER tr_i_not_null_meeting_user_group_ids AFTER INSERT ON m
 FOR EACH ROW EXECUTE FUNCTION check_not_null_for_n_m('nm_group_meeting_user_ids_meeting_user_t', 'meeting_user_t', 'group_ids', 'meeting_user_id');
 
 CREATE CONSTRAINT TRIGGER tr_d_not_null_meeting_user_group_ids AFTER DELETE ON nm_group_meeting_user_ids_meeting_user_t INITIALLY DEFERRED
-FOR EACH ROW EXECUTE FUNCTION check_not_null_for_n_m('nm_group_meeting_user_ids_meeting_user_t', 'meeting_user_t', 'group_ids', 'meeting_user_id', 'group_id', 'group', 'meeting_user_ids');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION check_not_null_for_n_m('nm_group_meeting_user_ids_meeting_user_t', 'meeting_user_t', 'group_ids', 'meeting_user_id', 'group_id', 'group', 'meeting_user_ids');
 
 
 
@@ -4397,850 +4612,980 @@ FOR EACH ROW EXECUTE FUNCTION check_unique_ids_pair('identical_motion_id');
 
 
 -- Create triggers for notify
-CREATE TRIGGER tr_log_action_worker AFTER INSERT OR UPDATE OR DELETE ON action_worker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('action_worker');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON action_worker_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_agenda_item AFTER INSERT OR UPDATE OR DELETE ON agenda_item_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('agenda_item');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON agenda_item_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-
-CREATE TRIGGER tr_log_motion_content_object_id_motion_id AFTER INSERT OR UPDATE OF content_object_id_motion_id OR DELETE ON agenda_item_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','content_object_id_motion_id','agenda_item_id');
-
-CREATE TRIGGER tr_log_motion_block_content_object_id_motion_block_id AFTER INSERT OR UPDATE OF content_object_id_motion_block_id OR DELETE ON agenda_item_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_block','content_object_id_motion_block_id','agenda_item_id');
-
-CREATE TRIGGER tr_log_assignment_content_object_id_assignment_id AFTER INSERT OR UPDATE OF content_object_id_assignment_id OR DELETE ON agenda_item_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('assignment','content_object_id_assignment_id','agenda_item_id');
-
-CREATE TRIGGER tr_log_topic_content_object_id_topic_id AFTER INSERT OR UPDATE OF content_object_id_topic_id OR DELETE ON agenda_item_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('topic','content_object_id_topic_id','agenda_item_id');
-CREATE TRIGGER tr_log_agenda_item_t_parent_id AFTER INSERT OR UPDATE OF parent_id OR DELETE ON agenda_item_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('agenda_item', 'parent_id', 'child_ids');
-CREATE TRIGGER tr_log_agenda_item_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON agenda_item_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'agenda_item_ids');
-
-CREATE TRIGGER tr_log_assignment AFTER INSERT OR UPDATE OR DELETE ON assignment_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('assignment');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON assignment_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_assignment_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON assignment_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'assignment_ids');
-
-CREATE TRIGGER tr_log_assignment_candidate AFTER INSERT OR UPDATE OR DELETE ON assignment_candidate_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('assignment_candidate');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON assignment_candidate_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_assignment_candidate_t_assignment_id AFTER INSERT OR UPDATE OF assignment_id OR DELETE ON assignment_candidate_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('assignment', 'assignment_id', 'candidate_ids');
-CREATE TRIGGER tr_log_assignment_candidate_t_meeting_user_id AFTER INSERT OR UPDATE OF meeting_user_id OR DELETE ON assignment_candidate_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user', 'meeting_user_id', 'assignment_candidate_ids');
-CREATE TRIGGER tr_log_assignment_candidate_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON assignment_candidate_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'assignment_candidate_ids');
-
-CREATE TRIGGER tr_log_chat_group AFTER INSERT OR UPDATE OR DELETE ON chat_group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('chat_group');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON chat_group_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-
-CREATE TRIGGER tr_log_nm_chat_group_read_group_ids_group_t AFTER INSERT OR UPDATE OR DELETE ON nm_chat_group_read_group_ids_group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('chat_group','chat_group_id','read_group_ids','group','group_id','read_chat_group_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_chat_group_read_group_ids_group_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_nm_chat_group_write_group_ids_group_t AFTER INSERT OR UPDATE OR DELETE ON nm_chat_group_write_group_ids_group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('chat_group','chat_group_id','write_group_ids','group','group_id','write_chat_group_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_chat_group_write_group_ids_group_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_chat_group_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON chat_group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'chat_group_ids');
-
-CREATE TRIGGER tr_log_chat_message AFTER INSERT OR UPDATE OR DELETE ON chat_message_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('chat_message');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON chat_message_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_chat_message_t_meeting_user_id AFTER INSERT OR UPDATE OF meeting_user_id OR DELETE ON chat_message_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user', 'meeting_user_id', 'chat_message_ids');
-CREATE TRIGGER tr_log_chat_message_t_chat_group_id AFTER INSERT OR UPDATE OF chat_group_id OR DELETE ON chat_message_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('chat_group', 'chat_group_id', 'chat_message_ids');
-CREATE TRIGGER tr_log_chat_message_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON chat_message_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'chat_message_ids');
-
-CREATE TRIGGER tr_log_committee AFTER INSERT OR UPDATE OR DELETE ON committee_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('committee');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON committee_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_committee_t_default_meeting_id AFTER INSERT OR UPDATE OF default_meeting_id OR DELETE ON committee_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'default_meeting_id', 'default_meeting_for_committee_id');
+CREATE TRIGGER tr_log_i_action_worker AFTER INSERT ON action_worker_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('action_worker');
+CREATE TRIGGER tr_log_u_action_worker AFTER UPDATE ON action_worker_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('action_worker');
+CREATE TRIGGER tr_log_d_action_worker AFTER DELETE ON action_worker_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('action_worker');
+
+CREATE TRIGGER tr_log_i_agenda_item AFTER INSERT ON agenda_item_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('agenda_item', 'motion', 'content_object_id_motion_id', 'agenda_item_id', 'id', 'motion_block', 'content_object_id_motion_block_id', 'agenda_item_id', 'id', 'assignment', 'content_object_id_assignment_id', 'agenda_item_id', 'id', 'topic', 'content_object_id_topic_id', 'agenda_item_id', 'id', 'agenda_item', 'parent_id', 'child_ids', 'id', 'meeting', 'meeting_id', 'agenda_item_ids', 'id');
+CREATE TRIGGER tr_log_u_agenda_item AFTER UPDATE ON agenda_item_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('agenda_item', 'motion', 'content_object_id_motion_id', 'agenda_item_id', 'id', 'motion_block', 'content_object_id_motion_block_id', 'agenda_item_id', 'id', 'assignment', 'content_object_id_assignment_id', 'agenda_item_id', 'id', 'topic', 'content_object_id_topic_id', 'agenda_item_id', 'id', 'agenda_item', 'parent_id', 'child_ids', 'id', 'meeting', 'meeting_id', 'agenda_item_ids', 'id');
+CREATE TRIGGER tr_log_d_agenda_item AFTER DELETE ON agenda_item_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('agenda_item', 'motion', 'content_object_id_motion_id', 'agenda_item_id', 'id', 'motion_block', 'content_object_id_motion_block_id', 'agenda_item_id', 'id', 'assignment', 'content_object_id_assignment_id', 'agenda_item_id', 'id', 'topic', 'content_object_id_topic_id', 'agenda_item_id', 'id', 'agenda_item', 'parent_id', 'child_ids', 'id', 'meeting', 'meeting_id', 'agenda_item_ids', 'id');
+
+CREATE TRIGGER tr_log_i_assignment AFTER INSERT ON assignment_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('assignment', 'meeting', 'meeting_id', 'assignment_ids', 'id');
+CREATE TRIGGER tr_log_u_assignment AFTER UPDATE ON assignment_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('assignment', 'meeting', 'meeting_id', 'assignment_ids', 'id');
+CREATE TRIGGER tr_log_d_assignment AFTER DELETE ON assignment_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('assignment', 'meeting', 'meeting_id', 'assignment_ids', 'id');
+
+CREATE TRIGGER tr_log_i_assignment_candidate AFTER INSERT ON assignment_candidate_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('assignment_candidate', 'assignment', 'assignment_id', 'candidate_ids', 'id', 'meeting_user', 'meeting_user_id', 'assignment_candidate_ids', 'id', 'meeting', 'meeting_id', 'assignment_candidate_ids', 'id');
+CREATE TRIGGER tr_log_u_assignment_candidate AFTER UPDATE ON assignment_candidate_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('assignment_candidate', 'assignment', 'assignment_id', 'candidate_ids', 'id', 'meeting_user', 'meeting_user_id', 'assignment_candidate_ids', 'id', 'meeting', 'meeting_id', 'assignment_candidate_ids', 'id');
+CREATE TRIGGER tr_log_d_assignment_candidate AFTER DELETE ON assignment_candidate_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('assignment_candidate', 'assignment', 'assignment_id', 'candidate_ids', 'id', 'meeting_user', 'meeting_user_id', 'assignment_candidate_ids', 'id', 'meeting', 'meeting_id', 'assignment_candidate_ids', 'id');
+
+CREATE TRIGGER tr_log_i_chat_group AFTER INSERT ON chat_group_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('chat_group', 'meeting', 'meeting_id', 'chat_group_ids', 'id');
+CREATE TRIGGER tr_log_u_chat_group AFTER UPDATE ON chat_group_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('chat_group', 'meeting', 'meeting_id', 'chat_group_ids', 'id');
+CREATE TRIGGER tr_log_d_chat_group AFTER DELETE ON chat_group_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('chat_group', 'meeting', 'meeting_id', 'chat_group_ids', 'id');
+
+
+CREATE TRIGGER tr_log_i_nm_chat_group_read_group_ids_group_t AFTER INSERT ON nm_chat_group_read_group_ids_group_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'chat_group', 'chat_group_id', 'read_group_ids', 'group_id', 'group', 'group_id', 'read_chat_group_ids', 'chat_group_id');
+CREATE TRIGGER tr_log_u_nm_chat_group_read_group_ids_group_t AFTER UPDATE ON nm_chat_group_read_group_ids_group_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'chat_group', 'chat_group_id', 'read_group_ids', 'group_id', 'group', 'group_id', 'read_chat_group_ids', 'chat_group_id');
+CREATE TRIGGER tr_log_d_nm_chat_group_read_group_ids_group_t AFTER DELETE ON nm_chat_group_read_group_ids_group_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'chat_group', 'chat_group_id', 'read_group_ids', 'group_id', 'group', 'group_id', 'read_chat_group_ids', 'chat_group_id');
+
+CREATE TRIGGER tr_log_i_nm_chat_group_write_group_ids_group_t AFTER INSERT ON nm_chat_group_write_group_ids_group_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'chat_group', 'chat_group_id', 'write_group_ids', 'group_id', 'group', 'group_id', 'write_chat_group_ids', 'chat_group_id');
+CREATE TRIGGER tr_log_u_nm_chat_group_write_group_ids_group_t AFTER UPDATE ON nm_chat_group_write_group_ids_group_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'chat_group', 'chat_group_id', 'write_group_ids', 'group_id', 'group', 'group_id', 'write_chat_group_ids', 'chat_group_id');
+CREATE TRIGGER tr_log_d_nm_chat_group_write_group_ids_group_t AFTER DELETE ON nm_chat_group_write_group_ids_group_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'chat_group', 'chat_group_id', 'write_group_ids', 'group_id', 'group', 'group_id', 'write_chat_group_ids', 'chat_group_id');
+
+CREATE TRIGGER tr_log_i_chat_message AFTER INSERT ON chat_message_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('chat_message', 'meeting_user', 'meeting_user_id', 'chat_message_ids', 'id', 'chat_group', 'chat_group_id', 'chat_message_ids', 'id', 'meeting', 'meeting_id', 'chat_message_ids', 'id');
+CREATE TRIGGER tr_log_u_chat_message AFTER UPDATE ON chat_message_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('chat_message', 'meeting_user', 'meeting_user_id', 'chat_message_ids', 'id', 'chat_group', 'chat_group_id', 'chat_message_ids', 'id', 'meeting', 'meeting_id', 'chat_message_ids', 'id');
+CREATE TRIGGER tr_log_d_chat_message AFTER DELETE ON chat_message_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('chat_message', 'meeting_user', 'meeting_user_id', 'chat_message_ids', 'id', 'chat_group', 'chat_group_id', 'chat_message_ids', 'id', 'meeting', 'meeting_id', 'chat_message_ids', 'id');
+
+CREATE TRIGGER tr_log_i_committee AFTER INSERT ON committee_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('committee', 'meeting', 'default_meeting_id', 'default_meeting_for_committee_id', 'id', 'committee', 'parent_id', 'child_ids', 'id', 'organization', 'organization_id', 'committee_ids', 'id');
+CREATE TRIGGER tr_log_u_committee AFTER UPDATE ON committee_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('committee', 'meeting', 'default_meeting_id', 'default_meeting_for_committee_id', 'id', 'committee', 'parent_id', 'child_ids', 'id', 'organization', 'organization_id', 'committee_ids', 'id');
+CREATE TRIGGER tr_log_d_committee AFTER DELETE ON committee_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('committee', 'meeting', 'default_meeting_id', 'default_meeting_for_committee_id', 'id', 'committee', 'parent_id', 'child_ids', 'id', 'organization', 'organization_id', 'committee_ids', 'id');
+
 
 CREATE TRIGGER tr_log_i_committee_user_ids_from_meeting_user_t BEFORE INSERT ON meeting_user_t
 FOR EACH ROW EXECUTE FUNCTION log_iu_modified_calculated_id_array_field('committee', '', 'SELECT committee_id FROM meeting_t WHERE id = ($1).meeting_id', 'user_ids', 'user_id', '');
 CREATE TRIGGER tr_log_d_committee_user_ids_from_meeting_user_t AFTER DELETE ON meeting_user_t
-FOR EACH ROW EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('committee', '', 'SELECT committee_id FROM meeting_t WHERE id = ($1).meeting_id', 'user_ids', 'user_id', '');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('committee', '', 'SELECT committee_id FROM meeting_t WHERE id = ($1).meeting_id', 'user_ids', 'user_id', '');
 CREATE TRIGGER tr_log_i_committee_user_ids_from_nm_committee_manager_idd4a2a53 BEFORE INSERT ON nm_committee_manager_ids_user_t
 FOR EACH ROW EXECUTE FUNCTION log_iu_modified_calculated_id_array_field('committee', 'committee_id', '', 'user_ids', 'user_id', '');
 CREATE TRIGGER tr_log_d_committee_user_ids_from_nm_committee_manager_id82dfd00 AFTER DELETE ON nm_committee_manager_ids_user_t
-FOR EACH ROW EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('committee', 'committee_id', '', 'user_ids', 'user_id', '');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('committee', 'committee_id', '', 'user_ids', 'user_id', '');
 CREATE TRIGGER tr_log_iu_committee_user_ids_from_user_t BEFORE INSERT OR UPDATE OF home_committee_id ON user_t
 FOR EACH ROW EXECUTE FUNCTION log_iu_modified_calculated_id_array_field('committee', 'home_committee_id', '', 'user_ids', 'id', '');
 CREATE TRIGGER tr_log_ud_committee_user_ids_from_user_t AFTER UPDATE OF home_committee_id OR DELETE ON user_t
-FOR EACH ROW EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('committee', 'home_committee_id', '', 'user_ids', 'id', '');
-
-
-CREATE TRIGGER tr_log_nm_committee_manager_ids_user_t AFTER INSERT OR UPDATE OR DELETE ON nm_committee_manager_ids_user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('committee','committee_id','manager_ids','user','user_id','committee_management_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_committee_manager_ids_user_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_committee_t_parent_id AFTER INSERT OR UPDATE OF parent_id OR DELETE ON committee_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('committee', 'parent_id', 'child_ids');
-
-CREATE TRIGGER tr_log_nm_committee_all_child_ids_committee_t AFTER INSERT OR UPDATE OR DELETE ON nm_committee_all_child_ids_committee_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('committee','all_parent_id','all_child_ids','committee','all_child_id','all_parent_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_committee_all_child_ids_committee_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_nm_committee_forward_to_committee_ids_committee_t AFTER INSERT OR UPDATE OR DELETE ON nm_committee_forward_to_committee_ids_committee_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('committee','receive_forwardings_from_committee_id','forward_to_committee_ids','committee','forward_to_committee_id','receive_forwardings_from_committee_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_committee_forward_to_committee_ids_committee_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_committee_t_organization_id AFTER INSERT OR UPDATE OF organization_id OR DELETE ON committee_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization', 'organization_id', 'committee_ids');
-
-CREATE TRIGGER tr_log_gender AFTER INSERT OR UPDATE OR DELETE ON gender_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('gender');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON gender_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_gender_t_organization_id AFTER INSERT OR UPDATE OF organization_id OR DELETE ON gender_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization', 'organization_id', 'gender_ids');
-
-CREATE TRIGGER tr_log_group AFTER INSERT OR UPDATE OR DELETE ON group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('group');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON group_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-
-CREATE TRIGGER tr_log_nm_group_meeting_user_ids_meeting_user_t AFTER INSERT OR UPDATE OR DELETE ON nm_group_meeting_user_ids_meeting_user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('group','group_id','meeting_user_ids','meeting_user','meeting_user_id','group_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_group_meeting_user_ids_meeting_user_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_nm_group_mmagi_meeting_mediafile_t AFTER INSERT OR UPDATE OR DELETE ON nm_group_mmagi_meeting_mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('group','group_id','meeting_mediafile_access_group_ids','meeting_mediafile','meeting_mediafile_id','access_group_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_group_mmagi_meeting_mediafile_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_nm_group_mmiagi_meeting_mediafile_t AFTER INSERT OR UPDATE OR DELETE ON nm_group_mmiagi_meeting_mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('group','group_id','meeting_mediafile_inherited_access_group_ids','meeting_mediafile','meeting_mediafile_id','inherited_access_group_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_group_mmiagi_meeting_mediafile_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_nm_group_read_comment_section_ids_motion_comment_6e42c77 AFTER INSERT OR UPDATE OR DELETE ON nm_group_read_comment_section_ids_motion_comment_section_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('group','group_id','read_comment_section_ids','motion_comment_section','motion_comment_section_id','read_group_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_group_read_comment_section_ids_motion_comment_section_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_nm_group_write_comment_section_ids_motion_commentb627a2e AFTER INSERT OR UPDATE OR DELETE ON nm_group_write_comment_section_ids_motion_comment_section_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('group','group_id','write_comment_section_ids','motion_comment_section','motion_comment_section_id','write_group_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_group_write_comment_section_ids_motion_comment_section_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_nm_group_poll_ids_poll_t AFTER INSERT OR UPDATE OR DELETE ON nm_group_poll_ids_poll_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('group','group_id','poll_ids','poll','poll_id','entitled_group_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_group_poll_ids_poll_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_group_t_used_as_motion_poll_default_id AFTER INSERT OR UPDATE OF used_as_motion_poll_default_id OR DELETE ON group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_motion_poll_default_id', 'motion_poll_default_group_ids');
-CREATE TRIGGER tr_log_group_t_used_as_assignment_poll_default_id AFTER INSERT OR UPDATE OF used_as_assignment_poll_default_id OR DELETE ON group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_assignment_poll_default_id', 'assignment_poll_default_group_ids');
-CREATE TRIGGER tr_log_group_t_used_as_topic_poll_default_id AFTER INSERT OR UPDATE OF used_as_topic_poll_default_id OR DELETE ON group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_topic_poll_default_id', 'topic_poll_default_group_ids');
-CREATE TRIGGER tr_log_group_t_used_as_poll_default_id AFTER INSERT OR UPDATE OF used_as_poll_default_id OR DELETE ON group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_poll_default_id', 'poll_default_group_ids');
-CREATE TRIGGER tr_log_group_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON group_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'group_ids');
-
-CREATE TRIGGER tr_log_history_entry AFTER INSERT OR UPDATE OR DELETE ON history_entry_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('history_entry');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON history_entry_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-
-CREATE TRIGGER tr_log_user_model_id_user_id AFTER INSERT OR UPDATE OF model_id_user_id OR DELETE ON history_entry_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('user','model_id_user_id','history_entry_ids');
-
-CREATE TRIGGER tr_log_motion_model_id_motion_id AFTER INSERT OR UPDATE OF model_id_motion_id OR DELETE ON history_entry_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','model_id_motion_id','history_entry_ids');
-
-CREATE TRIGGER tr_log_assignment_model_id_assignment_id AFTER INSERT OR UPDATE OF model_id_assignment_id OR DELETE ON history_entry_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('assignment','model_id_assignment_id','history_entry_ids');
-CREATE TRIGGER tr_log_history_entry_t_position_id AFTER INSERT OR UPDATE OF position_id OR DELETE ON history_entry_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('history_position', 'position_id', 'entry_ids');
-CREATE TRIGGER tr_log_history_entry_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON history_entry_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'relevant_history_entry_ids');
-
-CREATE TRIGGER tr_log_history_position AFTER INSERT OR UPDATE OR DELETE ON history_position_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('history_position');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON history_position_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_history_position_t_user_id AFTER INSERT OR UPDATE OF user_id OR DELETE ON history_position_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('user', 'user_id', 'history_position_ids');
-
-CREATE TRIGGER tr_log_import_preview AFTER INSERT OR UPDATE OR DELETE ON import_preview_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('import_preview');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON import_preview_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_list_of_speakers AFTER INSERT OR UPDATE OR DELETE ON list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('list_of_speakers');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON list_of_speakers_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-
-CREATE TRIGGER tr_log_motion_content_object_id_motion_id AFTER INSERT OR UPDATE OF content_object_id_motion_id OR DELETE ON list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','content_object_id_motion_id','list_of_speakers_id');
-
-CREATE TRIGGER tr_log_motion_block_content_object_id_motion_block_id AFTER INSERT OR UPDATE OF content_object_id_motion_block_id OR DELETE ON list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_block','content_object_id_motion_block_id','list_of_speakers_id');
-
-CREATE TRIGGER tr_log_assignment_content_object_id_assignment_id AFTER INSERT OR UPDATE OF content_object_id_assignment_id OR DELETE ON list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('assignment','content_object_id_assignment_id','list_of_speakers_id');
-
-CREATE TRIGGER tr_log_topic_content_object_id_topic_id AFTER INSERT OR UPDATE OF content_object_id_topic_id OR DELETE ON list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('topic','content_object_id_topic_id','list_of_speakers_id');
-
-CREATE TRIGGER tr_log_meeting_mediafile_content_object_id_meeting_mediafile_id AFTER INSERT OR UPDATE OF content_object_id_meeting_mediafile_id OR DELETE ON list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile','content_object_id_meeting_mediafile_id','list_of_speakers_id');
-CREATE TRIGGER tr_log_list_of_speakers_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'list_of_speakers_ids');
-
-CREATE TRIGGER tr_log_mediafile AFTER INSERT OR UPDATE OR DELETE ON mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('mediafile');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON mediafile_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_mediafile_t_published_to_meetings_in_organization_id AFTER INSERT OR UPDATE OF published_to_meetings_in_organization_id OR DELETE ON mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization', 'published_to_meetings_in_organization_id', 'published_mediafile_ids');
-CREATE TRIGGER tr_log_mediafile_t_parent_id AFTER INSERT OR UPDATE OF parent_id OR DELETE ON mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('mediafile', 'parent_id', 'child_ids');
-
-CREATE TRIGGER tr_log_meeting_owner_id_meeting_id AFTER INSERT OR UPDATE OF owner_id_meeting_id OR DELETE ON mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting','owner_id_meeting_id','mediafile_ids');
-
-CREATE TRIGGER tr_log_organization_owner_id_organization_id AFTER INSERT OR UPDATE OF owner_id_organization_id OR DELETE ON mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization','owner_id_organization_id','mediafile_ids');
-
-CREATE TRIGGER tr_log_meeting AFTER INSERT OR UPDATE OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('meeting');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON meeting_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_meeting_t_is_active_in_organization_id AFTER INSERT OR UPDATE OF is_active_in_organization_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization', 'is_active_in_organization_id', 'active_meeting_ids');
-CREATE TRIGGER tr_log_meeting_t_is_archived_in_organization_id AFTER INSERT OR UPDATE OF is_archived_in_organization_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization', 'is_archived_in_organization_id', 'archived_meeting_ids');
-CREATE TRIGGER tr_log_meeting_t_template_for_organization_id AFTER INSERT OR UPDATE OF template_for_organization_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization', 'template_for_organization_id', 'template_meeting_ids');
-CREATE TRIGGER tr_log_meeting_t_motions_default_workflow_id AFTER INSERT OR UPDATE OF motions_default_workflow_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_workflow', 'motions_default_workflow_id', 'default_workflow_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_motions_default_amendment_workflow_id AFTER INSERT OR UPDATE OF motions_default_amendment_workflow_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_workflow', 'motions_default_amendment_workflow_id', 'default_amendment_workflow_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_logo_projector_main_id AFTER INSERT OR UPDATE OF logo_projector_main_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'logo_projector_main_id', 'used_as_logo_projector_main_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_logo_projector_header_id AFTER INSERT OR UPDATE OF logo_projector_header_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'logo_projector_header_id', 'used_as_logo_projector_header_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_logo_web_header_id AFTER INSERT OR UPDATE OF logo_web_header_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'logo_web_header_id', 'used_as_logo_web_header_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_logo_pdf_header_l_id AFTER INSERT OR UPDATE OF logo_pdf_header_l_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'logo_pdf_header_l_id', 'used_as_logo_pdf_header_l_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_logo_pdf_header_r_id AFTER INSERT OR UPDATE OF logo_pdf_header_r_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'logo_pdf_header_r_id', 'used_as_logo_pdf_header_r_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_logo_pdf_footer_l_id AFTER INSERT OR UPDATE OF logo_pdf_footer_l_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'logo_pdf_footer_l_id', 'used_as_logo_pdf_footer_l_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_logo_pdf_footer_r_id AFTER INSERT OR UPDATE OF logo_pdf_footer_r_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'logo_pdf_footer_r_id', 'used_as_logo_pdf_footer_r_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_logo_pdf_ballot_paper_id AFTER INSERT OR UPDATE OF logo_pdf_ballot_paper_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'logo_pdf_ballot_paper_id', 'used_as_logo_pdf_ballot_paper_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_font_regular_id AFTER INSERT OR UPDATE OF font_regular_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'font_regular_id', 'used_as_font_regular_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_font_italic_id AFTER INSERT OR UPDATE OF font_italic_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'font_italic_id', 'used_as_font_italic_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_font_bold_id AFTER INSERT OR UPDATE OF font_bold_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'font_bold_id', 'used_as_font_bold_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_font_bold_italic_id AFTER INSERT OR UPDATE OF font_bold_italic_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'font_bold_italic_id', 'used_as_font_bold_italic_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_font_monospace_id AFTER INSERT OR UPDATE OF font_monospace_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'font_monospace_id', 'used_as_font_monospace_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_font_chyron_speaker_name_id AFTER INSERT OR UPDATE OF font_chyron_speaker_name_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'font_chyron_speaker_name_id', 'used_as_font_chyron_speaker_name_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_font_projector_h1_id AFTER INSERT OR UPDATE OF font_projector_h1_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'font_projector_h1_id', 'used_as_font_projector_h1_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_font_projector_h2_id AFTER INSERT OR UPDATE OF font_projector_h2_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile', 'font_projector_h2_id', 'used_as_font_projector_h2_in_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_committee_id AFTER INSERT OR UPDATE OF committee_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('committee', 'committee_id', 'meeting_ids');
-
-CREATE TRIGGER tr_log_nm_meeting_present_user_ids_user_t AFTER INSERT OR UPDATE OR DELETE ON nm_meeting_present_user_ids_user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting','meeting_id','present_user_ids','user','user_id','is_present_in_meeting_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_meeting_present_user_ids_user_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('committee', 'home_committee_id', '', 'user_ids', 'id', '');
+
+
+CREATE TRIGGER tr_log_i_nm_committee_manager_ids_user_t AFTER INSERT ON nm_committee_manager_ids_user_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'committee', 'committee_id', 'manager_ids', 'user_id', 'user', 'user_id', 'committee_management_ids', 'committee_id');
+CREATE TRIGGER tr_log_u_nm_committee_manager_ids_user_t AFTER UPDATE ON nm_committee_manager_ids_user_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'committee', 'committee_id', 'manager_ids', 'user_id', 'user', 'user_id', 'committee_management_ids', 'committee_id');
+CREATE TRIGGER tr_log_d_nm_committee_manager_ids_user_t AFTER DELETE ON nm_committee_manager_ids_user_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'committee', 'committee_id', 'manager_ids', 'user_id', 'user', 'user_id', 'committee_management_ids', 'committee_id');
+
+CREATE TRIGGER tr_log_i_nm_committee_all_child_ids_committee_t AFTER INSERT ON nm_committee_all_child_ids_committee_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'committee', 'all_parent_id', 'all_child_ids', 'all_child_id', 'committee', 'all_child_id', 'all_parent_ids', 'all_parent_id');
+CREATE TRIGGER tr_log_u_nm_committee_all_child_ids_committee_t AFTER UPDATE ON nm_committee_all_child_ids_committee_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'committee', 'all_parent_id', 'all_child_ids', 'all_child_id', 'committee', 'all_child_id', 'all_parent_ids', 'all_parent_id');
+CREATE TRIGGER tr_log_d_nm_committee_all_child_ids_committee_t AFTER DELETE ON nm_committee_all_child_ids_committee_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'committee', 'all_parent_id', 'all_child_ids', 'all_child_id', 'committee', 'all_child_id', 'all_parent_ids', 'all_parent_id');
+
+CREATE TRIGGER tr_log_i_nm_committee_forward_to_committee_ids_committee_t AFTER INSERT ON nm_committee_forward_to_committee_ids_committee_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'committee', 'receive_forwardings_from_committee_id', 'forward_to_committee_ids', 'forward_to_committee_id', 'committee', 'forward_to_committee_id', 'receive_forwardings_from_committee_ids', 'receive_forwardings_from_committee_id');
+CREATE TRIGGER tr_log_u_nm_committee_forward_to_committee_ids_committee_t AFTER UPDATE ON nm_committee_forward_to_committee_ids_committee_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'committee', 'receive_forwardings_from_committee_id', 'forward_to_committee_ids', 'forward_to_committee_id', 'committee', 'forward_to_committee_id', 'receive_forwardings_from_committee_ids', 'receive_forwardings_from_committee_id');
+CREATE TRIGGER tr_log_d_nm_committee_forward_to_committee_ids_committee_t AFTER DELETE ON nm_committee_forward_to_committee_ids_committee_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'committee', 'receive_forwardings_from_committee_id', 'forward_to_committee_ids', 'forward_to_committee_id', 'committee', 'forward_to_committee_id', 'receive_forwardings_from_committee_ids', 'receive_forwardings_from_committee_id');
+
+CREATE TRIGGER tr_log_i_gender AFTER INSERT ON gender_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('gender', 'organization', 'organization_id', 'gender_ids', 'id');
+CREATE TRIGGER tr_log_u_gender AFTER UPDATE ON gender_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('gender', 'organization', 'organization_id', 'gender_ids', 'id');
+CREATE TRIGGER tr_log_d_gender AFTER DELETE ON gender_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('gender', 'organization', 'organization_id', 'gender_ids', 'id');
+
+CREATE TRIGGER tr_log_i_group AFTER INSERT ON group_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('group', 'meeting', 'used_as_motion_poll_default_id', 'motion_poll_default_group_ids', 'id', 'meeting', 'used_as_assignment_poll_default_id', 'assignment_poll_default_group_ids', 'id', 'meeting', 'used_as_topic_poll_default_id', 'topic_poll_default_group_ids', 'id', 'meeting', 'used_as_poll_default_id', 'poll_default_group_ids', 'id', 'meeting', 'meeting_id', 'group_ids', 'id');
+CREATE TRIGGER tr_log_u_group AFTER UPDATE ON group_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('group', 'meeting', 'used_as_motion_poll_default_id', 'motion_poll_default_group_ids', 'id', 'meeting', 'used_as_assignment_poll_default_id', 'assignment_poll_default_group_ids', 'id', 'meeting', 'used_as_topic_poll_default_id', 'topic_poll_default_group_ids', 'id', 'meeting', 'used_as_poll_default_id', 'poll_default_group_ids', 'id', 'meeting', 'meeting_id', 'group_ids', 'id');
+CREATE TRIGGER tr_log_d_group AFTER DELETE ON group_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('group', 'meeting', 'used_as_motion_poll_default_id', 'motion_poll_default_group_ids', 'id', 'meeting', 'used_as_assignment_poll_default_id', 'assignment_poll_default_group_ids', 'id', 'meeting', 'used_as_topic_poll_default_id', 'topic_poll_default_group_ids', 'id', 'meeting', 'used_as_poll_default_id', 'poll_default_group_ids', 'id', 'meeting', 'meeting_id', 'group_ids', 'id');
+
+
+CREATE TRIGGER tr_log_i_nm_group_meeting_user_ids_meeting_user_t AFTER INSERT ON nm_group_meeting_user_ids_meeting_user_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'meeting_user_ids', 'meeting_user_id', 'meeting_user', 'meeting_user_id', 'group_ids', 'group_id');
+CREATE TRIGGER tr_log_u_nm_group_meeting_user_ids_meeting_user_t AFTER UPDATE ON nm_group_meeting_user_ids_meeting_user_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'meeting_user_ids', 'meeting_user_id', 'meeting_user', 'meeting_user_id', 'group_ids', 'group_id');
+CREATE TRIGGER tr_log_d_nm_group_meeting_user_ids_meeting_user_t AFTER DELETE ON nm_group_meeting_user_ids_meeting_user_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'meeting_user_ids', 'meeting_user_id', 'meeting_user', 'meeting_user_id', 'group_ids', 'group_id');
+
+CREATE TRIGGER tr_log_i_nm_group_mmagi_meeting_mediafile_t AFTER INSERT ON nm_group_mmagi_meeting_mediafile_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'meeting_mediafile_access_group_ids', 'meeting_mediafile_id', 'meeting_mediafile', 'meeting_mediafile_id', 'access_group_ids', 'group_id');
+CREATE TRIGGER tr_log_u_nm_group_mmagi_meeting_mediafile_t AFTER UPDATE ON nm_group_mmagi_meeting_mediafile_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'meeting_mediafile_access_group_ids', 'meeting_mediafile_id', 'meeting_mediafile', 'meeting_mediafile_id', 'access_group_ids', 'group_id');
+CREATE TRIGGER tr_log_d_nm_group_mmagi_meeting_mediafile_t AFTER DELETE ON nm_group_mmagi_meeting_mediafile_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'meeting_mediafile_access_group_ids', 'meeting_mediafile_id', 'meeting_mediafile', 'meeting_mediafile_id', 'access_group_ids', 'group_id');
+
+CREATE TRIGGER tr_log_i_nm_group_mmiagi_meeting_mediafile_t AFTER INSERT ON nm_group_mmiagi_meeting_mediafile_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'meeting_mediafile_inherited_access_group_ids', 'meeting_mediafile_id', 'meeting_mediafile', 'meeting_mediafile_id', 'inherited_access_group_ids', 'group_id');
+CREATE TRIGGER tr_log_u_nm_group_mmiagi_meeting_mediafile_t AFTER UPDATE ON nm_group_mmiagi_meeting_mediafile_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'meeting_mediafile_inherited_access_group_ids', 'meeting_mediafile_id', 'meeting_mediafile', 'meeting_mediafile_id', 'inherited_access_group_ids', 'group_id');
+CREATE TRIGGER tr_log_d_nm_group_mmiagi_meeting_mediafile_t AFTER DELETE ON nm_group_mmiagi_meeting_mediafile_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'meeting_mediafile_inherited_access_group_ids', 'meeting_mediafile_id', 'meeting_mediafile', 'meeting_mediafile_id', 'inherited_access_group_ids', 'group_id');
+
+CREATE TRIGGER tr_log_i_nm_group_read_comment_section_ids_motion_commen088d3c9 AFTER INSERT ON nm_group_read_comment_section_ids_motion_comment_section_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'read_comment_section_ids', 'motion_comment_section_id', 'motion_comment_section', 'motion_comment_section_id', 'read_group_ids', 'group_id');
+CREATE TRIGGER tr_log_u_nm_group_read_comment_section_ids_motion_commenb09cd1c AFTER UPDATE ON nm_group_read_comment_section_ids_motion_comment_section_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'read_comment_section_ids', 'motion_comment_section_id', 'motion_comment_section', 'motion_comment_section_id', 'read_group_ids', 'group_id');
+CREATE TRIGGER tr_log_d_nm_group_read_comment_section_ids_motion_commen328d50b AFTER DELETE ON nm_group_read_comment_section_ids_motion_comment_section_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'read_comment_section_ids', 'motion_comment_section_id', 'motion_comment_section', 'motion_comment_section_id', 'read_group_ids', 'group_id');
+
+CREATE TRIGGER tr_log_i_nm_group_write_comment_section_ids_motion_comme8bd87ae AFTER INSERT ON nm_group_write_comment_section_ids_motion_comment_section_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'write_comment_section_ids', 'motion_comment_section_id', 'motion_comment_section', 'motion_comment_section_id', 'write_group_ids', 'group_id');
+CREATE TRIGGER tr_log_u_nm_group_write_comment_section_ids_motion_commee3aaabe AFTER UPDATE ON nm_group_write_comment_section_ids_motion_comment_section_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'write_comment_section_ids', 'motion_comment_section_id', 'motion_comment_section', 'motion_comment_section_id', 'write_group_ids', 'group_id');
+CREATE TRIGGER tr_log_d_nm_group_write_comment_section_ids_motion_commec76e961 AFTER DELETE ON nm_group_write_comment_section_ids_motion_comment_section_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'write_comment_section_ids', 'motion_comment_section_id', 'motion_comment_section', 'motion_comment_section_id', 'write_group_ids', 'group_id');
+
+CREATE TRIGGER tr_log_i_nm_group_poll_ids_poll_t AFTER INSERT ON nm_group_poll_ids_poll_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'poll_ids', 'poll_id', 'poll', 'poll_id', 'entitled_group_ids', 'group_id');
+CREATE TRIGGER tr_log_u_nm_group_poll_ids_poll_t AFTER UPDATE ON nm_group_poll_ids_poll_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'poll_ids', 'poll_id', 'poll', 'poll_id', 'entitled_group_ids', 'group_id');
+CREATE TRIGGER tr_log_d_nm_group_poll_ids_poll_t AFTER DELETE ON nm_group_poll_ids_poll_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'group', 'group_id', 'poll_ids', 'poll_id', 'poll', 'poll_id', 'entitled_group_ids', 'group_id');
+
+CREATE TRIGGER tr_log_i_history_entry AFTER INSERT ON history_entry_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('history_entry', 'user', 'model_id_user_id', 'history_entry_ids', 'id', 'motion', 'model_id_motion_id', 'history_entry_ids', 'id', 'assignment', 'model_id_assignment_id', 'history_entry_ids', 'id', 'history_position', 'position_id', 'entry_ids', 'id', 'meeting', 'meeting_id', 'relevant_history_entry_ids', 'id');
+CREATE TRIGGER tr_log_u_history_entry AFTER UPDATE ON history_entry_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('history_entry', 'user', 'model_id_user_id', 'history_entry_ids', 'id', 'motion', 'model_id_motion_id', 'history_entry_ids', 'id', 'assignment', 'model_id_assignment_id', 'history_entry_ids', 'id', 'history_position', 'position_id', 'entry_ids', 'id', 'meeting', 'meeting_id', 'relevant_history_entry_ids', 'id');
+CREATE TRIGGER tr_log_d_history_entry AFTER DELETE ON history_entry_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('history_entry', 'user', 'model_id_user_id', 'history_entry_ids', 'id', 'motion', 'model_id_motion_id', 'history_entry_ids', 'id', 'assignment', 'model_id_assignment_id', 'history_entry_ids', 'id', 'history_position', 'position_id', 'entry_ids', 'id', 'meeting', 'meeting_id', 'relevant_history_entry_ids', 'id');
+
+CREATE TRIGGER tr_log_i_history_position AFTER INSERT ON history_position_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('history_position', 'user', 'user_id', 'history_position_ids', 'id');
+CREATE TRIGGER tr_log_u_history_position AFTER UPDATE ON history_position_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('history_position', 'user', 'user_id', 'history_position_ids', 'id');
+CREATE TRIGGER tr_log_d_history_position AFTER DELETE ON history_position_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('history_position', 'user', 'user_id', 'history_position_ids', 'id');
+
+CREATE TRIGGER tr_log_i_import_preview AFTER INSERT ON import_preview_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('import_preview');
+CREATE TRIGGER tr_log_u_import_preview AFTER UPDATE ON import_preview_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('import_preview');
+CREATE TRIGGER tr_log_d_import_preview AFTER DELETE ON import_preview_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('import_preview');
+
+CREATE TRIGGER tr_log_i_list_of_speakers AFTER INSERT ON list_of_speakers_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('list_of_speakers', 'motion', 'content_object_id_motion_id', 'list_of_speakers_id', 'id', 'motion_block', 'content_object_id_motion_block_id', 'list_of_speakers_id', 'id', 'assignment', 'content_object_id_assignment_id', 'list_of_speakers_id', 'id', 'topic', 'content_object_id_topic_id', 'list_of_speakers_id', 'id', 'meeting_mediafile', 'content_object_id_meeting_mediafile_id', 'list_of_speakers_id', 'id', 'meeting', 'meeting_id', 'list_of_speakers_ids', 'id');
+CREATE TRIGGER tr_log_u_list_of_speakers AFTER UPDATE ON list_of_speakers_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('list_of_speakers', 'motion', 'content_object_id_motion_id', 'list_of_speakers_id', 'id', 'motion_block', 'content_object_id_motion_block_id', 'list_of_speakers_id', 'id', 'assignment', 'content_object_id_assignment_id', 'list_of_speakers_id', 'id', 'topic', 'content_object_id_topic_id', 'list_of_speakers_id', 'id', 'meeting_mediafile', 'content_object_id_meeting_mediafile_id', 'list_of_speakers_id', 'id', 'meeting', 'meeting_id', 'list_of_speakers_ids', 'id');
+CREATE TRIGGER tr_log_d_list_of_speakers AFTER DELETE ON list_of_speakers_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('list_of_speakers', 'motion', 'content_object_id_motion_id', 'list_of_speakers_id', 'id', 'motion_block', 'content_object_id_motion_block_id', 'list_of_speakers_id', 'id', 'assignment', 'content_object_id_assignment_id', 'list_of_speakers_id', 'id', 'topic', 'content_object_id_topic_id', 'list_of_speakers_id', 'id', 'meeting_mediafile', 'content_object_id_meeting_mediafile_id', 'list_of_speakers_id', 'id', 'meeting', 'meeting_id', 'list_of_speakers_ids', 'id');
+
+CREATE TRIGGER tr_log_i_mediafile AFTER INSERT ON mediafile_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('mediafile', 'organization', 'published_to_meetings_in_organization_id', 'published_mediafile_ids', 'id', 'mediafile', 'parent_id', 'child_ids', 'id', 'meeting', 'owner_id_meeting_id', 'mediafile_ids', 'id', 'organization', 'owner_id_organization_id', 'mediafile_ids', 'id');
+CREATE TRIGGER tr_log_u_mediafile AFTER UPDATE ON mediafile_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('mediafile', 'organization', 'published_to_meetings_in_organization_id', 'published_mediafile_ids', 'id', 'mediafile', 'parent_id', 'child_ids', 'id', 'meeting', 'owner_id_meeting_id', 'mediafile_ids', 'id', 'organization', 'owner_id_organization_id', 'mediafile_ids', 'id');
+CREATE TRIGGER tr_log_d_mediafile AFTER DELETE ON mediafile_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('mediafile', 'organization', 'published_to_meetings_in_organization_id', 'published_mediafile_ids', 'id', 'mediafile', 'parent_id', 'child_ids', 'id', 'meeting', 'owner_id_meeting_id', 'mediafile_ids', 'id', 'organization', 'owner_id_organization_id', 'mediafile_ids', 'id');
+
+CREATE TRIGGER tr_log_i_meeting AFTER INSERT ON meeting_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('meeting', 'organization', 'is_active_in_organization_id', 'active_meeting_ids', 'id', 'organization', 'is_archived_in_organization_id', 'archived_meeting_ids', 'id', 'organization', 'template_for_organization_id', 'template_meeting_ids', 'id', 'motion_workflow', 'motions_default_workflow_id', 'default_workflow_meeting_id', 'id', 'motion_workflow', 'motions_default_amendment_workflow_id', 'default_amendment_workflow_meeting_id', 'id', 'meeting_mediafile', 'logo_projector_main_id', 'used_as_logo_projector_main_in_meeting_id', 'id', 'meeting_mediafile', 'logo_projector_header_id', 'used_as_logo_projector_header_in_meeting_id', 'id', 'meeting_mediafile', 'logo_web_header_id', 'used_as_logo_web_header_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_header_l_id', 'used_as_logo_pdf_header_l_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_header_r_id', 'used_as_logo_pdf_header_r_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_footer_l_id', 'used_as_logo_pdf_footer_l_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_footer_r_id', 'used_as_logo_pdf_footer_r_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_ballot_paper_id', 'used_as_logo_pdf_ballot_paper_in_meeting_id', 'id', 'meeting_mediafile', 'font_regular_id', 'used_as_font_regular_in_meeting_id', 'id', 'meeting_mediafile', 'font_italic_id', 'used_as_font_italic_in_meeting_id', 'id', 'meeting_mediafile', 'font_bold_id', 'used_as_font_bold_in_meeting_id', 'id', 'meeting_mediafile', 'font_bold_italic_id', 'used_as_font_bold_italic_in_meeting_id', 'id', 'meeting_mediafile', 'font_monospace_id', 'used_as_font_monospace_in_meeting_id', 'id', 'meeting_mediafile', 'font_chyron_speaker_name_id', 'used_as_font_chyron_speaker_name_in_meeting_id', 'id', 'meeting_mediafile', 'font_projector_h1_id', 'used_as_font_projector_h1_in_meeting_id', 'id', 'meeting_mediafile', 'font_projector_h2_id', 'used_as_font_projector_h2_in_meeting_id', 'id', 'committee', 'committee_id', 'meeting_ids', 'id', 'projector', 'reference_projector_id', 'used_as_reference_projector_meeting_id', 'id', 'projector_countdown', 'list_of_speakers_countdown_id', 'used_as_list_of_speakers_countdown_meeting_id', 'id', 'projector_countdown', 'poll_countdown_id', 'used_as_poll_countdown_meeting_id', 'id', 'group', 'default_group_id', 'default_group_for_meeting_id', 'id', 'group', 'admin_group_id', 'admin_group_for_meeting_id', 'id', 'group', 'anonymous_group_id', 'anonymous_group_for_meeting_id', 'id');
+CREATE TRIGGER tr_log_u_meeting AFTER UPDATE ON meeting_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('meeting', 'organization', 'is_active_in_organization_id', 'active_meeting_ids', 'id', 'organization', 'is_archived_in_organization_id', 'archived_meeting_ids', 'id', 'organization', 'template_for_organization_id', 'template_meeting_ids', 'id', 'motion_workflow', 'motions_default_workflow_id', 'default_workflow_meeting_id', 'id', 'motion_workflow', 'motions_default_amendment_workflow_id', 'default_amendment_workflow_meeting_id', 'id', 'meeting_mediafile', 'logo_projector_main_id', 'used_as_logo_projector_main_in_meeting_id', 'id', 'meeting_mediafile', 'logo_projector_header_id', 'used_as_logo_projector_header_in_meeting_id', 'id', 'meeting_mediafile', 'logo_web_header_id', 'used_as_logo_web_header_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_header_l_id', 'used_as_logo_pdf_header_l_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_header_r_id', 'used_as_logo_pdf_header_r_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_footer_l_id', 'used_as_logo_pdf_footer_l_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_footer_r_id', 'used_as_logo_pdf_footer_r_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_ballot_paper_id', 'used_as_logo_pdf_ballot_paper_in_meeting_id', 'id', 'meeting_mediafile', 'font_regular_id', 'used_as_font_regular_in_meeting_id', 'id', 'meeting_mediafile', 'font_italic_id', 'used_as_font_italic_in_meeting_id', 'id', 'meeting_mediafile', 'font_bold_id', 'used_as_font_bold_in_meeting_id', 'id', 'meeting_mediafile', 'font_bold_italic_id', 'used_as_font_bold_italic_in_meeting_id', 'id', 'meeting_mediafile', 'font_monospace_id', 'used_as_font_monospace_in_meeting_id', 'id', 'meeting_mediafile', 'font_chyron_speaker_name_id', 'used_as_font_chyron_speaker_name_in_meeting_id', 'id', 'meeting_mediafile', 'font_projector_h1_id', 'used_as_font_projector_h1_in_meeting_id', 'id', 'meeting_mediafile', 'font_projector_h2_id', 'used_as_font_projector_h2_in_meeting_id', 'id', 'committee', 'committee_id', 'meeting_ids', 'id', 'projector', 'reference_projector_id', 'used_as_reference_projector_meeting_id', 'id', 'projector_countdown', 'list_of_speakers_countdown_id', 'used_as_list_of_speakers_countdown_meeting_id', 'id', 'projector_countdown', 'poll_countdown_id', 'used_as_poll_countdown_meeting_id', 'id', 'group', 'default_group_id', 'default_group_for_meeting_id', 'id', 'group', 'admin_group_id', 'admin_group_for_meeting_id', 'id', 'group', 'anonymous_group_id', 'anonymous_group_for_meeting_id', 'id');
+CREATE TRIGGER tr_log_d_meeting AFTER DELETE ON meeting_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('meeting', 'organization', 'is_active_in_organization_id', 'active_meeting_ids', 'id', 'organization', 'is_archived_in_organization_id', 'archived_meeting_ids', 'id', 'organization', 'template_for_organization_id', 'template_meeting_ids', 'id', 'motion_workflow', 'motions_default_workflow_id', 'default_workflow_meeting_id', 'id', 'motion_workflow', 'motions_default_amendment_workflow_id', 'default_amendment_workflow_meeting_id', 'id', 'meeting_mediafile', 'logo_projector_main_id', 'used_as_logo_projector_main_in_meeting_id', 'id', 'meeting_mediafile', 'logo_projector_header_id', 'used_as_logo_projector_header_in_meeting_id', 'id', 'meeting_mediafile', 'logo_web_header_id', 'used_as_logo_web_header_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_header_l_id', 'used_as_logo_pdf_header_l_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_header_r_id', 'used_as_logo_pdf_header_r_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_footer_l_id', 'used_as_logo_pdf_footer_l_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_footer_r_id', 'used_as_logo_pdf_footer_r_in_meeting_id', 'id', 'meeting_mediafile', 'logo_pdf_ballot_paper_id', 'used_as_logo_pdf_ballot_paper_in_meeting_id', 'id', 'meeting_mediafile', 'font_regular_id', 'used_as_font_regular_in_meeting_id', 'id', 'meeting_mediafile', 'font_italic_id', 'used_as_font_italic_in_meeting_id', 'id', 'meeting_mediafile', 'font_bold_id', 'used_as_font_bold_in_meeting_id', 'id', 'meeting_mediafile', 'font_bold_italic_id', 'used_as_font_bold_italic_in_meeting_id', 'id', 'meeting_mediafile', 'font_monospace_id', 'used_as_font_monospace_in_meeting_id', 'id', 'meeting_mediafile', 'font_chyron_speaker_name_id', 'used_as_font_chyron_speaker_name_in_meeting_id', 'id', 'meeting_mediafile', 'font_projector_h1_id', 'used_as_font_projector_h1_in_meeting_id', 'id', 'meeting_mediafile', 'font_projector_h2_id', 'used_as_font_projector_h2_in_meeting_id', 'id', 'committee', 'committee_id', 'meeting_ids', 'id', 'projector', 'reference_projector_id', 'used_as_reference_projector_meeting_id', 'id', 'projector_countdown', 'list_of_speakers_countdown_id', 'used_as_list_of_speakers_countdown_meeting_id', 'id', 'projector_countdown', 'poll_countdown_id', 'used_as_poll_countdown_meeting_id', 'id', 'group', 'default_group_id', 'default_group_for_meeting_id', 'id', 'group', 'admin_group_id', 'admin_group_for_meeting_id', 'id', 'group', 'anonymous_group_id', 'anonymous_group_for_meeting_id', 'id');
+
+
+CREATE TRIGGER tr_log_i_nm_meeting_present_user_ids_user_t AFTER INSERT ON nm_meeting_present_user_ids_user_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'meeting', 'meeting_id', 'present_user_ids', 'user_id', 'user', 'user_id', 'is_present_in_meeting_ids', 'meeting_id');
+CREATE TRIGGER tr_log_u_nm_meeting_present_user_ids_user_t AFTER UPDATE ON nm_meeting_present_user_ids_user_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'meeting', 'meeting_id', 'present_user_ids', 'user_id', 'user', 'user_id', 'is_present_in_meeting_ids', 'meeting_id');
+CREATE TRIGGER tr_log_d_nm_meeting_present_user_ids_user_t AFTER DELETE ON nm_meeting_present_user_ids_user_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'meeting', 'meeting_id', 'present_user_ids', 'user_id', 'user', 'user_id', 'is_present_in_meeting_ids', 'meeting_id');
 
 CREATE TRIGGER tr_log_i_meeting_user_ids_from_meeting_user_t BEFORE INSERT ON meeting_user_t
 FOR EACH ROW EXECUTE FUNCTION log_iu_modified_calculated_id_array_field('meeting', 'meeting_id', '', 'user_ids', 'user_id', '');
 CREATE TRIGGER tr_log_d_meeting_user_ids_from_meeting_user_t AFTER DELETE ON meeting_user_t
-FOR EACH ROW EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('meeting', 'meeting_id', '', 'user_ids', 'user_id', '');
-
-CREATE TRIGGER tr_log_meeting_t_reference_projector_id AFTER INSERT OR UPDATE OF reference_projector_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('projector', 'reference_projector_id', 'used_as_reference_projector_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_list_of_speakers_countdown_id AFTER INSERT OR UPDATE OF list_of_speakers_countdown_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('projector_countdown', 'list_of_speakers_countdown_id', 'used_as_list_of_speakers_countdown_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_poll_countdown_id AFTER INSERT OR UPDATE OF poll_countdown_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('projector_countdown', 'poll_countdown_id', 'used_as_poll_countdown_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_default_group_id AFTER INSERT OR UPDATE OF default_group_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('group', 'default_group_id', 'default_group_for_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_admin_group_id AFTER INSERT OR UPDATE OF admin_group_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('group', 'admin_group_id', 'admin_group_for_meeting_id');
-CREATE TRIGGER tr_log_meeting_t_anonymous_group_id AFTER INSERT OR UPDATE OF anonymous_group_id OR DELETE ON meeting_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('group', 'anonymous_group_id', 'anonymous_group_for_meeting_id');
-
-CREATE TRIGGER tr_log_meeting_mediafile AFTER INSERT OR UPDATE OR DELETE ON meeting_mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('meeting_mediafile');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON meeting_mediafile_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_meeting_mediafile_t_mediafile_id AFTER INSERT OR UPDATE OF mediafile_id OR DELETE ON meeting_mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('mediafile', 'mediafile_id', 'meeting_mediafile_ids');
-CREATE TRIGGER tr_log_meeting_mediafile_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON meeting_mediafile_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'meeting_mediafile_ids');
-
-CREATE TRIGGER tr_log_attachment_id_motion_id_gm_meeting_mediafile_atta25df47a AFTER INSERT OR UPDATE OF attachment_id_motion_id OR DELETE ON gm_meeting_mediafile_attachment_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile','meeting_mediafile_id','attachment_ids','motion','attachment_id_motion_id','attachment_meeting_mediafile_ids');
-
-CREATE TRIGGER tr_log_attachment_id_topic_id_gm_meeting_mediafile_attac4e93703 AFTER INSERT OR UPDATE OF attachment_id_topic_id OR DELETE ON gm_meeting_mediafile_attachment_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile','meeting_mediafile_id','attachment_ids','topic','attachment_id_topic_id','attachment_meeting_mediafile_ids');
-
-CREATE TRIGGER tr_log_attachment_id_assignment_id_gm_meeting_mediafile_2f214fd AFTER INSERT OR UPDATE OF attachment_id_assignment_id OR DELETE ON gm_meeting_mediafile_attachment_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile','meeting_mediafile_id','attachment_ids','assignment','attachment_id_assignment_id','attachment_meeting_mediafile_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON gm_meeting_mediafile_attachment_ids_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_meeting_user AFTER INSERT OR UPDATE OR DELETE ON meeting_user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('meeting_user');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON meeting_user_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_meeting_user_t_user_id AFTER INSERT OR UPDATE OF user_id OR DELETE ON meeting_user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('user', 'user_id', 'meeting_user_ids');
-CREATE TRIGGER tr_log_meeting_user_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON meeting_user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'meeting_user_ids');
-CREATE TRIGGER tr_log_meeting_user_t_vote_delegated_to_id AFTER INSERT OR UPDATE OF vote_delegated_to_id OR DELETE ON meeting_user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user', 'vote_delegated_to_id', 'vote_delegations_from_ids');
-
-CREATE TRIGGER tr_log_nm_meeting_user_structure_level_ids_structure_level_t AFTER INSERT OR UPDATE OR DELETE ON nm_meeting_user_structure_level_ids_structure_level_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user','meeting_user_id','structure_level_ids','structure_level','structure_level_id','meeting_user_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_meeting_user_structure_level_ids_structure_level_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion AFTER INSERT OR UPDATE OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_t_lead_motion_id AFTER INSERT OR UPDATE OF lead_motion_id OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion', 'lead_motion_id', 'amendment_ids');
-CREATE TRIGGER tr_log_motion_t_sort_parent_id AFTER INSERT OR UPDATE OF sort_parent_id OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion', 'sort_parent_id', 'sort_child_ids');
-CREATE TRIGGER tr_log_motion_t_origin_id AFTER INSERT OR UPDATE OF origin_id OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion', 'origin_id', 'derived_motion_ids');
-CREATE TRIGGER tr_log_motion_t_origin_meeting_id AFTER INSERT OR UPDATE OF origin_meeting_id OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'origin_meeting_id', 'forwarded_motion_ids');
-
-CREATE TRIGGER tr_log_nm_motion_all_derived_motion_ids_motion_t AFTER INSERT OR UPDATE OR DELETE ON nm_motion_all_derived_motion_ids_motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','all_origin_id','all_derived_motion_ids','motion','all_derived_motion_id','all_origin_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_motion_all_derived_motion_ids_motion_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_nm_motion_identical_motion_ids_motion_t AFTER INSERT OR UPDATE OR DELETE ON nm_motion_identical_motion_ids_motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','identical_motion_id_1','identical_motion_ids','motion','identical_motion_id_2','identical_motion_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_motion_identical_motion_ids_motion_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_motion_t_state_id AFTER INSERT OR UPDATE OF state_id OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_state', 'state_id', 'motion_ids');
-CREATE TRIGGER tr_log_motion_t_recommendation_id AFTER INSERT OR UPDATE OF recommendation_id OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_state', 'recommendation_id', 'motion_recommendation_ids');
-
-CREATE TRIGGER tr_log_state_extension_reference_id_motion_id_gm_motion_2720cdc AFTER INSERT OR UPDATE OF state_extension_reference_id_motion_id OR DELETE ON gm_motion_state_extension_reference_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','motion_id','state_extension_reference_ids','motion','state_extension_reference_id_motion_id','referenced_in_motion_state_extension_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON gm_motion_state_extension_reference_ids_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_recommendation_extension_reference_id_motion_id_g047b2db AFTER INSERT OR UPDATE OF recommendation_extension_reference_id_motion_id OR DELETE ON gm_motion_recommendation_extension_reference_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','motion_id','recommendation_extension_reference_ids','motion','recommendation_extension_reference_id_motion_id','referenced_in_motion_recommendation_extension_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON gm_motion_recommendation_extension_reference_ids_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_motion_t_category_id AFTER INSERT OR UPDATE OF category_id OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_category', 'category_id', 'motion_ids');
-CREATE TRIGGER tr_log_motion_t_block_id AFTER INSERT OR UPDATE OF block_id OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_block', 'block_id', 'motion_ids');
-CREATE TRIGGER tr_log_motion_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_ids');
-
-CREATE TRIGGER tr_log_motion_block AFTER INSERT OR UPDATE OR DELETE ON motion_block_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_block');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_block_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_block_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_block_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_block_ids');
-
-CREATE TRIGGER tr_log_motion_category AFTER INSERT OR UPDATE OR DELETE ON motion_category_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_category');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_category_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_category_t_parent_id AFTER INSERT OR UPDATE OF parent_id OR DELETE ON motion_category_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_category', 'parent_id', 'child_ids');
-CREATE TRIGGER tr_log_motion_category_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_category_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_category_ids');
-
-CREATE TRIGGER tr_log_motion_change_recommendation AFTER INSERT OR UPDATE OR DELETE ON motion_change_recommendation_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_change_recommendation');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_change_recommendation_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_change_recommendation_t_motion_id AFTER INSERT OR UPDATE OF motion_id OR DELETE ON motion_change_recommendation_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion', 'motion_id', 'change_recommendation_ids');
-CREATE TRIGGER tr_log_motion_change_recommendation_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_change_recommendation_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_change_recommendation_ids');
-
-CREATE TRIGGER tr_log_motion_comment AFTER INSERT OR UPDATE OR DELETE ON motion_comment_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_comment');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_comment_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_comment_t_motion_id AFTER INSERT OR UPDATE OF motion_id OR DELETE ON motion_comment_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion', 'motion_id', 'comment_ids');
-CREATE TRIGGER tr_log_motion_comment_t_section_id AFTER INSERT OR UPDATE OF section_id OR DELETE ON motion_comment_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_comment_section', 'section_id', 'comment_ids');
-CREATE TRIGGER tr_log_motion_comment_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_comment_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_comment_ids');
-
-CREATE TRIGGER tr_log_motion_comment_section AFTER INSERT OR UPDATE OR DELETE ON motion_comment_section_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_comment_section');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_comment_section_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_comment_section_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_comment_section_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_comment_section_ids');
-
-CREATE TRIGGER tr_log_motion_editor AFTER INSERT OR UPDATE OR DELETE ON motion_editor_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_editor');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_editor_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_editor_t_meeting_user_id AFTER INSERT OR UPDATE OF meeting_user_id OR DELETE ON motion_editor_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user', 'meeting_user_id', 'motion_editor_ids');
-CREATE TRIGGER tr_log_motion_editor_t_motion_id AFTER INSERT OR UPDATE OF motion_id OR DELETE ON motion_editor_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion', 'motion_id', 'editor_ids');
-CREATE TRIGGER tr_log_motion_editor_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_editor_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_editor_ids');
-
-CREATE TRIGGER tr_log_motion_state AFTER INSERT OR UPDATE OR DELETE ON motion_state_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_state');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_state_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_state_t_submitter_withdraw_state_id AFTER INSERT OR UPDATE OF submitter_withdraw_state_id OR DELETE ON motion_state_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_state', 'submitter_withdraw_state_id', 'submitter_withdraw_back_ids');
-
-CREATE TRIGGER tr_log_nm_motion_state_next_state_ids_motion_state_t AFTER INSERT OR UPDATE OR DELETE ON nm_motion_state_next_state_ids_motion_state_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_state','previous_state_id','next_state_ids','motion_state','next_state_id','previous_state_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_motion_state_next_state_ids_motion_state_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_motion_state_t_workflow_id AFTER INSERT OR UPDATE OF workflow_id OR DELETE ON motion_state_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_workflow', 'workflow_id', 'state_ids');
-CREATE TRIGGER tr_log_motion_state_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_state_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_state_ids');
-
-CREATE TRIGGER tr_log_motion_submitter AFTER INSERT OR UPDATE OR DELETE ON motion_submitter_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_submitter');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_submitter_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_submitter_t_meeting_user_id AFTER INSERT OR UPDATE OF meeting_user_id OR DELETE ON motion_submitter_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user', 'meeting_user_id', 'motion_submitter_ids');
-CREATE TRIGGER tr_log_motion_submitter_t_motion_id AFTER INSERT OR UPDATE OF motion_id OR DELETE ON motion_submitter_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion', 'motion_id', 'submitter_ids');
-CREATE TRIGGER tr_log_motion_submitter_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_submitter_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_submitter_ids');
-
-CREATE TRIGGER tr_log_motion_supporter AFTER INSERT OR UPDATE OR DELETE ON motion_supporter_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_supporter');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_supporter_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_supporter_t_meeting_user_id AFTER INSERT OR UPDATE OF meeting_user_id OR DELETE ON motion_supporter_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user', 'meeting_user_id', 'motion_supporter_ids');
-CREATE TRIGGER tr_log_motion_supporter_t_motion_id AFTER INSERT OR UPDATE OF motion_id OR DELETE ON motion_supporter_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion', 'motion_id', 'supporter_ids');
-CREATE TRIGGER tr_log_motion_supporter_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_supporter_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_supporter_ids');
-
-CREATE TRIGGER tr_log_motion_workflow AFTER INSERT OR UPDATE OR DELETE ON motion_workflow_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_workflow');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_workflow_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_workflow_t_first_state_id AFTER INSERT OR UPDATE OF first_state_id OR DELETE ON motion_workflow_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_state', 'first_state_id', 'first_state_of_workflow_id');
-CREATE TRIGGER tr_log_motion_workflow_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_workflow_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_workflow_ids');
-
-CREATE TRIGGER tr_log_motion_working_group_speaker AFTER INSERT OR UPDATE OR DELETE ON motion_working_group_speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('motion_working_group_speaker');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON motion_working_group_speaker_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_motion_working_group_speaker_t_meeting_user_id AFTER INSERT OR UPDATE OF meeting_user_id OR DELETE ON motion_working_group_speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user', 'meeting_user_id', 'motion_working_group_speaker_ids');
-CREATE TRIGGER tr_log_motion_working_group_speaker_t_motion_id AFTER INSERT OR UPDATE OF motion_id OR DELETE ON motion_working_group_speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion', 'motion_id', 'working_group_speaker_ids');
-CREATE TRIGGER tr_log_motion_working_group_speaker_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON motion_working_group_speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'motion_working_group_speaker_ids');
-
-CREATE TRIGGER tr_log_option AFTER INSERT OR UPDATE OR DELETE ON option_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('option');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON option_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_option_t_poll_id AFTER INSERT OR UPDATE OF poll_id OR DELETE ON option_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('poll', 'poll_id', 'option_ids');
-
-CREATE TRIGGER tr_log_motion_content_object_id_motion_id AFTER INSERT OR UPDATE OF content_object_id_motion_id OR DELETE ON option_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','content_object_id_motion_id','option_ids');
-
-CREATE TRIGGER tr_log_user_content_object_id_user_id AFTER INSERT OR UPDATE OF content_object_id_user_id OR DELETE ON option_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('user','content_object_id_user_id','option_ids');
-
-CREATE TRIGGER tr_log_poll_candidate_list_content_object_id_poll_candidc235209 AFTER INSERT OR UPDATE OF content_object_id_poll_candidate_list_id OR DELETE ON option_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('poll_candidate_list','content_object_id_poll_candidate_list_id','option_id');
-CREATE TRIGGER tr_log_option_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON option_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'option_ids');
-
-CREATE TRIGGER tr_log_organization AFTER INSERT OR UPDATE OR DELETE ON organization_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('organization');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON organization_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_organization_t_theme_id AFTER INSERT OR UPDATE OF theme_id OR DELETE ON organization_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('theme', 'theme_id', 'theme_for_organization_id');
-
-CREATE TRIGGER tr_log_organization_tag AFTER INSERT OR UPDATE OR DELETE ON organization_tag_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('organization_tag');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON organization_tag_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-
-CREATE TRIGGER tr_log_tagged_id_committee_id_gm_organization_tag_tagged_ids_t AFTER INSERT OR UPDATE OF tagged_id_committee_id OR DELETE ON gm_organization_tag_tagged_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization_tag','organization_tag_id','tagged_ids','committee','tagged_id_committee_id','organization_tag_ids');
-
-CREATE TRIGGER tr_log_tagged_id_meeting_id_gm_organization_tag_tagged_ids_t AFTER INSERT OR UPDATE OF tagged_id_meeting_id OR DELETE ON gm_organization_tag_tagged_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization_tag','organization_tag_id','tagged_ids','meeting','tagged_id_meeting_id','organization_tag_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON gm_organization_tag_tagged_ids_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_organization_tag_t_organization_id AFTER INSERT OR UPDATE OF organization_id OR DELETE ON organization_tag_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization', 'organization_id', 'organization_tag_ids');
-
-CREATE TRIGGER tr_log_personal_note AFTER INSERT OR UPDATE OR DELETE ON personal_note_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('personal_note');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON personal_note_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_personal_note_t_meeting_user_id AFTER INSERT OR UPDATE OF meeting_user_id OR DELETE ON personal_note_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user', 'meeting_user_id', 'personal_note_ids');
-
-CREATE TRIGGER tr_log_motion_content_object_id_motion_id AFTER INSERT OR UPDATE OF content_object_id_motion_id OR DELETE ON personal_note_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','content_object_id_motion_id','personal_note_ids');
-CREATE TRIGGER tr_log_personal_note_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON personal_note_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'personal_note_ids');
-
-CREATE TRIGGER tr_log_point_of_order_category AFTER INSERT OR UPDATE OR DELETE ON point_of_order_category_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('point_of_order_category');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON point_of_order_category_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_point_of_order_category_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON point_of_order_category_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'point_of_order_category_ids');
-
-CREATE TRIGGER tr_log_poll AFTER INSERT OR UPDATE OR DELETE ON poll_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('poll');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON poll_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-
-CREATE TRIGGER tr_log_motion_content_object_id_motion_id AFTER INSERT OR UPDATE OF content_object_id_motion_id OR DELETE ON poll_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','content_object_id_motion_id','poll_ids');
-
-CREATE TRIGGER tr_log_assignment_content_object_id_assignment_id AFTER INSERT OR UPDATE OF content_object_id_assignment_id OR DELETE ON poll_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('assignment','content_object_id_assignment_id','poll_ids');
-
-CREATE TRIGGER tr_log_topic_content_object_id_topic_id AFTER INSERT OR UPDATE OF content_object_id_topic_id OR DELETE ON poll_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('topic','content_object_id_topic_id','poll_ids');
-CREATE TRIGGER tr_log_poll_t_global_option_id AFTER INSERT OR UPDATE OF global_option_id OR DELETE ON poll_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('option', 'global_option_id', 'used_as_global_option_in_poll_id');
-
-CREATE TRIGGER tr_log_nm_poll_voted_ids_user_t AFTER INSERT OR UPDATE OR DELETE ON nm_poll_voted_ids_user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('poll','poll_id','voted_ids','user','user_id','poll_voted_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON nm_poll_voted_ids_user_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_poll_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON poll_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'poll_ids');
-
-CREATE TRIGGER tr_log_poll_candidate AFTER INSERT OR UPDATE OR DELETE ON poll_candidate_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('poll_candidate');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON poll_candidate_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_poll_candidate_t_poll_candidate_list_id AFTER INSERT OR UPDATE OF poll_candidate_list_id OR DELETE ON poll_candidate_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('poll_candidate_list', 'poll_candidate_list_id', 'poll_candidate_ids');
-CREATE TRIGGER tr_log_poll_candidate_t_user_id AFTER INSERT OR UPDATE OF user_id OR DELETE ON poll_candidate_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('user', 'user_id', 'poll_candidate_ids');
-CREATE TRIGGER tr_log_poll_candidate_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON poll_candidate_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'poll_candidate_ids');
-
-CREATE TRIGGER tr_log_poll_candidate_list AFTER INSERT OR UPDATE OR DELETE ON poll_candidate_list_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('poll_candidate_list');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON poll_candidate_list_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_poll_candidate_list_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON poll_candidate_list_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'poll_candidate_list_ids');
-
-CREATE TRIGGER tr_log_projection AFTER INSERT OR UPDATE OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('projection');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON projection_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_projection_t_current_projector_id AFTER INSERT OR UPDATE OF current_projector_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('projector', 'current_projector_id', 'current_projection_ids');
-CREATE TRIGGER tr_log_projection_t_preview_projector_id AFTER INSERT OR UPDATE OF preview_projector_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('projector', 'preview_projector_id', 'preview_projection_ids');
-CREATE TRIGGER tr_log_projection_t_history_projector_id AFTER INSERT OR UPDATE OF history_projector_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('projector', 'history_projector_id', 'history_projection_ids');
-
-CREATE TRIGGER tr_log_meeting_content_object_id_meeting_id AFTER INSERT OR UPDATE OF content_object_id_meeting_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting','content_object_id_meeting_id','projection_ids');
-
-CREATE TRIGGER tr_log_motion_content_object_id_motion_id AFTER INSERT OR UPDATE OF content_object_id_motion_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion','content_object_id_motion_id','projection_ids');
-
-CREATE TRIGGER tr_log_meeting_mediafile_content_object_id_meeting_mediafile_id AFTER INSERT OR UPDATE OF content_object_id_meeting_mediafile_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_mediafile','content_object_id_meeting_mediafile_id','projection_ids');
-
-CREATE TRIGGER tr_log_list_of_speakers_content_object_id_list_of_speakers_id AFTER INSERT OR UPDATE OF content_object_id_list_of_speakers_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('list_of_speakers','content_object_id_list_of_speakers_id','projection_ids');
-
-CREATE TRIGGER tr_log_motion_block_content_object_id_motion_block_id AFTER INSERT OR UPDATE OF content_object_id_motion_block_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('motion_block','content_object_id_motion_block_id','projection_ids');
-
-CREATE TRIGGER tr_log_assignment_content_object_id_assignment_id AFTER INSERT OR UPDATE OF content_object_id_assignment_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('assignment','content_object_id_assignment_id','projection_ids');
-
-CREATE TRIGGER tr_log_agenda_item_content_object_id_agenda_item_id AFTER INSERT OR UPDATE OF content_object_id_agenda_item_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('agenda_item','content_object_id_agenda_item_id','projection_ids');
-
-CREATE TRIGGER tr_log_topic_content_object_id_topic_id AFTER INSERT OR UPDATE OF content_object_id_topic_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('topic','content_object_id_topic_id','projection_ids');
-
-CREATE TRIGGER tr_log_poll_content_object_id_poll_id AFTER INSERT OR UPDATE OF content_object_id_poll_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('poll','content_object_id_poll_id','projection_ids');
-
-CREATE TRIGGER tr_log_projector_message_content_object_id_projector_message_id AFTER INSERT OR UPDATE OF content_object_id_projector_message_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('projector_message','content_object_id_projector_message_id','projection_ids');
-
-CREATE TRIGGER tr_log_projector_countdown_content_object_id_projector_c35fae82 AFTER INSERT OR UPDATE OF content_object_id_projector_countdown_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('projector_countdown','content_object_id_projector_countdown_id','projection_ids');
-CREATE TRIGGER tr_log_projection_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON projection_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'all_projection_ids');
-
-CREATE TRIGGER tr_log_projector AFTER INSERT OR UPDATE OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('projector');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON projector_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_agenda_a3418fd AFTER INSERT OR UPDATE OF used_as_default_projector_for_agenda_item_list_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_agenda_item_list_in_meeting_id', 'default_projector_agenda_item_list_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_topic_iccc9ca7 AFTER INSERT OR UPDATE OF used_as_default_projector_for_topic_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_topic_in_meeting_id', 'default_projector_topic_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_list_offcea2e3 AFTER INSERT OR UPDATE OF used_as_default_projector_for_list_of_speakers_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_list_of_speakers_in_meeting_id', 'default_projector_list_of_speakers_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_current897012e AFTER INSERT OR UPDATE OF used_as_default_projector_for_current_los_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_current_los_in_meeting_id', 'default_projector_current_los_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_motion_9cf3618 AFTER INSERT OR UPDATE OF used_as_default_projector_for_motion_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_motion_in_meeting_id', 'default_projector_motion_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_amendme4ebfd41 AFTER INSERT OR UPDATE OF used_as_default_projector_for_amendment_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_amendment_in_meeting_id', 'default_projector_amendment_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_motion_1b9d3a7 AFTER INSERT OR UPDATE OF used_as_default_projector_for_motion_block_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_motion_block_in_meeting_id', 'default_projector_motion_block_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_assignm9e3b0b3 AFTER INSERT OR UPDATE OF used_as_default_projector_for_assignment_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_assignment_in_meeting_id', 'default_projector_assignment_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_mediafib4f0da8 AFTER INSERT OR UPDATE OF used_as_default_projector_for_mediafile_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_mediafile_in_meeting_id', 'default_projector_mediafile_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_message28c0ca6 AFTER INSERT OR UPDATE OF used_as_default_projector_for_message_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_message_in_meeting_id', 'default_projector_message_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_countdoe67f735 AFTER INSERT OR UPDATE OF used_as_default_projector_for_countdown_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_countdown_in_meeting_id', 'default_projector_countdown_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_assignmf3a7b0f AFTER INSERT OR UPDATE OF used_as_default_projector_for_assignment_poll_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_assignment_poll_in_meeting_id', 'default_projector_assignment_poll_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_motion_c48d3bb AFTER INSERT OR UPDATE OF used_as_default_projector_for_motion_poll_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_motion_poll_in_meeting_id', 'default_projector_motion_poll_ids');
-CREATE TRIGGER tr_log_projector_t_used_as_default_projector_for_poll_inf6f7d63 AFTER INSERT OR UPDATE OF used_as_default_projector_for_poll_in_meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'used_as_default_projector_for_poll_in_meeting_id', 'default_projector_poll_ids');
-CREATE TRIGGER tr_log_projector_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON projector_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'projector_ids');
-
-CREATE TRIGGER tr_log_projector_countdown AFTER INSERT OR UPDATE OR DELETE ON projector_countdown_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('projector_countdown');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON projector_countdown_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_projector_countdown_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON projector_countdown_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'projector_countdown_ids');
-
-CREATE TRIGGER tr_log_projector_message AFTER INSERT OR UPDATE OR DELETE ON projector_message_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('projector_message');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON projector_message_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_projector_message_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON projector_message_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'projector_message_ids');
-
-CREATE TRIGGER tr_log_speaker AFTER INSERT OR UPDATE OR DELETE ON speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('speaker');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON speaker_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_speaker_t_list_of_speakers_id AFTER INSERT OR UPDATE OF list_of_speakers_id OR DELETE ON speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('list_of_speakers', 'list_of_speakers_id', 'speaker_ids');
-CREATE TRIGGER tr_log_speaker_t_structure_level_list_of_speakers_id AFTER INSERT OR UPDATE OF structure_level_list_of_speakers_id OR DELETE ON speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('structure_level_list_of_speakers', 'structure_level_list_of_speakers_id', 'speaker_ids');
-CREATE TRIGGER tr_log_speaker_t_meeting_user_id AFTER INSERT OR UPDATE OF meeting_user_id OR DELETE ON speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting_user', 'meeting_user_id', 'speaker_ids');
-CREATE TRIGGER tr_log_speaker_t_point_of_order_category_id AFTER INSERT OR UPDATE OF point_of_order_category_id OR DELETE ON speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('point_of_order_category', 'point_of_order_category_id', 'speaker_ids');
-CREATE TRIGGER tr_log_speaker_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON speaker_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'speaker_ids');
-
-CREATE TRIGGER tr_log_structure_level AFTER INSERT OR UPDATE OR DELETE ON structure_level_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('structure_level');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON structure_level_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_structure_level_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON structure_level_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'structure_level_ids');
-
-CREATE TRIGGER tr_log_structure_level_list_of_speakers AFTER INSERT OR UPDATE OR DELETE ON structure_level_list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('structure_level_list_of_speakers');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON structure_level_list_of_speakers_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_structure_level_list_of_speakers_t_structure_level_id AFTER INSERT OR UPDATE OF structure_level_id OR DELETE ON structure_level_list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('structure_level', 'structure_level_id', 'structure_level_list_of_speakers_ids');
-CREATE TRIGGER tr_log_structure_level_list_of_speakers_t_list_of_speakers_id AFTER INSERT OR UPDATE OF list_of_speakers_id OR DELETE ON structure_level_list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('list_of_speakers', 'list_of_speakers_id', 'structure_level_list_of_speakers_ids');
-CREATE TRIGGER tr_log_structure_level_list_of_speakers_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON structure_level_list_of_speakers_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'structure_level_list_of_speakers_ids');
-
-CREATE TRIGGER tr_log_tag AFTER INSERT OR UPDATE OR DELETE ON tag_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('tag');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON tag_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-
-CREATE TRIGGER tr_log_tagged_id_agenda_item_id_gm_tag_tagged_ids_t AFTER INSERT OR UPDATE OF tagged_id_agenda_item_id OR DELETE ON gm_tag_tagged_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('tag','tag_id','tagged_ids','agenda_item','tagged_id_agenda_item_id','tag_ids');
-
-CREATE TRIGGER tr_log_tagged_id_assignment_id_gm_tag_tagged_ids_t AFTER INSERT OR UPDATE OF tagged_id_assignment_id OR DELETE ON gm_tag_tagged_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('tag','tag_id','tagged_ids','assignment','tagged_id_assignment_id','tag_ids');
-
-CREATE TRIGGER tr_log_tagged_id_motion_id_gm_tag_tagged_ids_t AFTER INSERT OR UPDATE OF tagged_id_motion_id OR DELETE ON gm_tag_tagged_ids_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('tag','tag_id','tagged_ids','motion','tagged_id_motion_id','tag_ids');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON gm_tag_tagged_ids_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-CREATE TRIGGER tr_log_tag_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON tag_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'tag_ids');
-
-CREATE TRIGGER tr_log_theme AFTER INSERT OR UPDATE OR DELETE ON theme_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('theme');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON theme_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_theme_t_organization_id AFTER INSERT OR UPDATE OF organization_id OR DELETE ON theme_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization', 'organization_id', 'theme_ids');
-
-CREATE TRIGGER tr_log_topic AFTER INSERT OR UPDATE OR DELETE ON topic_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('topic');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON topic_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_topic_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON topic_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'topic_ids');
-
-CREATE TRIGGER tr_log_user AFTER INSERT OR UPDATE OR DELETE ON user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('user');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON user_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_user_t_gender_id AFTER INSERT OR UPDATE OF gender_id OR DELETE ON user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('gender', 'gender_id', 'user_ids');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('meeting', 'meeting_id', '', 'user_ids', 'user_id', '');
+
+
+CREATE TRIGGER tr_log_i_meeting_mediafile AFTER INSERT ON meeting_mediafile_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('meeting_mediafile', 'mediafile', 'mediafile_id', 'meeting_mediafile_ids', 'id', 'meeting', 'meeting_id', 'meeting_mediafile_ids', 'id');
+CREATE TRIGGER tr_log_u_meeting_mediafile AFTER UPDATE ON meeting_mediafile_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('meeting_mediafile', 'mediafile', 'mediafile_id', 'meeting_mediafile_ids', 'id', 'meeting', 'meeting_id', 'meeting_mediafile_ids', 'id');
+CREATE TRIGGER tr_log_d_meeting_mediafile AFTER DELETE ON meeting_mediafile_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('meeting_mediafile', 'mediafile', 'mediafile_id', 'meeting_mediafile_ids', 'id', 'meeting', 'meeting_id', 'meeting_mediafile_ids', 'id');
+
+
+CREATE TRIGGER tr_log_i_gm_meeting_mediafile_attachment_ids_t AFTER INSERT ON gm_meeting_mediafile_attachment_ids_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'meeting_mediafile', 'meeting_mediafile_id', 'attachment_ids', 'attachment_id', 'motion', 'attachment_id_motion_id', 'attachment_meeting_mediafile_ids', 'meeting_mediafile_id', 'topic', 'attachment_id_topic_id', 'attachment_meeting_mediafile_ids', 'meeting_mediafile_id', 'assignment', 'attachment_id_assignment_id', 'attachment_meeting_mediafile_ids', 'meeting_mediafile_id');
+CREATE TRIGGER tr_log_u_gm_meeting_mediafile_attachment_ids_t AFTER UPDATE ON gm_meeting_mediafile_attachment_ids_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'meeting_mediafile', 'meeting_mediafile_id', 'attachment_ids', 'attachment_id', 'motion', 'attachment_id_motion_id', 'attachment_meeting_mediafile_ids', 'meeting_mediafile_id', 'topic', 'attachment_id_topic_id', 'attachment_meeting_mediafile_ids', 'meeting_mediafile_id', 'assignment', 'attachment_id_assignment_id', 'attachment_meeting_mediafile_ids', 'meeting_mediafile_id');
+CREATE TRIGGER tr_log_d_gm_meeting_mediafile_attachment_ids_t AFTER DELETE ON gm_meeting_mediafile_attachment_ids_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'meeting_mediafile', 'meeting_mediafile_id', 'attachment_ids', 'attachment_id', 'motion', 'attachment_id_motion_id', 'attachment_meeting_mediafile_ids', 'meeting_mediafile_id', 'topic', 'attachment_id_topic_id', 'attachment_meeting_mediafile_ids', 'meeting_mediafile_id', 'assignment', 'attachment_id_assignment_id', 'attachment_meeting_mediafile_ids', 'meeting_mediafile_id');
+
+CREATE TRIGGER tr_log_i_meeting_user AFTER INSERT ON meeting_user_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('meeting_user', 'user', 'user_id', 'meeting_user_ids', 'id', 'meeting', 'meeting_id', 'meeting_user_ids', 'id', 'meeting_user', 'vote_delegated_to_id', 'vote_delegations_from_ids', 'id');
+CREATE TRIGGER tr_log_u_meeting_user AFTER UPDATE ON meeting_user_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('meeting_user', 'user', 'user_id', 'meeting_user_ids', 'id', 'meeting', 'meeting_id', 'meeting_user_ids', 'id', 'meeting_user', 'vote_delegated_to_id', 'vote_delegations_from_ids', 'id');
+CREATE TRIGGER tr_log_d_meeting_user AFTER DELETE ON meeting_user_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('meeting_user', 'user', 'user_id', 'meeting_user_ids', 'id', 'meeting', 'meeting_id', 'meeting_user_ids', 'id', 'meeting_user', 'vote_delegated_to_id', 'vote_delegations_from_ids', 'id');
+
+
+CREATE TRIGGER tr_log_i_nm_meeting_user_structure_level_ids_structure_level_t AFTER INSERT ON nm_meeting_user_structure_level_ids_structure_level_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'meeting_user', 'meeting_user_id', 'structure_level_ids', 'structure_level_id', 'structure_level', 'structure_level_id', 'meeting_user_ids', 'meeting_user_id');
+CREATE TRIGGER tr_log_u_nm_meeting_user_structure_level_ids_structure_level_t AFTER UPDATE ON nm_meeting_user_structure_level_ids_structure_level_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'meeting_user', 'meeting_user_id', 'structure_level_ids', 'structure_level_id', 'structure_level', 'structure_level_id', 'meeting_user_ids', 'meeting_user_id');
+CREATE TRIGGER tr_log_d_nm_meeting_user_structure_level_ids_structure_level_t AFTER DELETE ON nm_meeting_user_structure_level_ids_structure_level_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'meeting_user', 'meeting_user_id', 'structure_level_ids', 'structure_level_id', 'structure_level', 'structure_level_id', 'meeting_user_ids', 'meeting_user_id');
+
+CREATE TRIGGER tr_log_i_motion AFTER INSERT ON motion_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion', 'motion', 'lead_motion_id', 'amendment_ids', 'id', 'motion', 'sort_parent_id', 'sort_child_ids', 'id', 'motion', 'origin_id', 'derived_motion_ids', 'id', 'meeting', 'origin_meeting_id', 'forwarded_motion_ids', 'id', 'motion_state', 'state_id', 'motion_ids', 'id', 'motion_state', 'recommendation_id', 'motion_recommendation_ids', 'id', 'motion_category', 'category_id', 'motion_ids', 'id', 'motion_block', 'block_id', 'motion_ids', 'id', 'meeting', 'meeting_id', 'motion_ids', 'id');
+CREATE TRIGGER tr_log_u_motion AFTER UPDATE ON motion_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion', 'motion', 'lead_motion_id', 'amendment_ids', 'id', 'motion', 'sort_parent_id', 'sort_child_ids', 'id', 'motion', 'origin_id', 'derived_motion_ids', 'id', 'meeting', 'origin_meeting_id', 'forwarded_motion_ids', 'id', 'motion_state', 'state_id', 'motion_ids', 'id', 'motion_state', 'recommendation_id', 'motion_recommendation_ids', 'id', 'motion_category', 'category_id', 'motion_ids', 'id', 'motion_block', 'block_id', 'motion_ids', 'id', 'meeting', 'meeting_id', 'motion_ids', 'id');
+CREATE TRIGGER tr_log_d_motion AFTER DELETE ON motion_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion', 'motion', 'lead_motion_id', 'amendment_ids', 'id', 'motion', 'sort_parent_id', 'sort_child_ids', 'id', 'motion', 'origin_id', 'derived_motion_ids', 'id', 'meeting', 'origin_meeting_id', 'forwarded_motion_ids', 'id', 'motion_state', 'state_id', 'motion_ids', 'id', 'motion_state', 'recommendation_id', 'motion_recommendation_ids', 'id', 'motion_category', 'category_id', 'motion_ids', 'id', 'motion_block', 'block_id', 'motion_ids', 'id', 'meeting', 'meeting_id', 'motion_ids', 'id');
+
+
+CREATE TRIGGER tr_log_i_nm_motion_all_derived_motion_ids_motion_t AFTER INSERT ON nm_motion_all_derived_motion_ids_motion_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'all_origin_id', 'all_derived_motion_ids', 'all_derived_motion_id', 'motion', 'all_derived_motion_id', 'all_origin_ids', 'all_origin_id');
+CREATE TRIGGER tr_log_u_nm_motion_all_derived_motion_ids_motion_t AFTER UPDATE ON nm_motion_all_derived_motion_ids_motion_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'all_origin_id', 'all_derived_motion_ids', 'all_derived_motion_id', 'motion', 'all_derived_motion_id', 'all_origin_ids', 'all_origin_id');
+CREATE TRIGGER tr_log_d_nm_motion_all_derived_motion_ids_motion_t AFTER DELETE ON nm_motion_all_derived_motion_ids_motion_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'all_origin_id', 'all_derived_motion_ids', 'all_derived_motion_id', 'motion', 'all_derived_motion_id', 'all_origin_ids', 'all_origin_id');
+
+CREATE TRIGGER tr_log_i_nm_motion_identical_motion_ids_motion_t AFTER INSERT ON nm_motion_identical_motion_ids_motion_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'identical_motion_id_1', 'identical_motion_ids', 'identical_motion_id_2', 'motion', 'identical_motion_id_2', 'identical_motion_ids', 'identical_motion_id_1');
+CREATE TRIGGER tr_log_u_nm_motion_identical_motion_ids_motion_t AFTER UPDATE ON nm_motion_identical_motion_ids_motion_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'identical_motion_id_1', 'identical_motion_ids', 'identical_motion_id_2', 'motion', 'identical_motion_id_2', 'identical_motion_ids', 'identical_motion_id_1');
+CREATE TRIGGER tr_log_d_nm_motion_identical_motion_ids_motion_t AFTER DELETE ON nm_motion_identical_motion_ids_motion_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'identical_motion_id_1', 'identical_motion_ids', 'identical_motion_id_2', 'motion', 'identical_motion_id_2', 'identical_motion_ids', 'identical_motion_id_1');
+
+CREATE TRIGGER tr_log_i_gm_motion_state_extension_reference_ids_t AFTER INSERT ON gm_motion_state_extension_reference_ids_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'motion_id', 'state_extension_reference_ids', 'state_extension_reference_id', 'motion', 'state_extension_reference_id_motion_id', 'referenced_in_motion_state_extension_ids', 'motion_id');
+CREATE TRIGGER tr_log_u_gm_motion_state_extension_reference_ids_t AFTER UPDATE ON gm_motion_state_extension_reference_ids_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'motion_id', 'state_extension_reference_ids', 'state_extension_reference_id', 'motion', 'state_extension_reference_id_motion_id', 'referenced_in_motion_state_extension_ids', 'motion_id');
+CREATE TRIGGER tr_log_d_gm_motion_state_extension_reference_ids_t AFTER DELETE ON gm_motion_state_extension_reference_ids_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'motion_id', 'state_extension_reference_ids', 'state_extension_reference_id', 'motion', 'state_extension_reference_id_motion_id', 'referenced_in_motion_state_extension_ids', 'motion_id');
+
+CREATE TRIGGER tr_log_i_gm_motion_recommendation_extension_reference_ids_t AFTER INSERT ON gm_motion_recommendation_extension_reference_ids_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'motion_id', 'recommendation_extension_reference_ids', 'recommendation_extension_reference_id', 'motion', 'recommendation_extension_reference_id_motion_id', 'referenced_in_motion_recommendation_extension_ids', 'motion_id');
+CREATE TRIGGER tr_log_u_gm_motion_recommendation_extension_reference_ids_t AFTER UPDATE ON gm_motion_recommendation_extension_reference_ids_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'motion_id', 'recommendation_extension_reference_ids', 'recommendation_extension_reference_id', 'motion', 'recommendation_extension_reference_id_motion_id', 'referenced_in_motion_recommendation_extension_ids', 'motion_id');
+CREATE TRIGGER tr_log_d_gm_motion_recommendation_extension_reference_ids_t AFTER DELETE ON gm_motion_recommendation_extension_reference_ids_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion', 'motion_id', 'recommendation_extension_reference_ids', 'recommendation_extension_reference_id', 'motion', 'recommendation_extension_reference_id_motion_id', 'referenced_in_motion_recommendation_extension_ids', 'motion_id');
+
+CREATE TRIGGER tr_log_i_motion_block AFTER INSERT ON motion_block_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_block', 'meeting', 'meeting_id', 'motion_block_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_block AFTER UPDATE ON motion_block_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_block', 'meeting', 'meeting_id', 'motion_block_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_block AFTER DELETE ON motion_block_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_block', 'meeting', 'meeting_id', 'motion_block_ids', 'id');
+
+CREATE TRIGGER tr_log_i_motion_category AFTER INSERT ON motion_category_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_category', 'motion_category', 'parent_id', 'child_ids', 'id', 'meeting', 'meeting_id', 'motion_category_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_category AFTER UPDATE ON motion_category_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_category', 'motion_category', 'parent_id', 'child_ids', 'id', 'meeting', 'meeting_id', 'motion_category_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_category AFTER DELETE ON motion_category_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_category', 'motion_category', 'parent_id', 'child_ids', 'id', 'meeting', 'meeting_id', 'motion_category_ids', 'id');
+
+CREATE TRIGGER tr_log_i_motion_change_recommendation AFTER INSERT ON motion_change_recommendation_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_change_recommendation', 'motion', 'motion_id', 'change_recommendation_ids', 'id', 'meeting', 'meeting_id', 'motion_change_recommendation_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_change_recommendation AFTER UPDATE ON motion_change_recommendation_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_change_recommendation', 'motion', 'motion_id', 'change_recommendation_ids', 'id', 'meeting', 'meeting_id', 'motion_change_recommendation_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_change_recommendation AFTER DELETE ON motion_change_recommendation_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_change_recommendation', 'motion', 'motion_id', 'change_recommendation_ids', 'id', 'meeting', 'meeting_id', 'motion_change_recommendation_ids', 'id');
+
+CREATE TRIGGER tr_log_i_motion_comment AFTER INSERT ON motion_comment_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_comment', 'motion', 'motion_id', 'comment_ids', 'id', 'motion_comment_section', 'section_id', 'comment_ids', 'id', 'meeting', 'meeting_id', 'motion_comment_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_comment AFTER UPDATE ON motion_comment_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_comment', 'motion', 'motion_id', 'comment_ids', 'id', 'motion_comment_section', 'section_id', 'comment_ids', 'id', 'meeting', 'meeting_id', 'motion_comment_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_comment AFTER DELETE ON motion_comment_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_comment', 'motion', 'motion_id', 'comment_ids', 'id', 'motion_comment_section', 'section_id', 'comment_ids', 'id', 'meeting', 'meeting_id', 'motion_comment_ids', 'id');
+
+CREATE TRIGGER tr_log_i_motion_comment_section AFTER INSERT ON motion_comment_section_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_comment_section', 'meeting', 'meeting_id', 'motion_comment_section_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_comment_section AFTER UPDATE ON motion_comment_section_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_comment_section', 'meeting', 'meeting_id', 'motion_comment_section_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_comment_section AFTER DELETE ON motion_comment_section_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_comment_section', 'meeting', 'meeting_id', 'motion_comment_section_ids', 'id');
+
+CREATE TRIGGER tr_log_i_motion_editor AFTER INSERT ON motion_editor_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_editor', 'meeting_user', 'meeting_user_id', 'motion_editor_ids', 'id', 'motion', 'motion_id', 'editor_ids', 'id', 'meeting', 'meeting_id', 'motion_editor_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_editor AFTER UPDATE ON motion_editor_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_editor', 'meeting_user', 'meeting_user_id', 'motion_editor_ids', 'id', 'motion', 'motion_id', 'editor_ids', 'id', 'meeting', 'meeting_id', 'motion_editor_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_editor AFTER DELETE ON motion_editor_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_editor', 'meeting_user', 'meeting_user_id', 'motion_editor_ids', 'id', 'motion', 'motion_id', 'editor_ids', 'id', 'meeting', 'meeting_id', 'motion_editor_ids', 'id');
+
+CREATE TRIGGER tr_log_i_motion_state AFTER INSERT ON motion_state_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_state', 'motion_state', 'submitter_withdraw_state_id', 'submitter_withdraw_back_ids', 'id', 'motion_workflow', 'workflow_id', 'state_ids', 'id', 'meeting', 'meeting_id', 'motion_state_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_state AFTER UPDATE ON motion_state_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_state', 'motion_state', 'submitter_withdraw_state_id', 'submitter_withdraw_back_ids', 'id', 'motion_workflow', 'workflow_id', 'state_ids', 'id', 'meeting', 'meeting_id', 'motion_state_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_state AFTER DELETE ON motion_state_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_state', 'motion_state', 'submitter_withdraw_state_id', 'submitter_withdraw_back_ids', 'id', 'motion_workflow', 'workflow_id', 'state_ids', 'id', 'meeting', 'meeting_id', 'motion_state_ids', 'id');
+
+
+CREATE TRIGGER tr_log_i_nm_motion_state_next_state_ids_motion_state_t AFTER INSERT ON nm_motion_state_next_state_ids_motion_state_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion_state', 'previous_state_id', 'next_state_ids', 'next_state_id', 'motion_state', 'next_state_id', 'previous_state_ids', 'previous_state_id');
+CREATE TRIGGER tr_log_u_nm_motion_state_next_state_ids_motion_state_t AFTER UPDATE ON nm_motion_state_next_state_ids_motion_state_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion_state', 'previous_state_id', 'next_state_ids', 'next_state_id', 'motion_state', 'next_state_id', 'previous_state_ids', 'previous_state_id');
+CREATE TRIGGER tr_log_d_nm_motion_state_next_state_ids_motion_state_t AFTER DELETE ON nm_motion_state_next_state_ids_motion_state_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'motion_state', 'previous_state_id', 'next_state_ids', 'next_state_id', 'motion_state', 'next_state_id', 'previous_state_ids', 'previous_state_id');
+
+CREATE TRIGGER tr_log_i_motion_submitter AFTER INSERT ON motion_submitter_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_submitter', 'meeting_user', 'meeting_user_id', 'motion_submitter_ids', 'id', 'motion', 'motion_id', 'submitter_ids', 'id', 'meeting', 'meeting_id', 'motion_submitter_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_submitter AFTER UPDATE ON motion_submitter_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_submitter', 'meeting_user', 'meeting_user_id', 'motion_submitter_ids', 'id', 'motion', 'motion_id', 'submitter_ids', 'id', 'meeting', 'meeting_id', 'motion_submitter_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_submitter AFTER DELETE ON motion_submitter_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_submitter', 'meeting_user', 'meeting_user_id', 'motion_submitter_ids', 'id', 'motion', 'motion_id', 'submitter_ids', 'id', 'meeting', 'meeting_id', 'motion_submitter_ids', 'id');
+
+CREATE TRIGGER tr_log_i_motion_supporter AFTER INSERT ON motion_supporter_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_supporter', 'meeting_user', 'meeting_user_id', 'motion_supporter_ids', 'id', 'motion', 'motion_id', 'supporter_ids', 'id', 'meeting', 'meeting_id', 'motion_supporter_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_supporter AFTER UPDATE ON motion_supporter_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_supporter', 'meeting_user', 'meeting_user_id', 'motion_supporter_ids', 'id', 'motion', 'motion_id', 'supporter_ids', 'id', 'meeting', 'meeting_id', 'motion_supporter_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_supporter AFTER DELETE ON motion_supporter_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_supporter', 'meeting_user', 'meeting_user_id', 'motion_supporter_ids', 'id', 'motion', 'motion_id', 'supporter_ids', 'id', 'meeting', 'meeting_id', 'motion_supporter_ids', 'id');
+
+CREATE TRIGGER tr_log_i_motion_workflow AFTER INSERT ON motion_workflow_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_workflow', 'motion_state', 'first_state_id', 'first_state_of_workflow_id', 'id', 'meeting', 'meeting_id', 'motion_workflow_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_workflow AFTER UPDATE ON motion_workflow_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_workflow', 'motion_state', 'first_state_id', 'first_state_of_workflow_id', 'id', 'meeting', 'meeting_id', 'motion_workflow_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_workflow AFTER DELETE ON motion_workflow_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_workflow', 'motion_state', 'first_state_id', 'first_state_of_workflow_id', 'id', 'meeting', 'meeting_id', 'motion_workflow_ids', 'id');
+
+CREATE TRIGGER tr_log_i_motion_working_group_speaker AFTER INSERT ON motion_working_group_speaker_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_working_group_speaker', 'meeting_user', 'meeting_user_id', 'motion_working_group_speaker_ids', 'id', 'motion', 'motion_id', 'working_group_speaker_ids', 'id', 'meeting', 'meeting_id', 'motion_working_group_speaker_ids', 'id');
+CREATE TRIGGER tr_log_u_motion_working_group_speaker AFTER UPDATE ON motion_working_group_speaker_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_working_group_speaker', 'meeting_user', 'meeting_user_id', 'motion_working_group_speaker_ids', 'id', 'motion', 'motion_id', 'working_group_speaker_ids', 'id', 'meeting', 'meeting_id', 'motion_working_group_speaker_ids', 'id');
+CREATE TRIGGER tr_log_d_motion_working_group_speaker AFTER DELETE ON motion_working_group_speaker_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('motion_working_group_speaker', 'meeting_user', 'meeting_user_id', 'motion_working_group_speaker_ids', 'id', 'motion', 'motion_id', 'working_group_speaker_ids', 'id', 'meeting', 'meeting_id', 'motion_working_group_speaker_ids', 'id');
+
+CREATE TRIGGER tr_log_i_option AFTER INSERT ON option_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('option', 'poll', 'poll_id', 'option_ids', 'id', 'motion', 'content_object_id_motion_id', 'option_ids', 'id', 'user', 'content_object_id_user_id', 'option_ids', 'id', 'poll_candidate_list', 'content_object_id_poll_candidate_list_id', 'option_id', 'id', 'meeting', 'meeting_id', 'option_ids', 'id');
+CREATE TRIGGER tr_log_u_option AFTER UPDATE ON option_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('option', 'poll', 'poll_id', 'option_ids', 'id', 'motion', 'content_object_id_motion_id', 'option_ids', 'id', 'user', 'content_object_id_user_id', 'option_ids', 'id', 'poll_candidate_list', 'content_object_id_poll_candidate_list_id', 'option_id', 'id', 'meeting', 'meeting_id', 'option_ids', 'id');
+CREATE TRIGGER tr_log_d_option AFTER DELETE ON option_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('option', 'poll', 'poll_id', 'option_ids', 'id', 'motion', 'content_object_id_motion_id', 'option_ids', 'id', 'user', 'content_object_id_user_id', 'option_ids', 'id', 'poll_candidate_list', 'content_object_id_poll_candidate_list_id', 'option_id', 'id', 'meeting', 'meeting_id', 'option_ids', 'id');
+
+CREATE TRIGGER tr_log_i_organization AFTER INSERT ON organization_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('organization', 'theme', 'theme_id', 'theme_for_organization_id', 'id');
+CREATE TRIGGER tr_log_u_organization AFTER UPDATE ON organization_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('organization', 'theme', 'theme_id', 'theme_for_organization_id', 'id');
+CREATE TRIGGER tr_log_d_organization AFTER DELETE ON organization_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('organization', 'theme', 'theme_id', 'theme_for_organization_id', 'id');
+
+CREATE TRIGGER tr_log_i_organization_tag AFTER INSERT ON organization_tag_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('organization_tag', 'organization', 'organization_id', 'organization_tag_ids', 'id');
+CREATE TRIGGER tr_log_u_organization_tag AFTER UPDATE ON organization_tag_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('organization_tag', 'organization', 'organization_id', 'organization_tag_ids', 'id');
+CREATE TRIGGER tr_log_d_organization_tag AFTER DELETE ON organization_tag_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('organization_tag', 'organization', 'organization_id', 'organization_tag_ids', 'id');
+
+
+CREATE TRIGGER tr_log_i_gm_organization_tag_tagged_ids_t AFTER INSERT ON gm_organization_tag_tagged_ids_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'organization_tag', 'organization_tag_id', 'tagged_ids', 'tagged_id', 'committee', 'tagged_id_committee_id', 'organization_tag_ids', 'organization_tag_id', 'meeting', 'tagged_id_meeting_id', 'organization_tag_ids', 'organization_tag_id');
+CREATE TRIGGER tr_log_u_gm_organization_tag_tagged_ids_t AFTER UPDATE ON gm_organization_tag_tagged_ids_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'organization_tag', 'organization_tag_id', 'tagged_ids', 'tagged_id', 'committee', 'tagged_id_committee_id', 'organization_tag_ids', 'organization_tag_id', 'meeting', 'tagged_id_meeting_id', 'organization_tag_ids', 'organization_tag_id');
+CREATE TRIGGER tr_log_d_gm_organization_tag_tagged_ids_t AFTER DELETE ON gm_organization_tag_tagged_ids_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'organization_tag', 'organization_tag_id', 'tagged_ids', 'tagged_id', 'committee', 'tagged_id_committee_id', 'organization_tag_ids', 'organization_tag_id', 'meeting', 'tagged_id_meeting_id', 'organization_tag_ids', 'organization_tag_id');
+
+CREATE TRIGGER tr_log_i_personal_note AFTER INSERT ON personal_note_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('personal_note', 'meeting_user', 'meeting_user_id', 'personal_note_ids', 'id', 'motion', 'content_object_id_motion_id', 'personal_note_ids', 'id', 'meeting', 'meeting_id', 'personal_note_ids', 'id');
+CREATE TRIGGER tr_log_u_personal_note AFTER UPDATE ON personal_note_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('personal_note', 'meeting_user', 'meeting_user_id', 'personal_note_ids', 'id', 'motion', 'content_object_id_motion_id', 'personal_note_ids', 'id', 'meeting', 'meeting_id', 'personal_note_ids', 'id');
+CREATE TRIGGER tr_log_d_personal_note AFTER DELETE ON personal_note_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('personal_note', 'meeting_user', 'meeting_user_id', 'personal_note_ids', 'id', 'motion', 'content_object_id_motion_id', 'personal_note_ids', 'id', 'meeting', 'meeting_id', 'personal_note_ids', 'id');
+
+CREATE TRIGGER tr_log_i_point_of_order_category AFTER INSERT ON point_of_order_category_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('point_of_order_category', 'meeting', 'meeting_id', 'point_of_order_category_ids', 'id');
+CREATE TRIGGER tr_log_u_point_of_order_category AFTER UPDATE ON point_of_order_category_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('point_of_order_category', 'meeting', 'meeting_id', 'point_of_order_category_ids', 'id');
+CREATE TRIGGER tr_log_d_point_of_order_category AFTER DELETE ON point_of_order_category_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('point_of_order_category', 'meeting', 'meeting_id', 'point_of_order_category_ids', 'id');
+
+CREATE TRIGGER tr_log_i_poll AFTER INSERT ON poll_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('poll', 'motion', 'content_object_id_motion_id', 'poll_ids', 'id', 'assignment', 'content_object_id_assignment_id', 'poll_ids', 'id', 'topic', 'content_object_id_topic_id', 'poll_ids', 'id', 'option', 'global_option_id', 'used_as_global_option_in_poll_id', 'id', 'meeting', 'meeting_id', 'poll_ids', 'id');
+CREATE TRIGGER tr_log_u_poll AFTER UPDATE ON poll_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('poll', 'motion', 'content_object_id_motion_id', 'poll_ids', 'id', 'assignment', 'content_object_id_assignment_id', 'poll_ids', 'id', 'topic', 'content_object_id_topic_id', 'poll_ids', 'id', 'option', 'global_option_id', 'used_as_global_option_in_poll_id', 'id', 'meeting', 'meeting_id', 'poll_ids', 'id');
+CREATE TRIGGER tr_log_d_poll AFTER DELETE ON poll_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('poll', 'motion', 'content_object_id_motion_id', 'poll_ids', 'id', 'assignment', 'content_object_id_assignment_id', 'poll_ids', 'id', 'topic', 'content_object_id_topic_id', 'poll_ids', 'id', 'option', 'global_option_id', 'used_as_global_option_in_poll_id', 'id', 'meeting', 'meeting_id', 'poll_ids', 'id');
+
+
+CREATE TRIGGER tr_log_i_nm_poll_voted_ids_user_t AFTER INSERT ON nm_poll_voted_ids_user_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'poll', 'poll_id', 'voted_ids', 'user_id', 'user', 'user_id', 'poll_voted_ids', 'poll_id');
+CREATE TRIGGER tr_log_u_nm_poll_voted_ids_user_t AFTER UPDATE ON nm_poll_voted_ids_user_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'poll', 'poll_id', 'voted_ids', 'user_id', 'user', 'user_id', 'poll_voted_ids', 'poll_id');
+CREATE TRIGGER tr_log_d_nm_poll_voted_ids_user_t AFTER DELETE ON nm_poll_voted_ids_user_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'poll', 'poll_id', 'voted_ids', 'user_id', 'user', 'user_id', 'poll_voted_ids', 'poll_id');
+
+CREATE TRIGGER tr_log_i_poll_candidate AFTER INSERT ON poll_candidate_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('poll_candidate', 'poll_candidate_list', 'poll_candidate_list_id', 'poll_candidate_ids', 'id', 'user', 'user_id', 'poll_candidate_ids', 'id', 'meeting', 'meeting_id', 'poll_candidate_ids', 'id');
+CREATE TRIGGER tr_log_u_poll_candidate AFTER UPDATE ON poll_candidate_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('poll_candidate', 'poll_candidate_list', 'poll_candidate_list_id', 'poll_candidate_ids', 'id', 'user', 'user_id', 'poll_candidate_ids', 'id', 'meeting', 'meeting_id', 'poll_candidate_ids', 'id');
+CREATE TRIGGER tr_log_d_poll_candidate AFTER DELETE ON poll_candidate_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('poll_candidate', 'poll_candidate_list', 'poll_candidate_list_id', 'poll_candidate_ids', 'id', 'user', 'user_id', 'poll_candidate_ids', 'id', 'meeting', 'meeting_id', 'poll_candidate_ids', 'id');
+
+CREATE TRIGGER tr_log_i_poll_candidate_list AFTER INSERT ON poll_candidate_list_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('poll_candidate_list', 'meeting', 'meeting_id', 'poll_candidate_list_ids', 'id');
+CREATE TRIGGER tr_log_u_poll_candidate_list AFTER UPDATE ON poll_candidate_list_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('poll_candidate_list', 'meeting', 'meeting_id', 'poll_candidate_list_ids', 'id');
+CREATE TRIGGER tr_log_d_poll_candidate_list AFTER DELETE ON poll_candidate_list_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('poll_candidate_list', 'meeting', 'meeting_id', 'poll_candidate_list_ids', 'id');
+
+CREATE TRIGGER tr_log_i_projection AFTER INSERT ON projection_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projection', 'projector', 'current_projector_id', 'current_projection_ids', 'id', 'projector', 'preview_projector_id', 'preview_projection_ids', 'id', 'projector', 'history_projector_id', 'history_projection_ids', 'id', 'meeting', 'content_object_id_meeting_id', 'projection_ids', 'id', 'motion', 'content_object_id_motion_id', 'projection_ids', 'id', 'meeting_mediafile', 'content_object_id_meeting_mediafile_id', 'projection_ids', 'id', 'list_of_speakers', 'content_object_id_list_of_speakers_id', 'projection_ids', 'id', 'motion_block', 'content_object_id_motion_block_id', 'projection_ids', 'id', 'assignment', 'content_object_id_assignment_id', 'projection_ids', 'id', 'agenda_item', 'content_object_id_agenda_item_id', 'projection_ids', 'id', 'topic', 'content_object_id_topic_id', 'projection_ids', 'id', 'poll', 'content_object_id_poll_id', 'projection_ids', 'id', 'projector_message', 'content_object_id_projector_message_id', 'projection_ids', 'id', 'projector_countdown', 'content_object_id_projector_countdown_id', 'projection_ids', 'id', 'meeting', 'meeting_id', 'all_projection_ids', 'id');
+CREATE TRIGGER tr_log_u_projection AFTER UPDATE ON projection_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projection', 'projector', 'current_projector_id', 'current_projection_ids', 'id', 'projector', 'preview_projector_id', 'preview_projection_ids', 'id', 'projector', 'history_projector_id', 'history_projection_ids', 'id', 'meeting', 'content_object_id_meeting_id', 'projection_ids', 'id', 'motion', 'content_object_id_motion_id', 'projection_ids', 'id', 'meeting_mediafile', 'content_object_id_meeting_mediafile_id', 'projection_ids', 'id', 'list_of_speakers', 'content_object_id_list_of_speakers_id', 'projection_ids', 'id', 'motion_block', 'content_object_id_motion_block_id', 'projection_ids', 'id', 'assignment', 'content_object_id_assignment_id', 'projection_ids', 'id', 'agenda_item', 'content_object_id_agenda_item_id', 'projection_ids', 'id', 'topic', 'content_object_id_topic_id', 'projection_ids', 'id', 'poll', 'content_object_id_poll_id', 'projection_ids', 'id', 'projector_message', 'content_object_id_projector_message_id', 'projection_ids', 'id', 'projector_countdown', 'content_object_id_projector_countdown_id', 'projection_ids', 'id', 'meeting', 'meeting_id', 'all_projection_ids', 'id');
+CREATE TRIGGER tr_log_d_projection AFTER DELETE ON projection_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projection', 'projector', 'current_projector_id', 'current_projection_ids', 'id', 'projector', 'preview_projector_id', 'preview_projection_ids', 'id', 'projector', 'history_projector_id', 'history_projection_ids', 'id', 'meeting', 'content_object_id_meeting_id', 'projection_ids', 'id', 'motion', 'content_object_id_motion_id', 'projection_ids', 'id', 'meeting_mediafile', 'content_object_id_meeting_mediafile_id', 'projection_ids', 'id', 'list_of_speakers', 'content_object_id_list_of_speakers_id', 'projection_ids', 'id', 'motion_block', 'content_object_id_motion_block_id', 'projection_ids', 'id', 'assignment', 'content_object_id_assignment_id', 'projection_ids', 'id', 'agenda_item', 'content_object_id_agenda_item_id', 'projection_ids', 'id', 'topic', 'content_object_id_topic_id', 'projection_ids', 'id', 'poll', 'content_object_id_poll_id', 'projection_ids', 'id', 'projector_message', 'content_object_id_projector_message_id', 'projection_ids', 'id', 'projector_countdown', 'content_object_id_projector_countdown_id', 'projection_ids', 'id', 'meeting', 'meeting_id', 'all_projection_ids', 'id');
+
+CREATE TRIGGER tr_log_i_projector AFTER INSERT ON projector_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projector', 'meeting', 'used_as_default_projector_for_agenda_item_list_in_meeting_id', 'default_projector_agenda_item_list_ids', 'id', 'meeting', 'used_as_default_projector_for_topic_in_meeting_id', 'default_projector_topic_ids', 'id', 'meeting', 'used_as_default_projector_for_list_of_speakers_in_meeting_id', 'default_projector_list_of_speakers_ids', 'id', 'meeting', 'used_as_default_projector_for_current_los_in_meeting_id', 'default_projector_current_los_ids', 'id', 'meeting', 'used_as_default_projector_for_motion_in_meeting_id', 'default_projector_motion_ids', 'id', 'meeting', 'used_as_default_projector_for_amendment_in_meeting_id', 'default_projector_amendment_ids', 'id', 'meeting', 'used_as_default_projector_for_motion_block_in_meeting_id', 'default_projector_motion_block_ids', 'id', 'meeting', 'used_as_default_projector_for_assignment_in_meeting_id', 'default_projector_assignment_ids', 'id', 'meeting', 'used_as_default_projector_for_mediafile_in_meeting_id', 'default_projector_mediafile_ids', 'id', 'meeting', 'used_as_default_projector_for_message_in_meeting_id', 'default_projector_message_ids', 'id', 'meeting', 'used_as_default_projector_for_countdown_in_meeting_id', 'default_projector_countdown_ids', 'id', 'meeting', 'used_as_default_projector_for_assignment_poll_in_meeting_id', 'default_projector_assignment_poll_ids', 'id', 'meeting', 'used_as_default_projector_for_motion_poll_in_meeting_id', 'default_projector_motion_poll_ids', 'id', 'meeting', 'used_as_default_projector_for_poll_in_meeting_id', 'default_projector_poll_ids', 'id', 'meeting', 'meeting_id', 'projector_ids', 'id');
+CREATE TRIGGER tr_log_u_projector AFTER UPDATE ON projector_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projector', 'meeting', 'used_as_default_projector_for_agenda_item_list_in_meeting_id', 'default_projector_agenda_item_list_ids', 'id', 'meeting', 'used_as_default_projector_for_topic_in_meeting_id', 'default_projector_topic_ids', 'id', 'meeting', 'used_as_default_projector_for_list_of_speakers_in_meeting_id', 'default_projector_list_of_speakers_ids', 'id', 'meeting', 'used_as_default_projector_for_current_los_in_meeting_id', 'default_projector_current_los_ids', 'id', 'meeting', 'used_as_default_projector_for_motion_in_meeting_id', 'default_projector_motion_ids', 'id', 'meeting', 'used_as_default_projector_for_amendment_in_meeting_id', 'default_projector_amendment_ids', 'id', 'meeting', 'used_as_default_projector_for_motion_block_in_meeting_id', 'default_projector_motion_block_ids', 'id', 'meeting', 'used_as_default_projector_for_assignment_in_meeting_id', 'default_projector_assignment_ids', 'id', 'meeting', 'used_as_default_projector_for_mediafile_in_meeting_id', 'default_projector_mediafile_ids', 'id', 'meeting', 'used_as_default_projector_for_message_in_meeting_id', 'default_projector_message_ids', 'id', 'meeting', 'used_as_default_projector_for_countdown_in_meeting_id', 'default_projector_countdown_ids', 'id', 'meeting', 'used_as_default_projector_for_assignment_poll_in_meeting_id', 'default_projector_assignment_poll_ids', 'id', 'meeting', 'used_as_default_projector_for_motion_poll_in_meeting_id', 'default_projector_motion_poll_ids', 'id', 'meeting', 'used_as_default_projector_for_poll_in_meeting_id', 'default_projector_poll_ids', 'id', 'meeting', 'meeting_id', 'projector_ids', 'id');
+CREATE TRIGGER tr_log_d_projector AFTER DELETE ON projector_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projector', 'meeting', 'used_as_default_projector_for_agenda_item_list_in_meeting_id', 'default_projector_agenda_item_list_ids', 'id', 'meeting', 'used_as_default_projector_for_topic_in_meeting_id', 'default_projector_topic_ids', 'id', 'meeting', 'used_as_default_projector_for_list_of_speakers_in_meeting_id', 'default_projector_list_of_speakers_ids', 'id', 'meeting', 'used_as_default_projector_for_current_los_in_meeting_id', 'default_projector_current_los_ids', 'id', 'meeting', 'used_as_default_projector_for_motion_in_meeting_id', 'default_projector_motion_ids', 'id', 'meeting', 'used_as_default_projector_for_amendment_in_meeting_id', 'default_projector_amendment_ids', 'id', 'meeting', 'used_as_default_projector_for_motion_block_in_meeting_id', 'default_projector_motion_block_ids', 'id', 'meeting', 'used_as_default_projector_for_assignment_in_meeting_id', 'default_projector_assignment_ids', 'id', 'meeting', 'used_as_default_projector_for_mediafile_in_meeting_id', 'default_projector_mediafile_ids', 'id', 'meeting', 'used_as_default_projector_for_message_in_meeting_id', 'default_projector_message_ids', 'id', 'meeting', 'used_as_default_projector_for_countdown_in_meeting_id', 'default_projector_countdown_ids', 'id', 'meeting', 'used_as_default_projector_for_assignment_poll_in_meeting_id', 'default_projector_assignment_poll_ids', 'id', 'meeting', 'used_as_default_projector_for_motion_poll_in_meeting_id', 'default_projector_motion_poll_ids', 'id', 'meeting', 'used_as_default_projector_for_poll_in_meeting_id', 'default_projector_poll_ids', 'id', 'meeting', 'meeting_id', 'projector_ids', 'id');
+
+CREATE TRIGGER tr_log_i_projector_countdown AFTER INSERT ON projector_countdown_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projector_countdown', 'meeting', 'meeting_id', 'projector_countdown_ids', 'id');
+CREATE TRIGGER tr_log_u_projector_countdown AFTER UPDATE ON projector_countdown_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projector_countdown', 'meeting', 'meeting_id', 'projector_countdown_ids', 'id');
+CREATE TRIGGER tr_log_d_projector_countdown AFTER DELETE ON projector_countdown_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projector_countdown', 'meeting', 'meeting_id', 'projector_countdown_ids', 'id');
+
+CREATE TRIGGER tr_log_i_projector_message AFTER INSERT ON projector_message_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projector_message', 'meeting', 'meeting_id', 'projector_message_ids', 'id');
+CREATE TRIGGER tr_log_u_projector_message AFTER UPDATE ON projector_message_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projector_message', 'meeting', 'meeting_id', 'projector_message_ids', 'id');
+CREATE TRIGGER tr_log_d_projector_message AFTER DELETE ON projector_message_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('projector_message', 'meeting', 'meeting_id', 'projector_message_ids', 'id');
+
+CREATE TRIGGER tr_log_i_speaker AFTER INSERT ON speaker_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('speaker', 'list_of_speakers', 'list_of_speakers_id', 'speaker_ids', 'id', 'structure_level_list_of_speakers', 'structure_level_list_of_speakers_id', 'speaker_ids', 'id', 'meeting_user', 'meeting_user_id', 'speaker_ids', 'id', 'point_of_order_category', 'point_of_order_category_id', 'speaker_ids', 'id', 'meeting', 'meeting_id', 'speaker_ids', 'id');
+CREATE TRIGGER tr_log_u_speaker AFTER UPDATE ON speaker_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('speaker', 'list_of_speakers', 'list_of_speakers_id', 'speaker_ids', 'id', 'structure_level_list_of_speakers', 'structure_level_list_of_speakers_id', 'speaker_ids', 'id', 'meeting_user', 'meeting_user_id', 'speaker_ids', 'id', 'point_of_order_category', 'point_of_order_category_id', 'speaker_ids', 'id', 'meeting', 'meeting_id', 'speaker_ids', 'id');
+CREATE TRIGGER tr_log_d_speaker AFTER DELETE ON speaker_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('speaker', 'list_of_speakers', 'list_of_speakers_id', 'speaker_ids', 'id', 'structure_level_list_of_speakers', 'structure_level_list_of_speakers_id', 'speaker_ids', 'id', 'meeting_user', 'meeting_user_id', 'speaker_ids', 'id', 'point_of_order_category', 'point_of_order_category_id', 'speaker_ids', 'id', 'meeting', 'meeting_id', 'speaker_ids', 'id');
+
+CREATE TRIGGER tr_log_i_structure_level AFTER INSERT ON structure_level_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('structure_level', 'meeting', 'meeting_id', 'structure_level_ids', 'id');
+CREATE TRIGGER tr_log_u_structure_level AFTER UPDATE ON structure_level_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('structure_level', 'meeting', 'meeting_id', 'structure_level_ids', 'id');
+CREATE TRIGGER tr_log_d_structure_level AFTER DELETE ON structure_level_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('structure_level', 'meeting', 'meeting_id', 'structure_level_ids', 'id');
+
+CREATE TRIGGER tr_log_i_structure_level_list_of_speakers AFTER INSERT ON structure_level_list_of_speakers_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('structure_level_list_of_speakers', 'structure_level', 'structure_level_id', 'structure_level_list_of_speakers_ids', 'id', 'list_of_speakers', 'list_of_speakers_id', 'structure_level_list_of_speakers_ids', 'id', 'meeting', 'meeting_id', 'structure_level_list_of_speakers_ids', 'id');
+CREATE TRIGGER tr_log_u_structure_level_list_of_speakers AFTER UPDATE ON structure_level_list_of_speakers_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('structure_level_list_of_speakers', 'structure_level', 'structure_level_id', 'structure_level_list_of_speakers_ids', 'id', 'list_of_speakers', 'list_of_speakers_id', 'structure_level_list_of_speakers_ids', 'id', 'meeting', 'meeting_id', 'structure_level_list_of_speakers_ids', 'id');
+CREATE TRIGGER tr_log_d_structure_level_list_of_speakers AFTER DELETE ON structure_level_list_of_speakers_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('structure_level_list_of_speakers', 'structure_level', 'structure_level_id', 'structure_level_list_of_speakers_ids', 'id', 'list_of_speakers', 'list_of_speakers_id', 'structure_level_list_of_speakers_ids', 'id', 'meeting', 'meeting_id', 'structure_level_list_of_speakers_ids', 'id');
+
+CREATE TRIGGER tr_log_i_tag AFTER INSERT ON tag_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('tag', 'meeting', 'meeting_id', 'tag_ids', 'id');
+CREATE TRIGGER tr_log_u_tag AFTER UPDATE ON tag_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('tag', 'meeting', 'meeting_id', 'tag_ids', 'id');
+CREATE TRIGGER tr_log_d_tag AFTER DELETE ON tag_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('tag', 'meeting', 'meeting_id', 'tag_ids', 'id');
+
+
+CREATE TRIGGER tr_log_i_gm_tag_tagged_ids_t AFTER INSERT ON gm_tag_tagged_ids_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'tag', 'tag_id', 'tagged_ids', 'tagged_id', 'agenda_item', 'tagged_id_agenda_item_id', 'tag_ids', 'tag_id', 'assignment', 'tagged_id_assignment_id', 'tag_ids', 'tag_id', 'motion', 'tagged_id_motion_id', 'tag_ids', 'tag_id');
+CREATE TRIGGER tr_log_u_gm_tag_tagged_ids_t AFTER UPDATE ON gm_tag_tagged_ids_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'tag', 'tag_id', 'tagged_ids', 'tagged_id', 'agenda_item', 'tagged_id_agenda_item_id', 'tag_ids', 'tag_id', 'assignment', 'tagged_id_assignment_id', 'tag_ids', 'tag_id', 'motion', 'tagged_id_motion_id', 'tag_ids', 'tag_id');
+CREATE TRIGGER tr_log_d_gm_tag_tagged_ids_t AFTER DELETE ON gm_tag_tagged_ids_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('', 'tag', 'tag_id', 'tagged_ids', 'tagged_id', 'agenda_item', 'tagged_id_agenda_item_id', 'tag_ids', 'tag_id', 'assignment', 'tagged_id_assignment_id', 'tag_ids', 'tag_id', 'motion', 'tagged_id_motion_id', 'tag_ids', 'tag_id');
+
+CREATE TRIGGER tr_log_i_theme AFTER INSERT ON theme_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('theme', 'organization', 'organization_id', 'theme_ids', 'id');
+CREATE TRIGGER tr_log_u_theme AFTER UPDATE ON theme_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('theme', 'organization', 'organization_id', 'theme_ids', 'id');
+CREATE TRIGGER tr_log_d_theme AFTER DELETE ON theme_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('theme', 'organization', 'organization_id', 'theme_ids', 'id');
+
+CREATE TRIGGER tr_log_i_topic AFTER INSERT ON topic_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('topic', 'meeting', 'meeting_id', 'topic_ids', 'id');
+CREATE TRIGGER tr_log_u_topic AFTER UPDATE ON topic_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('topic', 'meeting', 'meeting_id', 'topic_ids', 'id');
+CREATE TRIGGER tr_log_d_topic AFTER DELETE ON topic_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('topic', 'meeting', 'meeting_id', 'topic_ids', 'id');
+
+CREATE TRIGGER tr_log_i_user AFTER INSERT ON user_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('user', 'gender', 'gender_id', 'user_ids', 'id', 'committee', 'home_committee_id', 'native_user_ids', 'id', 'organization', 'organization_id', 'user_ids', 'id');
+CREATE TRIGGER tr_log_u_user AFTER UPDATE ON user_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('user', 'gender', 'gender_id', 'user_ids', 'id', 'committee', 'home_committee_id', 'native_user_ids', 'id', 'organization', 'organization_id', 'user_ids', 'id');
+CREATE TRIGGER tr_log_d_user AFTER DELETE ON user_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('user', 'gender', 'gender_id', 'user_ids', 'id', 'committee', 'home_committee_id', 'native_user_ids', 'id', 'organization', 'organization_id', 'user_ids', 'id');
+
 
 CREATE TRIGGER tr_log_i_user_committee_ids_from_meeting_user_t BEFORE INSERT ON meeting_user_t
 FOR EACH ROW EXECUTE FUNCTION log_iu_modified_calculated_id_array_field('user', 'user_id', '', 'committee_ids', '', 'SELECT committee_id FROM meeting_t WHERE id = ($1).meeting_id');
 CREATE TRIGGER tr_log_d_user_committee_ids_from_meeting_user_t AFTER DELETE ON meeting_user_t
-FOR EACH ROW EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('user', 'user_id', '', 'committee_ids', '', 'SELECT committee_id FROM meeting_t WHERE id = ($1).meeting_id');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('user', 'user_id', '', 'committee_ids', '', 'SELECT committee_id FROM meeting_t WHERE id = ($1).meeting_id');
 CREATE TRIGGER tr_log_i_user_committee_ids_from_nm_committee_manager_id3c34791 BEFORE INSERT ON nm_committee_manager_ids_user_t
 FOR EACH ROW EXECUTE FUNCTION log_iu_modified_calculated_id_array_field('user', 'user_id', '', 'committee_ids', 'committee_id', '');
 CREATE TRIGGER tr_log_d_user_committee_ids_from_nm_committee_manager_id8cfd923 AFTER DELETE ON nm_committee_manager_ids_user_t
-FOR EACH ROW EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('user', 'user_id', '', 'committee_ids', 'committee_id', '');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('user', 'user_id', '', 'committee_ids', 'committee_id', '');
 CREATE TRIGGER tr_log_iu_user_committee_ids_from_user_t BEFORE INSERT OR UPDATE OF home_committee_id ON user_t
 FOR EACH ROW EXECUTE FUNCTION log_iu_modified_calculated_id_array_field('user', 'id', '', 'committee_ids', 'home_committee_id', '');
 CREATE TRIGGER tr_log_ud_user_committee_ids_from_user_t AFTER UPDATE OF home_committee_id OR DELETE ON user_t
-FOR EACH ROW EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('user', 'id', '', 'committee_ids', 'home_committee_id', '');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('user', 'id', '', 'committee_ids', 'home_committee_id', '');
 
-CREATE TRIGGER tr_log_user_t_home_committee_id AFTER INSERT OR UPDATE OF home_committee_id OR DELETE ON user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('committee', 'home_committee_id', 'native_user_ids');
 
 CREATE TRIGGER tr_log_i_user_meeting_ids_from_meeting_user_t BEFORE INSERT ON meeting_user_t
 FOR EACH ROW EXECUTE FUNCTION log_iu_modified_calculated_id_array_field('user', 'user_id', '', 'meeting_ids', 'meeting_id', '');
 CREATE TRIGGER tr_log_d_user_meeting_ids_from_meeting_user_t AFTER DELETE ON meeting_user_t
-FOR EACH ROW EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('user', 'user_id', '', 'meeting_ids', 'meeting_id', '');
+FOR EACH ROW WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting()) EXECUTE FUNCTION log_ud_modified_calculated_id_array_field('user', 'user_id', '', 'meeting_ids', 'meeting_id', '');
 
-CREATE TRIGGER tr_log_user_t_organization_id AFTER INSERT OR UPDATE OF organization_id OR DELETE ON user_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('organization', 'organization_id', 'user_ids');
 
-CREATE TRIGGER tr_log_vote AFTER INSERT OR UPDATE OR DELETE ON vote_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_models('vote');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON vote_t
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-
-CREATE TRIGGER tr_log_vote_t_option_id AFTER INSERT OR UPDATE OF option_id OR DELETE ON vote_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('option', 'option_id', 'vote_ids');
-CREATE TRIGGER tr_log_vote_t_user_id AFTER INSERT OR UPDATE OF user_id OR DELETE ON vote_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('user', 'user_id', 'vote_ids');
-CREATE TRIGGER tr_log_vote_t_delegated_user_id AFTER INSERT OR UPDATE OF delegated_user_id OR DELETE ON vote_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('user', 'delegated_user_id', 'delegated_vote_ids');
-CREATE TRIGGER tr_log_vote_t_meeting_id AFTER INSERT OR UPDATE OF meeting_id OR DELETE ON vote_t
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('meeting', 'meeting_id', 'vote_ids');
+CREATE TRIGGER tr_log_i_vote AFTER INSERT ON vote_t
+REFERENCING NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('vote', 'option', 'option_id', 'vote_ids', 'id', 'user', 'user_id', 'vote_ids', 'id', 'user', 'delegated_user_id', 'delegated_vote_ids', 'id', 'meeting', 'meeting_id', 'vote_ids', 'id');
+CREATE TRIGGER tr_log_u_vote AFTER UPDATE ON vote_t
+REFERENCING OLD TABLE AS old_table NEW TABLE AS new_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('vote', 'option', 'option_id', 'vote_ids', 'id', 'user', 'user_id', 'vote_ids', 'id', 'user', 'delegated_user_id', 'delegated_vote_ids', 'id', 'meeting', 'meeting_id', 'vote_ids', 'id');
+CREATE TRIGGER tr_log_d_vote AFTER DELETE ON vote_t
+REFERENCING OLD TABLE AS old_table
+FOR EACH STATEMENT WHEN (current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on' OR NOT os_deleting_meeting())
+EXECUTE FUNCTION log_modified_models('vote', 'option', 'option_id', 'vote_ids', 'id', 'user', 'user_id', 'vote_ids', 'id', 'user', 'delegated_user_id', 'delegated_vote_ids', 'id', 'meeting', 'meeting_id', 'vote_ids', 'id');
 
 
 
@@ -5830,6 +6175,1467 @@ FOR EACH ROW EXECUTE FUNCTION check_equals('vote', 'option', 'option_id', 'meeti
 
 
 
+
+-- Meeting functions
+
+CREATE FUNCTION clone_meeting(source_meeting_id INTEGER, target_committee_id INTEGER)
+RETURNS INTEGER AS $clone_meeting$
+-- Copies the meeting with all its models into the committee and returns the id of the copy.
+-- Every table is copied with one INSERT ... SELECT, the new ids are drawn from the id
+-- sequences in advance and all references to copied models are mapped to them.
+-- The mediafiles owned by the meeting are copied, too, but not the history entries.
+-- References to models outside of the meeting, e.g. users and mediafiles of the
+-- organization, are kept, unique fields without relation, e.g. external_id, are left empty.
+-- Session state like the present users isn't copied.
+-- All foreign keys are deferred, so the tables don't need to be copied in dependency order.
+-- The log triggers run once per statement and the notify once per transaction.
+DECLARE
+    new_meeting_id INTEGER;
+BEGIN
+    CREATE TEMPORARY TABLE IF NOT EXISTS os_clone_id_map_t (
+        collection varchar(32),
+        old_id integer,
+        new_id integer,
+        PRIMARY KEY (collection, old_id)
+    ) ON COMMIT DROP;
+    TRUNCATE os_clone_id_map_t;
+
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'meeting', id, nextval(pg_get_serial_sequence('meeting_t', 'id'))
+    FROM (SELECT id FROM meeting_t WHERE id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'agenda_item', id, nextval(pg_get_serial_sequence('agenda_item_t', 'id'))
+    FROM (SELECT id FROM agenda_item_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'assignment', id, nextval(pg_get_serial_sequence('assignment_t', 'id'))
+    FROM (SELECT id FROM assignment_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'assignment_candidate', id, nextval(pg_get_serial_sequence('assignment_candidate_t', 'id'))
+    FROM (SELECT id FROM assignment_candidate_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'chat_group', id, nextval(pg_get_serial_sequence('chat_group_t', 'id'))
+    FROM (SELECT id FROM chat_group_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'chat_message', id, nextval(pg_get_serial_sequence('chat_message_t', 'id'))
+    FROM (SELECT id FROM chat_message_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'group', id, nextval(pg_get_serial_sequence('group_t', 'id'))
+    FROM (SELECT id FROM group_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'list_of_speakers', id, nextval(pg_get_serial_sequence('list_of_speakers_t', 'id'))
+    FROM (SELECT id FROM list_of_speakers_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'mediafile', id, nextval(pg_get_serial_sequence('mediafile_t', 'id'))
+    FROM (SELECT id FROM mediafile_t WHERE owner_id_meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'meeting_mediafile', id, nextval(pg_get_serial_sequence('meeting_mediafile_t', 'id'))
+    FROM (SELECT id FROM meeting_mediafile_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'meeting_user', id, nextval(pg_get_serial_sequence('meeting_user_t', 'id'))
+    FROM (SELECT id FROM meeting_user_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion', id, nextval(pg_get_serial_sequence('motion_t', 'id'))
+    FROM (SELECT id FROM motion_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_block', id, nextval(pg_get_serial_sequence('motion_block_t', 'id'))
+    FROM (SELECT id FROM motion_block_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_category', id, nextval(pg_get_serial_sequence('motion_category_t', 'id'))
+    FROM (SELECT id FROM motion_category_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_change_recommendation', id, nextval(pg_get_serial_sequence('motion_change_recommendation_t', 'id'))
+    FROM (SELECT id FROM motion_change_recommendation_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_comment', id, nextval(pg_get_serial_sequence('motion_comment_t', 'id'))
+    FROM (SELECT id FROM motion_comment_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_comment_section', id, nextval(pg_get_serial_sequence('motion_comment_section_t', 'id'))
+    FROM (SELECT id FROM motion_comment_section_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_editor', id, nextval(pg_get_serial_sequence('motion_editor_t', 'id'))
+    FROM (SELECT id FROM motion_editor_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_state', id, nextval(pg_get_serial_sequence('motion_state_t', 'id'))
+    FROM (SELECT id FROM motion_state_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_submitter', id, nextval(pg_get_serial_sequence('motion_submitter_t', 'id'))
+    FROM (SELECT id FROM motion_submitter_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_supporter', id, nextval(pg_get_serial_sequence('motion_supporter_t', 'id'))
+    FROM (SELECT id FROM motion_supporter_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_workflow', id, nextval(pg_get_serial_sequence('motion_workflow_t', 'id'))
+    FROM (SELECT id FROM motion_workflow_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'motion_working_group_speaker', id, nextval(pg_get_serial_sequence('motion_working_group_speaker_t', 'id'))
+    FROM (SELECT id FROM motion_working_group_speaker_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'option', id, nextval(pg_get_serial_sequence('option_t', 'id'))
+    FROM (SELECT id FROM option_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'personal_note', id, nextval(pg_get_serial_sequence('personal_note_t', 'id'))
+    FROM (SELECT id FROM personal_note_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'point_of_order_category', id, nextval(pg_get_serial_sequence('point_of_order_category_t', 'id'))
+    FROM (SELECT id FROM point_of_order_category_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'poll', id, nextval(pg_get_serial_sequence('poll_t', 'id'))
+    FROM (SELECT id FROM poll_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'poll_candidate', id, nextval(pg_get_serial_sequence('poll_candidate_t', 'id'))
+    FROM (SELECT id FROM poll_candidate_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'poll_candidate_list', id, nextval(pg_get_serial_sequence('poll_candidate_list_t', 'id'))
+    FROM (SELECT id FROM poll_candidate_list_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'projection', id, nextval(pg_get_serial_sequence('projection_t', 'id'))
+    FROM (SELECT id FROM projection_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'projector', id, nextval(pg_get_serial_sequence('projector_t', 'id'))
+    FROM (SELECT id FROM projector_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'projector_countdown', id, nextval(pg_get_serial_sequence('projector_countdown_t', 'id'))
+    FROM (SELECT id FROM projector_countdown_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'projector_message', id, nextval(pg_get_serial_sequence('projector_message_t', 'id'))
+    FROM (SELECT id FROM projector_message_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'speaker', id, nextval(pg_get_serial_sequence('speaker_t', 'id'))
+    FROM (SELECT id FROM speaker_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'structure_level', id, nextval(pg_get_serial_sequence('structure_level_t', 'id'))
+    FROM (SELECT id FROM structure_level_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'structure_level_list_of_speakers', id, nextval(pg_get_serial_sequence('structure_level_list_of_speakers_t', 'id'))
+    FROM (SELECT id FROM structure_level_list_of_speakers_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'tag', id, nextval(pg_get_serial_sequence('tag_t', 'id'))
+    FROM (SELECT id FROM tag_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'topic', id, nextval(pg_get_serial_sequence('topic_t', 'id'))
+    FROM (SELECT id FROM topic_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    INSERT INTO os_clone_id_map_t (collection, old_id, new_id)
+    SELECT 'vote', id, nextval(pg_get_serial_sequence('vote_t', 'id'))
+    FROM (SELECT id FROM vote_t WHERE meeting_id = source_meeting_id ORDER BY id) AS t;
+    ANALYZE os_clone_id_map_t;
+    SELECT new_id INTO new_meeting_id FROM os_clone_id_map_t WHERE collection = 'meeting';
+    IF new_meeting_id IS NULL THEN
+        RAISE EXCEPTION 'Meeting % does not exist', source_meeting_id;
+    END IF;
+
+    INSERT INTO meeting_t (id, external_id, welcome_title, welcome_text, name, is_active_in_organization_id, is_archived_in_organization_id, description, location, time_zone, start_time, end_time, locked_from_inside, imported_at, language, jitsi_domain, jitsi_room_name, jitsi_room_password, template_for_organization_id, enable_anonymous, custom_translations, conference_show, conference_auto_connect, conference_los_restriction, conference_stream_url, conference_stream_poster_url, conference_open_microphone, conference_open_video, conference_auto_connect_next_speakers, conference_enable_helpdesk, applause_enable, applause_type, applause_show_level, applause_min_amount, applause_max_amount, applause_timeout, applause_particle_image_url, projector_countdown_default_time, projector_countdown_warning_time, export_csv_encoding, export_csv_separator, export_pdf_pagenumber_alignment, export_pdf_fontsize, export_pdf_line_height, export_pdf_page_margin_left, export_pdf_page_margin_top, export_pdf_page_margin_right, export_pdf_page_margin_bottom, export_pdf_pagesize, agenda_show_subtitles, agenda_enable_numbering, agenda_number_prefix, agenda_numeral_system, agenda_item_creation, agenda_new_items_default_visibility, agenda_show_internal_items_on_projector, agenda_show_topic_navigation_on_detail_view, list_of_speakers_amount_last_on_projector, list_of_speakers_amount_next_on_projector, list_of_speakers_couple_countdown, list_of_speakers_show_amount_of_speakers_on_slide, list_of_speakers_present_users_only, list_of_speakers_show_first_contribution, list_of_speakers_hide_contribution_count, list_of_speakers_allow_multiple_speakers, list_of_speakers_enable_point_of_order_speakers, list_of_speakers_can_create_point_of_order_for_others, list_of_speakers_enable_point_of_order_categories, list_of_speakers_closing_disables_point_of_order, list_of_speakers_enable_pro_contra_speech, list_of_speakers_can_set_contribution_self, list_of_speakers_speaker_note_for_everyone, list_of_speakers_initially_closed, list_of_speakers_default_structure_level_time, list_of_speakers_enable_interposed_question, list_of_speakers_intervention_time, motions_default_workflow_id, motions_default_amendment_workflow_id, motions_preamble, motions_default_line_numbering, motions_line_length, motions_reason_required, motions_origin_motion_toggle_default, motions_enable_origin_motion_display, motions_enable_text_on_projector, motions_enable_reason_on_projector, motions_enable_sidebox_on_projector, motions_enable_recommendation_on_projector, motions_hide_metadata_background, motions_show_referring_motions, motions_show_sequential_number, motions_create_enable_additional_submitter_text, motions_recommendations_by, motions_block_slide_columns, motions_recommendation_text_mode, motions_default_sorting, motions_number_type, motions_number_min_digits, motions_number_with_blank, motions_amendments_enabled, motions_amendments_in_main_list, motions_amendments_of_amendments, motions_amendments_prefix, motions_amendments_text_mode, motions_amendments_multiple_paragraphs, motions_supporters_min_amount, motions_enable_editor, motions_enable_working_group_speaker, motions_export_title, motions_export_preamble, motions_export_submitter_recommendation, motions_export_follow_recommendation, motions_enable_restricted_editor_for_manager, motions_enable_restricted_editor_for_non_manager, motion_poll_ballot_paper_selection, motion_poll_ballot_paper_number, motion_poll_default_type, motion_poll_default_method, motion_poll_default_onehundred_percent_base, motion_poll_default_backend, motion_poll_projection_name_order_first, motion_poll_projection_max_columns, users_enable_presence_view, users_enable_vote_weight, users_allow_self_set_present, users_pdf_welcometitle, users_pdf_welcometext, users_pdf_wlan_ssid, users_pdf_wlan_password, users_pdf_wlan_encryption, users_email_sender, users_email_replyto, users_email_subject, users_email_body, users_enable_vote_delegations, users_forbid_delegator_in_list_of_speakers, users_forbid_delegator_as_submitter, users_forbid_delegator_as_supporter, users_forbid_delegator_to_vote, assignments_export_title, assignments_export_preamble, assignment_poll_ballot_paper_selection, assignment_poll_ballot_paper_number, assignment_poll_add_candidates_to_list_of_speakers, assignment_poll_enable_max_votes_per_option, assignment_poll_sort_poll_result_by_votes, assignment_poll_default_type, assignment_poll_default_method, assignment_poll_default_onehundred_percent_base, assignment_poll_default_backend, poll_ballot_paper_selection, poll_ballot_paper_number, poll_sort_poll_result_by_votes, poll_default_type, poll_default_method, poll_default_onehundred_percent_base, poll_default_backend, poll_default_live_voting_enabled, poll_couple_countdown, logo_projector_main_id, logo_projector_header_id, logo_web_header_id, logo_pdf_header_l_id, logo_pdf_header_r_id, logo_pdf_footer_l_id, logo_pdf_footer_r_id, logo_pdf_ballot_paper_id, font_regular_id, font_italic_id, font_bold_id, font_bold_italic_id, font_monospace_id, font_chyron_speaker_name_id, font_projector_h1_id, font_projector_h2_id, committee_id, reference_projector_id, list_of_speakers_countdown_id, poll_countdown_id, default_group_id, admin_group_id, anonymous_group_id)
+    SELECT m.new_id, NULL, t.welcome_title, t.welcome_text, t.name, t.is_active_in_organization_id, t.is_archived_in_organization_id, t.description, t.location, t.time_zone, t.start_time, t.end_time, t.locked_from_inside, t.imported_at, t.language, t.jitsi_domain, t.jitsi_room_name, t.jitsi_room_password, t.template_for_organization_id, t.enable_anonymous, t.custom_translations, t.conference_show, t.conference_auto_connect, t.conference_los_restriction, t.conference_stream_url, t.conference_stream_poster_url, t.conference_open_microphone, t.conference_open_video, t.conference_auto_connect_next_speakers, t.conference_enable_helpdesk, t.applause_enable, t.applause_type, t.applause_show_level, t.applause_min_amount, t.applause_max_amount, t.applause_timeout, t.applause_particle_image_url, t.projector_countdown_default_time, t.projector_countdown_warning_time, t.export_csv_encoding, t.export_csv_separator, t.export_pdf_pagenumber_alignment, t.export_pdf_fontsize, t.export_pdf_line_height, t.export_pdf_page_margin_left, t.export_pdf_page_margin_top, t.export_pdf_page_margin_right, t.export_pdf_page_margin_bottom, t.export_pdf_pagesize, t.agenda_show_subtitles, t.agenda_enable_numbering, t.agenda_number_prefix, t.agenda_numeral_system, t.agenda_item_creation, t.agenda_new_items_default_visibility, t.agenda_show_internal_items_on_projector, t.agenda_show_topic_navigation_on_detail_view, t.list_of_speakers_amount_last_on_projector, t.list_of_speakers_amount_next_on_projector, t.list_of_speakers_couple_countdown, t.list_of_speakers_show_amount_of_speakers_on_slide, t.list_of_speakers_present_users_only, t.list_of_speakers_show_first_contribution, t.list_of_speakers_hide_contribution_count, t.list_of_speakers_allow_multiple_speakers, t.list_of_speakers_enable_point_of_order_speakers, t.list_of_speakers_can_create_point_of_order_for_others, t.list_of_speakers_enable_point_of_order_categories, t.list_of_speakers_closing_disables_point_of_order, t.list_of_speakers_enable_pro_contra_speech, t.list_of_speakers_can_set_contribution_self, t.list_of_speakers_speaker_note_for_everyone, t.list_of_speakers_initially_closed, t.list_of_speakers_default_structure_level_time, t.list_of_speakers_enable_interposed_question, t.list_of_speakers_intervention_time, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_workflow' AND old_id = t.motions_default_workflow_id), t.motions_default_workflow_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_workflow' AND old_id = t.motions_default_amendment_workflow_id), t.motions_default_amendment_workflow_id), t.motions_preamble, t.motions_default_line_numbering, t.motions_line_length, t.motions_reason_required, t.motions_origin_motion_toggle_default, t.motions_enable_origin_motion_display, t.motions_enable_text_on_projector, t.motions_enable_reason_on_projector, t.motions_enable_sidebox_on_projector, t.motions_enable_recommendation_on_projector, t.motions_hide_metadata_background, t.motions_show_referring_motions, t.motions_show_sequential_number, t.motions_create_enable_additional_submitter_text, t.motions_recommendations_by, t.motions_block_slide_columns, t.motions_recommendation_text_mode, t.motions_default_sorting, t.motions_number_type, t.motions_number_min_digits, t.motions_number_with_blank, t.motions_amendments_enabled, t.motions_amendments_in_main_list, t.motions_amendments_of_amendments, t.motions_amendments_prefix, t.motions_amendments_text_mode, t.motions_amendments_multiple_paragraphs, t.motions_supporters_min_amount, t.motions_enable_editor, t.motions_enable_working_group_speaker, t.motions_export_title, t.motions_export_preamble, t.motions_export_submitter_recommendation, t.motions_export_follow_recommendation, t.motions_enable_restricted_editor_for_manager, t.motions_enable_restricted_editor_for_non_manager, t.motion_poll_ballot_paper_selection, t.motion_poll_ballot_paper_number, t.motion_poll_default_type, t.motion_poll_default_method, t.motion_poll_default_onehundred_percent_base, t.motion_poll_default_backend, t.motion_poll_projection_name_order_first, t.motion_poll_projection_max_columns, t.users_enable_presence_view, t.users_enable_vote_weight, t.users_allow_self_set_present, t.users_pdf_welcometitle, t.users_pdf_welcometext, t.users_pdf_wlan_ssid, t.users_pdf_wlan_password, t.users_pdf_wlan_encryption, t.users_email_sender, t.users_email_replyto, t.users_email_subject, t.users_email_body, t.users_enable_vote_delegations, t.users_forbid_delegator_in_list_of_speakers, t.users_forbid_delegator_as_submitter, t.users_forbid_delegator_as_supporter, t.users_forbid_delegator_to_vote, t.assignments_export_title, t.assignments_export_preamble, t.assignment_poll_ballot_paper_selection, t.assignment_poll_ballot_paper_number, t.assignment_poll_add_candidates_to_list_of_speakers, t.assignment_poll_enable_max_votes_per_option, t.assignment_poll_sort_poll_result_by_votes, t.assignment_poll_default_type, t.assignment_poll_default_method, t.assignment_poll_default_onehundred_percent_base, t.assignment_poll_default_backend, t.poll_ballot_paper_selection, t.poll_ballot_paper_number, t.poll_sort_poll_result_by_votes, t.poll_default_type, t.poll_default_method, t.poll_default_onehundred_percent_base, t.poll_default_backend, t.poll_default_live_voting_enabled, t.poll_couple_countdown, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.logo_projector_main_id), t.logo_projector_main_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.logo_projector_header_id), t.logo_projector_header_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.logo_web_header_id), t.logo_web_header_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.logo_pdf_header_l_id), t.logo_pdf_header_l_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.logo_pdf_header_r_id), t.logo_pdf_header_r_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.logo_pdf_footer_l_id), t.logo_pdf_footer_l_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.logo_pdf_footer_r_id), t.logo_pdf_footer_r_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.logo_pdf_ballot_paper_id), t.logo_pdf_ballot_paper_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.font_regular_id), t.font_regular_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.font_italic_id), t.font_italic_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.font_bold_id), t.font_bold_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.font_bold_italic_id), t.font_bold_italic_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.font_monospace_id), t.font_monospace_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.font_chyron_speaker_name_id), t.font_chyron_speaker_name_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.font_projector_h1_id), t.font_projector_h1_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.font_projector_h2_id), t.font_projector_h2_id), target_committee_id, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'projector' AND old_id = t.reference_projector_id), t.reference_projector_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'projector_countdown' AND old_id = t.list_of_speakers_countdown_id), t.list_of_speakers_countdown_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'projector_countdown' AND old_id = t.poll_countdown_id), t.poll_countdown_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.default_group_id), t.default_group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.admin_group_id), t.admin_group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.anonymous_group_id), t.anonymous_group_id)
+    FROM meeting_t t JOIN os_clone_id_map_t m ON m.collection = 'meeting' AND m.old_id = t.id;
+    INSERT INTO agenda_item_t (id, item_number, comment, closed, type, duration, is_internal, is_hidden, level, weight, content_object_id, parent_id, meeting_id)
+    SELECT m.new_id, t.item_number, t.comment, t.closed, t.type, t.duration, t.is_internal, t.is_hidden, t.level, t.weight, COALESCE(split_part(t.content_object_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.content_object_id, '/', 1) AND old_id = split_part(t.content_object_id, '/', 2)::integer), t.content_object_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'agenda_item' AND old_id = t.parent_id), t.parent_id), new_meeting_id
+    FROM agenda_item_t t JOIN os_clone_id_map_t m ON m.collection = 'agenda_item' AND m.old_id = t.id;
+    INSERT INTO assignment_t (id, title, description, open_posts, phase, default_poll_description, number_poll_candidates, sequential_number, meeting_id)
+    SELECT m.new_id, t.title, t.description, t.open_posts, t.phase, t.default_poll_description, t.number_poll_candidates, t.sequential_number, new_meeting_id
+    FROM assignment_t t JOIN os_clone_id_map_t m ON m.collection = 'assignment' AND m.old_id = t.id;
+    INSERT INTO assignment_candidate_t (id, weight, assignment_id, meeting_user_id, meeting_id)
+    SELECT m.new_id, t.weight, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'assignment' AND old_id = t.assignment_id), t.assignment_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id), new_meeting_id
+    FROM assignment_candidate_t t JOIN os_clone_id_map_t m ON m.collection = 'assignment_candidate' AND m.old_id = t.id;
+    INSERT INTO chat_group_t (id, name, weight, meeting_id)
+    SELECT m.new_id, t.name, t.weight, new_meeting_id
+    FROM chat_group_t t JOIN os_clone_id_map_t m ON m.collection = 'chat_group' AND m.old_id = t.id;
+    INSERT INTO chat_message_t (id, content, created, meeting_user_id, chat_group_id, meeting_id)
+    SELECT m.new_id, t.content, t.created, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'chat_group' AND old_id = t.chat_group_id), t.chat_group_id), new_meeting_id
+    FROM chat_message_t t JOIN os_clone_id_map_t m ON m.collection = 'chat_message' AND m.old_id = t.id;
+    INSERT INTO group_t (id, external_id, name, permissions, weight, used_as_motion_poll_default_id, used_as_assignment_poll_default_id, used_as_topic_poll_default_id, used_as_poll_default_id, meeting_id)
+    SELECT m.new_id, t.external_id, t.name, t.permissions, t.weight, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_motion_poll_default_id), t.used_as_motion_poll_default_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_assignment_poll_default_id), t.used_as_assignment_poll_default_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_topic_poll_default_id), t.used_as_topic_poll_default_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_poll_default_id), t.used_as_poll_default_id), new_meeting_id
+    FROM group_t t JOIN os_clone_id_map_t m ON m.collection = 'group' AND m.old_id = t.id;
+    INSERT INTO list_of_speakers_t (id, closed, sequential_number, moderator_notes, content_object_id, meeting_id)
+    SELECT m.new_id, t.closed, t.sequential_number, t.moderator_notes, COALESCE(split_part(t.content_object_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.content_object_id, '/', 1) AND old_id = split_part(t.content_object_id, '/', 2)::integer), t.content_object_id), new_meeting_id
+    FROM list_of_speakers_t t JOIN os_clone_id_map_t m ON m.collection = 'list_of_speakers' AND m.old_id = t.id;
+    INSERT INTO mediafile_t (id, title, is_directory, filesize, filename, mimetype, pdf_information, create_timestamp, token, published_to_meetings_in_organization_id, parent_id, owner_id)
+    SELECT m.new_id, t.title, t.is_directory, t.filesize, t.filename, t.mimetype, t.pdf_information, t.create_timestamp, NULL, t.published_to_meetings_in_organization_id, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'mediafile' AND old_id = t.parent_id), t.parent_id), COALESCE(split_part(t.owner_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.owner_id, '/', 1) AND old_id = split_part(t.owner_id, '/', 2)::integer), t.owner_id)
+    FROM mediafile_t t JOIN os_clone_id_map_t m ON m.collection = 'mediafile' AND m.old_id = t.id;
+    INSERT INTO meeting_mediafile_t (id, mediafile_id, meeting_id, is_public)
+    SELECT m.new_id, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'mediafile' AND old_id = t.mediafile_id), t.mediafile_id), new_meeting_id, t.is_public
+    FROM meeting_mediafile_t t JOIN os_clone_id_map_t m ON m.collection = 'meeting_mediafile' AND m.old_id = t.id;
+    INSERT INTO meeting_user_t (id, comment, number, about_me, vote_weight, locked_out, user_id, meeting_id, vote_delegated_to_id)
+    SELECT m.new_id, t.comment, t.number, t.about_me, t.vote_weight, t.locked_out, t.user_id, new_meeting_id, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.vote_delegated_to_id), t.vote_delegated_to_id)
+    FROM meeting_user_t t JOIN os_clone_id_map_t m ON m.collection = 'meeting_user' AND m.old_id = t.id;
+    INSERT INTO motion_t (id, number, number_value, sequential_number, title, diff_version, text, text_hash, amendment_paragraphs, modified_final_version, reason, category_weight, state_extension, recommendation_extension, sort_weight, created, last_modified, workflow_timestamp, start_line_number, forwarded, additional_submitter, marked_forwarded, lead_motion_id, sort_parent_id, origin_id, origin_meeting_id, state_id, recommendation_id, category_id, block_id, meeting_id)
+    SELECT m.new_id, t.number, t.number_value, t.sequential_number, t.title, t.diff_version, t.text, t.text_hash, t.amendment_paragraphs, t.modified_final_version, t.reason, t.category_weight, t.state_extension, t.recommendation_extension, t.sort_weight, t.created, t.last_modified, t.workflow_timestamp, t.start_line_number, t.forwarded, t.additional_submitter, t.marked_forwarded, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.lead_motion_id), t.lead_motion_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.sort_parent_id), t.sort_parent_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.origin_id), t.origin_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.origin_meeting_id), t.origin_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_state' AND old_id = t.state_id), t.state_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_state' AND old_id = t.recommendation_id), t.recommendation_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_category' AND old_id = t.category_id), t.category_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_block' AND old_id = t.block_id), t.block_id), new_meeting_id
+    FROM motion_t t JOIN os_clone_id_map_t m ON m.collection = 'motion' AND m.old_id = t.id;
+    INSERT INTO motion_block_t (id, title, internal, sequential_number, meeting_id)
+    SELECT m.new_id, t.title, t.internal, t.sequential_number, new_meeting_id
+    FROM motion_block_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_block' AND m.old_id = t.id;
+    INSERT INTO motion_category_t (id, name, prefix, weight, level, sequential_number, parent_id, meeting_id)
+    SELECT m.new_id, t.name, t.prefix, t.weight, t.level, t.sequential_number, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_category' AND old_id = t.parent_id), t.parent_id), new_meeting_id
+    FROM motion_category_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_category' AND m.old_id = t.id;
+    INSERT INTO motion_change_recommendation_t (id, rejected, internal, type, other_description, line_from, line_to, text, creation_time, motion_id, meeting_id)
+    SELECT m.new_id, t.rejected, t.internal, t.type, t.other_description, t.line_from, t.line_to, t.text, t.creation_time, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.motion_id), t.motion_id), new_meeting_id
+    FROM motion_change_recommendation_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_change_recommendation' AND m.old_id = t.id;
+    INSERT INTO motion_comment_t (id, comment, motion_id, section_id, meeting_id)
+    SELECT m.new_id, t.comment, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.motion_id), t.motion_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_comment_section' AND old_id = t.section_id), t.section_id), new_meeting_id
+    FROM motion_comment_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_comment' AND m.old_id = t.id;
+    INSERT INTO motion_comment_section_t (id, name, weight, sequential_number, submitter_can_write, meeting_id)
+    SELECT m.new_id, t.name, t.weight, t.sequential_number, t.submitter_can_write, new_meeting_id
+    FROM motion_comment_section_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_comment_section' AND m.old_id = t.id;
+    INSERT INTO motion_editor_t (id, weight, meeting_user_id, motion_id, meeting_id)
+    SELECT m.new_id, t.weight, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.motion_id), t.motion_id), new_meeting_id
+    FROM motion_editor_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_editor' AND m.old_id = t.id;
+    INSERT INTO motion_state_t (id, name, weight, recommendation_label, is_internal, css_class, restrictions, allow_support, allow_create_poll, allow_submitter_edit, set_number, show_state_extension_field, show_recommendation_extension_field, merge_amendment_into_final, allow_motion_forwarding, allow_amendment_forwarding, set_workflow_timestamp, state_button_label, submitter_withdraw_state_id, workflow_id, meeting_id)
+    SELECT m.new_id, t.name, t.weight, t.recommendation_label, t.is_internal, t.css_class, t.restrictions, t.allow_support, t.allow_create_poll, t.allow_submitter_edit, t.set_number, t.show_state_extension_field, t.show_recommendation_extension_field, t.merge_amendment_into_final, t.allow_motion_forwarding, t.allow_amendment_forwarding, t.set_workflow_timestamp, t.state_button_label, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_state' AND old_id = t.submitter_withdraw_state_id), t.submitter_withdraw_state_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_workflow' AND old_id = t.workflow_id), t.workflow_id), new_meeting_id
+    FROM motion_state_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_state' AND m.old_id = t.id;
+    INSERT INTO motion_submitter_t (id, weight, meeting_user_id, motion_id, meeting_id)
+    SELECT m.new_id, t.weight, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.motion_id), t.motion_id), new_meeting_id
+    FROM motion_submitter_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_submitter' AND m.old_id = t.id;
+    INSERT INTO motion_supporter_t (id, meeting_user_id, motion_id, meeting_id)
+    SELECT m.new_id, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.motion_id), t.motion_id), new_meeting_id
+    FROM motion_supporter_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_supporter' AND m.old_id = t.id;
+    INSERT INTO motion_workflow_t (id, name, sequential_number, first_state_id, meeting_id)
+    SELECT m.new_id, t.name, t.sequential_number, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_state' AND old_id = t.first_state_id), t.first_state_id), new_meeting_id
+    FROM motion_workflow_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_workflow' AND m.old_id = t.id;
+    INSERT INTO motion_working_group_speaker_t (id, weight, meeting_user_id, motion_id, meeting_id)
+    SELECT m.new_id, t.weight, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.motion_id), t.motion_id), new_meeting_id
+    FROM motion_working_group_speaker_t t JOIN os_clone_id_map_t m ON m.collection = 'motion_working_group_speaker' AND m.old_id = t.id;
+    INSERT INTO option_t (id, weight, text, yes, no, abstain, poll_id, content_object_id, meeting_id)
+    SELECT m.new_id, t.weight, t.text, t.yes, t.no, t.abstain, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'poll' AND old_id = t.poll_id), t.poll_id), COALESCE(split_part(t.content_object_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.content_object_id, '/', 1) AND old_id = split_part(t.content_object_id, '/', 2)::integer), t.content_object_id), new_meeting_id
+    FROM option_t t JOIN os_clone_id_map_t m ON m.collection = 'option' AND m.old_id = t.id;
+    INSERT INTO personal_note_t (id, note, star, meeting_user_id, content_object_id, meeting_id)
+    SELECT m.new_id, t.note, t.star, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id), COALESCE(split_part(t.content_object_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.content_object_id, '/', 1) AND old_id = split_part(t.content_object_id, '/', 2)::integer), t.content_object_id), new_meeting_id
+    FROM personal_note_t t JOIN os_clone_id_map_t m ON m.collection = 'personal_note' AND m.old_id = t.id;
+    INSERT INTO point_of_order_category_t (id, text, rank, meeting_id)
+    SELECT m.new_id, t.text, t.rank, new_meeting_id
+    FROM point_of_order_category_t t JOIN os_clone_id_map_t m ON m.collection = 'point_of_order_category' AND m.old_id = t.id;
+    INSERT INTO poll_t (id, title, description, type, backend, is_pseudoanonymized, pollmethod, state, min_votes_amount, max_votes_amount, max_votes_per_option, global_yes, global_no, global_abstain, onehundred_percent_base, votesvalid, votesinvalid, votescast, entitled_users_at_stop, live_voting_enabled, sequential_number, content_object_id, global_option_id, meeting_id)
+    SELECT m.new_id, t.title, t.description, t.type, t.backend, t.is_pseudoanonymized, t.pollmethod, t.state, t.min_votes_amount, t.max_votes_amount, t.max_votes_per_option, t.global_yes, t.global_no, t.global_abstain, t.onehundred_percent_base, t.votesvalid, t.votesinvalid, t.votescast, t.entitled_users_at_stop, t.live_voting_enabled, t.sequential_number, COALESCE(split_part(t.content_object_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.content_object_id, '/', 1) AND old_id = split_part(t.content_object_id, '/', 2)::integer), t.content_object_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'option' AND old_id = t.global_option_id), t.global_option_id), new_meeting_id
+    FROM poll_t t JOIN os_clone_id_map_t m ON m.collection = 'poll' AND m.old_id = t.id;
+    INSERT INTO poll_candidate_t (id, poll_candidate_list_id, user_id, weight, meeting_id)
+    SELECT m.new_id, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'poll_candidate_list' AND old_id = t.poll_candidate_list_id), t.poll_candidate_list_id), t.user_id, t.weight, new_meeting_id
+    FROM poll_candidate_t t JOIN os_clone_id_map_t m ON m.collection = 'poll_candidate' AND m.old_id = t.id;
+    INSERT INTO poll_candidate_list_t (id, meeting_id)
+    SELECT m.new_id, new_meeting_id
+    FROM poll_candidate_list_t t JOIN os_clone_id_map_t m ON m.collection = 'poll_candidate_list' AND m.old_id = t.id;
+    INSERT INTO projection_t (id, options, stable, weight, type, current_projector_id, preview_projector_id, history_projector_id, content_object_id, meeting_id)
+    SELECT m.new_id, t.options, t.stable, t.weight, t.type, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'projector' AND old_id = t.current_projector_id), t.current_projector_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'projector' AND old_id = t.preview_projector_id), t.preview_projector_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'projector' AND old_id = t.history_projector_id), t.history_projector_id), COALESCE(split_part(t.content_object_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.content_object_id, '/', 1) AND old_id = split_part(t.content_object_id, '/', 2)::integer), t.content_object_id), new_meeting_id
+    FROM projection_t t JOIN os_clone_id_map_t m ON m.collection = 'projection' AND m.old_id = t.id;
+    INSERT INTO projector_t (id, name, is_internal, scale, scroll, width, aspect_ratio_numerator, aspect_ratio_denominator, color, background_color, header_background_color, header_font_color, header_h1_color, chyron_background_color, chyron_background_color_2, chyron_font_color, chyron_font_color_2, show_header_footer, show_title, show_logo, show_clock, sequential_number, used_as_default_projector_for_agenda_item_list_in_meeting_id, used_as_default_projector_for_topic_in_meeting_id, used_as_default_projector_for_list_of_speakers_in_meeting_id, used_as_default_projector_for_current_los_in_meeting_id, used_as_default_projector_for_motion_in_meeting_id, used_as_default_projector_for_amendment_in_meeting_id, used_as_default_projector_for_motion_block_in_meeting_id, used_as_default_projector_for_assignment_in_meeting_id, used_as_default_projector_for_mediafile_in_meeting_id, used_as_default_projector_for_message_in_meeting_id, used_as_default_projector_for_countdown_in_meeting_id, used_as_default_projector_for_assignment_poll_in_meeting_id, used_as_default_projector_for_motion_poll_in_meeting_id, used_as_default_projector_for_poll_in_meeting_id, meeting_id)
+    SELECT m.new_id, t.name, t.is_internal, t.scale, t.scroll, t.width, t.aspect_ratio_numerator, t.aspect_ratio_denominator, t.color, t.background_color, t.header_background_color, t.header_font_color, t.header_h1_color, t.chyron_background_color, t.chyron_background_color_2, t.chyron_font_color, t.chyron_font_color_2, t.show_header_footer, t.show_title, t.show_logo, t.show_clock, t.sequential_number, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_agenda_item_list_in_meeting_id), t.used_as_default_projector_for_agenda_item_list_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_topic_in_meeting_id), t.used_as_default_projector_for_topic_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_list_of_speakers_in_meeting_id), t.used_as_default_projector_for_list_of_speakers_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_current_los_in_meeting_id), t.used_as_default_projector_for_current_los_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_motion_in_meeting_id), t.used_as_default_projector_for_motion_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_amendment_in_meeting_id), t.used_as_default_projector_for_amendment_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_motion_block_in_meeting_id), t.used_as_default_projector_for_motion_block_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_assignment_in_meeting_id), t.used_as_default_projector_for_assignment_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_mediafile_in_meeting_id), t.used_as_default_projector_for_mediafile_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_message_in_meeting_id), t.used_as_default_projector_for_message_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_countdown_in_meeting_id), t.used_as_default_projector_for_countdown_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_assignment_poll_in_meeting_id), t.used_as_default_projector_for_assignment_poll_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_motion_poll_in_meeting_id), t.used_as_default_projector_for_motion_poll_in_meeting_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting' AND old_id = t.used_as_default_projector_for_poll_in_meeting_id), t.used_as_default_projector_for_poll_in_meeting_id), new_meeting_id
+    FROM projector_t t JOIN os_clone_id_map_t m ON m.collection = 'projector' AND m.old_id = t.id;
+    INSERT INTO projector_countdown_t (id, title, description, default_time, countdown_time, running, meeting_id)
+    SELECT m.new_id, t.title, t.description, t.default_time, t.countdown_time, t.running, new_meeting_id
+    FROM projector_countdown_t t JOIN os_clone_id_map_t m ON m.collection = 'projector_countdown' AND m.old_id = t.id;
+    INSERT INTO projector_message_t (id, message, meeting_id)
+    SELECT m.new_id, t.message, new_meeting_id
+    FROM projector_message_t t JOIN os_clone_id_map_t m ON m.collection = 'projector_message' AND m.old_id = t.id;
+    INSERT INTO speaker_t (id, begin_time, end_time, pause_time, unpause_time, total_pause, weight, speech_state, answer, note, point_of_order, list_of_speakers_id, structure_level_list_of_speakers_id, meeting_user_id, point_of_order_category_id, meeting_id)
+    SELECT m.new_id, t.begin_time, t.end_time, t.pause_time, t.unpause_time, t.total_pause, t.weight, t.speech_state, t.answer, t.note, t.point_of_order, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'list_of_speakers' AND old_id = t.list_of_speakers_id), t.list_of_speakers_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'structure_level_list_of_speakers' AND old_id = t.structure_level_list_of_speakers_id), t.structure_level_list_of_speakers_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'point_of_order_category' AND old_id = t.point_of_order_category_id), t.point_of_order_category_id), new_meeting_id
+    FROM speaker_t t JOIN os_clone_id_map_t m ON m.collection = 'speaker' AND m.old_id = t.id;
+    INSERT INTO structure_level_t (id, name, color, default_time, meeting_id)
+    SELECT m.new_id, t.name, t.color, t.default_time, new_meeting_id
+    FROM structure_level_t t JOIN os_clone_id_map_t m ON m.collection = 'structure_level' AND m.old_id = t.id;
+    INSERT INTO structure_level_list_of_speakers_t (id, structure_level_id, list_of_speakers_id, initial_time, additional_time, remaining_time, current_start_time, meeting_id)
+    SELECT m.new_id, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'structure_level' AND old_id = t.structure_level_id), t.structure_level_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'list_of_speakers' AND old_id = t.list_of_speakers_id), t.list_of_speakers_id), t.initial_time, t.additional_time, t.remaining_time, t.current_start_time, new_meeting_id
+    FROM structure_level_list_of_speakers_t t JOIN os_clone_id_map_t m ON m.collection = 'structure_level_list_of_speakers' AND m.old_id = t.id;
+    INSERT INTO tag_t (id, name, meeting_id)
+    SELECT m.new_id, t.name, new_meeting_id
+    FROM tag_t t JOIN os_clone_id_map_t m ON m.collection = 'tag' AND m.old_id = t.id;
+    INSERT INTO topic_t (id, title, text, sequential_number, meeting_id)
+    SELECT m.new_id, t.title, t.text, t.sequential_number, new_meeting_id
+    FROM topic_t t JOIN os_clone_id_map_t m ON m.collection = 'topic' AND m.old_id = t.id;
+    INSERT INTO vote_t (id, weight, value, user_token, option_id, user_id, delegated_user_id, meeting_id)
+    SELECT m.new_id, t.weight, t.value, t.user_token, COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'option' AND old_id = t.option_id), t.option_id), t.user_id, t.delegated_user_id, new_meeting_id
+    FROM vote_t t JOIN os_clone_id_map_t m ON m.collection = 'vote' AND m.old_id = t.id;
+    INSERT INTO nm_chat_group_read_group_ids_group_t (chat_group_id, group_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'chat_group' AND old_id = t.chat_group_id), t.chat_group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.group_id), t.group_id)
+    FROM nm_chat_group_read_group_ids_group_t t
+    WHERE t.chat_group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'chat_group')
+        OR t.group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'group');
+    INSERT INTO nm_chat_group_write_group_ids_group_t (chat_group_id, group_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'chat_group' AND old_id = t.chat_group_id), t.chat_group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.group_id), t.group_id)
+    FROM nm_chat_group_write_group_ids_group_t t
+    WHERE t.chat_group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'chat_group')
+        OR t.group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'group');
+    INSERT INTO nm_group_meeting_user_ids_meeting_user_t (group_id, meeting_user_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.group_id), t.group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id)
+    FROM nm_group_meeting_user_ids_meeting_user_t t
+    WHERE t.group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'group')
+        OR t.meeting_user_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'meeting_user');
+    INSERT INTO nm_group_mmagi_meeting_mediafile_t (group_id, meeting_mediafile_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.group_id), t.group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.meeting_mediafile_id), t.meeting_mediafile_id)
+    FROM nm_group_mmagi_meeting_mediafile_t t
+    WHERE t.group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'group')
+        OR t.meeting_mediafile_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile');
+    INSERT INTO nm_group_mmiagi_meeting_mediafile_t (group_id, meeting_mediafile_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.group_id), t.group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.meeting_mediafile_id), t.meeting_mediafile_id)
+    FROM nm_group_mmiagi_meeting_mediafile_t t
+    WHERE t.group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'group')
+        OR t.meeting_mediafile_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile');
+    INSERT INTO nm_group_read_comment_section_ids_motion_comment_section_t (group_id, motion_comment_section_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.group_id), t.group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_comment_section' AND old_id = t.motion_comment_section_id), t.motion_comment_section_id)
+    FROM nm_group_read_comment_section_ids_motion_comment_section_t t
+    WHERE t.group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'group')
+        OR t.motion_comment_section_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion_comment_section');
+    INSERT INTO nm_group_write_comment_section_ids_motion_comment_section_t (group_id, motion_comment_section_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.group_id), t.group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_comment_section' AND old_id = t.motion_comment_section_id), t.motion_comment_section_id)
+    FROM nm_group_write_comment_section_ids_motion_comment_section_t t
+    WHERE t.group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'group')
+        OR t.motion_comment_section_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion_comment_section');
+    INSERT INTO nm_group_poll_ids_poll_t (group_id, poll_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'group' AND old_id = t.group_id), t.group_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'poll' AND old_id = t.poll_id), t.poll_id)
+    FROM nm_group_poll_ids_poll_t t
+    WHERE t.group_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'group')
+        OR t.poll_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'poll');
+    INSERT INTO gm_meeting_mediafile_attachment_ids_t (meeting_mediafile_id, attachment_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile' AND old_id = t.meeting_mediafile_id), t.meeting_mediafile_id), COALESCE(split_part(t.attachment_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.attachment_id, '/', 1) AND old_id = split_part(t.attachment_id, '/', 2)::integer), t.attachment_id)
+    FROM gm_meeting_mediafile_attachment_ids_t t
+    WHERE t.meeting_mediafile_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'meeting_mediafile')
+        OR t.attachment_id_motion_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion')
+        OR t.attachment_id_topic_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'topic')
+        OR t.attachment_id_assignment_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'assignment');
+    INSERT INTO nm_meeting_user_structure_level_ids_structure_level_t (meeting_user_id, structure_level_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'meeting_user' AND old_id = t.meeting_user_id), t.meeting_user_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'structure_level' AND old_id = t.structure_level_id), t.structure_level_id)
+    FROM nm_meeting_user_structure_level_ids_structure_level_t t
+    WHERE t.meeting_user_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'meeting_user')
+        OR t.structure_level_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'structure_level');
+    INSERT INTO nm_motion_all_derived_motion_ids_motion_t (all_origin_id, all_derived_motion_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.all_origin_id), t.all_origin_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.all_derived_motion_id), t.all_derived_motion_id)
+    FROM nm_motion_all_derived_motion_ids_motion_t t
+    WHERE t.all_origin_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion')
+        OR t.all_derived_motion_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion');
+    INSERT INTO nm_motion_identical_motion_ids_motion_t (identical_motion_id_1, identical_motion_id_2)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.identical_motion_id_1), t.identical_motion_id_1), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.identical_motion_id_2), t.identical_motion_id_2)
+    FROM nm_motion_identical_motion_ids_motion_t t
+    WHERE t.identical_motion_id_1 IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion')
+        OR t.identical_motion_id_2 IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion');
+    INSERT INTO gm_motion_state_extension_reference_ids_t (motion_id, state_extension_reference_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.motion_id), t.motion_id), COALESCE(split_part(t.state_extension_reference_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.state_extension_reference_id, '/', 1) AND old_id = split_part(t.state_extension_reference_id, '/', 2)::integer), t.state_extension_reference_id)
+    FROM gm_motion_state_extension_reference_ids_t t
+    WHERE t.motion_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion')
+        OR t.state_extension_reference_id_motion_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion');
+    INSERT INTO gm_motion_recommendation_extension_reference_ids_t (motion_id, recommendation_extension_reference_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion' AND old_id = t.motion_id), t.motion_id), COALESCE(split_part(t.recommendation_extension_reference_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.recommendation_extension_reference_id, '/', 1) AND old_id = split_part(t.recommendation_extension_reference_id, '/', 2)::integer), t.recommendation_extension_reference_id)
+    FROM gm_motion_recommendation_extension_reference_ids_t t
+    WHERE t.motion_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion')
+        OR t.recommendation_extension_reference_id_motion_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion');
+    INSERT INTO nm_motion_state_next_state_ids_motion_state_t (previous_state_id, next_state_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_state' AND old_id = t.previous_state_id), t.previous_state_id), COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'motion_state' AND old_id = t.next_state_id), t.next_state_id)
+    FROM nm_motion_state_next_state_ids_motion_state_t t
+    WHERE t.previous_state_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion_state')
+        OR t.next_state_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion_state');
+    INSERT INTO gm_organization_tag_tagged_ids_t (organization_tag_id, tagged_id)
+    SELECT t.organization_tag_id, COALESCE(split_part(t.tagged_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.tagged_id, '/', 1) AND old_id = split_part(t.tagged_id, '/', 2)::integer), t.tagged_id)
+    FROM gm_organization_tag_tagged_ids_t t
+    WHERE t.tagged_id_meeting_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'meeting');
+    INSERT INTO nm_poll_voted_ids_user_t (poll_id, user_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'poll' AND old_id = t.poll_id), t.poll_id), t.user_id
+    FROM nm_poll_voted_ids_user_t t
+    WHERE t.poll_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'poll');
+    INSERT INTO gm_tag_tagged_ids_t (tag_id, tagged_id)
+    SELECT COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = 'tag' AND old_id = t.tag_id), t.tag_id), COALESCE(split_part(t.tagged_id, '/', 1) || '/' || (SELECT new_id FROM os_clone_id_map_t WHERE collection = split_part(t.tagged_id, '/', 1) AND old_id = split_part(t.tagged_id, '/', 2)::integer), t.tagged_id)
+    FROM gm_tag_tagged_ids_t t
+    WHERE t.tag_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'tag')
+        OR t.tagged_id_agenda_item_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'agenda_item')
+        OR t.tagged_id_assignment_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'assignment')
+        OR t.tagged_id_motion_id IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = 'motion');
+    RETURN new_meeting_id;
+END;
+$clone_meeting$ LANGUAGE plpgsql;
+
+CREATE FUNCTION delete_meeting(deleted_meeting_id INTEGER)
+RETURNS VOID AS $delete_meeting$
+-- Deletes the meeting with all models owned by it.
+-- Every table is deleted with one DELETE, referencing tables before the referenced ones.
+-- While deleting, the not null triggers of the relations and the log triggers are skipped
+-- via the row of the transaction in os_deleting_meeting_t, which only this function
+-- writes, and os.deleting_meeting. Only the deletion of the meeting and the changed relations of
+-- models, which aren't deleted themselves, e.g. users, the committee or mediafiles of the
+-- organization, are logged.
+-- References from models outside of the meeting to deleted models are set to NULL before.
+DECLARE
+    sequence_name TEXT;
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM meeting_t WHERE id = deleted_meeting_id) THEN
+        RAISE EXCEPTION 'Meeting % does not exist', deleted_meeting_id;
+    END IF;
+
+    UPDATE assignment_candidate_t SET meeting_user_id = NULL
+    WHERE meeting_user_id IN (SELECT id FROM meeting_user_t WHERE meeting_id = deleted_meeting_id)
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE chat_message_t SET meeting_user_id = NULL
+    WHERE meeting_user_id IN (SELECT id FROM meeting_user_t WHERE meeting_id = deleted_meeting_id)
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE committee_t SET default_meeting_id = NULL
+    WHERE default_meeting_id = deleted_meeting_id;
+    UPDATE group_t SET used_as_motion_poll_default_id = NULL
+    WHERE used_as_motion_poll_default_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE group_t SET used_as_assignment_poll_default_id = NULL
+    WHERE used_as_assignment_poll_default_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE group_t SET used_as_topic_poll_default_id = NULL
+    WHERE used_as_topic_poll_default_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE group_t SET used_as_poll_default_id = NULL
+    WHERE used_as_poll_default_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE history_entry_t SET model_id = NULL
+    WHERE model_id_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id)
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET logo_projector_main_id = NULL
+    WHERE logo_projector_main_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET logo_projector_header_id = NULL
+    WHERE logo_projector_header_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET logo_web_header_id = NULL
+    WHERE logo_web_header_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET logo_pdf_header_l_id = NULL
+    WHERE logo_pdf_header_l_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET logo_pdf_header_r_id = NULL
+    WHERE logo_pdf_header_r_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET logo_pdf_footer_l_id = NULL
+    WHERE logo_pdf_footer_l_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET logo_pdf_footer_r_id = NULL
+    WHERE logo_pdf_footer_r_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET logo_pdf_ballot_paper_id = NULL
+    WHERE logo_pdf_ballot_paper_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET font_regular_id = NULL
+    WHERE font_regular_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET font_italic_id = NULL
+    WHERE font_italic_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET font_bold_id = NULL
+    WHERE font_bold_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET font_bold_italic_id = NULL
+    WHERE font_bold_italic_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET font_monospace_id = NULL
+    WHERE font_monospace_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET font_chyron_speaker_name_id = NULL
+    WHERE font_chyron_speaker_name_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET font_projector_h1_id = NULL
+    WHERE font_projector_h1_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET font_projector_h2_id = NULL
+    WHERE font_projector_h2_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET list_of_speakers_countdown_id = NULL
+    WHERE list_of_speakers_countdown_id IN (SELECT id FROM projector_countdown_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET poll_countdown_id = NULL
+    WHERE poll_countdown_id IN (SELECT id FROM projector_countdown_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET admin_group_id = NULL
+    WHERE admin_group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE meeting_t SET anonymous_group_id = NULL
+    WHERE anonymous_group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id)
+        AND id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE motion_t SET origin_id = NULL
+    WHERE origin_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id)
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE motion_t SET origin_meeting_id = NULL
+    WHERE origin_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE motion_editor_t SET meeting_user_id = NULL
+    WHERE meeting_user_id IN (SELECT id FROM meeting_user_t WHERE meeting_id = deleted_meeting_id)
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE motion_submitter_t SET meeting_user_id = NULL
+    WHERE meeting_user_id IN (SELECT id FROM meeting_user_t WHERE meeting_id = deleted_meeting_id)
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE motion_supporter_t SET meeting_user_id = NULL
+    WHERE meeting_user_id IN (SELECT id FROM meeting_user_t WHERE meeting_id = deleted_meeting_id)
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE motion_working_group_speaker_t SET meeting_user_id = NULL
+    WHERE meeting_user_id IN (SELECT id FROM meeting_user_t WHERE meeting_id = deleted_meeting_id)
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE option_t SET content_object_id = NULL
+    WHERE content_object_id_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id)
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_agenda_item_list_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_agenda_item_list_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_topic_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_topic_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_list_of_speakers_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_list_of_speakers_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_current_los_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_current_los_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_motion_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_motion_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_amendment_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_amendment_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_motion_block_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_motion_block_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_assignment_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_assignment_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_mediafile_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_mediafile_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_message_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_message_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_countdown_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_countdown_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_assignment_poll_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_assignment_poll_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_motion_poll_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_motion_poll_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+    UPDATE projector_t SET used_as_default_projector_for_poll_in_meeting_id = NULL
+    WHERE used_as_default_projector_for_poll_in_meeting_id = deleted_meeting_id
+        AND meeting_id IS DISTINCT FROM deleted_meeting_id;
+
+    INSERT INTO os_deleting_meeting_t (xact_id, meeting_id) VALUES (pg_current_xact_id(), deleted_meeting_id);
+    PERFORM set_config('os.deleting_meeting', 'on', true);
+    EXECUTE log_field_changes_statement(format($entries$
+        SELECT 'delete' AS operation, 'meeting/' || %1$s AS fqid, NULL::varchar(63)[] AS fields
+        UNION ALL SELECT DISTINCT 'update', 'organization/' || is_active_in_organization_id, ARRAY['active_meeting_ids']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND is_active_in_organization_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'organization/' || is_archived_in_organization_id, ARRAY['archived_meeting_ids']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND is_archived_in_organization_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'organization/' || template_for_organization_id, ARRAY['template_meeting_ids']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND template_for_organization_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'motion_workflow/' || motions_default_workflow_id, ARRAY['default_workflow_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND motions_default_workflow_id IS NOT NULL AND NOT motions_default_workflow_id IN (SELECT id FROM motion_workflow_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'motion_workflow/' || motions_default_amendment_workflow_id, ARRAY['default_amendment_workflow_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND motions_default_amendment_workflow_id IS NOT NULL AND NOT motions_default_amendment_workflow_id IN (SELECT id FROM motion_workflow_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || logo_projector_main_id, ARRAY['used_as_logo_projector_main_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND logo_projector_main_id IS NOT NULL AND NOT logo_projector_main_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || logo_projector_header_id, ARRAY['used_as_logo_projector_header_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND logo_projector_header_id IS NOT NULL AND NOT logo_projector_header_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || logo_web_header_id, ARRAY['used_as_logo_web_header_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND logo_web_header_id IS NOT NULL AND NOT logo_web_header_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || logo_pdf_header_l_id, ARRAY['used_as_logo_pdf_header_l_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND logo_pdf_header_l_id IS NOT NULL AND NOT logo_pdf_header_l_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || logo_pdf_header_r_id, ARRAY['used_as_logo_pdf_header_r_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND logo_pdf_header_r_id IS NOT NULL AND NOT logo_pdf_header_r_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || logo_pdf_footer_l_id, ARRAY['used_as_logo_pdf_footer_l_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND logo_pdf_footer_l_id IS NOT NULL AND NOT logo_pdf_footer_l_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || logo_pdf_footer_r_id, ARRAY['used_as_logo_pdf_footer_r_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND logo_pdf_footer_r_id IS NOT NULL AND NOT logo_pdf_footer_r_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || logo_pdf_ballot_paper_id, ARRAY['used_as_logo_pdf_ballot_paper_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND logo_pdf_ballot_paper_id IS NOT NULL AND NOT logo_pdf_ballot_paper_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || font_regular_id, ARRAY['used_as_font_regular_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND font_regular_id IS NOT NULL AND NOT font_regular_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || font_italic_id, ARRAY['used_as_font_italic_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND font_italic_id IS NOT NULL AND NOT font_italic_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || font_bold_id, ARRAY['used_as_font_bold_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND font_bold_id IS NOT NULL AND NOT font_bold_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || font_bold_italic_id, ARRAY['used_as_font_bold_italic_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND font_bold_italic_id IS NOT NULL AND NOT font_bold_italic_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || font_monospace_id, ARRAY['used_as_font_monospace_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND font_monospace_id IS NOT NULL AND NOT font_monospace_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || font_chyron_speaker_name_id, ARRAY['used_as_font_chyron_speaker_name_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND font_chyron_speaker_name_id IS NOT NULL AND NOT font_chyron_speaker_name_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || font_projector_h1_id, ARRAY['used_as_font_projector_h1_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND font_projector_h1_id IS NOT NULL AND NOT font_projector_h1_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || font_projector_h2_id, ARRAY['used_as_font_projector_h2_in_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND font_projector_h2_id IS NOT NULL AND NOT font_projector_h2_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'committee/' || committee_id, ARRAY['meeting_ids']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND committee_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'projector/' || reference_projector_id, ARRAY['used_as_reference_projector_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND reference_projector_id IS NOT NULL AND NOT reference_projector_id IN (SELECT id FROM projector_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'projector_countdown/' || list_of_speakers_countdown_id, ARRAY['used_as_list_of_speakers_countdown_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND list_of_speakers_countdown_id IS NOT NULL AND NOT list_of_speakers_countdown_id IN (SELECT id FROM projector_countdown_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'projector_countdown/' || poll_countdown_id, ARRAY['used_as_poll_countdown_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND poll_countdown_id IS NOT NULL AND NOT poll_countdown_id IN (SELECT id FROM projector_countdown_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'group/' || default_group_id, ARRAY['default_group_for_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND default_group_id IS NOT NULL AND NOT default_group_id IN (SELECT id FROM group_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'group/' || admin_group_id, ARRAY['admin_group_for_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND admin_group_id IS NOT NULL AND NOT admin_group_id IN (SELECT id FROM group_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'group/' || anonymous_group_id, ARRAY['anonymous_group_for_meeting_id']::varchar(63)[]
+        FROM meeting_t WHERE id = %1$s AND anonymous_group_id IS NOT NULL AND NOT anonymous_group_id IN (SELECT id FROM group_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_motion_poll_default_id, ARRAY['motion_poll_default_group_ids']::varchar(63)[]
+        FROM group_t WHERE meeting_id = %1$s AND used_as_motion_poll_default_id IS NOT NULL AND NOT used_as_motion_poll_default_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_assignment_poll_default_id, ARRAY['assignment_poll_default_group_ids']::varchar(63)[]
+        FROM group_t WHERE meeting_id = %1$s AND used_as_assignment_poll_default_id IS NOT NULL AND NOT used_as_assignment_poll_default_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_topic_poll_default_id, ARRAY['topic_poll_default_group_ids']::varchar(63)[]
+        FROM group_t WHERE meeting_id = %1$s AND used_as_topic_poll_default_id IS NOT NULL AND NOT used_as_topic_poll_default_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_poll_default_id, ARRAY['poll_default_group_ids']::varchar(63)[]
+        FROM group_t WHERE meeting_id = %1$s AND used_as_poll_default_id IS NOT NULL AND NOT used_as_poll_default_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'user/' || model_id_user_id, ARRAY['history_entry_ids']::varchar(63)[]
+        FROM history_entry_t WHERE meeting_id = %1$s AND model_id_user_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'motion/' || model_id_motion_id, ARRAY['history_entry_ids']::varchar(63)[]
+        FROM history_entry_t WHERE meeting_id = %1$s AND model_id_motion_id IS NOT NULL AND NOT model_id_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'assignment/' || model_id_assignment_id, ARRAY['history_entry_ids']::varchar(63)[]
+        FROM history_entry_t WHERE meeting_id = %1$s AND model_id_assignment_id IS NOT NULL AND NOT model_id_assignment_id IN (SELECT id FROM assignment_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'history_position/' || position_id, ARRAY['entry_ids']::varchar(63)[]
+        FROM history_entry_t WHERE meeting_id = %1$s AND position_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || content_object_id_meeting_mediafile_id, ARRAY['list_of_speakers_id']::varchar(63)[]
+        FROM list_of_speakers_t WHERE meeting_id = %1$s AND content_object_id_meeting_mediafile_id IS NOT NULL AND NOT content_object_id_meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'organization/' || published_to_meetings_in_organization_id, ARRAY['published_mediafile_ids']::varchar(63)[]
+        FROM mediafile_t WHERE owner_id_meeting_id = %1$s AND published_to_meetings_in_organization_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'mediafile/' || parent_id, ARRAY['child_ids']::varchar(63)[]
+        FROM mediafile_t WHERE owner_id_meeting_id = %1$s AND parent_id IS NOT NULL AND NOT parent_id IN (SELECT id FROM mediafile_t WHERE owner_id_meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'organization/' || owner_id_organization_id, ARRAY['mediafile_ids']::varchar(63)[]
+        FROM mediafile_t WHERE owner_id_meeting_id = %1$s AND owner_id_organization_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'mediafile/' || mediafile_id, ARRAY['meeting_mediafile_ids']::varchar(63)[]
+        FROM meeting_mediafile_t WHERE meeting_id = %1$s AND mediafile_id IS NOT NULL AND NOT mediafile_id IN (SELECT id FROM mediafile_t WHERE owner_id_meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'user/' || user_id, ARRAY['meeting_user_ids']::varchar(63)[]
+        FROM meeting_user_t WHERE meeting_id = %1$s AND user_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'committee/' || (SELECT committee_id FROM meeting_t WHERE id = t.meeting_id), ARRAY['user_ids']::varchar(63)[]
+        FROM meeting_user_t t WHERE meeting_id = %1$s AND (SELECT committee_id FROM meeting_t WHERE id = t.meeting_id) IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || t.meeting_id, ARRAY['user_ids']::varchar(63)[]
+        FROM meeting_user_t t WHERE meeting_id = %1$s AND t.meeting_id IS NOT NULL AND NOT t.meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'user/' || t.user_id, ARRAY['committee_ids']::varchar(63)[]
+        FROM meeting_user_t t WHERE meeting_id = %1$s AND t.user_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'user/' || t.user_id, ARRAY['meeting_ids']::varchar(63)[]
+        FROM meeting_user_t t WHERE meeting_id = %1$s AND t.user_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'motion/' || origin_id, ARRAY['derived_motion_ids']::varchar(63)[]
+        FROM motion_t WHERE meeting_id = %1$s AND origin_id IS NOT NULL AND NOT origin_id IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || origin_meeting_id, ARRAY['forwarded_motion_ids']::varchar(63)[]
+        FROM motion_t WHERE meeting_id = %1$s AND origin_meeting_id IS NOT NULL AND NOT origin_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'user/' || content_object_id_user_id, ARRAY['option_ids']::varchar(63)[]
+        FROM option_t WHERE meeting_id = %1$s AND content_object_id_user_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'user/' || user_id, ARRAY['poll_candidate_ids']::varchar(63)[]
+        FROM poll_candidate_t WHERE meeting_id = %1$s AND user_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || content_object_id_meeting_id, ARRAY['projection_ids']::varchar(63)[]
+        FROM projection_t WHERE meeting_id = %1$s AND content_object_id_meeting_id IS NOT NULL AND NOT content_object_id_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || content_object_id_meeting_mediafile_id, ARRAY['projection_ids']::varchar(63)[]
+        FROM projection_t WHERE meeting_id = %1$s AND content_object_id_meeting_mediafile_id IS NOT NULL AND NOT content_object_id_meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_agenda_item_list_in_meeting_id, ARRAY['default_projector_agenda_item_list_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_agenda_item_list_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_agenda_item_list_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_topic_in_meeting_id, ARRAY['default_projector_topic_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_topic_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_topic_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_list_of_speakers_in_meeting_id, ARRAY['default_projector_list_of_speakers_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_list_of_speakers_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_list_of_speakers_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_current_los_in_meeting_id, ARRAY['default_projector_current_los_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_current_los_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_current_los_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_motion_in_meeting_id, ARRAY['default_projector_motion_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_motion_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_motion_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_amendment_in_meeting_id, ARRAY['default_projector_amendment_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_amendment_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_amendment_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_motion_block_in_meeting_id, ARRAY['default_projector_motion_block_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_motion_block_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_motion_block_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_assignment_in_meeting_id, ARRAY['default_projector_assignment_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_assignment_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_assignment_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_mediafile_in_meeting_id, ARRAY['default_projector_mediafile_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_mediafile_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_mediafile_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_message_in_meeting_id, ARRAY['default_projector_message_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_message_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_message_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_countdown_in_meeting_id, ARRAY['default_projector_countdown_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_countdown_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_countdown_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_assignment_poll_in_meeting_id, ARRAY['default_projector_assignment_poll_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_assignment_poll_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_assignment_poll_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_motion_poll_in_meeting_id, ARRAY['default_projector_motion_poll_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_motion_poll_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_motion_poll_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || used_as_default_projector_for_poll_in_meeting_id, ARRAY['default_projector_poll_ids']::varchar(63)[]
+        FROM projector_t WHERE meeting_id = %1$s AND used_as_default_projector_for_poll_in_meeting_id IS NOT NULL AND NOT used_as_default_projector_for_poll_in_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'user/' || user_id, ARRAY['vote_ids']::varchar(63)[]
+        FROM vote_t WHERE meeting_id = %1$s AND user_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'user/' || delegated_user_id, ARRAY['delegated_vote_ids']::varchar(63)[]
+        FROM vote_t WHERE meeting_id = %1$s AND delegated_user_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || meeting_mediafile_id, ARRAY['access_group_ids']::varchar(63)[]
+        FROM nm_group_mmagi_meeting_mediafile_t WHERE (group_id IN (SELECT id FROM group_t WHERE meeting_id = %1$s) OR meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)) AND meeting_mediafile_id IS NOT NULL AND NOT meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'group/' || group_id, ARRAY['meeting_mediafile_inherited_access_group_ids']::varchar(63)[]
+        FROM nm_group_mmiagi_meeting_mediafile_t WHERE (group_id IN (SELECT id FROM group_t WHERE meeting_id = %1$s) OR meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)) AND group_id IS NOT NULL AND NOT group_id IN (SELECT id FROM group_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || meeting_mediafile_id, ARRAY['inherited_access_group_ids']::varchar(63)[]
+        FROM nm_group_mmiagi_meeting_mediafile_t WHERE (group_id IN (SELECT id FROM group_t WHERE meeting_id = %1$s) OR meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)) AND meeting_mediafile_id IS NOT NULL AND NOT meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || meeting_id, ARRAY['present_user_ids']::varchar(63)[]
+        FROM nm_meeting_present_user_ids_user_t WHERE (meeting_id = %1$s) AND meeting_id IS NOT NULL AND NOT meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'user/' || user_id, ARRAY['is_present_in_meeting_ids']::varchar(63)[]
+        FROM nm_meeting_present_user_ids_user_t WHERE (meeting_id = %1$s) AND user_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'meeting_mediafile/' || meeting_mediafile_id, ARRAY['attachment_ids']::varchar(63)[]
+        FROM gm_meeting_mediafile_attachment_ids_t WHERE (meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s) OR attachment_id_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = %1$s) OR attachment_id_topic_id IN (SELECT id FROM topic_t WHERE meeting_id = %1$s) OR attachment_id_assignment_id IN (SELECT id FROM assignment_t WHERE meeting_id = %1$s)) AND meeting_mediafile_id IS NOT NULL AND NOT meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'motion/' || all_origin_id, ARRAY['all_derived_motion_ids']::varchar(63)[]
+        FROM nm_motion_all_derived_motion_ids_motion_t WHERE (all_origin_id IN (SELECT id FROM motion_t WHERE meeting_id = %1$s) OR all_derived_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)) AND all_origin_id IS NOT NULL AND NOT all_origin_id IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'motion/' || all_derived_motion_id, ARRAY['all_origin_ids']::varchar(63)[]
+        FROM nm_motion_all_derived_motion_ids_motion_t WHERE (all_origin_id IN (SELECT id FROM motion_t WHERE meeting_id = %1$s) OR all_derived_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)) AND all_derived_motion_id IS NOT NULL AND NOT all_derived_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'motion/' || identical_motion_id_1, ARRAY['identical_motion_ids']::varchar(63)[]
+        FROM nm_motion_identical_motion_ids_motion_t WHERE (identical_motion_id_1 IN (SELECT id FROM motion_t WHERE meeting_id = %1$s) OR identical_motion_id_2 IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)) AND identical_motion_id_1 IS NOT NULL AND NOT identical_motion_id_1 IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'motion/' || identical_motion_id_2, ARRAY['identical_motion_ids']::varchar(63)[]
+        FROM nm_motion_identical_motion_ids_motion_t WHERE (identical_motion_id_1 IN (SELECT id FROM motion_t WHERE meeting_id = %1$s) OR identical_motion_id_2 IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)) AND identical_motion_id_2 IS NOT NULL AND NOT identical_motion_id_2 IN (SELECT id FROM motion_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'organization_tag/' || organization_tag_id, ARRAY['tagged_ids']::varchar(63)[]
+        FROM gm_organization_tag_tagged_ids_t WHERE (tagged_id_meeting_id = %1$s) AND organization_tag_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'committee/' || tagged_id_committee_id, ARRAY['organization_tag_ids']::varchar(63)[]
+        FROM gm_organization_tag_tagged_ids_t WHERE (tagged_id_meeting_id = %1$s) AND tagged_id_committee_id IS NOT NULL
+        UNION ALL SELECT DISTINCT 'update', 'meeting/' || tagged_id_meeting_id, ARRAY['organization_tag_ids']::varchar(63)[]
+        FROM gm_organization_tag_tagged_ids_t WHERE (tagged_id_meeting_id = %1$s) AND tagged_id_meeting_id IS NOT NULL AND NOT tagged_id_meeting_id = %1$s
+        UNION ALL SELECT DISTINCT 'update', 'poll/' || poll_id, ARRAY['voted_ids']::varchar(63)[]
+        FROM nm_poll_voted_ids_user_t WHERE (poll_id IN (SELECT id FROM poll_t WHERE meeting_id = %1$s)) AND poll_id IS NOT NULL AND NOT poll_id IN (SELECT id FROM poll_t WHERE meeting_id = %1$s)
+        UNION ALL SELECT DISTINCT 'update', 'user/' || user_id, ARRAY['poll_voted_ids']::varchar(63)[]
+        FROM nm_poll_voted_ids_user_t WHERE (poll_id IN (SELECT id FROM poll_t WHERE meeting_id = %1$s)) AND user_id IS NOT NULL
+    $entries$, deleted_meeting_id));
+
+    DELETE FROM nm_chat_group_read_group_ids_group_t
+    WHERE chat_group_id IN (SELECT id FROM chat_group_t WHERE meeting_id = deleted_meeting_id)
+        OR group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_chat_group_write_group_ids_group_t
+    WHERE chat_group_id IN (SELECT id FROM chat_group_t WHERE meeting_id = deleted_meeting_id)
+        OR group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_group_meeting_user_ids_meeting_user_t
+    WHERE group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id)
+        OR meeting_user_id IN (SELECT id FROM meeting_user_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_group_mmagi_meeting_mediafile_t
+    WHERE group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id)
+        OR meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_group_mmiagi_meeting_mediafile_t
+    WHERE group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id)
+        OR meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_group_read_comment_section_ids_motion_comment_section_t
+    WHERE group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id)
+        OR motion_comment_section_id IN (SELECT id FROM motion_comment_section_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_group_write_comment_section_ids_motion_comment_section_t
+    WHERE group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id)
+        OR motion_comment_section_id IN (SELECT id FROM motion_comment_section_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_group_poll_ids_poll_t
+    WHERE group_id IN (SELECT id FROM group_t WHERE meeting_id = deleted_meeting_id)
+        OR poll_id IN (SELECT id FROM poll_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_meeting_present_user_ids_user_t
+    WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM gm_meeting_mediafile_attachment_ids_t
+    WHERE meeting_mediafile_id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id)
+        OR attachment_id_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id)
+        OR attachment_id_topic_id IN (SELECT id FROM topic_t WHERE meeting_id = deleted_meeting_id)
+        OR attachment_id_assignment_id IN (SELECT id FROM assignment_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_meeting_user_structure_level_ids_structure_level_t
+    WHERE meeting_user_id IN (SELECT id FROM meeting_user_t WHERE meeting_id = deleted_meeting_id)
+        OR structure_level_id IN (SELECT id FROM structure_level_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_motion_all_derived_motion_ids_motion_t
+    WHERE all_origin_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id)
+        OR all_derived_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_motion_identical_motion_ids_motion_t
+    WHERE identical_motion_id_1 IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id)
+        OR identical_motion_id_2 IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM gm_motion_state_extension_reference_ids_t
+    WHERE motion_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id)
+        OR state_extension_reference_id_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM gm_motion_recommendation_extension_reference_ids_t
+    WHERE motion_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id)
+        OR recommendation_extension_reference_id_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM nm_motion_state_next_state_ids_motion_state_t
+    WHERE previous_state_id IN (SELECT id FROM motion_state_t WHERE meeting_id = deleted_meeting_id)
+        OR next_state_id IN (SELECT id FROM motion_state_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM gm_organization_tag_tagged_ids_t
+    WHERE tagged_id_meeting_id = deleted_meeting_id;
+    DELETE FROM nm_poll_voted_ids_user_t
+    WHERE poll_id IN (SELECT id FROM poll_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM gm_tag_tagged_ids_t
+    WHERE tag_id IN (SELECT id FROM tag_t WHERE meeting_id = deleted_meeting_id)
+        OR tagged_id_agenda_item_id IN (SELECT id FROM agenda_item_t WHERE meeting_id = deleted_meeting_id)
+        OR tagged_id_assignment_id IN (SELECT id FROM assignment_t WHERE meeting_id = deleted_meeting_id)
+        OR tagged_id_motion_id IN (SELECT id FROM motion_t WHERE meeting_id = deleted_meeting_id);
+    DELETE FROM projection_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM agenda_item_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM assignment_candidate_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM history_entry_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM speaker_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM structure_level_list_of_speakers_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM list_of_speakers_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM vote_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM option_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM poll_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM assignment_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM chat_message_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM chat_group_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM group_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM meeting_mediafile_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM mediafile_t WHERE owner_id_meeting_id = deleted_meeting_id;
+    DELETE FROM motion_editor_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_submitter_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_supporter_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_working_group_speaker_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM personal_note_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM meeting_user_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_change_recommendation_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_comment_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_block_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_category_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_comment_section_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_workflow_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM motion_state_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM point_of_order_category_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM poll_candidate_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM poll_candidate_list_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM projector_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM projector_countdown_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM projector_message_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM structure_level_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM tag_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM topic_t WHERE meeting_id = deleted_meeting_id;
+    DELETE FROM meeting_t WHERE id = deleted_meeting_id;
+    FOR sequence_name IN
+        SELECT relname FROM pg_class WHERE relkind = 'S' AND relname IN (
+            'assignment_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq',
+            'list_of_speakers_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq',
+            'motion_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq',
+            'motion_block_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq',
+            'motion_category_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq',
+            'motion_comment_section_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq',
+            'motion_workflow_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq',
+            'poll_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq',
+            'projector_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq',
+            'topic_t_meeting_id' || deleted_meeting_id || '_sequential_number_seq'
+        )
+    LOOP
+        EXECUTE format('DROP SEQUENCE %I', sequence_name);
+    END LOOP;
+    PERFORM set_config('os.deleting_meeting', 'off', true);
+    DELETE FROM os_deleting_meeting_t WHERE xact_id = pg_current_xact_id();
+END;
+$delete_meeting$ LANGUAGE plpgsql;
+
+CREATE FUNCTION export_meeting(exported_meeting_id INTEGER)
+RETURNS SETOF TEXT AS $export_meeting$
+-- Returns the meeting with all models owned by it as newline-delimited JSON,
+-- one row {"fqid": "motion/1", "fields": {...}} per model.
+-- The fields are read from the tables, the relation lists calculated in the views are
+-- aggregated once per table and meeting and joined.
+-- The function is a single stable SQL query and inlined by the planner, so its rows
+-- are streamed to a cursor, e.g. DECLARE export CURSOR FOR SELECT * FROM export_meeting(1);
+SELECT jsonb_build_object('fqid', 'meeting/' || m.id, 'fields', to_jsonb(m) || jsonb_build_object('agenda_item_ids', r1.value, 'all_projection_ids', r2.value, 'assignment_candidate_ids', r3.value, 'assignment_ids', r4.value, 'assignment_poll_default_group_ids', r5.value, 'chat_group_ids', r6.value, 'chat_message_ids', r7.value, 'default_meeting_for_committee_id', r8.value, 'default_projector_agenda_item_list_ids', r9.value, 'default_projector_amendment_ids', r10.value, 'default_projector_assignment_ids', r11.value, 'default_projector_assignment_poll_ids', r12.value, 'default_projector_countdown_ids', r13.value, 'default_projector_current_los_ids', r14.value, 'default_projector_list_of_speakers_ids', r15.value, 'default_projector_mediafile_ids', r16.value, 'default_projector_message_ids', r17.value, 'default_projector_motion_block_ids', r18.value, 'default_projector_motion_ids', r19.value, 'default_projector_motion_poll_ids', r20.value, 'default_projector_poll_ids', r21.value, 'default_projector_topic_ids', r22.value, 'forwarded_motion_ids', r23.value, 'group_ids', r24.value, 'list_of_speakers_ids', r25.value, 'mediafile_ids', r26.value, 'meeting_mediafile_ids', r27.value, 'meeting_user_ids', r28.value, 'motion_block_ids', r29.value, 'motion_category_ids', r30.value, 'motion_change_recommendation_ids', r31.value, 'motion_comment_ids', r32.value, 'motion_comment_section_ids', r33.value, 'motion_editor_ids', r34.value, 'motion_ids', r35.value, 'motion_poll_default_group_ids', r36.value, 'motion_state_ids', r37.value, 'motion_submitter_ids', r38.value, 'motion_supporter_ids', r39.value, 'motion_workflow_ids', r40.value, 'motion_working_group_speaker_ids', r41.value, 'option_ids', r42.value, 'organization_tag_ids', r43.value, 'personal_note_ids', r44.value, 'point_of_order_category_ids', r45.value, 'poll_candidate_ids', r46.value, 'poll_candidate_list_ids', r47.value, 'poll_default_group_ids', r48.value, 'poll_ids', r49.value, 'present_user_ids', r50.value) || jsonb_build_object('projection_ids', r51.value, 'projector_countdown_ids', r52.value, 'projector_ids', r53.value, 'projector_message_ids', r54.value, 'relevant_history_entry_ids', r55.value, 'speaker_ids', r56.value, 'structure_level_ids', r57.value, 'structure_level_list_of_speakers_ids', r58.value, 'tag_ids', r59.value, 'topic_ids', r60.value, 'topic_poll_default_group_ids', r61.value, 'vote_ids', r62.value, 'user_ids', (
+  SELECT array_agg(DISTINCT mu.user_id ORDER BY mu.user_id)
+  FROM meeting_user_t mu
+  WHERE mu.meeting_id = m.id
+)))::text
+FROM meeting_t m
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM agenda_item_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM projection_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r2 ON r2.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM assignment_candidate_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r3 ON r3.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM assignment_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r4 ON r4.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_assignment_poll_default_id AS id, id AS value FROM group_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r5 ON r5.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM chat_group_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r6 ON r6.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM chat_message_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r7 ON r7.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT default_meeting_id AS id, id AS value FROM committee_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r8 ON r8.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_agenda_item_list_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r9 ON r9.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_amendment_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r10 ON r10.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_assignment_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r11 ON r11.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_assignment_poll_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r12 ON r12.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_countdown_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r13 ON r13.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_current_los_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r14 ON r14.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_list_of_speakers_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r15 ON r15.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_mediafile_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r16 ON r16.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_message_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r17 ON r17.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_motion_block_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r18 ON r18.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_motion_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r19 ON r19.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_motion_poll_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r20 ON r20.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_poll_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r21 ON r21.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_default_projector_for_topic_in_meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r22 ON r22.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT origin_meeting_id AS id, id AS value FROM motion_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r23 ON r23.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM group_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r24 ON r24.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM list_of_speakers_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r25 ON r25.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT owner_id_meeting_id AS id, id AS value FROM mediafile_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r26 ON r26.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM meeting_mediafile_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r27 ON r27.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM meeting_user_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r28 ON r28.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_block_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r29 ON r29.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_category_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r30 ON r30.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_change_recommendation_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r31 ON r31.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_comment_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r32 ON r32.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_comment_section_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r33 ON r33.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_editor_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r34 ON r34.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r35 ON r35.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_motion_poll_default_id AS id, id AS value FROM group_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r36 ON r36.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_state_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r37 ON r37.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_submitter_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r38 ON r38.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_supporter_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r39 ON r39.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_workflow_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r40 ON r40.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM motion_working_group_speaker_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r41 ON r41.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM option_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r42 ON r42.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT tagged_id_meeting_id AS id, organization_tag_id AS value FROM gm_organization_tag_tagged_ids_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r43 ON r43.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM personal_note_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r44 ON r44.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM point_of_order_category_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r45 ON r45.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM poll_candidate_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r46 ON r46.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM poll_candidate_list_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r47 ON r47.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_poll_default_id AS id, id AS value FROM group_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r48 ON r48.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM poll_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r49 ON r49.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, user_id AS value FROM nm_meeting_present_user_ids_user_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r50 ON r50.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_meeting_id AS id, id AS value FROM projection_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r51 ON r51.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM projector_countdown_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r52 ON r52.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM projector_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r53 ON r53.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM projector_message_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r54 ON r54.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM history_entry_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r55 ON r55.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM speaker_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r56 ON r56.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM structure_level_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r57 ON r57.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM structure_level_list_of_speakers_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r58 ON r58.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM tag_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r59 ON r59.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM topic_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r60 ON r60.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT used_as_topic_poll_default_id AS id, id AS value FROM group_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r61 ON r61.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_id AS id, id AS value FROM vote_t) s
+    WHERE s.id = exported_meeting_id GROUP BY s.id) r62 ON r62.id = m.id
+WHERE m.id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'agenda_item/' || a.id, 'fields', (to_jsonb(a) - '{content_object_id_motion_id,content_object_id_motion_block_id,content_object_id_assignment_id,content_object_id_topic_id}'::text[]) || jsonb_build_object('child_ids', r1.value, 'projection_ids', r2.value, 'tag_ids', r3.value))::text
+FROM agenda_item_t a
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT parent_id AS id, id AS value FROM agenda_item_t) s
+    WHERE s.id IN (SELECT id FROM agenda_item_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = a.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_agenda_item_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM agenda_item_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = a.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT tagged_id_agenda_item_id AS id, tag_id AS value FROM gm_tag_tagged_ids_t) s
+    WHERE s.id IN (SELECT id FROM agenda_item_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = a.id
+WHERE a.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'assignment/' || a.id, 'fields', to_jsonb(a) || jsonb_build_object('agenda_item_id', r1.value, 'attachment_meeting_mediafile_ids', r2.value, 'candidate_ids', r3.value, 'history_entry_ids', r4.value, 'list_of_speakers_id', r5.value, 'poll_ids', r6.value, 'projection_ids', r7.value, 'tag_ids', r8.value))::text
+FROM assignment_t a
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_assignment_id AS id, id AS value FROM agenda_item_t) s
+    WHERE s.id IN (SELECT id FROM assignment_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = a.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT attachment_id_assignment_id AS id, meeting_mediafile_id AS value FROM gm_meeting_mediafile_attachment_ids_t) s
+    WHERE s.id IN (SELECT id FROM assignment_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = a.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT assignment_id AS id, id AS value FROM assignment_candidate_t) s
+    WHERE s.id IN (SELECT id FROM assignment_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = a.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT model_id_assignment_id AS id, id AS value FROM history_entry_t) s
+    WHERE s.id IN (SELECT id FROM assignment_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = a.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_assignment_id AS id, id AS value FROM list_of_speakers_t) s
+    WHERE s.id IN (SELECT id FROM assignment_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r5 ON r5.id = a.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_assignment_id AS id, id AS value FROM poll_t) s
+    WHERE s.id IN (SELECT id FROM assignment_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r6 ON r6.id = a.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_assignment_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM assignment_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r7 ON r7.id = a.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT tagged_id_assignment_id AS id, tag_id AS value FROM gm_tag_tagged_ids_t) s
+    WHERE s.id IN (SELECT id FROM assignment_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r8 ON r8.id = a.id
+WHERE a.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'assignment_candidate/' || a.id, 'fields', to_jsonb(a))::text
+FROM assignment_candidate_t a
+WHERE a.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'chat_group/' || c.id, 'fields', to_jsonb(c) || jsonb_build_object('chat_message_ids', r1.value, 'read_group_ids', r2.value, 'write_group_ids', r3.value))::text
+FROM chat_group_t c
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT chat_group_id AS id, id AS value FROM chat_message_t) s
+    WHERE s.id IN (SELECT id FROM chat_group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = c.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT chat_group_id AS id, group_id AS value FROM nm_chat_group_read_group_ids_group_t) s
+    WHERE s.id IN (SELECT id FROM chat_group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = c.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT chat_group_id AS id, group_id AS value FROM nm_chat_group_write_group_ids_group_t) s
+    WHERE s.id IN (SELECT id FROM chat_group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = c.id
+WHERE c.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'chat_message/' || c.id, 'fields', to_jsonb(c))::text
+FROM chat_message_t c
+WHERE c.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'group/' || g.id, 'fields', to_jsonb(g) || jsonb_build_object('admin_group_for_meeting_id', r1.value, 'anonymous_group_for_meeting_id', r2.value, 'default_group_for_meeting_id', r3.value, 'meeting_mediafile_access_group_ids', r4.value, 'meeting_mediafile_inherited_access_group_ids', r5.value, 'meeting_user_ids', r6.value, 'poll_ids', r7.value, 'read_chat_group_ids', r8.value, 'read_comment_section_ids', r9.value, 'write_chat_group_ids', r10.value, 'write_comment_section_ids', r11.value))::text
+FROM group_t g
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT admin_group_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = g.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT anonymous_group_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = g.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT default_group_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = g.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT group_id AS id, meeting_mediafile_id AS value FROM nm_group_mmagi_meeting_mediafile_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = g.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT group_id AS id, meeting_mediafile_id AS value FROM nm_group_mmiagi_meeting_mediafile_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r5 ON r5.id = g.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT group_id AS id, meeting_user_id AS value FROM nm_group_meeting_user_ids_meeting_user_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r6 ON r6.id = g.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT group_id AS id, poll_id AS value FROM nm_group_poll_ids_poll_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r7 ON r7.id = g.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT group_id AS id, chat_group_id AS value FROM nm_chat_group_read_group_ids_group_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r8 ON r8.id = g.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT group_id AS id, motion_comment_section_id AS value FROM nm_group_read_comment_section_ids_motion_comment_section_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r9 ON r9.id = g.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT group_id AS id, chat_group_id AS value FROM nm_chat_group_write_group_ids_group_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r10 ON r10.id = g.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT group_id AS id, motion_comment_section_id AS value FROM nm_group_write_comment_section_ids_motion_comment_section_t) s
+    WHERE s.id IN (SELECT id FROM group_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r11 ON r11.id = g.id
+WHERE g.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'history_entry/' || h.id, 'fields', (to_jsonb(h) - '{model_id_user_id,model_id_motion_id,model_id_assignment_id}'::text[]))::text
+FROM history_entry_t h
+WHERE h.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'list_of_speakers/' || l.id, 'fields', (to_jsonb(l) - '{content_object_id_motion_id,content_object_id_motion_block_id,content_object_id_assignment_id,content_object_id_topic_id,content_object_id_meeting_mediafile_id}'::text[]) || jsonb_build_object('projection_ids', r1.value, 'speaker_ids', r2.value, 'structure_level_list_of_speakers_ids', r3.value))::text
+FROM list_of_speakers_t l
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_list_of_speakers_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM list_of_speakers_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = l.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT list_of_speakers_id AS id, id AS value FROM speaker_t) s
+    WHERE s.id IN (SELECT id FROM list_of_speakers_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = l.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT list_of_speakers_id AS id, id AS value FROM structure_level_list_of_speakers_t) s
+    WHERE s.id IN (SELECT id FROM list_of_speakers_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = l.id
+WHERE l.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'mediafile/' || m.id, 'fields', (to_jsonb(m) - '{owner_id_meeting_id,owner_id_organization_id}'::text[]) || jsonb_build_object('child_ids', r1.value, 'meeting_mediafile_ids', r2.value))::text
+FROM mediafile_t m
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT parent_id AS id, id AS value FROM mediafile_t) s
+    WHERE s.id IN (SELECT id FROM mediafile_t WHERE owner_id_meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT mediafile_id AS id, id AS value FROM meeting_mediafile_t) s
+    WHERE s.id IN (SELECT id FROM mediafile_t WHERE owner_id_meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = m.id
+WHERE m.owner_id_meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'meeting_mediafile/' || m.id, 'fields', to_jsonb(m) || jsonb_build_object('access_group_ids', r1.value, 'attachment_ids', r2.value, 'inherited_access_group_ids', r3.value, 'list_of_speakers_id', r4.value, 'projection_ids', r5.value, 'used_as_font_bold_in_meeting_id', r6.value, 'used_as_font_bold_italic_in_meeting_id', r7.value, 'used_as_font_chyron_speaker_name_in_meeting_id', r8.value, 'used_as_font_italic_in_meeting_id', r9.value, 'used_as_font_monospace_in_meeting_id', r10.value, 'used_as_font_projector_h1_in_meeting_id', r11.value, 'used_as_font_projector_h2_in_meeting_id', r12.value, 'used_as_font_regular_in_meeting_id', r13.value, 'used_as_logo_pdf_ballot_paper_in_meeting_id', r14.value, 'used_as_logo_pdf_footer_l_in_meeting_id', r15.value, 'used_as_logo_pdf_footer_r_in_meeting_id', r16.value, 'used_as_logo_pdf_header_l_in_meeting_id', r17.value, 'used_as_logo_pdf_header_r_in_meeting_id', r18.value, 'used_as_logo_projector_header_in_meeting_id', r19.value, 'used_as_logo_projector_main_in_meeting_id', r20.value, 'used_as_logo_web_header_in_meeting_id', r21.value))::text
+FROM meeting_mediafile_t m
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_mediafile_id AS id, group_id AS value FROM nm_group_mmagi_meeting_mediafile_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_mediafile_id AS id, attachment_id AS value FROM gm_meeting_mediafile_attachment_ids_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_mediafile_id AS id, group_id AS value FROM nm_group_mmiagi_meeting_mediafile_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_meeting_mediafile_id AS id, id AS value FROM list_of_speakers_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_meeting_mediafile_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r5 ON r5.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT font_bold_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r6 ON r6.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT font_bold_italic_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r7 ON r7.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT font_chyron_speaker_name_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r8 ON r8.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT font_italic_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r9 ON r9.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT font_monospace_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r10 ON r10.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT font_projector_h1_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r11 ON r11.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT font_projector_h2_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r12 ON r12.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT font_regular_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r13 ON r13.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT logo_pdf_ballot_paper_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r14 ON r14.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT logo_pdf_footer_l_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r15 ON r15.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT logo_pdf_footer_r_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r16 ON r16.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT logo_pdf_header_l_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r17 ON r17.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT logo_pdf_header_r_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r18 ON r18.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT logo_projector_header_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r19 ON r19.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT logo_projector_main_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r20 ON r20.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT logo_web_header_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM meeting_mediafile_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r21 ON r21.id = m.id
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'meeting_user/' || m.id, 'fields', to_jsonb(m) || jsonb_build_object('assignment_candidate_ids', r1.value, 'chat_message_ids', r2.value, 'group_ids', r3.value, 'motion_editor_ids', r4.value, 'motion_submitter_ids', r5.value, 'motion_supporter_ids', r6.value, 'motion_working_group_speaker_ids', r7.value, 'personal_note_ids', r8.value, 'speaker_ids', r9.value, 'structure_level_ids', r10.value, 'vote_delegations_from_ids', r11.value))::text
+FROM meeting_user_t m
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, id AS value FROM assignment_candidate_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, id AS value FROM chat_message_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, group_id AS value FROM nm_group_meeting_user_ids_meeting_user_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, id AS value FROM motion_editor_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, id AS value FROM motion_submitter_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r5 ON r5.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, id AS value FROM motion_supporter_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r6 ON r6.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, id AS value FROM motion_working_group_speaker_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r7 ON r7.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, id AS value FROM personal_note_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r8 ON r8.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, id AS value FROM speaker_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r9 ON r9.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT meeting_user_id AS id, structure_level_id AS value FROM nm_meeting_user_structure_level_ids_structure_level_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r10 ON r10.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT vote_delegated_to_id AS id, id AS value FROM meeting_user_t) s
+    WHERE s.id IN (SELECT id FROM meeting_user_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r11 ON r11.id = m.id
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion/' || m.id, 'fields', to_jsonb(m) || jsonb_build_object('agenda_item_id', r1.value, 'all_derived_motion_ids', r2.value, 'all_origin_ids', r3.value, 'amendment_ids', r4.value, 'attachment_meeting_mediafile_ids', r5.value, 'change_recommendation_ids', r6.value, 'comment_ids', r7.value, 'derived_motion_ids', r8.value, 'editor_ids', r9.value, 'history_entry_ids', r10.value, 'identical_motion_ids', r11.value, 'list_of_speakers_id', r12.value, 'option_ids', r13.value, 'personal_note_ids', r14.value, 'poll_ids', r15.value, 'projection_ids', r16.value, 'recommendation_extension_reference_ids', r17.value, 'referenced_in_motion_recommendation_extension_ids', r18.value, 'referenced_in_motion_state_extension_ids', r19.value, 'sort_child_ids', r20.value, 'state_extension_reference_ids', r21.value, 'submitter_ids', r22.value, 'supporter_ids', r23.value, 'tag_ids', r24.value, 'working_group_speaker_ids', r25.value))::text
+FROM motion_t m
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_motion_id AS id, id AS value FROM agenda_item_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT all_origin_id AS id, all_derived_motion_id AS value FROM nm_motion_all_derived_motion_ids_motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT all_derived_motion_id AS id, all_origin_id AS value FROM nm_motion_all_derived_motion_ids_motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT lead_motion_id AS id, id AS value FROM motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT attachment_id_motion_id AS id, meeting_mediafile_id AS value FROM gm_meeting_mediafile_attachment_ids_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r5 ON r5.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_id AS id, id AS value FROM motion_change_recommendation_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r6 ON r6.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_id AS id, id AS value FROM motion_comment_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r7 ON r7.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT origin_id AS id, id AS value FROM motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r8 ON r8.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_id AS id, id AS value FROM motion_editor_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r9 ON r9.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT model_id_motion_id AS id, id AS value FROM history_entry_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r10 ON r10.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT identical_motion_id_1 AS id, identical_motion_id_2 AS value FROM nm_motion_identical_motion_ids_motion_t UNION ALL SELECT identical_motion_id_2 AS id, identical_motion_id_1 AS value FROM nm_motion_identical_motion_ids_motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r11 ON r11.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_motion_id AS id, id AS value FROM list_of_speakers_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r12 ON r12.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_motion_id AS id, id AS value FROM option_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r13 ON r13.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_motion_id AS id, id AS value FROM personal_note_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r14 ON r14.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_motion_id AS id, id AS value FROM poll_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r15 ON r15.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_motion_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r16 ON r16.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_id AS id, recommendation_extension_reference_id AS value FROM gm_motion_recommendation_extension_reference_ids_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r17 ON r17.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT recommendation_extension_reference_id_motion_id AS id, motion_id AS value FROM gm_motion_recommendation_extension_reference_ids_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r18 ON r18.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT state_extension_reference_id_motion_id AS id, motion_id AS value FROM gm_motion_state_extension_reference_ids_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r19 ON r19.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT sort_parent_id AS id, id AS value FROM motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r20 ON r20.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_id AS id, state_extension_reference_id AS value FROM gm_motion_state_extension_reference_ids_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r21 ON r21.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_id AS id, id AS value FROM motion_submitter_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r22 ON r22.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_id AS id, id AS value FROM motion_supporter_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r23 ON r23.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT tagged_id_motion_id AS id, tag_id AS value FROM gm_tag_tagged_ids_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r24 ON r24.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_id AS id, id AS value FROM motion_working_group_speaker_t) s
+    WHERE s.id IN (SELECT id FROM motion_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r25 ON r25.id = m.id
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_block/' || m.id, 'fields', to_jsonb(m) || jsonb_build_object('agenda_item_id', r1.value, 'list_of_speakers_id', r2.value, 'motion_ids', r3.value, 'projection_ids', r4.value))::text
+FROM motion_block_t m
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_motion_block_id AS id, id AS value FROM agenda_item_t) s
+    WHERE s.id IN (SELECT id FROM motion_block_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_motion_block_id AS id, id AS value FROM list_of_speakers_t) s
+    WHERE s.id IN (SELECT id FROM motion_block_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT block_id AS id, id AS value FROM motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_block_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_motion_block_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM motion_block_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = m.id
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_category/' || m.id, 'fields', to_jsonb(m) || jsonb_build_object('child_ids', r1.value, 'motion_ids', r2.value))::text
+FROM motion_category_t m
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT parent_id AS id, id AS value FROM motion_category_t) s
+    WHERE s.id IN (SELECT id FROM motion_category_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT category_id AS id, id AS value FROM motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_category_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = m.id
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_change_recommendation/' || m.id, 'fields', to_jsonb(m))::text
+FROM motion_change_recommendation_t m
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_comment/' || m.id, 'fields', to_jsonb(m))::text
+FROM motion_comment_t m
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_comment_section/' || m.id, 'fields', to_jsonb(m) || jsonb_build_object('comment_ids', r1.value, 'read_group_ids', r2.value, 'write_group_ids', r3.value))::text
+FROM motion_comment_section_t m
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT section_id AS id, id AS value FROM motion_comment_t) s
+    WHERE s.id IN (SELECT id FROM motion_comment_section_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_comment_section_id AS id, group_id AS value FROM nm_group_read_comment_section_ids_motion_comment_section_t) s
+    WHERE s.id IN (SELECT id FROM motion_comment_section_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT motion_comment_section_id AS id, group_id AS value FROM nm_group_write_comment_section_ids_motion_comment_section_t) s
+    WHERE s.id IN (SELECT id FROM motion_comment_section_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = m.id
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_editor/' || m.id, 'fields', to_jsonb(m))::text
+FROM motion_editor_t m
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_state/' || m.id, 'fields', to_jsonb(m) || jsonb_build_object('first_state_of_workflow_id', r1.value, 'motion_ids', r2.value, 'motion_recommendation_ids', r3.value, 'next_state_ids', r4.value, 'previous_state_ids', r5.value, 'submitter_withdraw_back_ids', r6.value))::text
+FROM motion_state_t m
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT first_state_id AS id, id AS value FROM motion_workflow_t) s
+    WHERE s.id IN (SELECT id FROM motion_state_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT state_id AS id, id AS value FROM motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_state_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT recommendation_id AS id, id AS value FROM motion_t) s
+    WHERE s.id IN (SELECT id FROM motion_state_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT previous_state_id AS id, next_state_id AS value FROM nm_motion_state_next_state_ids_motion_state_t) s
+    WHERE s.id IN (SELECT id FROM motion_state_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT next_state_id AS id, previous_state_id AS value FROM nm_motion_state_next_state_ids_motion_state_t) s
+    WHERE s.id IN (SELECT id FROM motion_state_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r5 ON r5.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT submitter_withdraw_state_id AS id, id AS value FROM motion_state_t) s
+    WHERE s.id IN (SELECT id FROM motion_state_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r6 ON r6.id = m.id
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_submitter/' || m.id, 'fields', to_jsonb(m))::text
+FROM motion_submitter_t m
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_supporter/' || m.id, 'fields', to_jsonb(m))::text
+FROM motion_supporter_t m
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_workflow/' || m.id, 'fields', to_jsonb(m) || jsonb_build_object('default_amendment_workflow_meeting_id', r1.value, 'default_workflow_meeting_id', r2.value, 'state_ids', r3.value))::text
+FROM motion_workflow_t m
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT motions_default_amendment_workflow_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM motion_workflow_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = m.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT motions_default_workflow_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM motion_workflow_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = m.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT workflow_id AS id, id AS value FROM motion_state_t) s
+    WHERE s.id IN (SELECT id FROM motion_workflow_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = m.id
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'motion_working_group_speaker/' || m.id, 'fields', to_jsonb(m))::text
+FROM motion_working_group_speaker_t m
+WHERE m.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'option/' || o.id, 'fields', (to_jsonb(o) - '{content_object_id_motion_id,content_object_id_user_id,content_object_id_poll_candidate_list_id}'::text[]) || jsonb_build_object('used_as_global_option_in_poll_id', r1.value, 'vote_ids', r2.value))::text
+FROM option_t o
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT global_option_id AS id, id AS value FROM poll_t) s
+    WHERE s.id IN (SELECT id FROM option_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = o.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT option_id AS id, id AS value FROM vote_t) s
+    WHERE s.id IN (SELECT id FROM option_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = o.id
+WHERE o.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'personal_note/' || p.id, 'fields', (to_jsonb(p) - '{content_object_id_motion_id}'::text[]))::text
+FROM personal_note_t p
+WHERE p.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'point_of_order_category/' || p.id, 'fields', to_jsonb(p) || jsonb_build_object('speaker_ids', r1.value))::text
+FROM point_of_order_category_t p
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT point_of_order_category_id AS id, id AS value FROM speaker_t) s
+    WHERE s.id IN (SELECT id FROM point_of_order_category_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = p.id
+WHERE p.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'poll/' || p.id, 'fields', (to_jsonb(p) - '{content_object_id_motion_id,content_object_id_assignment_id,content_object_id_topic_id}'::text[]) || jsonb_build_object('entitled_group_ids', r1.value, 'option_ids', r2.value, 'projection_ids', r3.value, 'voted_ids', r4.value))::text
+FROM poll_t p
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT poll_id AS id, group_id AS value FROM nm_group_poll_ids_poll_t) s
+    WHERE s.id IN (SELECT id FROM poll_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = p.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT poll_id AS id, id AS value FROM option_t) s
+    WHERE s.id IN (SELECT id FROM poll_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = p.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_poll_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM poll_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = p.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT poll_id AS id, user_id AS value FROM nm_poll_voted_ids_user_t) s
+    WHERE s.id IN (SELECT id FROM poll_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = p.id
+WHERE p.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'poll_candidate/' || p.id, 'fields', to_jsonb(p))::text
+FROM poll_candidate_t p
+WHERE p.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'poll_candidate_list/' || p.id, 'fields', to_jsonb(p) || jsonb_build_object('option_id', r1.value, 'poll_candidate_ids', r2.value))::text
+FROM poll_candidate_list_t p
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_poll_candidate_list_id AS id, id AS value FROM option_t) s
+    WHERE s.id IN (SELECT id FROM poll_candidate_list_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = p.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT poll_candidate_list_id AS id, id AS value FROM poll_candidate_t) s
+    WHERE s.id IN (SELECT id FROM poll_candidate_list_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = p.id
+WHERE p.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'projection/' || p.id, 'fields', (to_jsonb(p) - '{content_object_id_meeting_id,content_object_id_motion_id,content_object_id_meeting_mediafile_id,content_object_id_list_of_speakers_id,content_object_id_motion_block_id,content_object_id_assignment_id,content_object_id_agenda_item_id,content_object_id_topic_id,content_object_id_poll_id,content_object_id_projector_message_id,content_object_id_projector_countdown_id}'::text[]))::text
+FROM projection_t p
+WHERE p.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'projector/' || p.id, 'fields', to_jsonb(p) || jsonb_build_object('current_projection_ids', r1.value, 'history_projection_ids', r2.value, 'preview_projection_ids', r3.value, 'used_as_reference_projector_meeting_id', r4.value))::text
+FROM projector_t p
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT current_projector_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM projector_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = p.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT history_projector_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM projector_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = p.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT preview_projector_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM projector_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = p.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT reference_projector_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM projector_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = p.id
+WHERE p.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'projector_countdown/' || p.id, 'fields', to_jsonb(p) || jsonb_build_object('projection_ids', r1.value, 'used_as_list_of_speakers_countdown_meeting_id', r2.value, 'used_as_poll_countdown_meeting_id', r3.value))::text
+FROM projector_countdown_t p
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_projector_countdown_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM projector_countdown_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = p.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT list_of_speakers_countdown_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM projector_countdown_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = p.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT poll_countdown_id AS id, id AS value FROM meeting_t) s
+    WHERE s.id IN (SELECT id FROM projector_countdown_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = p.id
+WHERE p.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'projector_message/' || p.id, 'fields', to_jsonb(p) || jsonb_build_object('projection_ids', r1.value))::text
+FROM projector_message_t p
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_projector_message_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM projector_message_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = p.id
+WHERE p.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'speaker/' || s.id, 'fields', to_jsonb(s))::text
+FROM speaker_t s
+WHERE s.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'structure_level/' || s.id, 'fields', to_jsonb(s) || jsonb_build_object('meeting_user_ids', r1.value, 'structure_level_list_of_speakers_ids', r2.value))::text
+FROM structure_level_t s
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT structure_level_id AS id, meeting_user_id AS value FROM nm_meeting_user_structure_level_ids_structure_level_t) s
+    WHERE s.id IN (SELECT id FROM structure_level_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = s.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT structure_level_id AS id, id AS value FROM structure_level_list_of_speakers_t) s
+    WHERE s.id IN (SELECT id FROM structure_level_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = s.id
+WHERE s.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'structure_level_list_of_speakers/' || s.id, 'fields', to_jsonb(s) || jsonb_build_object('speaker_ids', r1.value))::text
+FROM structure_level_list_of_speakers_t s
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT structure_level_list_of_speakers_id AS id, id AS value FROM speaker_t) s
+    WHERE s.id IN (SELECT id FROM structure_level_list_of_speakers_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = s.id
+WHERE s.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'tag/' || t.id, 'fields', to_jsonb(t) || jsonb_build_object('tagged_ids', r1.value))::text
+FROM tag_t t
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT tag_id AS id, tagged_id AS value FROM gm_tag_tagged_ids_t) s
+    WHERE s.id IN (SELECT id FROM tag_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = t.id
+WHERE t.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'topic/' || t.id, 'fields', to_jsonb(t) || jsonb_build_object('agenda_item_id', r1.value, 'attachment_meeting_mediafile_ids', r2.value, 'list_of_speakers_id', r3.value, 'poll_ids', r4.value, 'projection_ids', r5.value))::text
+FROM topic_t t
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_topic_id AS id, id AS value FROM agenda_item_t) s
+    WHERE s.id IN (SELECT id FROM topic_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r1 ON r1.id = t.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT attachment_id_topic_id AS id, meeting_mediafile_id AS value FROM gm_meeting_mediafile_attachment_ids_t) s
+    WHERE s.id IN (SELECT id FROM topic_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r2 ON r2.id = t.id
+LEFT JOIN (SELECT s.id, min(s.value) AS value FROM (SELECT content_object_id_topic_id AS id, id AS value FROM list_of_speakers_t) s
+    WHERE s.id IN (SELECT id FROM topic_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r3 ON r3.id = t.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_topic_id AS id, id AS value FROM poll_t) s
+    WHERE s.id IN (SELECT id FROM topic_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r4 ON r4.id = t.id
+LEFT JOIN (SELECT s.id, array_agg(s.value ORDER BY s.value) AS value FROM (SELECT content_object_id_topic_id AS id, id AS value FROM projection_t) s
+    WHERE s.id IN (SELECT id FROM topic_t WHERE meeting_id = exported_meeting_id) GROUP BY s.id) r5 ON r5.id = t.id
+WHERE t.meeting_id = exported_meeting_id
+UNION ALL
+SELECT jsonb_build_object('fqid', 'vote/' || v.id, 'fields', to_jsonb(v))::text
+FROM vote_t v
+WHERE v.meeting_id = exported_meeting_id
+$export_meeting$ LANGUAGE sql STABLE;
+
+
+-- Read functions
+
+CREATE FUNCTION get_models(fqids TEXT[], fields TEXT[] DEFAULT NULL)
+RETURNS TABLE (fqid TEXT, data JSONB) AS $get_models$
+-- Returns the models of fqids with the given fields, one row per existing model.
+-- The fqids are grouped by collection and every view is read once with only the
+-- requested columns, so relation lists not asked for aren't calculated.
+-- Without fields all fields are returned, unknown fields are ignored.
+DECLARE
+    collection_var TEXT;
+    ids INTEGER[];
+    columns TEXT[];
+BEGIN
+    FOR collection_var, ids IN
+        SELECT split_part(f, '/', 1), array_agg(DISTINCT split_part(f, '/', 2)::integer)
+        FROM unnest(fqids) AS f
+        GROUP BY 1
+    LOOP
+        columns := CASE collection_var
+            WHEN 'action_worker' THEN ARRAY['id', 'name', 'state', 'created', 'timestamp', 'result', 'user_id']
+            WHEN 'agenda_item' THEN ARRAY['id', 'item_number', 'comment', 'closed', 'type', 'duration', 'is_internal', 'is_hidden', 'level', 'weight', 'content_object_id', 'parent_id', 'child_ids', 'tag_ids', 'projection_ids', 'meeting_id']
+            WHEN 'assignment' THEN ARRAY['id', 'title', 'description', 'open_posts', 'phase', 'default_poll_description', 'number_poll_candidates', 'sequential_number', 'candidate_ids', 'poll_ids', 'agenda_item_id', 'list_of_speakers_id', 'tag_ids', 'attachment_meeting_mediafile_ids', 'projection_ids', 'meeting_id', 'history_entry_ids']
+            WHEN 'assignment_candidate' THEN ARRAY['id', 'weight', 'assignment_id', 'meeting_user_id', 'meeting_id']
+            WHEN 'chat_group' THEN ARRAY['id', 'name', 'weight', 'chat_message_ids', 'read_group_ids', 'write_group_ids', 'meeting_id']
+            WHEN 'chat_message' THEN ARRAY['id', 'content', 'created', 'meeting_user_id', 'chat_group_id', 'meeting_id']
+            WHEN 'committee' THEN ARRAY['id', 'name', 'description', 'external_id', 'meeting_ids', 'default_meeting_id', 'user_ids', 'manager_ids', 'parent_id', 'child_ids', 'all_parent_ids', 'all_child_ids', 'native_user_ids', 'forward_to_committee_ids', 'receive_forwardings_from_committee_ids', 'organization_tag_ids', 'organization_id']
+            WHEN 'gender' THEN ARRAY['id', 'name', 'organization_id', 'user_ids']
+            WHEN 'group' THEN ARRAY['id', 'external_id', 'name', 'permissions', 'weight', 'meeting_user_ids', 'default_group_for_meeting_id', 'admin_group_for_meeting_id', 'anonymous_group_for_meeting_id', 'meeting_mediafile_access_group_ids', 'meeting_mediafile_inherited_access_group_ids', 'read_comment_section_ids', 'write_comment_section_ids', 'read_chat_group_ids', 'write_chat_group_ids', 'poll_ids', 'used_as_motion_poll_default_id', 'used_as_assignment_poll_default_id', 'used_as_topic_poll_default_id', 'used_as_poll_default_id', 'meeting_id']
+            WHEN 'history_entry' THEN ARRAY['id', 'entries', 'original_model_id', 'model_id', 'position_id', 'meeting_id']
+            WHEN 'history_position' THEN ARRAY['id', 'timestamp', 'original_user_id', 'user_id', 'entry_ids']
+            WHEN 'import_preview' THEN ARRAY['id', 'name', 'state', 'created', 'result']
+            WHEN 'list_of_speakers' THEN ARRAY['id', 'closed', 'sequential_number', 'moderator_notes', 'content_object_id', 'speaker_ids', 'structure_level_list_of_speakers_ids', 'projection_ids', 'meeting_id']
+            WHEN 'mediafile' THEN ARRAY['id', 'title', 'is_directory', 'filesize', 'filename', 'mimetype', 'pdf_information', 'create_timestamp', 'token', 'published_to_meetings_in_organization_id', 'parent_id', 'child_ids', 'owner_id', 'meeting_mediafile_ids']
+            WHEN 'meeting' THEN ARRAY['id', 'external_id', 'welcome_title', 'welcome_text', 'name', 'is_active_in_organization_id', 'is_archived_in_organization_id', 'description', 'location', 'time_zone', 'start_time', 'end_time', 'locked_from_inside', 'imported_at', 'language', 'jitsi_domain', 'jitsi_room_name', 'jitsi_room_password', 'template_for_organization_id', 'enable_anonymous', 'custom_translations', 'conference_show', 'conference_auto_connect', 'conference_los_restriction', 'conference_stream_url', 'conference_stream_poster_url', 'conference_open_microphone', 'conference_open_video', 'conference_auto_connect_next_speakers', 'conference_enable_helpdesk', 'applause_enable', 'applause_type', 'applause_show_level', 'applause_min_amount', 'applause_max_amount', 'applause_timeout', 'applause_particle_image_url', 'projector_countdown_default_time', 'projector_countdown_warning_time', 'export_csv_encoding', 'export_csv_separator', 'export_pdf_pagenumber_alignment', 'export_pdf_fontsize', 'export_pdf_line_height', 'export_pdf_page_margin_left', 'export_pdf_page_margin_top', 'export_pdf_page_margin_right', 'export_pdf_page_margin_bottom', 'export_pdf_pagesize', 'agenda_show_subtitles', 'agenda_enable_numbering', 'agenda_number_prefix', 'agenda_numeral_system', 'agenda_item_creation', 'agenda_new_items_default_visibility', 'agenda_show_internal_items_on_projector', 'agenda_show_topic_navigation_on_detail_view', 'list_of_speakers_amount_last_on_projector', 'list_of_speakers_amount_next_on_projector', 'list_of_speakers_couple_countdown', 'list_of_speakers_show_amount_of_speakers_on_slide', 'list_of_speakers_present_users_only', 'list_of_speakers_show_first_contribution', 'list_of_speakers_hide_contribution_count', 'list_of_speakers_allow_multiple_speakers', 'list_of_speakers_enable_point_of_order_speakers', 'list_of_speakers_can_create_point_of_order_for_others', 'list_of_speakers_enable_point_of_order_categories', 'list_of_speakers_closing_disables_point_of_order', 'list_of_speakers_enable_pro_contra_speech', 'list_of_speakers_can_set_contribution_self', 'list_of_speakers_speaker_note_for_everyone', 'list_of_speakers_initially_closed', 'list_of_speakers_default_structure_level_time', 'list_of_speakers_enable_interposed_question', 'list_of_speakers_intervention_time', 'motions_default_workflow_id', 'motions_default_amendment_workflow_id', 'motions_preamble', 'motions_default_line_numbering', 'motions_line_length', 'motions_reason_required', 'motions_origin_motion_toggle_default', 'motions_enable_origin_motion_display', 'motions_enable_text_on_projector', 'motions_enable_reason_on_projector', 'motions_enable_sidebox_on_projector', 'motions_enable_recommendation_on_projector', 'motions_hide_metadata_background', 'motions_show_referring_motions', 'motions_show_sequential_number', 'motions_create_enable_additional_submitter_text', 'motions_recommendations_by', 'motions_block_slide_columns', 'motions_recommendation_text_mode', 'motions_default_sorting', 'motions_number_type', 'motions_number_min_digits', 'motions_number_with_blank', 'motions_amendments_enabled', 'motions_amendments_in_main_list', 'motions_amendments_of_amendments', 'motions_amendments_prefix', 'motions_amendments_text_mode', 'motions_amendments_multiple_paragraphs', 'motions_supporters_min_amount', 'motions_enable_editor', 'motions_enable_working_group_speaker', 'motions_export_title', 'motions_export_preamble', 'motions_export_submitter_recommendation', 'motions_export_follow_recommendation', 'motions_enable_restricted_editor_for_manager', 'motions_enable_restricted_editor_for_non_manager', 'motion_poll_ballot_paper_selection', 'motion_poll_ballot_paper_number', 'motion_poll_default_type', 'motion_poll_default_method', 'motion_poll_default_onehundred_percent_base', 'motion_poll_default_group_ids', 'motion_poll_default_backend', 'motion_poll_projection_name_order_first', 'motion_poll_projection_max_columns', 'poll_candidate_list_ids', 'poll_candidate_ids', 'meeting_user_ids', 'users_enable_presence_view', 'users_enable_vote_weight', 'users_allow_self_set_present', 'users_pdf_welcometitle', 'users_pdf_welcometext', 'users_pdf_wlan_ssid', 'users_pdf_wlan_password', 'users_pdf_wlan_encryption', 'users_email_sender', 'users_email_replyto', 'users_email_subject', 'users_email_body', 'users_enable_vote_delegations', 'users_forbid_delegator_in_list_of_speakers', 'users_forbid_delegator_as_submitter', 'users_forbid_delegator_as_supporter', 'users_forbid_delegator_to_vote', 'assignments_export_title', 'assignments_export_preamble', 'assignment_poll_ballot_paper_selection', 'assignment_poll_ballot_paper_number', 'assignment_poll_add_candidates_to_list_of_speakers', 'assignment_poll_enable_max_votes_per_option', 'assignment_poll_sort_poll_result_by_votes', 'assignment_poll_default_type', 'assignment_poll_default_method', 'assignment_poll_default_onehundred_percent_base', 'assignment_poll_default_group_ids', 'assignment_poll_default_backend', 'poll_ballot_paper_selection', 'poll_ballot_paper_number', 'poll_sort_poll_result_by_votes', 'poll_default_type', 'poll_default_method', 'poll_default_onehundred_percent_base', 'poll_default_group_ids', 'poll_default_backend', 'poll_default_live_voting_enabled', 'poll_couple_countdown', 'topic_poll_default_group_ids', 'projector_ids', 'all_projection_ids', 'projector_message_ids', 'projector_countdown_ids', 'tag_ids', 'agenda_item_ids', 'list_of_speakers_ids', 'structure_level_list_of_speakers_ids', 'point_of_order_category_ids', 'speaker_ids', 'topic_ids', 'group_ids', 'meeting_mediafile_ids', 'mediafile_ids', 'motion_ids', 'forwarded_motion_ids', 'motion_comment_section_ids', 'motion_category_ids', 'motion_block_ids', 'motion_workflow_ids', 'motion_comment_ids', 'motion_submitter_ids', 'motion_supporter_ids', 'motion_editor_ids', 'motion_working_group_speaker_ids', 'motion_change_recommendation_ids', 'motion_state_ids', 'poll_ids', 'option_ids', 'vote_ids', 'assignment_ids', 'assignment_candidate_ids', 'personal_note_ids', 'chat_group_ids', 'chat_message_ids', 'structure_level_ids', 'logo_projector_main_id', 'logo_projector_header_id', 'logo_web_header_id', 'logo_pdf_header_l_id', 'logo_pdf_header_r_id', 'logo_pdf_footer_l_id', 'logo_pdf_footer_r_id', 'logo_pdf_ballot_paper_id', 'font_regular_id', 'font_italic_id', 'font_bold_id', 'font_bold_italic_id', 'font_monospace_id', 'font_chyron_speaker_name_id', 'font_projector_h1_id', 'font_projector_h2_id', 'committee_id', 'default_meeting_for_committee_id', 'organization_tag_ids', 'present_user_ids', 'user_ids', 'reference_projector_id', 'list_of_speakers_countdown_id', 'poll_countdown_id', 'projection_ids', 'default_projector_agenda_item_list_ids', 'default_projector_topic_ids', 'default_projector_list_of_speakers_ids', 'default_projector_current_los_ids', 'default_projector_motion_ids', 'default_projector_amendment_ids', 'default_projector_motion_block_ids', 'default_projector_assignment_ids', 'default_projector_mediafile_ids', 'default_projector_message_ids', 'default_projector_countdown_ids', 'default_projector_assignment_poll_ids', 'default_projector_motion_poll_ids', 'default_projector_poll_ids', 'default_group_id', 'admin_group_id', 'anonymous_group_id', 'relevant_history_entry_ids']
+            WHEN 'meeting_mediafile' THEN ARRAY['id', 'mediafile_id', 'meeting_id', 'is_public', 'inherited_access_group_ids', 'access_group_ids', 'list_of_speakers_id', 'projection_ids', 'attachment_ids', 'used_as_logo_projector_main_in_meeting_id', 'used_as_logo_projector_header_in_meeting_id', 'used_as_logo_web_header_in_meeting_id', 'used_as_logo_pdf_header_l_in_meeting_id', 'used_as_logo_pdf_header_r_in_meeting_id', 'used_as_logo_pdf_footer_l_in_meeting_id', 'used_as_logo_pdf_footer_r_in_meeting_id', 'used_as_logo_pdf_ballot_paper_in_meeting_id', 'used_as_font_regular_in_meeting_id', 'used_as_font_italic_in_meeting_id', 'used_as_font_bold_in_meeting_id', 'used_as_font_bold_italic_in_meeting_id', 'used_as_font_monospace_in_meeting_id', 'used_as_font_chyron_speaker_name_in_meeting_id', 'used_as_font_projector_h1_in_meeting_id', 'used_as_font_projector_h2_in_meeting_id']
+            WHEN 'meeting_user' THEN ARRAY['id', 'comment', 'number', 'about_me', 'vote_weight', 'locked_out', 'user_id', 'meeting_id', 'personal_note_ids', 'speaker_ids', 'motion_supporter_ids', 'motion_editor_ids', 'motion_working_group_speaker_ids', 'motion_submitter_ids', 'assignment_candidate_ids', 'vote_delegated_to_id', 'vote_delegations_from_ids', 'chat_message_ids', 'group_ids', 'structure_level_ids']
+            WHEN 'motion' THEN ARRAY['id', 'number', 'number_value', 'sequential_number', 'title', 'diff_version', 'text', 'text_hash', 'amendment_paragraphs', 'modified_final_version', 'reason', 'category_weight', 'state_extension', 'recommendation_extension', 'sort_weight', 'created', 'last_modified', 'workflow_timestamp', 'start_line_number', 'forwarded', 'additional_submitter', 'marked_forwarded', 'lead_motion_id', 'amendment_ids', 'sort_parent_id', 'sort_child_ids', 'origin_id', 'origin_meeting_id', 'derived_motion_ids', 'all_origin_ids', 'all_derived_motion_ids', 'identical_motion_ids', 'state_id', 'recommendation_id', 'state_extension_reference_ids', 'referenced_in_motion_state_extension_ids', 'recommendation_extension_reference_ids', 'referenced_in_motion_recommendation_extension_ids', 'category_id', 'block_id', 'submitter_ids', 'supporter_ids', 'editor_ids', 'working_group_speaker_ids', 'poll_ids', 'option_ids', 'change_recommendation_ids', 'comment_ids', 'agenda_item_id', 'list_of_speakers_id', 'tag_ids', 'attachment_meeting_mediafile_ids', 'projection_ids', 'personal_note_ids', 'meeting_id', 'history_entry_ids']
+            WHEN 'motion_block' THEN ARRAY['id', 'title', 'internal', 'sequential_number', 'motion_ids', 'agenda_item_id', 'list_of_speakers_id', 'projection_ids', 'meeting_id']
+            WHEN 'motion_category' THEN ARRAY['id', 'name', 'prefix', 'weight', 'level', 'sequential_number', 'parent_id', 'child_ids', 'motion_ids', 'meeting_id']
+            WHEN 'motion_change_recommendation' THEN ARRAY['id', 'rejected', 'internal', 'type', 'other_description', 'line_from', 'line_to', 'text', 'creation_time', 'motion_id', 'meeting_id']
+            WHEN 'motion_comment' THEN ARRAY['id', 'comment', 'motion_id', 'section_id', 'meeting_id']
+            WHEN 'motion_comment_section' THEN ARRAY['id', 'name', 'weight', 'sequential_number', 'submitter_can_write', 'comment_ids', 'read_group_ids', 'write_group_ids', 'meeting_id']
+            WHEN 'motion_editor' THEN ARRAY['id', 'weight', 'meeting_user_id', 'motion_id', 'meeting_id']
+            WHEN 'motion_state' THEN ARRAY['id', 'name', 'weight', 'recommendation_label', 'is_internal', 'css_class', 'restrictions', 'allow_support', 'allow_create_poll', 'allow_submitter_edit', 'set_number', 'show_state_extension_field', 'show_recommendation_extension_field', 'merge_amendment_into_final', 'allow_motion_forwarding', 'allow_amendment_forwarding', 'set_workflow_timestamp', 'state_button_label', 'submitter_withdraw_state_id', 'submitter_withdraw_back_ids', 'next_state_ids', 'previous_state_ids', 'motion_ids', 'motion_recommendation_ids', 'workflow_id', 'first_state_of_workflow_id', 'meeting_id']
+            WHEN 'motion_submitter' THEN ARRAY['id', 'weight', 'meeting_user_id', 'motion_id', 'meeting_id']
+            WHEN 'motion_supporter' THEN ARRAY['id', 'meeting_user_id', 'motion_id', 'meeting_id']
+            WHEN 'motion_workflow' THEN ARRAY['id', 'name', 'sequential_number', 'state_ids', 'first_state_id', 'default_workflow_meeting_id', 'default_amendment_workflow_meeting_id', 'meeting_id']
+            WHEN 'motion_working_group_speaker' THEN ARRAY['id', 'weight', 'meeting_user_id', 'motion_id', 'meeting_id']
+            WHEN 'option' THEN ARRAY['id', 'weight', 'text', 'yes', 'no', 'abstain', 'poll_id', 'used_as_global_option_in_poll_id', 'vote_ids', 'content_object_id', 'meeting_id']
+            WHEN 'organization' THEN ARRAY['id', 'name', 'description', 'legal_notice', 'privacy_policy', 'login_text', 'reset_password_verbose_errors', 'gender_ids', 'disable_forward_with_attachments', 'restrict_edit_forward_committees', 'enable_electronic_voting', 'enable_chat', 'limit_of_meetings', 'limit_of_users', 'default_language', 'time_zone', 'require_duplicate_from', 'enable_anonymous', 'restrict_editing_same_level_committee_admins', 'saml_enabled', 'saml_login_button_text', 'saml_attr_mapping', 'saml_metadata_idp', 'saml_metadata_sp', 'saml_private_key', 'committee_ids', 'active_meeting_ids', 'archived_meeting_ids', 'template_meeting_ids', 'organization_tag_ids', 'theme_id', 'theme_ids', 'mediafile_ids', 'published_mediafile_ids', 'user_ids', 'users_email_sender', 'users_email_replyto', 'users_email_subject', 'users_email_body', 'url']
+            WHEN 'organization_tag' THEN ARRAY['id', 'name', 'color', 'tagged_ids', 'organization_id']
+            WHEN 'personal_note' THEN ARRAY['id', 'note', 'star', 'meeting_user_id', 'content_object_id', 'meeting_id']
+            WHEN 'point_of_order_category' THEN ARRAY['id', 'text', 'rank', 'meeting_id', 'speaker_ids']
+            WHEN 'poll' THEN ARRAY['id', 'title', 'description', 'type', 'backend', 'is_pseudoanonymized', 'pollmethod', 'state', 'min_votes_amount', 'max_votes_amount', 'max_votes_per_option', 'global_yes', 'global_no', 'global_abstain', 'onehundred_percent_base', 'votesvalid', 'votesinvalid', 'votescast', 'entitled_users_at_stop', 'live_voting_enabled', 'sequential_number', 'content_object_id', 'option_ids', 'global_option_id', 'voted_ids', 'entitled_group_ids', 'projection_ids', 'meeting_id']
+            WHEN 'poll_candidate' THEN ARRAY['id', 'poll_candidate_list_id', 'user_id', 'weight', 'meeting_id']
+            WHEN 'poll_candidate_list' THEN ARRAY['id', 'poll_candidate_ids', 'meeting_id', 'option_id']
+            WHEN 'projection' THEN ARRAY['id', 'options', 'stable', 'weight', 'type', 'current_projector_id', 'preview_projector_id', 'history_projector_id', 'content_object_id', 'meeting_id']
+            WHEN 'projector' THEN ARRAY['id', 'name', 'is_internal', 'scale', 'scroll', 'width', 'aspect_ratio_numerator', 'aspect_ratio_denominator', 'color', 'background_color', 'header_background_color', 'header_font_color', 'header_h1_color', 'chyron_background_color', 'chyron_background_color_2', 'chyron_font_color', 'chyron_font_color_2', 'show_header_footer', 'show_title', 'show_logo', 'show_clock', 'sequential_number', 'current_projection_ids', 'preview_projection_ids', 'history_projection_ids', 'used_as_reference_projector_meeting_id', 'used_as_default_projector_for_agenda_item_list_in_meeting_id', 'used_as_default_projector_for_topic_in_meeting_id', 'used_as_default_projector_for_list_of_speakers_in_meeting_id', 'used_as_default_projector_for_current_los_in_meeting_id', 'used_as_default_projector_for_motion_in_meeting_id', 'used_as_default_projector_for_amendment_in_meeting_id', 'used_as_default_projector_for_motion_block_in_meeting_id', 'used_as_default_projector_for_assignment_in_meeting_id', 'used_as_default_projector_for_mediafile_in_meeting_id', 'used_as_default_projector_for_message_in_meeting_id', 'used_as_default_projector_for_countdown_in_meeting_id', 'used_as_default_projector_for_assignment_poll_in_meeting_id', 'used_as_default_projector_for_motion_poll_in_meeting_id', 'used_as_default_projector_for_poll_in_meeting_id', 'meeting_id']
+            WHEN 'projector_countdown' THEN ARRAY['id', 'title', 'description', 'default_time', 'countdown_time', 'running', 'projection_ids', 'used_as_list_of_speakers_countdown_meeting_id', 'used_as_poll_countdown_meeting_id', 'meeting_id']
+            WHEN 'projector_message' THEN ARRAY['id', 'message', 'projection_ids', 'meeting_id']
+            WHEN 'speaker' THEN ARRAY['id', 'begin_time', 'end_time', 'pause_time', 'unpause_time', 'total_pause', 'weight', 'speech_state', 'answer', 'note', 'point_of_order', 'list_of_speakers_id', 'structure_level_list_of_speakers_id', 'meeting_user_id', 'point_of_order_category_id', 'meeting_id']
+            WHEN 'structure_level' THEN ARRAY['id', 'name', 'color', 'default_time', 'meeting_user_ids', 'structure_level_list_of_speakers_ids', 'meeting_id']
+            WHEN 'structure_level_list_of_speakers' THEN ARRAY['id', 'structure_level_id', 'list_of_speakers_id', 'speaker_ids', 'initial_time', 'additional_time', 'remaining_time', 'current_start_time', 'meeting_id']
+            WHEN 'tag' THEN ARRAY['id', 'name', 'tagged_ids', 'meeting_id']
+            WHEN 'theme' THEN ARRAY['id', 'name', 'accent_100', 'accent_200', 'accent_300', 'accent_400', 'accent_50', 'accent_500', 'accent_600', 'accent_700', 'accent_800', 'accent_900', 'accent_a100', 'accent_a200', 'accent_a400', 'accent_a700', 'primary_100', 'primary_200', 'primary_300', 'primary_400', 'primary_50', 'primary_500', 'primary_600', 'primary_700', 'primary_800', 'primary_900', 'primary_a100', 'primary_a200', 'primary_a400', 'primary_a700', 'warn_100', 'warn_200', 'warn_300', 'warn_400', 'warn_50', 'warn_500', 'warn_600', 'warn_700', 'warn_800', 'warn_900', 'warn_a100', 'warn_a200', 'warn_a400', 'warn_a700', 'headbar', 'yes', 'no', 'abstain', 'theme_for_organization_id', 'organization_id']
+            WHEN 'topic' THEN ARRAY['id', 'title', 'text', 'sequential_number', 'attachment_meeting_mediafile_ids', 'agenda_item_id', 'list_of_speakers_id', 'poll_ids', 'projection_ids', 'meeting_id']
+            WHEN 'user' THEN ARRAY['id', 'username', 'member_number', 'saml_id', 'pronoun', 'title', 'first_name', 'last_name', 'is_active', 'is_physical_person', 'password', 'default_password', 'can_change_own_password', 'email', 'default_vote_weight', 'last_email_sent', 'is_demo_user', 'last_login', 'external', 'gender_id', 'organization_management_level', 'is_present_in_meeting_ids', 'committee_ids', 'committee_management_ids', 'meeting_user_ids', 'poll_voted_ids', 'option_ids', 'vote_ids', 'delegated_vote_ids', 'poll_candidate_ids', 'home_committee_id', 'history_position_ids', 'history_entry_ids', 'meeting_ids', 'organization_id']
+            WHEN 'vote' THEN ARRAY['id', 'weight', 'value', 'user_token', 'option_id', 'user_id', 'delegated_user_id', 'meeting_id']
+        END;
+        IF columns IS NULL THEN
+            RAISE EXCEPTION 'Unknown collection %', collection_var;
+        END IF;
+        IF fields IS NOT NULL THEN
+            columns := ARRAY(SELECT c FROM unnest(columns) AS c WHERE c = 'id' OR c = ANY(fields));
+        END IF;
+        RETURN QUERY EXECUTE format(
+            'SELECT %L || ''/'' || m.id, to_jsonb(m) FROM (SELECT %s FROM %I WHERE id = ANY($1)) AS m',
+            collection_var,
+            (SELECT string_agg(quote_ident(c), ', ') FROM unnest(columns) AS c),
+            collection_var
+        ) USING ids;
+    END LOOP;
+END;
+$get_models$ LANGUAGE plpgsql STABLE;
+
 /*   Relation-list infos
 Generated: What will be generated for left field
     FIELD: a usual Database field
@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+from argparse import ArgumentParser
+from collections.abc import Iterator
+from typing import Any, TextIO, TypedDict
+
+import psycopg
+from psycopg.rows import tuple_row
+
+
+class ExportedModel(TypedDict):
+    """One line written by export_meeting"""
+
+    fqid: str
+    fields: dict[str, Any]
+
+
+class MeetingExport:
+    """
+    Streams a meeting with the function export_meeting created by generate_sql_schema.py.
+    The lines are fetched by a server-side cursor in batches of itersize rows, so neither
+    the number of round trips nor the memory of the client grows with the collections
+    or the models of the meeting.
+    """
+
+    def __init__(self, connection: psycopg.Connection, itersize: int = 1000) -> None:
+        self.connection = connection
+        self.itersize = itersize
+
+    def lines(self, meeting_id: int) -> Iterator[str]:
+        """Yields one JSON object per model without trailing newline"""
+        # server-side cursors live in a transaction, a savepoint if one is already open
+        with self.connection.transaction():
+            with self.connection.cursor(
+                name=f"export_meeting_{meeting_id}", row_factory=tuple_row
+            ) as curs:
+                curs.itersize = self.itersize
+                curs.execute(
+                    "SELECT line FROM export_meeting(%s) AS line", (meeting_id,)
+                )
+                for (line,) in curs:
+                    yield line
+
+    def models(self, meeting_id: int) -> Iterator[ExportedModel]:
+        for line in self.lines(meeting_id):
+            yield json.loads(line)
+
+    def write(self, meeting_id: int, destination: TextIO) -> int:
+        """Writes the meeting as newline-delimited JSON and returns the number of models"""
+        count = 0
+        for line in self.lines(meeting_id):
+            destination.write(line + "\n")
+            count += 1
+        return count
+
+
+def main() -> int:
+    parser = ArgumentParser(
+        description="Writes a meeting as newline-delimited JSON, one model per line."
+    )
+    parser.add_argument("meeting_id", type=int)
+    parser.add_argument(
+        "--destination", help="file the export is written to (default: stdout)"
+    )
+    args = parser.parse_args()
+
+    env = os.environ
+    with psycopg.connect(
+        f"dbname='{env['DATABASE_NAME']}' user='{env['DATABASE_USER']}' host='{env['DATABASE_HOST']}' password='{env['PGPASSWORD']}'"
+    ) as connection:
+        export = MeetingExport(connection)
+        if args.destination:
+            with open(args.destination, "w") as destination:
+                count = export.write(args.meeting_id, destination)
+        else:
+            count = export.write(args.meeting_id, sys.stdout)
+    print(f"Exported {count} models of meeting {args.meeting_id}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,8 @@
+import argparse
 import logging
+import re
 import string
+import sys
 from collections import defaultdict
 from collections.abc import Callable
 from decimal import Decimal
@@ -12,6 +15,7 @@ from typing import Any, TypedDict, cast
 from sqlfluff import fix
 
 from .helper_get_names import (
+    DEFAULT_COLLECTIONS_DIR,
     KEYSEPARATOR,
     FieldSqlErrorType,
     HelperGetNames,
@@ -23,6 +27,26 @@ DESTINATION = (Path(__file__).parent / ".." / "sql" / "schema_relational.sql").r
 MODELS: dict[str, dict[str, Any]] = {}
 
 
+class GeneratorOptions(TypedDict, total=False):
+    """TypedDict definition for the optional generator modes set on the command line"""
+
+    materialize_relation_lists: bool
+    base_views: bool
+    stage_notify_log: bool
+    sequence_counters: bool
+    static_trigger_functions: bool
+    consolidated_triggers: bool
+    composite_equal_fields: bool
+    typed_generic_relations: bool
+    logical_replication: bool
+    index_audit: bool
+    strict: bool
+    trigger_report: bool
+
+
+OPTIONS: GeneratorOptions = {}
+
+
 # Set log level for sqlfluff
 for name in logging.root.manager.loggerDict:
     if "sqlfluff" in name:
@@ -37,6 +61,9 @@ class SchemaZoneTexts(TypedDict, total=False):
     post_view: str
     alter_table: str
     alter_table_final: str
+    relation_list_table: str
+    storage: str
+    partitions: str
     create_trigger_partitioned_sequences: str
     create_trigger_1_1_relation_not_null: str
     create_trigger_1_n_relation_not_null: str
@@ -45,6 +72,7 @@ class SchemaZoneTexts(TypedDict, total=False):
     create_trigger_unique_ids_pair_code: str
     create_trigger_equal_fields_code: str
     create_trigger_notify: str
+    log_related_arguments: str
     undecided: str
     final_info: str
     errors: list[str]
@@ -75,6 +103,16 @@ class SubstDict(TypedDict, total=False):
     unique: str
 
 
+class MeetingTable(TypedDict):
+    """A table whose rows belong to a meeting, see get_meeting_tables"""
+
+    collection: str  # empty for intermediate tables
+    meeting_column: str  # column holding the meeting id, empty for intermediate tables
+    columns: list[str]  # without generated columns
+    foreign_keys: dict[str, str]  # column to foreign collection
+    generic_columns: list[str]  # fqid columns of generic relations
+
+
 class GenerateCodeBlocks:
     """Main work is done here by recursing the models and their fields and determine the method to use"""
 
@@ -83,6 +121,27 @@ class GenerateCodeBlocks:
     intermediate_tables: dict[str, str] = (
         {}
     )  # Key=Name, data: collected content of table
+    materialized_relation_lists: dict[str, list[tuple[str, str, str, str]]] = (
+        {}
+    )  # Key=source table, data: (relation list table, column, fk column, value column)
+    materialized_fields: dict[str, list[tuple[tuple[str, ...], str, str, str]]] = (
+        {}
+    )  # Key=source table, data: (operations, function, id sql, update condition)
+    materialized_field_functions: list[str] = (
+        []
+    )  # Definitions of the functions recalculating materialized sql fields
+    composite_unique_constraints: set[str] = (
+        set()
+    )  # Names of the UNIQUE (id, equal_field) constraints already created
+    index_lookups: dict[tuple[str, str], list[str]] = (
+        {}
+    )  # Key=(table, column) looked up by views and triggers, data: users of the lookup
+    log_arguments: dict[str, list[str]] = (
+        {}
+    )  # Key=logged table, data: arguments of log_modified_models
+    calculated_log_paths: dict[str, dict[tuple[str, ...], tuple[str, str]]] = (
+        {}
+    )  # Key=table of the log_triggers, data: logged path to the names of its triggers
 
     @classmethod
     def generate_the_code(
@@ -105,6 +164,9 @@ class GenerateCodeBlocks:
         str,
         str,
         str,
+        str,
+        str,
+        str,
         list[str],
     ]:
         """
@@ -128,6 +190,9 @@ class GenerateCodeBlocks:
           create_trigger_unique_ids_pair_code: Definitions of triggers calling check_unique_ids_pair
           create_trigger_equal_fields_code: Definitions of triggers checking equal_fields
           create_trigger_notify_code: Definitions of triggers calling notify_modified_models
+          create_trigger_relation_lists_code: Definitions of triggers maintaining materialized relation lists
+          create_trigger_materialized_fields_code: Definitions of functions and triggers maintaining materialized sql fields
+          create_trigger_consolidated_code: Definitions of the triggers running all row level checks of a table
           errors: to show
         """
         handled_attributes = {
@@ -150,15 +215,23 @@ class GenerateCodeBlocks:
             # "on_delete", # must have other name then the key-value-store one
             "sql",
             "log_triggers",
+            "materialize",
             "equal_fields",
             "unique",
             "constant",
         }
         collection_meta_handled_attributes = {
             "unique_together",
+            "partition_by",
+            "storage",
+            "materialize",
         }
         enum_definitions: str = ""
         pre_code: str = ""
+        if OPTIONS.get("stage_notify_log"):
+            pre_code += Helper.FILE_TEMPLATE_LOG_WRITE_STAGED
+        else:
+            pre_code += Helper.FILE_TEMPLATE_LOG_WRITE
         table_name_code: str = ""
         view_name_code: str = ""
         alter_table_final_code: str = ""
@@ -170,6 +243,9 @@ class GenerateCodeBlocks:
         create_trigger_unique_ids_pair_code: str = ""
         create_trigger_equal_fields_code: str = ""
         create_trigger_notify_code: str = ""
+        create_trigger_relation_lists_code: str = ""
+        create_trigger_materialized_fields_code: str = ""
+        create_trigger_consolidated_code: str = ""
         final_info_code: str = ""
         missing_handled_attributes = []
         missing_handled_collections_meta_attributes = set()
@@ -183,6 +259,36 @@ class GenerateCodeBlocks:
                 )
             )
         pre_code += Helper.FILE_TEMPLATE_CONSTANT_TRIGGERS
+        if OPTIONS.get("materialize_relation_lists"):
+            pre_code += Helper.FILE_TEMPLATE_RELATION_LISTS
+        if any(
+            cls.is_materialized(collection, fname)
+            for collection, model in InternalHelper.MODELS.items()
+            if collection not in ("_migration_index", "_meta")
+            for fname in model["fields"]
+        ):
+            pre_code += Helper.FILE_TEMPLATE_MATERIALIZED_FIELDS
+        if OPTIONS.get("sequence_counters"):
+            pre_code += Helper.FILE_TEMPLATE_SEQUENCE_COUNTERS
+        if OPTIONS.get("logical_replication"):
+            pre_code += Helper.FILE_TEMPLATE_LOGICAL_REPLICATION
+        if any(
+            (cls.get_partition_definition(collection) or {}).get("method") == "list"
+            for collection in InternalHelper.MODELS
+        ):
+            pre_code += Helper.FILE_TEMPLATE_LIST_PARTITIONS
+        if any(
+            "compression" in InternalHelper.MODELS[collection].get("storage", {})
+            for collection in InternalHelper.MODELS
+        ):
+            pre_code += Helper.FILE_TEMPLATE_STORAGE
+        cls.materialized_relation_lists = {}
+        cls.materialized_fields = {}
+        cls.materialized_field_functions = []
+        cls.composite_unique_constraints = set()
+        cls.index_lookups = {}
+        cls.log_arguments = {}
+        cls.calculated_log_paths = {}
 
         for type_ in ["1_1", "1_n", "n_m"]:
             pre_code += Helper.NOT_NULL_TRIGGER_FUNCTION_TEMPLATE.substitute(
@@ -233,6 +339,25 @@ class GenerateCodeBlocks:
                             ] += cls.get_constraint_unique_together(
                                 table_name, value, True
                             )
+                        case "partition_by":
+                            partition = cast(
+                                dict[str, Any], cls.get_partition_definition(table_name)
+                            )
+                            schema_zone_texts[
+                                "table"
+                            ] += f"    PRIMARY KEY (id, {partition['column']}),\n"
+                            schema_zone_texts["partitions"] = Helper.get_partitions(
+                                table_name,
+                                partition,
+                                cls.get_storage_definition(table_name)[0],
+                            )
+                        case "storage":
+                            _, compression = cls.get_storage_definition(table_name)
+                            schema_zone_texts[
+                                "storage"
+                            ] += Helper.get_column_compressions(table_name, compression)
+                        case "materialize":
+                            continue  # see is_materialized
                         case _:
                             if attr not in collection_meta_handled_attributes:
                                 missing_handled_collections_meta_attributes.add(attr)
@@ -243,9 +368,25 @@ class GenerateCodeBlocks:
 
             if code := schema_zone_texts["table"]:
                 table_name_code += Helper.get_table_head(table_name)
-                table_name_code += Helper.get_table_body_end(code) + "\n\n"
+                table_name_code += (
+                    Helper.get_table_body_end(
+                        code,
+                        cls.get_partition_definition(table_name),
+                        cls.get_storage_definition(table_name)[0],
+                    )
+                    + "\n\n"
+                )
+            # before the partitions, which take over the compression of the columns
+            if code := schema_zone_texts["storage"]:
+                table_name_code += code + "\n"
+            if code := schema_zone_texts["partitions"]:
+                table_name_code += code + "\n"
             if code := schema_zone_texts["alter_table"]:
                 table_name_code += code + "\n"
+            if relation_list_code := schema_zone_texts["relation_list_table"]:
+                table_name_code += Helper.get_relation_list_table(
+                    table_name, relation_list_code
+                )
             if code := schema_zone_texts["undecided"]:
                 table_name_code += Helper.get_undecided_all(table_name, code)
             view_name_code += Helper.get_view_head(table_name)
@@ -254,6 +395,8 @@ class GenerateCodeBlocks:
             )
             if code := schema_zone_texts["post_view"]:
                 view_name_code += code
+            if OPTIONS.get("base_views"):
+                view_name_code += Helper.get_base_view(table_name)
             if code := schema_zone_texts["alter_table_final"]:
                 alter_table_final_code += code + "\n"
             if code := schema_zone_texts["create_trigger_partitioned_sequences"]:
@@ -277,14 +420,61 @@ class GenerateCodeBlocks:
 
             # schema_zone_texts is filled per model field.
             # If any fields for this collection generated table code, create the main notify trigger on it.
+            # It also logs the related models collected in log_related_arguments.
             if schema_zone_texts["table"]:
                 create_trigger_notify_code += (
-                    Helper.get_notify_trigger(table_name) + "\n"
+                    Helper.get_notify_trigger(
+                        table_name, schema_zone_texts["log_related_arguments"]
+                    )
+                    + "\n"
                 )
             # Special triggers (e.g. for relation fields) come after
             # TODO: needs to be filled in the get_*_relation_*_type functions
             if code := schema_zone_texts["create_trigger_notify"]:
                 create_trigger_notify_code += code + "\n"
+        # log paths of calculated fields already logged by log_modified_models
+        for trigger_name in cls.get_redundant_calculated_log_triggers():
+            create_trigger_notify_code = re.sub(
+                rf"CREATE TRIGGER {trigger_name} .*?\);\n",
+                "",
+                create_trigger_notify_code,
+                flags=re.DOTALL,
+            )
+        if OPTIONS.get("consolidated_triggers"):
+            (
+                [
+                    create_trigger_partitioned_sequences_code,
+                    create_trigger_1_1_relation_not_null_code,
+                    create_trigger_1_n_relation_not_null_code,
+                    create_trigger_n_m_relation_not_null_code,
+                    create_trigger_prevent_updates_code,
+                    create_trigger_unique_ids_pair_code,
+                    create_trigger_equal_fields_code,
+                ],
+                create_trigger_consolidated_code,
+            ) = Helper.get_consolidated_row_triggers(
+                [
+                    create_trigger_partitioned_sequences_code,
+                    create_trigger_1_1_relation_not_null_code,
+                    create_trigger_1_n_relation_not_null_code,
+                    create_trigger_n_m_relation_not_null_code,
+                    create_trigger_prevent_updates_code,
+                    create_trigger_unique_ids_pair_code,
+                    create_trigger_equal_fields_code,
+                ]
+            )
+        for source_table, relation_lists in cls.materialized_relation_lists.items():
+            create_trigger_relation_lists_code += (
+                Helper.get_relation_list_triggers(source_table, relation_lists) + "\n"
+            )
+        if cls.materialized_field_functions:
+            create_trigger_materialized_fields_code += (
+                "".join(cls.materialized_field_functions) + "\n"
+            )
+        for source_table, groups in cls.materialized_fields.items():
+            create_trigger_materialized_fields_code += (
+                Helper.get_materialized_field_triggers(source_table, groups) + "\n"
+            )
         enum_definitions = Helper.get_enum_types_definitions()
 
         return (
@@ -305,6 +495,9 @@ class GenerateCodeBlocks:
             create_trigger_unique_ids_pair_code,
             create_trigger_equal_fields_code,
             create_trigger_notify_code,
+            create_trigger_relation_lists_code,
+            create_trigger_materialized_fields_code,
+            create_trigger_consolidated_code,
             errors,
         )
 
@@ -571,7 +764,12 @@ class GenerateCodeBlocks:
         text = cast(SchemaZoneTexts, defaultdict(str))
         subst, tmp = Helper.get_initials(table_name, fname, type_, fdata)
         text.update(tmp)
-        subst["primary_key"] = " PRIMARY KEY GENERATED BY DEFAULT AS IDENTITY"
+        if cls.get_partition_definition(table_name):
+            # The primary key has to include the partition key, see partition_by. The ids
+            # are only unique, if they are taken from the identity, so explicit ids are rejected.
+            subst["primary_key"] = " GENERATED ALWAYS AS IDENTITY"
+        else:
+            subst["primary_key"] = " PRIMARY KEY GENERATED BY DEFAULT AS IDENTITY"
         text["table"] = Helper.FIELD_TEMPLATE.substitute(subst)
         return text, ""
 
@@ -601,8 +799,9 @@ class GenerateCodeBlocks:
                 text, error = cls.get_schema_simple_types(
                     table_name, fname, fdata, "number"
                 )
+            composite_fk_code = ""
             if cls.get_equal_fields(own_table_field, foreign_table_field):
-                text["create_trigger_equal_fields_code"] = (
+                text["create_trigger_equal_fields_code"], composite_fk_code = (
                     cls.get_trigger_check_equal_fields_for_1_x(
                         own_table_field, foreign_table_field, state
                     )
@@ -618,18 +817,20 @@ class GenerateCodeBlocks:
                     foreign_table_field.ref_column,
                     initially_deferred,
                 )
+                + composite_fk_code
             )
-            table_name = HelperGetNames.get_table_name(table_name)
-            text["create_trigger_notify"] = Helper.get_foreign_key_notify_trigger(
-                table_name,
+            text["log_related_arguments"] = Helper.get_log_related_arguments(
                 foreign_table_field.table,
                 fname,
                 foreign_table_field.column,
-                foreign_table_field.ref_column,
-                initially_deferred,
+                own_table_field.ref_column,
             )
         elif state == FieldSqlErrorType.SQL:
-            if sql := fix(fdata.get("sql", "")):
+            if cls.is_materialized(table_name, fname):
+                text["table"] = cls.get_materialized_field(
+                    table_name, fname, fdata, "integer"
+                )
+            elif sql := fix(fdata.get("sql", "")):
                 text["view"] = sql + ",\n"
             else:
                 if foreign_table_field.field_def["type"] == "generic-relation":
@@ -719,7 +920,12 @@ class GenerateCodeBlocks:
                         raise Exception(
                             f"Tried to create im_table '{nm_table_name}' twice"
                         )
-            if sql := fdata.get("sql", ""):
+            if cls.is_materialized(table_name, fname):
+                # changes of the column are logged by the log trigger of the table
+                text["table"] = cls.get_materialized_field(
+                    table_name, fname, fdata, "integer[]"
+                )
+            elif sql := fdata.get("sql", ""):
                 text["view"] = sql + ",\n"
                 text["create_trigger_notify"] = (
                     "\n"
@@ -787,15 +993,34 @@ class GenerateCodeBlocks:
                         raise Exception(
                             f"Still not implemented for foreign_table type '{type_}' in False case"
                         )
-                text["view"] = cls.get_sql_for_relation_n_1(
-                    table_name,
-                    fname,
-                    own_ref_column,
-                    foreign_table_name,
-                    foreign_table_column,
-                    foreign_table_ref_column,
-                    own_table_field.field_def == foreign_table_field.field_def,
+                self_reference = (
+                    own_table_field.field_def == foreign_table_field.field_def
                 )
+                if (
+                    OPTIONS.get("materialize_relation_lists")
+                    and foreign_table_column
+                    and not self_reference
+                ):
+                    text["relation_list_table"] = cls.get_materialized_relation_list(
+                        table_name,
+                        fname,
+                        foreign_table_name,
+                        foreign_table_column,
+                        foreign_table_ref_column,
+                    )
+                    text["view"] = Helper.get_relation_list_view_column(
+                        table_name, fname
+                    )
+                else:
+                    text["view"] = cls.get_sql_for_relation_n_1(
+                        table_name,
+                        fname,
+                        own_ref_column,
+                        foreign_table_name,
+                        foreign_table_column,
+                        foreign_table_ref_column,
+                        self_reference,
+                    )
                 if own_table_field.field_def.get("required"):
                     if (
                         type_ := foreign_table_field.field_def.get("type", "")
@@ -844,32 +1069,752 @@ class GenerateCodeBlocks:
         foreign_table_column: str,
         foreign_table_ref_column: str,
         self_reference: bool = False,
+        generic: bool = False,
     ) -> str:
+        """
+        Aggregates the foreign_table_ref_column of the rows referencing the own row.
+        With generic and typed_generic_relations the stored collection and id pair of a
+        gm-table is aggregated as fqid.
+        """
         table_letter = Helper.get_table_letter(table_name)
         foreign_letter = Helper.get_table_letter(foreign_table_name, [table_letter])
-        AGG_TEMPLATE = f"select array_agg({foreign_letter}.{{}} ORDER BY {foreign_letter}.{{}}) from {foreign_table_name} {foreign_letter}"
+        AGG_TEMPLATE = f"select array_agg({{0}} ORDER BY {{0}}) from {foreign_table_name} {foreign_letter}"
         COND_TEMPLATE = (
             f" where {foreign_letter}.{{}} = {table_letter}.{own_ref_column}"
         )
+        used_by = f"view {table_name}.{fname}"
         if not foreign_table_column or not self_reference:
-            query = AGG_TEMPLATE.format(
-                foreign_table_ref_column, foreign_table_ref_column
-            )
+            if generic and OPTIONS.get("typed_generic_relations"):
+                value = Helper.get_generic_fqid_expression(
+                    foreign_table_ref_column, foreign_letter
+                )
+            else:
+                value = f"{foreign_letter}.{foreign_table_ref_column}"
+            query = AGG_TEMPLATE.format(value)
             if foreign_table_column:
                 query += COND_TEMPLATE.format(foreign_table_column)
+                cls.register_index_lookup(
+                    foreign_table_name, foreign_table_column, used_by
+                )
         else:
             assert foreign_table_ref_column == (
                 col := foreign_table_column
             ), f"own {col} and foreign {foreign_table_ref_column} should be equal"
-            arr1 = AGG_TEMPLATE.format(f"{col}_1", f"{col}_1") + COND_TEMPLATE.format(
-                f"{col}_2"
-            )
-            arr2 = AGG_TEMPLATE.format(f"{col}_2", f"{col}_2") + COND_TEMPLATE.format(
-                f"{col}_1"
-            )
+            arr1 = AGG_TEMPLATE.format(
+                f"{foreign_letter}.{col}_1"
+            ) + COND_TEMPLATE.format(f"{col}_2")
+            arr2 = AGG_TEMPLATE.format(
+                f"{foreign_letter}.{col}_2"
+            ) + COND_TEMPLATE.format(f"{col}_1")
             query = f"select array_cat(({arr1}), ({arr2}))"
+            cls.register_index_lookup(foreign_table_name, f"{col}_1", used_by)
+            cls.register_index_lookup(foreign_table_name, f"{col}_2", used_by)
         return f"({query}) as {fname},\n"
 
+    @classmethod
+    def register_index_lookup(cls, table: str, column: str, used_by: str) -> None:
+        """Registers a WHERE column = value lookup of the generated code for --index-audit"""
+        cls.index_lookups.setdefault((table, column), []).append(used_by)
+
+    @classmethod
+    def register_log_arguments(cls, table: str, arguments: str) -> str:
+        """
+        Registers the log_modified_models arguments of a table, they describe its relations.
+        Returns the arguments without repeated groups, so every related field is logged once
+        per fk and value column.
+        """
+        collection, *related = [
+            argument.strip().strip("'") for argument in arguments.split(",")
+        ]
+        groups: list[tuple[str, ...]] = []
+        for i in range(0, len(related), 4):
+            if (group := tuple(related[i : i + 4])) not in groups:
+                groups.append(group)
+        cls.log_arguments[table] = [collection, *(a for group in groups for a in group)]
+        return ", ".join(f"'{argument}'" for argument in cls.log_arguments[table])
+
+    @classmethod
+    def register_calculated_log_path(
+        cls, table: str, path: tuple[str, ...], trigger_names: tuple[str, str]
+    ) -> bool:
+        """
+        Registers the path (log_collection_id_column, log_collection_id_sql, log_value_column,
+        log_value_sql, on_columns, log collection, log field) of calculated field log triggers
+        on table. Returns False, if the same path is already logged by other triggers.
+        """
+        paths = cls.calculated_log_paths.setdefault(table, {})
+        if path in paths:
+            return False
+        paths[path] = trigger_names
+        return True
+
+    @classmethod
+    def get_redundant_calculated_log_triggers(cls) -> list[str]:
+        """
+        Returns the names of the calculated field log triggers, whose field is logged by
+        log_modified_models on the same table anyway: the id is the fk column and the
+        value the value column of one of its groups and no other column triggers them.
+        """
+        names: list[str] = []
+        for table, paths in cls.calculated_log_paths.items():
+            arguments = cls.log_arguments.get(table, [])
+            groups = {tuple(arguments[i : i + 4]) for i in range(1, len(arguments), 4)}
+            for path, trigger_names in paths.items():
+                id_column, id_sql, value_column, value_sql, on_columns, *target = path
+                if id_sql or value_sql or not id_column or not value_column:
+                    continue
+                if not {
+                    column.strip() for column in on_columns.split(",") if column
+                } <= {id_column, value_column}:
+                    continue
+                if (target[0], id_column, target[1], value_column) in groups:
+                    names.extend(trigger_names)
+        return names
+
+    @classmethod
+    def get_trigger_report(cls, code: str) -> list[str]:
+        """
+        Returns a line per table with the number of row and statement level triggers
+        fired by an insert, update and delete and the number of related fields logged.
+        """
+        fired: dict[str, dict[str, list[int]]] = {}
+        for match in Helper.TRIGGER_DEFINITION_REGEX.finditer(code):
+            counts = fired.setdefault(
+                match["table"], {operation: [0, 0] for operation in Helper.OPERATIONS}
+            )
+            for event in match["events"].split(" OR "):
+                counts[event.split()[0]][match["level"] == "STATEMENT"] += 1
+        lines = []
+        for table, counts in sorted(fired.items()):
+            log_paths = len(cls.log_arguments.get(table, [])) // 4 + len(
+                cls.calculated_log_paths.get(table, {})
+            )
+            lines.append(
+                f"    {table}: "
+                + ", ".join(
+                    f"{operation.lower()} {row}+{statement}"
+                    for operation, (row, statement) in counts.items()
+                )
+                + f", {log_paths} related fields logged\n"
+            )
+        return lines
+
+    @classmethod
+    def get_index_audit(cls, code: str) -> list[str]:
+        """
+        Returns a line for every registered lookup, whose column isn't the
+        leading column of an index, primary key or unique constraint in code.
+        """
+        indexed = Helper.get_indexed_columns(code)
+        return [
+            f"    {table}.{column} used by {', '.join(sorted(set(used_by)))}\n"
+            for (table, column), used_by in sorted(cls.index_lookups.items())
+            if (table, column) not in indexed
+        ]
+
+    @classmethod
+    def get_meeting_tables(cls, owned: bool = False) -> dict[str, MeetingTable]:
+        """
+        Returns the tables of the meeting and its models, i.e. all collections with a
+        required meeting_id, and the intermediate tables referencing them. The relations
+        are taken from the registered log arguments, so the code must be generated before.
+        With owned all models owned by the meeting are included, i.e. also those with an
+        optional meeting_id or a required generic relation to the meeting like mediafile.owner_id.
+        """
+        collections = {"meeting": "id"}
+        for collection, model in InternalHelper.MODELS.items():
+            if collection in ("_migration_index", "_meta", "meeting"):
+                continue
+            if cls.is_table_column(collection, "meeting_id", required=not owned):
+                collections[collection] = "meeting_id"
+            elif owned:
+                for fname, fdata in model["fields"].items():
+                    if (
+                        fdata["type"] == "generic-relation"
+                        and fdata.get("required")
+                        and "meeting"
+                        in [
+                            foreign.table
+                            for foreign in InternalHelper.get_definitions_from_foreign_list(
+                                fdata.get("to"), fdata.get("reference")
+                            )
+                        ]
+                    ):
+                        collections[collection] = f"{fname}_meeting_id"
+        model_tables: dict[str, MeetingTable] = {}
+        intermediate_tables: dict[str, MeetingTable] = {}
+        for table, arguments in cls.log_arguments.items():
+            collection = arguments[0]
+            groups = [arguments[i : i + 4] for i in range(1, len(arguments), 4)]
+            foreign_keys = {fk_column: foreign for foreign, fk_column, _, _ in groups}
+            if collection:
+                if collection not in collections:
+                    continue
+                columns = [
+                    fname
+                    for fname, fdata in InternalHelper.MODELS[collection][
+                        "fields"
+                    ].items()
+                    if (
+                        cls.is_table_column(collection, fname)
+                        # calculated by the triggers of materialized fields
+                        and not cls.is_materialized(collection, fname)
+                    )
+                    or (
+                        fdata["type"] == "generic-relation"
+                        and not fdata.get("calculated")
+                        and not fdata.get("sql")
+                    )
+                ]
+            else:
+                if not set(foreign_keys.values()) & set(collections):
+                    continue
+                columns = list(dict.fromkeys(arguments[2::2]))
+                if OPTIONS.get("typed_generic_relations"):
+                    # gm-tables log the id column of the stored pair, see get_trigger_for_generic_intermediate_table
+                    columns = [
+                        (
+                            column.removesuffix("_model_id")
+                            if any(
+                                fk_column
+                                == f"{column.removesuffix('_model_id')}_{foreign}_id"
+                                for fk_column, foreign in foreign_keys.items()
+                            )
+                            else column
+                        )
+                        for column in columns
+                    ]
+            # generic relations reference with generated columns <fqid column>_<collection>_id
+            generic_columns = [
+                column
+                for column in columns
+                if any(
+                    fk_column == f"{column}_{foreign}_id"
+                    for fk_column, foreign in foreign_keys.items()
+                )
+            ]
+            meeting_table: MeetingTable = {
+                "collection": collection,
+                "meeting_column": collections.get(collection, ""),
+                "columns": [
+                    column
+                    for column in columns
+                    if not any(
+                        column == f"{generic_column}_{foreign_keys.get(column)}_id"
+                        for generic_column in generic_columns
+                    )
+                ],
+                "foreign_keys": foreign_keys,
+                "generic_columns": generic_columns,
+            }
+            if collection == "meeting":
+                model_tables = {table: meeting_table, **model_tables}
+            elif collection:
+                model_tables[table] = meeting_table
+            else:
+                intermediate_tables[table] = meeting_table
+        return {**model_tables, **intermediate_tables}
+
+    @classmethod
+    def get_clone_meeting_function(cls) -> str:
+        # the models owned by the meeting, e.g. its mediafiles, without its history
+        meeting_tables = {
+            table: data
+            for table, data in cls.get_meeting_tables(owned=True).items()
+            if data["meeting_column"] != "meeting_id"
+            or cls.is_table_column(data["collection"], "meeting_id", required=True)
+        }
+        collections = {data["collection"] for data in meeting_tables.values()}
+        id_maps = ""
+        copies = ""
+        for table, data in meeting_tables.items():
+            collection = data["collection"]
+            arguments = cls.log_arguments[table]
+            if not collection and any(
+                f"{foreign}/{field}" in Helper.CLONE_MEETING_SKIPPED_FIELDS
+                for foreign, field in zip(arguments[1::4], arguments[3::4])
+            ):
+                continue
+            expressions = []
+            for column in data["columns"]:
+                foreign = data["foreign_keys"].get(column)
+                if collection and column == "id":
+                    expressions.append("m.new_id")
+                elif collection and column == "meeting_id":
+                    expressions.append("new_meeting_id")
+                elif collection == "meeting" and column == "committee_id":
+                    expressions.append("target_committee_id")
+                elif (
+                    collection
+                    and InternalHelper.MODELS[collection]["fields"][column].get(
+                        "unique"
+                    )
+                    and not foreign
+                ):
+                    expressions.append("NULL")
+                elif column in data["generic_columns"]:
+                    expressions.append(Helper.get_clone_generic_id(column))
+                elif foreign in collections:
+                    expressions.append(Helper.get_clone_id(foreign, column))
+                else:
+                    expressions.append(f"t.{column}")
+            if collection:
+                condition = f"{data['meeting_column']} = source_meeting_id"
+                id_maps += (
+                    f"INSERT INTO os_clone_id_map_t (collection, old_id, new_id)\n"
+                    f"SELECT '{collection}', id, nextval(pg_get_serial_sequence('{table}', 'id'))\n"
+                    f"FROM (SELECT id FROM {table} WHERE {condition} ORDER BY id) AS t;\n"
+                )
+                source = f"FROM {table} t JOIN os_clone_id_map_t m ON m.collection = '{collection}' AND m.old_id = t.id"
+                partition = cls.get_partition_definition(collection) or {}
+                if partition.get("method") == "list":
+                    copies += (
+                        f"PERFORM create_list_partition('{table}', new_meeting_id);\n"
+                    )
+            else:
+                source = f"FROM {table} t\nWHERE " + "\n    OR ".join(
+                    f"t.{fk_column} IN (SELECT old_id FROM os_clone_id_map_t WHERE collection = '{foreign}')"
+                    for fk_column, foreign in data["foreign_keys"].items()
+                    if foreign in collections
+                )
+            stored_columns = [
+                stored_column
+                for column in data["columns"]
+                for stored_column in (
+                    Helper.get_generic_stored_columns(column)
+                    if column in data["generic_columns"]
+                    else [column]
+                )
+            ]
+            copies += f"INSERT INTO {table} ({', '.join(stored_columns)})\n"
+            if collection and cls.get_partition_definition(collection):
+                # the new ids are taken from the identity of the table
+                copies += "OVERRIDING SYSTEM VALUE\n"
+            copies += f"SELECT {', '.join(expressions)}\n{source};\n"
+        return Helper.CLONE_MEETING_FUNCTION_TEMPLATE.substitute(
+            {
+                "id_maps": indent(id_maps, "    ").strip(),
+                "copies": indent(copies, "    ").strip(),
+            }
+        )
+
+    @classmethod
+    def get_delete_meeting_function(cls) -> str:
+        meeting_tables = cls.get_meeting_tables(owned=True)
+        collections = {
+            data["collection"]: data["meeting_column"]
+            for data in meeting_tables.values()
+            if data["collection"]
+        }
+
+        def references(fk_column: str, foreign: str, meeting_id: str) -> str:
+            if foreign == "meeting":
+                return f"{fk_column} = {meeting_id}"
+            return f"{fk_column} IN (SELECT id FROM {HelperGetNames.get_table_name(foreign)} WHERE {collections[foreign]} = {meeting_id})"
+
+        def in_meeting(foreign: str, foreign_field: str) -> bool:
+            """True if the equal_fields of the relation keep the related model in the meeting"""
+            if collections.get(foreign) != "meeting_id":
+                return False
+            equal_fields = InternalHelper.MODELS[foreign]["fields"][foreign_field].get(
+                "equal_fields", []
+            )
+            if isinstance(equal_fields, str):
+                equal_fields = [equal_fields]
+            return "meeting_id" in equal_fields
+
+        def kept(fk_column: str, foreign: str) -> str:
+            """
+            Condition for logging a related model only if it isn't deleted itself. This is
+            decided per row, e.g. mediafiles of the organization are kept, those of the meeting not.
+            """
+            if foreign not in collections:
+                return ""
+            return f" AND NOT {references(fk_column, foreign, '%1$s')}"
+
+        # References from rows, which are kept, are removed before the deletion and logged as usual
+        detaches = ""
+        for table, arguments in cls.log_arguments.items():
+            collection = arguments[0]
+            if not collection:
+                continue
+            fields = InternalHelper.MODELS[collection]["fields"]
+            meeting_column = collections.get(collection)
+            detached: set[str] = set()
+            groups = [arguments[i : i + 4] for i in range(1, len(arguments), 4)]
+            for foreign, fk_column, _, _ in groups:
+                if foreign not in collections or fk_column == meeting_column:
+                    continue
+                fname = (
+                    fk_column
+                    if fk_column in fields
+                    else fk_column.removesuffix(f"_{foreign}_id")
+                )
+                fdata = fields[fname]
+                equal_fields = fdata.get("equal_fields", [])
+                if isinstance(equal_fields, str):
+                    equal_fields = [equal_fields]
+                # required references can't be removed, the deferred foreign keys report them
+                if fdata.get("required") or fname in detached:
+                    continue
+                if (
+                    meeting_column
+                    and meeting_column.removesuffix("_meeting_id") in equal_fields
+                ):
+                    continue
+                detached.add(fname)
+                assignments = ", ".join(
+                    f"{column} = NULL"
+                    for column in GenerateCodeBlocks.get_stored_columns(
+                        collection, fname
+                    )
+                )
+                detaches += f"UPDATE {table} SET {assignments}\nWHERE {references(fk_column, foreign, 'deleted_meeting_id')}"
+                if meeting_column:
+                    detaches += f"\n    AND {meeting_column} IS DISTINCT FROM deleted_meeting_id"
+                detaches += ";\n"
+
+        # The models of the meeting are deleted with the meeting, only the related models are logged
+        entries = [
+            "SELECT 'delete' AS operation, 'meeting/' || %1$s AS fqid, NULL::varchar(63)[] AS fields"
+        ]
+        intermediate_deletes = ""
+        model_deletes: dict[str, str] = {}
+        for table, data in meeting_tables.items():
+            if collection := data["collection"]:
+                condition = f"{data['meeting_column']} = deleted_meeting_id"
+                model_deletes[collection] = f"DELETE FROM {table} WHERE {condition};\n"
+                log_condition = f"{data['meeting_column']} = %1$s"
+            else:
+                condition = "\n    OR ".join(
+                    references(fk_column, foreign, "deleted_meeting_id")
+                    for fk_column, foreign in data["foreign_keys"].items()
+                    if foreign in collections
+                )
+                intermediate_deletes += f"DELETE FROM {table}\nWHERE {condition};\n"
+                log_condition = (
+                    "("
+                    + " OR ".join(
+                        references(fk_column, foreign, "%1$s")
+                        for fk_column, foreign in data["foreign_keys"].items()
+                        if foreign in collections
+                    )
+                    + ")"
+                )
+            arguments = cls.log_arguments[table]
+            groups = [arguments[i : i + 4] for i in range(1, len(arguments), 4)]
+            for foreign, fk_column, foreign_field, _ in groups:
+                if fk_column == data["meeting_column"] or in_meeting(
+                    foreign, foreign_field
+                ):
+                    continue
+                entries.append(
+                    f"SELECT DISTINCT 'update', '{foreign}/' || {fk_column}, ARRAY['{foreign_field}']::varchar(63)[]\n"
+                    f"FROM {table} WHERE {log_condition} AND {fk_column} IS NOT NULL{kept(fk_column, foreign)}"
+                )
+            # calculated fields logged by the skipped log_ud_modified_calculated_id_array_field triggers
+            for foreign, model in InternalHelper.MODELS.items():
+                for fname, fdata in model.get("fields", {}).items():
+                    for log_trigger in fdata.get("log_triggers", []):
+                        if log_trigger["on_table"] != table:
+                            continue
+                        if sql := log_trigger.get("log_collection_id_sql"):
+                            foreign_id = f"({sql.replace('($1).', 't.')})"
+                        else:
+                            foreign_id = f"t.{log_trigger['log_collection_id_column']}"
+                        entries.append(
+                            f"SELECT DISTINCT 'update', '{foreign}/' || {foreign_id}, ARRAY['{fname}']::varchar(63)[]\n"
+                            f"FROM {table} t WHERE {log_condition} AND {foreign_id} IS NOT NULL{kept(foreign_id, foreign)}"
+                        )
+
+        # Referencing tables are deleted before the referenced ones, so no row is deleted
+        # by a cascade or set null action. References within cycles are checked deferred.
+        referencing: dict[str, list[str]] = defaultdict(list)
+        for table, data in meeting_tables.items():
+            for foreign in data["foreign_keys"].values():
+                if data["collection"] and foreign in collections:
+                    referencing[foreign].append(data["collection"])
+        visited: set[str] = set()
+        ordered: list[str] = []
+
+        def visit(collection: str) -> None:
+            if collection in visited:
+                return
+            visited.add(collection)
+            for referencing_collection in referencing[collection]:
+                visit(referencing_collection)
+            ordered.append(collection)
+
+        visit("meeting")
+        for collection in collections:
+            visit(collection)
+        deletes = intermediate_deletes + "".join(
+            model_deletes[collection] for collection in ordered
+        )
+        # the sequences of the sequence_scope fields are numbered per meeting
+        sequences = [
+            (HelperGetNames.get_table_name(collection), fname)
+            for collection in collections
+            for fname, fdata in InternalHelper.MODELS[collection]["fields"].items()
+            if fdata.get("sequence_scope") == "meeting_id"
+        ]
+        if sequences and OPTIONS.get("sequence_counters"):
+            deletes += (
+                "DELETE FROM os_sequence_counter_t\nWHERE scope_id = deleted_meeting_id AND (table_name, column_name) IN ("
+                + ", ".join(f"('{table}', '{fname}')" for table, fname in sequences)
+                + ");\n"
+            )
+        elif sequences:
+            # only the existing sequences, DROP SEQUENCE IF EXISTS raises a notice per table
+            deletes += (
+                "FOR sequence_name IN\n"
+                "    SELECT relname FROM pg_class WHERE relkind = 'S' AND relname IN (\n"
+                + ",\n".join(
+                    f"        '{table}_meeting_id' || deleted_meeting_id || '_{fname}_seq'"
+                    for table, fname in sequences
+                )
+                + "\n    )\nLOOP\n"
+                "    EXECUTE format('DROP SEQUENCE %I', sequence_name);\n"
+                "END LOOP;\n"
+            )
+        return Helper.DELETE_MEETING_FUNCTION_TEMPLATE.substitute(
+            {
+                "detaches": indent(detaches, "    ").strip(),
+                "entries": indent("\nUNION ALL ".join(entries), "        ").strip(),
+                "deletes": indent(deletes, "    ").strip(),
+            }
+        )
+
+    @classmethod
+    def get_export_meeting_function(cls) -> str:
+        meeting_tables = cls.get_meeting_tables(owned=True)
+        collections = {
+            data["collection"]: data["meeting_column"]
+            for data in meeting_tables.values()
+            if data["collection"]
+        }
+        # relation fields calculated in the views: collection to field to (table, fk column, value column)
+        relation_fields: dict[str, dict[str, list[tuple[str, str, str]]]] = defaultdict(
+            dict
+        )
+        for table, arguments in cls.log_arguments.items():
+            groups = [arguments[i : i + 4] for i in range(1, len(arguments), 4)]
+            for foreign, fk_column, foreign_field, value_column in groups:
+                if foreign in collections and not cls.is_table_column(
+                    foreign, foreign_field
+                ):
+                    relation_fields[foreign].setdefault(foreign_field, []).append(
+                        (table, fk_column, value_column)
+                    )
+        selects = []
+        for table, data in meeting_tables.items():
+            if not (collection := data["collection"]):
+                continue
+            letter = Helper.get_table_letter(collection)
+            generated_columns = [
+                column
+                for column in data["foreign_keys"]
+                if column not in data["columns"]
+            ]
+            pairs = []
+            if OPTIONS.get("typed_generic_relations"):
+                for column in data["generic_columns"]:
+                    generated_columns.extend(Helper.get_generic_stored_columns(column))
+                    pairs.append(
+                        f"'{column}', {Helper.get_generic_fqid_expression(column, letter)}"
+                    )
+            fields = [f"to_jsonb({letter})"]
+            if generated_columns:
+                fields[0] = (
+                    f"(to_jsonb({letter}) - '{{{','.join(generated_columns)}}}'::text[])"
+                )
+            joins = ""
+            for i, (fname, sources) in enumerate(
+                sorted(relation_fields[collection].items()), 1
+            ):
+                if collection == "meeting":
+                    condition = "s.id = exported_meeting_id"
+                else:
+                    condition = f"s.id IN (SELECT id FROM {table} WHERE {data['meeting_column']} = exported_meeting_id)"
+                if InternalHelper.MODELS[collection]["fields"][fname]["type"] in (
+                    "relation-list",
+                    "generic-relation-list",
+                ):
+                    aggregate = "array_agg(s.value ORDER BY s.value)"
+                else:
+                    aggregate = "min(s.value)"
+                union = " UNION ALL ".join(
+                    f"SELECT {fk_column} AS id, {Helper.get_generic_value_expression(source_table, value_column)} AS value FROM {source_table}"
+                    for source_table, fk_column, value_column in sources
+                )
+                joins += (
+                    f"\nLEFT JOIN (SELECT s.id, {aggregate} AS value FROM ({union}) s\n"
+                    f"    WHERE {condition} GROUP BY s.id) r{i} ON r{i}.id = {letter}.id"
+                )
+                pairs.append(f"'{fname}', r{i}.value")
+            for fname, fdata in InternalHelper.MODELS[collection]["fields"].items():
+                if (
+                    (sql := fdata.get("sql"))
+                    and not fdata.get("calculated")
+                    and not cls.is_materialized(collection, fname)
+                ):
+                    pairs.append(
+                        f"'{fname}', {Helper.get_sql_field_expression(fname, sql)}"
+                    )
+            # jsonb_build_object takes at most 100 arguments
+            for i in range(0, len(pairs), 50):
+                fields.append(f"jsonb_build_object({', '.join(pairs[i : i + 50])})")
+            selects.append(
+                f"SELECT jsonb_build_object('fqid', '{collection}/' || {letter}.id, 'fields', {' || '.join(fields)})::text\n"
+                f"FROM {table} {letter}{joins}\n"
+                f"WHERE {letter}.{data['meeting_column']} = exported_meeting_id"
+            )
+        return Helper.EXPORT_MEETING_FUNCTION_TEMPLATE.substitute(
+            {"selects": "\nUNION ALL\n".join(selects)}
+        )
+
+    @classmethod
+    def get_models_function(cls) -> str:
+        columns = ""
+        for collection, model in InternalHelper.MODELS.items():
+            if collection in ("_migration_index", "_meta"):
+                continue
+            fields = [
+                fname
+                for fname, fdata in model["fields"].items()
+                if not fdata.get("calculated")
+            ]
+            names = "', '".join(fields)
+            columns += f"WHEN '{collection}' THEN ARRAY['{names}']\n"
+        return Helper.GET_MODELS_FUNCTION_TEMPLATE.substitute(
+            {"columns": indent(columns, "            ").strip()}
+        )
+
+    @classmethod
+    def get_materialized_relation_list(
+        cls,
+        table_name: str,
+        fname: str,
+        source_table: str,
+        fk_column: str,
+        value_column: str,
+        pg_type: str = "integer[]",
+    ) -> str:
+        """
+        Registers the relation list for maintenance by the triggers on the source table
+        and returns the column definition for the relation list table.
+        """
+        cls.materialized_relation_lists.setdefault(source_table, []).append(
+            (
+                HelperGetNames.get_relation_list_table_name(table_name),
+                fname,
+                fk_column,
+                value_column,
+            )
+        )
+        return f"    {fname} {pg_type},\n"
+
+    @classmethod
+    def is_materialized(cls, collection: str, fname: str) -> bool:
+        """
+        Returns True if the sql field is stored as a column of the collections table.
+        The materialize attribute of the field overrides the one of the collection.
+        """
+        fdata = InternalHelper.MODELS[collection]["fields"].get(fname, {})
+        return bool(
+            fdata.get("sql")
+            and not fdata.get("calculated")
+            and fdata.get(
+                "materialize", InternalHelper.MODELS[collection].get("materialize")
+            )
+        )
+
+    @classmethod
+    def get_materialized_field(
+        cls, table_name: str, fname: str, fdata: dict[str, Any], pg_type: str
+    ) -> str:
+        """
+        Registers the function recalculating the sql field for changes of the tables in
+        its log_triggers and new rows of the own table and returns the column definition.
+        """
+        own_table = HelperGetNames.get_table_name(table_name)
+        function_name = HelperGetNames.get_materialized_field_function_name(
+            table_name, fname
+        )
+        cls.materialized_field_functions.append(
+            Helper.MATERIALIZED_FIELD_FUNCTION_TEMPLATE.substitute(
+                {
+                    "function_name": function_name,
+                    "own_table": own_table,
+                    "letter": Helper.get_table_letter(table_name),
+                    "field": fname,
+                    "expression": Helper.get_sql_field_expression(fname, fdata["sql"]),
+                }
+            )
+        )
+        cls.materialized_fields.setdefault(own_table, []).append(
+            (("INSERT",), function_name, "r.id", "")
+        )
+        for log_trigger in fdata.get("log_triggers", []):
+            if id_sql := log_trigger.get("log_collection_id_sql"):
+                id_sql = f"({id_sql.replace('($1).', 'r.')})"
+            else:
+                id_sql = f"r.{log_trigger['log_collection_id_column']}"
+            update_condition = ""
+            if on_columns := log_trigger.get("on_columns"):
+                columns = [column.strip() for column in on_columns.split(",")]
+                update_condition = (
+                    f"({', '.join('o.' + column for column in columns)}) IS DISTINCT FROM "
+                    f"({', '.join('n.' + column for column in columns)})"
+                )
+            cls.materialized_fields.setdefault(log_trigger["on_table"], []).append(
+                (
+                    ("INSERT", "UPDATE", "DELETE"),
+                    function_name,
+                    id_sql,
+                    update_condition,
+                )
+            )
+        return f"    {fname} {pg_type},\n"
+
+    @classmethod
+    def get_partition_definition(cls, table_name: str) -> dict[str, Any] | None:
+        """
+        Returns the normalized partition_by definition of the collection with the keys
+        column, method and partitions or None, if the collection isn't partitioned.
+        Raises an exception, if the table can't be partitioned by PostgreSQL.
+        """
+        value = InternalHelper.MODELS[table_name].get("partition_by")
+        if value is None:
+            return None
+        partition, errors = InternalHelper.check_partition_by(
+            table_name,
+            value,
+            InternalHelper.MODELS[table_name]["fields"],
+            InternalHelper.MODELS[table_name],
+        )
+        if errors:
+            raise Exception("\n".join(errors))
+        return cast(dict[str, Any], partition)
+
+    @classmethod
+    def get_storage_definition(
+        cls, table_name: str
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """
+        Returns the storage parameters and the compression methods per field of the
+        storage attribute of the collection, both empty if not set.
+        Raises an exception for unknown parameters or fields without compressible column.
+        """
+        storage, compression, errors = InternalHelper.check_storage(
+            table_name,
+            InternalHelper.MODELS[table_name].get("storage", {}),
+            InternalHelper.MODELS[table_name]["fields"],
+        )
+        if errors:
+            raise Exception("\n".join(errors))
+        return storage, compression
+
     @staticmethod
     def get_constraint_unique_together(
         table_name: str, value: Any, strict: bool
@@ -893,10 +1838,27 @@ class GenerateCodeBlocks:
         trigger_name = HelperGetNames.get_partitioned_sequence_trigger_name(
             view_name, actual_field
         )
-        return dedent(f"""
+        function_definition = ""
+        if not OPTIONS.get("sequence_counters"):
+            function_call = (
+                f"generate_sequence('{table_name}', '{actual_field}', '{depend_field}')"
+            )
+        elif OPTIONS.get("static_trigger_functions"):
+            function_definition, function_call = Helper.get_static_trigger_function(
+                trigger_name,
+                Helper.STATIC_SEQUENCE_COUNTER_FUNCTION_TEMPLATE,
+                {
+                    "table_name": table_name,
+                    "actual_field": actual_field,
+                    "depend_field": depend_field,
+                },
+            )
+        else:
+            function_call = f"generate_sequence_from_counter('{table_name}', '{actual_field}', '{depend_field}')"
+        return function_definition + dedent(f"""
             -- definition trigger generate partitioned sequence number for {table_name}.{actual_field} partitioned by {depend_field}
             CREATE TRIGGER {trigger_name} BEFORE INSERT ON {table_name}
-            FOR EACH ROW EXECUTE FUNCTION generate_sequence('{table_name}', '{actual_field}', '{depend_field}');
+            FOR EACH ROW EXECUTE FUNCTION {function_call};
             """)
 
     @classmethod
@@ -909,13 +1871,47 @@ class GenerateCodeBlocks:
     ) -> str:
         own_table_t = HelperGetNames.get_table_name(own_collection)
         foreign_table_t = HelperGetNames.get_table_name(foreign_collection)
-        return dedent(f"""
+        trigger_name_insert = HelperGetNames.get_not_null_1_1_rel_insert_trigger_name(
+            own_collection, own_column
+        )
+        trigger_name_upd_del = HelperGetNames.get_not_null_1_1_rel_upd_del_trigger_name(
+            own_collection, own_column
+        )
+        function_definitions = ""
+        if OPTIONS.get("static_trigger_functions"):
+            condition = f"(SELECT {own_column} FROM {own_collection} WHERE id = own_id_var) IS NULL"
+            function_definition, function_call_insert = (
+                Helper.get_static_not_null_function(
+                    trigger_name_insert, own_collection, own_column, condition
+                )
+            )
+            function_definitions += function_definition
+            function_definition, function_call_upd_del = (
+                Helper.get_static_not_null_function(
+                    trigger_name_upd_del,
+                    own_collection,
+                    own_column,
+                    condition,
+                    f"OLD.{foreign_column}",
+                    own_collection,
+                    foreign_collection,
+                    "OLD.id",
+                    foreign_column,
+                )
+            )
+            function_definitions += function_definition
+        else:
+            function_call_insert = (
+                f"check_not_null_for_1_1('{own_collection}', '{own_column}')"
+            )
+            function_call_upd_del = f"check_not_null_for_1_1('{own_collection}', '{own_column}', '{foreign_collection}', '{foreign_column}')"
+        return function_definitions + dedent(f"""
             -- definition trigger not null for {own_collection}.{own_column} against {foreign_collection}.{foreign_column}
-            CREATE CONSTRAINT TRIGGER {HelperGetNames.get_not_null_1_1_rel_insert_trigger_name(own_collection, own_column)} AFTER INSERT ON {own_table_t} INITIALLY DEFERRED
-            FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('{own_collection}', '{own_column}');
+            CREATE CONSTRAINT TRIGGER {trigger_name_insert} AFTER INSERT ON {own_table_t} INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION {function_call_insert};
 
-            CREATE CONSTRAINT TRIGGER {HelperGetNames.get_not_null_1_1_rel_upd_del_trigger_name(own_collection, own_column)} AFTER UPDATE OF {foreign_column} OR DELETE ON {foreign_table_t} INITIALLY DEFERRED
-            FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_1('{own_collection}', '{own_column}', '{foreign_collection}', '{foreign_column}');
+            CREATE CONSTRAINT TRIGGER {trigger_name_upd_del} AFTER UPDATE OF {foreign_column} OR DELETE ON {foreign_table_t} INITIALLY DEFERRED
+            FOR EACH ROW WHEN ({Helper.NOT_DELETING_MEETING}) EXECUTE FUNCTION {function_call_upd_del};
             """)
 
     @classmethod
@@ -928,16 +1924,54 @@ class GenerateCodeBlocks:
     ) -> str:
         own_table_t = HelperGetNames.get_table_name(own_collection)
         foreign_table_t = HelperGetNames.get_table_name(foreign_collection)
-        return dedent(f"""
-            -- definition trigger not null for {own_collection}.{own_column} against {foreign_collection}.{foreign_column}
-            CREATE CONSTRAINT TRIGGER {HelperGetNames.get_not_null_rel_list_insert_trigger_name(own_collection, own_column)} AFTER INSERT ON {own_table_t} INITIALLY DEFERRED
-            FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('{own_table_t}', '{own_column}', '{foreign_table_t}', '{foreign_column}');
-
-            CREATE CONSTRAINT TRIGGER {HelperGetNames.get_not_null_rel_list_upd_del_trigger_name(own_collection, own_column)} AFTER UPDATE OF {foreign_column} OR DELETE ON {foreign_table_t} INITIALLY DEFERRED
-            FOR EACH ROW EXECUTE FUNCTION check_not_null_for_1_n('{own_table_t}', '{own_column}', '{foreign_table_t}', '{foreign_column}');
-
-            """)
-
+        trigger_name_insert = HelperGetNames.get_not_null_rel_list_insert_trigger_name(
+            own_collection, own_column
+        )
+        cls.register_index_lookup(
+            foreign_table_t, foreign_column, f"trigger {trigger_name_insert}"
+        )
+        trigger_name_upd_del = (
+            HelperGetNames.get_not_null_rel_list_upd_del_trigger_name(
+                own_collection, own_column
+            )
+        )
+        function_definitions = ""
+        if OPTIONS.get("static_trigger_functions"):
+            condition = f"NOT EXISTS (SELECT 1 FROM {foreign_table_t} WHERE {foreign_column} = own_id_var)"
+            function_definition, function_call_insert = (
+                Helper.get_static_not_null_function(
+                    trigger_name_insert, own_collection, own_column, condition
+                )
+            )
+            function_definitions += function_definition
+            function_definition, function_call_upd_del = (
+                Helper.get_static_not_null_function(
+                    trigger_name_upd_del,
+                    own_collection,
+                    own_column,
+                    condition,
+                    f"OLD.{foreign_column}",
+                    own_table_t,
+                    foreign_collection,
+                    "OLD.id",
+                    foreign_column,
+                )
+            )
+            function_definitions += function_definition
+        else:
+            function_call_insert = function_call_upd_del = (
+                f"check_not_null_for_1_n('{own_table_t}', '{own_column}', '{foreign_table_t}', '{foreign_column}')"
+            )
+        return function_definitions + dedent(f"""
+            -- definition trigger not null for {own_collection}.{own_column} against {foreign_collection}.{foreign_column}
+            CREATE CONSTRAINT TRIGGER {trigger_name_insert} AFTER INSERT ON {own_table_t} INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION {function_call_insert};
+
+            CREATE CONSTRAINT TRIGGER {trigger_name_upd_del} AFTER UPDATE OF {foreign_column} OR DELETE ON {foreign_table_t} INITIALLY DEFERRED
+            FOR EACH ROW WHEN ({Helper.NOT_DELETING_MEETING}) EXECUTE FUNCTION {function_call_upd_del};
+
+            """)
+
     @classmethod
     def get_trigger_check_not_null_for_n_m(
         cls, own_table_field: TableFieldType, foreign_table_field: TableFieldType
@@ -962,13 +1996,44 @@ class GenerateCodeBlocks:
         trigger_name_delete = HelperGetNames.get_not_null_rel_list_delete_trigger_name(
             own_collection, own_column
         )
-        return dedent(f"""
+        cls.register_index_lookup(
+            intermediate_table_name,
+            intermediate_table_own_key,
+            f"trigger {trigger_name_insert}",
+        )
+        function_definitions = ""
+        if OPTIONS.get("static_trigger_functions"):
+            condition = f"NOT EXISTS (SELECT 1 FROM {intermediate_table_name} WHERE {intermediate_table_own_key} = own_id_var)"
+            function_definition, function_call_insert = (
+                Helper.get_static_not_null_function(
+                    trigger_name_insert, own_collection, own_column, condition
+                )
+            )
+            function_definitions += function_definition
+            function_definition, function_call_delete = (
+                Helper.get_static_not_null_function(
+                    trigger_name_delete,
+                    own_collection,
+                    own_column,
+                    condition,
+                    f"OLD.{intermediate_table_own_key}",
+                    own_table,
+                    foreign_collection,
+                    f"OLD.{intermediate_table_foreign_key}",
+                    foreign_column,
+                )
+            )
+            function_definitions += function_definition
+        else:
+            function_call_insert = f"check_not_null_for_n_m('{intermediate_table_name}', '{own_table}', '{own_column}', '{intermediate_table_own_key}')"
+            function_call_delete = f"check_not_null_for_n_m('{intermediate_table_name}', '{own_table}', '{own_column}', '{intermediate_table_own_key}', '{intermediate_table_foreign_key}', '{foreign_collection}', '{foreign_column}')"
+        return function_definitions + dedent(f"""
             -- definition trigger not null for {own_collection}.{own_column} against {foreign_collection}.{foreign_column} through {intermediate_table_name}
             CREATE CONSTRAINT TRIGGER {trigger_name_insert} AFTER INSERT ON {own_table} INITIALLY DEFERRED
-            FOR EACH ROW EXECUTE FUNCTION check_not_null_for_n_m('{intermediate_table_name}', '{own_table}', '{own_column}', '{intermediate_table_own_key}');
+            FOR EACH ROW EXECUTE FUNCTION {function_call_insert};
 
             CREATE CONSTRAINT TRIGGER {trigger_name_delete} AFTER DELETE ON {intermediate_table_name} INITIALLY DEFERRED
-            FOR EACH ROW EXECUTE FUNCTION check_not_null_for_n_m('{intermediate_table_name}', '{own_table}', '{own_column}', '{intermediate_table_own_key}', '{intermediate_table_foreign_key}', '{foreign_collection}', '{foreign_column}');
+            FOR EACH ROW WHEN ({Helper.NOT_DELETING_MEETING}) EXECUTE FUNCTION {function_call_delete};
 
             """)
 
@@ -981,10 +2046,19 @@ class GenerateCodeBlocks:
     ) -> str:
         base_column_name = column[:-1]
         trigger_name = HelperGetNames.get_unique_ids_trigger_name(view, column)
-        return dedent(f"""
+        function_definition = ""
+        if OPTIONS.get("static_trigger_functions"):
+            function_definition, function_call = Helper.get_static_trigger_function(
+                trigger_name,
+                Helper.STATIC_UNIQUE_IDS_PAIR_FUNCTION_TEMPLATE,
+                {"base_column_name": base_column_name},
+            )
+        else:
+            function_call = f"check_unique_ids_pair('{base_column_name}')"
+        return function_definition + dedent(f"""
             -- definition trigger unique ids pair for {view}.{column}
             CREATE TRIGGER {trigger_name} BEFORE INSERT OR UPDATE ON {table_name}
-            FOR EACH ROW EXECUTE FUNCTION check_unique_ids_pair('{base_column_name}');
+            FOR EACH ROW EXECUTE FUNCTION {function_call};
 
             """)
 
@@ -994,10 +2068,19 @@ class GenerateCodeBlocks:
             collection_name, fname
         )
         table_name = HelperGetNames.get_table_name(collection_name)
-        return dedent(f"""
+        function_definition = ""
+        if OPTIONS.get("static_trigger_functions"):
+            function_definition, function_call = Helper.get_static_trigger_function(
+                trigger_name,
+                Helper.STATIC_PREVENT_UPDATES_FUNCTION_TEMPLATE,
+                {"collection": collection_name, "constant_column": fname},
+            )
+        else:
+            function_call = f"prevent_updates('{collection_name}', '{fname}')"
+        return function_definition + dedent(f"""
             -- definition trigger prevent_updates for {collection_name}.{fname}
             CREATE TRIGGER {trigger_name} BEFORE UPDATE OF {fname} ON {table_name}
-            FOR EACH ROW EXECUTE FUNCTION prevent_updates('{collection_name}', '{fname}');
+            FOR EACH ROW EXECUTE FUNCTION {function_call};
             """)
 
     @classmethod
@@ -1049,7 +2132,16 @@ class GenerateCodeBlocks:
                 field_def = InternalHelper.get_models(collection, field)
                 field_name = field
             if field_def and not field_def.get("constant"):
-                on_update_fields.append(field_name)
+                on_update_fields.extend(
+                    cls.get_stored_columns(
+                        (
+                            field.table
+                            if isinstance(field, TableFieldType)
+                            else collection
+                        ),
+                        field_name,
+                    )
+                )
         return HelperGetNames.get_table_name(table_field.table), on_update_fields
 
     @classmethod
@@ -1065,11 +2157,26 @@ class GenerateCodeBlocks:
         own_table_field: TableFieldType,
         foreign_table_field: TableFieldType,
         state: FieldSqlErrorType,
-    ) -> str:
+    ) -> tuple[str, str]:
+        """
+        Returns the triggers checking the equal fields and the composite foreign keys
+        replacing them with the option composite_equal_fields.
+        """
         cls.equal_fields_state_check(state, own_table_field)
         equal_fields = cls.get_equal_fields(own_table_field, foreign_table_field)
         sql = ""
+        composite_fk_code = ""
         for equal_field in equal_fields:
+            if (
+                OPTIONS.get("composite_equal_fields")
+                and foreign_table_field.ref_column == "id"
+                and cls.is_table_column(own_table_field.table, equal_field, True)
+                and cls.is_table_column(foreign_table_field.table, equal_field)
+            ):
+                composite_fk_code += cls.get_composite_foreign_key(
+                    own_table_field, foreign_table_field, equal_field
+                )
+                continue
             own_table, own_on_update_fields = cls.get_equal_field_trigger_config(
                 own_table_field, [own_table_field, equal_field]
             )
@@ -1085,21 +2192,103 @@ class GenerateCodeBlocks:
                 raise Exception(
                     f"Cannot generate equal_fields triggers for {own_table_field.collectionfield} and {foreign_table_field.collectionfield}: Both have reference set."
                 )
-            own_trigger_name = HelperGetNames.get_equal_field_trigger_name(
-                equal_field, own_table, own_table_field.column
-            )
-            foreign_event_str = cls.get_event_string(foreign_on_update_fields)
-            foreign_trigger_name = HelperGetNames.get_equal_field_trigger_name(
-                equal_field, foreign_table, foreign_table_field.column
+            # a generic equal field is checked by its collection and id columns
+            for check_column in cls.get_stored_columns(
+                own_table_field.table, equal_field
+            ):
+                own_trigger_name = HelperGetNames.get_equal_field_trigger_name(
+                    check_column, own_table, own_table_field.column
+                )
+                foreign_event_str = cls.get_event_string(foreign_on_update_fields)
+                foreign_trigger_name = HelperGetNames.get_equal_field_trigger_name(
+                    check_column, foreign_table, foreign_table_field.column
+                )
+                function_definitions, own_function_call, foreign_function_call = (
+                    Helper.get_check_equals_function_calls(
+                        own_trigger_name,
+                        foreign_trigger_name,
+                        own_table_field.table,
+                        foreign_table_field.table,
+                        own_table_field.column,
+                        check_column,
+                    )
+                )
+                cls.register_index_lookup(
+                    own_table, own_table_field.column, f"trigger {foreign_trigger_name}"
+                )
+                sql += function_definitions + dedent(f"""
+                    CREATE CONSTRAINT TRIGGER {own_trigger_name} AFTER {own_event_str} ON {own_table} INITIALLY DEFERRED
+                    FOR EACH ROW EXECUTE FUNCTION {own_function_call};
+                    CREATE CONSTRAINT TRIGGER {foreign_trigger_name} AFTER {foreign_event_str} ON {foreign_table} INITIALLY DEFERRED
+                    FOR EACH ROW EXECUTE FUNCTION {foreign_function_call};
+
+                """)
+        return sql, composite_fk_code
+
+    @classmethod
+    def get_stored_columns(cls, collection: str, fname: str) -> list[str]:
+        """
+        Returns the columns storing the field. With typed_generic_relations these are the
+        collection and id columns for a generic relation.
+        """
+        fdata = InternalHelper.MODELS[collection]["fields"].get(fname, {})
+        if fdata.get("type") == "generic-relation":
+            return Helper.get_generic_stored_columns(fname)
+        return [fname]
+
+    @classmethod
+    def is_table_column(
+        cls, collection: str, field: str, required: bool = False
+    ) -> bool:
+        """
+        Returns True if the field is stored as a column of the collections table
+        and, if required is set, defined as required.
+        """
+        fdata = InternalHelper.MODELS[collection]["fields"].get(field)
+        if not fdata or fdata.get("calculated"):
+            return False
+        if fdata.get("sql"):
+            return cls.is_materialized(collection, field)
+        if required and not fdata.get("required"):
+            return False
+        type_ = fdata.get("type")
+        if type_ == "relation":
+            state, _, _, _ = InternalHelper.check_relation_definitions(
+                TableFieldType(collection, field, fdata),
+                [
+                    TableFieldType.get_definitions_from_foreign(
+                        fdata.get("to"), fdata.get("reference")
+                    )
+                ],
             )
-            sql += dedent(f"""
-                CREATE CONSTRAINT TRIGGER {own_trigger_name} AFTER {own_event_str} ON {own_table} INITIALLY DEFERRED
-                FOR EACH ROW EXECUTE FUNCTION check_equals('{own_table_field.table}', '{foreign_table_field.table}', '{own_table_field.column}', '{equal_field}', FALSE);
-                CREATE CONSTRAINT TRIGGER {foreign_trigger_name} AFTER {foreign_event_str} ON {foreign_table} INITIALLY DEFERRED
-                FOR EACH ROW EXECUTE FUNCTION check_equals('{own_table_field.table}', '{foreign_table_field.table}', '{own_table_field.column}', '{equal_field}', TRUE);
+            return state == FieldSqlErrorType.FIELD
+        return type_ not in (
+            "relation-list",
+            "generic-relation",
+            "generic-relation-list",
+        )
 
-            """)
-        return sql
+    @classmethod
+    def get_composite_foreign_key(
+        cls,
+        own_table_field: TableFieldType,
+        foreign_table_field: TableFieldType,
+        equal_field: str,
+    ) -> str:
+        own_table = HelperGetNames.get_table_name(own_table_field.table)
+        foreign_table = HelperGetNames.get_table_name(foreign_table_field.table)
+        code = ""
+        unique_name = HelperGetNames.get_composite_unique_constraint_name(
+            foreign_table, equal_field
+        )
+        if unique_name not in cls.composite_unique_constraints:
+            cls.composite_unique_constraints.add(unique_name)
+            code += f"ALTER TABLE {foreign_table} ADD CONSTRAINT {unique_name} UNIQUE (id, {equal_field});\n"
+        fk_name = HelperGetNames.get_composite_fk_constraint_name(
+            own_table, own_table_field.column, equal_field, foreign_table
+        )
+        code += f"ALTER TABLE {own_table} ADD CONSTRAINT {fk_name} FOREIGN KEY ({own_table_field.column}, {equal_field}) REFERENCES {foreign_table} (id, {equal_field}) INITIALLY DEFERRED;\n"
+        return code
 
     @classmethod
     def get_trigger_check_equal_fields_for_n_m(
@@ -1181,11 +2370,26 @@ class GenerateCodeBlocks:
                 foreign_trigger_name = HelperGetNames.get_equal_field_trigger_name(
                     equal_field, foreign_table, foreign_table_field.column
                 )
-                sql += dedent(f"""
+                function_definitions, own_function_call, foreign_function_call = (
+                    Helper.get_check_equals_function_calls(
+                        own_trigger_name,
+                        foreign_trigger_name,
+                        own_table_field.table,
+                        foreign_table_field.table,
+                        specified_relation_field,
+                        equal_field,
+                    )
+                )
+                cls.register_index_lookup(
+                    own_table,
+                    specified_relation_field,
+                    f"trigger {foreign_trigger_name}",
+                )
+                sql += function_definitions + dedent(f"""
                     CREATE CONSTRAINT TRIGGER {own_trigger_name} AFTER {own_event_str} ON {own_table} INITIALLY DEFERRED
-                    FOR EACH ROW EXECUTE FUNCTION check_equals('{own_table_field.table}', '{foreign_table_field.table}', '{specified_relation_field}', '{equal_field}', FALSE);
+                    FOR EACH ROW EXECUTE FUNCTION {own_function_call};
                     CREATE CONSTRAINT TRIGGER {foreign_trigger_name} AFTER {foreign_event_str} ON {foreign_table} INITIALLY DEFERRED
-                    FOR EACH ROW EXECUTE FUNCTION check_equals('{own_table_field.table}', '{foreign_table_field.table}', '{specified_relation_field}', '{equal_field}', TRUE);
+                    FOR EACH ROW EXECUTE FUNCTION {foreign_function_call};
 
                 """)
         return sql
@@ -1250,9 +2454,20 @@ class GenerateCodeBlocks:
         )
 
         if state == FieldSqlErrorType.FIELD:
-            text, error = cls.get_schema_simple_types(
-                table_name, fname, fdata, fdata["type"]
-            )
+            if OPTIONS.get("typed_generic_relations"):
+                text = cls.get_typed_generic_relation_columns(
+                    table_name,
+                    fname,
+                    fdata,
+                    [
+                        foreign_table_field.table
+                        for foreign_table_field in foreign_table_fields
+                    ],
+                )
+            else:
+                text, error = cls.get_schema_simple_types(
+                    table_name, fname, fdata, fdata["type"]
+                )
             initially_deferred = any(
                 ModelsHelper.is_fk_initially_deferred(
                     table_name, foreign_table_field.table
@@ -1277,13 +2492,11 @@ class GenerateCodeBlocks:
                         generic_plain_field_name,
                         state,
                     )
-                text[
-                    "create_trigger_notify"
-                ] += Helper.get_trigger_for_generic_relation(
-                    table_name,
+                text["log_related_arguments"] += Helper.get_log_related_arguments(
+                    foreign_table_field.table,
                     generic_plain_field_name,
                     foreign_table_field.column,
-                    foreign_table_field.table,
+                    own_table_field.ref_column,
                 )
                 text[
                     "alter_table_final"
@@ -1296,12 +2509,50 @@ class GenerateCodeBlocks:
                 )
             if equal_fields_text:
                 text["create_trigger_equal_fields_code"] = equal_fields_text
-            text["table"] += Helper.get_generic_field_constraint(
-                own_table_field.table, own_table_field.column, foreign_tables
-            )
+            # with typed_generic_relations the enum type of the collection column is the check
+            if not OPTIONS.get("typed_generic_relations"):
+                text["table"] += Helper.get_generic_field_constraint(
+                    own_table_field.table, own_table_field.column, foreign_tables
+                )
         text["final_info"] = final_info
         return text, error
 
+    @classmethod
+    def get_typed_generic_relation_columns(
+        cls,
+        table_name: str,
+        fname: str,
+        fdata: dict[str, Any],
+        foreign_tables: list[str],
+    ) -> SchemaZoneTexts:
+        """
+        Returns the columns of a generic relation with typed_generic_relations: the collection
+        as enum of the referenced collections and the id as integer. The fqid is only put
+        together in the view.
+        """
+        text = cast(SchemaZoneTexts, defaultdict(str))
+        collection_column, model_id_column = cls.get_stored_columns(table_name, fname)
+        enum_type = HelperGetNames.get_enum_name_for_column(table_name, fname)
+        InternalHelper.ENUMS[enum_type] = foreign_tables
+        for column, pg_type in (
+            (collection_column, enum_type),
+            (model_id_column, "integer"),
+        ):
+            subst, szt = Helper.get_initials(table_name, column, fdata["type"], fdata)
+            subst["type"] = pg_type
+            text.update(szt)
+            text["table"] += Helper.FIELD_TEMPLATE.substitute(subst)
+            if fdata.get("constant"):
+                text[
+                    "create_trigger_prevent_updates_code"
+                ] += cls.get_trigger_prevent_updates(table_name, column)
+        if not fdata.get("required"):
+            text["table"] += Helper.get_generic_pair_constraint(
+                table_name, fname, collection_column, model_id_column
+            )
+        text["view"] = f"{Helper.get_generic_fqid_expression(fname)} AS {fname},\n"
+        return text
+
     @classmethod
     def get_generic_relation_list_type(
         cls, table_name: str, fname: str, fdata: dict[str, Any], type_: str
@@ -1358,20 +2609,41 @@ class GenerateCodeBlocks:
                     text["create_trigger_equal_fields_code"] = equal_fields_text
 
             # add field to view definition of table_name
-            text["view"] = cls.get_sql_for_relation_n_1(
-                table_name,
-                fname,
-                own_table_field.ref_column,
-                gm_foreign_table,
-                f"{own_table_field.table}_{own_table_field.ref_column}",
-                own_table_field.intermediate_column,
-            )
+            if OPTIONS.get("materialize_relation_lists"):
+                text["relation_list_table"] = cls.get_materialized_relation_list(
+                    table_name,
+                    fname,
+                    gm_foreign_table,
+                    f"{own_table_field.table}_{own_table_field.ref_column}",
+                    own_table_field.intermediate_column,
+                    FIELD_TYPES[type_]["pg_type"],
+                )
+                text["view"] = Helper.get_relation_list_view_column(table_name, fname)
+            else:
+                text["view"] = cls.get_sql_for_relation_n_1(
+                    table_name,
+                    fname,
+                    own_table_field.ref_column,
+                    gm_foreign_table,
+                    f"{own_table_field.table}_{own_table_field.ref_column}",
+                    own_table_field.intermediate_column,
+                    generic=True,
+                )
 
         text["final_info"] = final_info
         return text, error
 
 
 class Helper:
+    # session state of the source meeting, the intermediate tables of these fields aren't cloned
+    CLONE_MEETING_SKIPPED_FIELDS = ("meeting/present_user_ids",)
+    # set by delete_meeting, the consistency and log triggers of the deleted rows are skipped.
+    # The setting is only a cheap check for all other writes, it has no effect without the
+    # row of the transaction in os_deleting_meeting_t.
+    NOT_DELETING_MEETING = (
+        "current_setting('os.deleting_meeting', true) IS DISTINCT FROM 'on'"
+        " OR NOT os_deleting_meeting()"
+    )
     FILE_TEMPLATE_HEADER = dedent("""
         -- schema_relational.sql for initial database setup OpenSlides
         -- Code generated. DO NOT EDIT.
@@ -1417,15 +2689,129 @@ class Helper:
         $sequences_trigger$
         LANGUAGE plpgsql;
 
+        -- Marks the transaction deleting a meeting, see delete_meeting().
+        CREATE UNLOGGED TABLE os_deleting_meeting_t (
+            xact_id xid8 PRIMARY KEY,
+            meeting_id integer NOT NULL
+        );
+
+        CREATE FUNCTION os_deleting_meeting() RETURNS boolean AS $os_deleting_meeting$
+        -- True while delete_meeting is running in the current transaction. Used by the WHEN
+        -- conditions of the triggers skipped for the deleted rows.
+            SELECT EXISTS (SELECT 1 FROM os_deleting_meeting_t WHERE xact_id = pg_current_xact_id_if_assigned());
+        $os_deleting_meeting$ LANGUAGE sql STABLE;
+
+        -- Range partitioned by day, see maintain_notify_log_partitions().
+        -- All entries of a transaction share its now() as timestamp, so adding it
+        -- to the unique constraint keeps one entry per operation, fqid and transaction.
         CREATE TABLE os_notify_log_t (
-            id integer PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id integer GENERATED ALWAYS AS IDENTITY,
             operation varchar(32),
             fqid varchar(256) NOT NULL,
             updated_fields varchar(63)[],
             xact_id xid8,
-            timestamp timestamptz,
-            CONSTRAINT unique_fqid_xact_id_operation UNIQUE (operation,fqid,xact_id)
-        );
+            timestamp timestamptz NOT NULL,
+            PRIMARY KEY (id, timestamp),
+            CONSTRAINT unique_fqid_xact_id_operation UNIQUE (operation,fqid,xact_id,timestamp)
+        ) PARTITION BY RANGE (timestamp);
+
+        CREATE TABLE os_notify_log_t_pdefault PARTITION OF os_notify_log_t DEFAULT;
+
+        CREATE INDEX os_notify_log_t_timestamp_brin ON os_notify_log_t USING brin (timestamp);
+
+        CREATE FUNCTION maintain_notify_log_partitions(
+            retention interval DEFAULT '7 days',
+            premake integer DEFAULT 3,
+            lock_wait interval DEFAULT '1s'
+        ) RETURNS void
+        -- the days of the partitions are UTC days, independent of the TimeZone of the session
+        SET TimeZone = 'UTC'
+        AS $maintain_notify_log_partitions$
+        -- Creates the daily partitions of os_notify_log_t up to premake days ahead and
+        -- detaches and drops the partitions ending before now() - retention. Meant to be
+        -- called periodically, e.g. daily by a cron job of the backend.
+        -- Rows written to the default partition, because the maintenance was not run
+        -- in time, are moved into the newly created partitions. Until then the retention
+        -- of these rows falls back to a DELETE row by row.
+        -- Detaching takes an ACCESS EXCLUSIVE lock on os_notify_log_t, which blocks all
+        -- writing transactions until the commit. DETACH PARTITION CONCURRENTLY isn't
+        -- possible with a default partition nor within a function. To not queue writers
+        -- behind a waiting lock, a partition is skipped, if the lock isn't granted within
+        -- lock_wait, and detached by the next call.
+        DECLARE
+            day date;
+            partition_name TEXT;
+            part RECORD;
+            old_lock_timeout TEXT := current_setting('lock_timeout');
+        BEGIN
+            FOR day IN
+                SELECT d::date FROM generate_series(
+                    date_trunc('day', now()), date_trunc('day', now()) + premake * interval '1 day', interval '1 day'
+                ) AS d
+            LOOP
+                partition_name := 'os_notify_log_t_p' || to_char(day, 'YYYYMMDD');
+                CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+                EXECUTE format('CREATE TABLE %I (LIKE os_notify_log_t INCLUDING DEFAULTS)', partition_name);
+                EXECUTE format(
+                    'WITH moved AS (
+                        DELETE FROM os_notify_log_t_pdefault WHERE timestamp >= %1$L AND timestamp < %2$L RETURNING *
+                    ) INSERT INTO %3$I SELECT * FROM moved',
+                    day, day + 1, partition_name
+                );
+                EXECUTE format(
+                    'ALTER TABLE os_notify_log_t ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, day, day + 1
+                );
+            END LOOP;
+
+            FOR part IN
+                SELECT c.relname
+                FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'os_notify_log_t'::regclass
+                    AND c.relname ~ '^os_notify_log_t_p[0-9]{8}$'
+                    AND to_date(substring(c.relname from '[0-9]{8}$'), 'YYYYMMDD') + 1 <= now() - retention
+            LOOP
+                BEGIN
+                    PERFORM set_config('lock_timeout', (extract(epoch FROM lock_wait) * 1000)::integer::text, true);
+                    EXECUTE format('ALTER TABLE os_notify_log_t DETACH PARTITION %I', part.relname);
+                    -- the detached table isn't part of os_notify_log_t anymore
+                    EXECUTE format('DROP TABLE %I', part.relname);
+                EXCEPTION WHEN lock_not_available THEN
+                    RAISE NOTICE 'maintain_notify_log_partitions: % not detached, os_notify_log_t is locked', part.relname;
+                END;
+            END LOOP;
+            PERFORM set_config('lock_timeout', old_lock_timeout, true);
+            DELETE FROM os_notify_log_t_pdefault WHERE timestamp < now() - retention;
+        END;
+        $maintain_notify_log_partitions$ LANGUAGE plpgsql;
+
+        DO $$ BEGIN PERFORM maintain_notify_log_partitions(); END $$;
+
+        CREATE INDEX os_notify_log_t_xact_id_idx ON os_notify_log_t (xact_id);
+
+        CREATE FUNCTION os_changes_since(last_xact_id xid8, max_transactions integer DEFAULT 100)
+        RETURNS TABLE (xact_id xid8, xact_timestamp timestamptz, changes jsonb) AS $os_changes_since$
+        -- Returns the logged changes of up to max_transactions transactions following last_xact_id,
+        -- one row per transaction in ascending xact_id order. Pass NULL to start with the oldest entry
+        -- and the xact_id of the last returned row to fetch the next batch.
+        -- The log id is no safe position: ids are drawn at insert time, so a transaction still running
+        -- can commit entries with lower ids than already returned ones. Only transactions older than the
+        -- xmin of the current snapshot are returned, all of them are finished and no transaction
+        -- committing later can get a lower xact_id. A consumer passing the last returned xact_id never
+        -- misses nor repeats a transaction.
+            SELECT l.xact_id, min(l.timestamp),
+                jsonb_agg(jsonb_build_object('operation', l.operation, 'fqid', l.fqid, 'fields', l.updated_fields) ORDER BY l.id)
+            FROM os_notify_log_t l
+            WHERE l.xact_id IN (
+                SELECT DISTINCT t.xact_id FROM os_notify_log_t t
+                WHERE (last_xact_id IS NULL OR t.xact_id > last_xact_id)
+                    AND t.xact_id < pg_snapshot_xmin(pg_current_snapshot())
+                ORDER BY t.xact_id
+                LIMIT max_transactions
+            )
+            GROUP BY l.xact_id
+            ORDER BY l.xact_id;
+        $os_changes_since$ LANGUAGE sql STABLE;
 
         CREATE TABLE version (
             migration_index INTEGER PRIMARY KEY,
@@ -1435,6 +2821,150 @@ class Helper:
 
         -- Log functions
 
+        CREATE FUNCTION log_modified_models() RETURNS trigger AS $log_modified_trigger$
+        -- Statement level trigger reading the transition tables old_table and new_table.
+        -- All log entries of the statement are written by one INSERT into os_notify_log_t.
+        -- Parameters:
+        -- 0. collection of the triggered table, empty for intermediate tables
+        -- followed by groups of 4 parameters for every relation logged on the related models:
+        -- 1. foreign collection
+        -- 2. column of the triggered table referencing the foreign collection
+        -- 3. field of the foreign collection to be logged
+        -- 4. column of the triggered table holding the value of this field
+        DECLARE
+            collection TEXT := TG_ARGV[0];
+            fk_column TEXT;
+            value_column TEXT;
+            old_pairs TEXT;
+            new_pairs TEXT;
+            pairs TEXT;
+            entries TEXT[] := '{}';
+            i INTEGER := 1;
+        BEGIN
+            IF collection <> '' THEN
+                IF (TG_OP = 'UPDATE') THEN
+                    entries := entries || format(
+                        'SELECT ''update'' AS operation, %L || ''/'' || n.id AS fqid,
+                            akeys((hstore(n) - hstore(o)) || (hstore(o) - hstore(n)))::varchar(63)[] AS fields
+                        FROM new_table n JOIN old_table o ON o.id = n.id',
+                        collection
+                    );
+                ELSE
+                    entries := entries || format(
+                        'SELECT %L AS operation, %L || ''/'' || id AS fqid, NULL::varchar(63)[] AS fields FROM %I',
+                        LOWER(TG_OP),
+                        collection,
+                        CASE TG_OP WHEN 'INSERT' THEN 'new_table' ELSE 'old_table' END
+                    );
+                END IF;
+            END IF;
+
+            WHILE i < TG_NARGS LOOP
+                fk_column := TG_ARGV[i+1];
+                value_column := TG_ARGV[i+3];
+                old_pairs := format('SELECT %I AS foreign_id, %I AS value FROM old_table', fk_column, value_column);
+                new_pairs := format('SELECT %I AS foreign_id, %I AS value FROM new_table', fk_column, value_column);
+                IF (TG_OP = 'INSERT') THEN
+                    pairs := new_pairs;
+                ELSIF (TG_OP = 'DELETE') THEN
+                    pairs := old_pairs;
+                ELSE
+                    -- only references missing in one of the transition tables changed
+                    pairs := format('(%1$s EXCEPT %2$s) UNION ALL (%2$s EXCEPT %1$s)', old_pairs, new_pairs);
+                END IF;
+                entries := entries || format(
+                    'SELECT ''update'' AS operation, %L || ''/'' || foreign_id AS fqid, ARRAY[%L]::varchar(63)[] AS fields
+                    FROM (%s) AS pairs WHERE foreign_id IS NOT NULL',
+                    TG_ARGV[i],
+                    TG_ARGV[i+2],
+                    pairs
+                );
+                i := i + 4;
+            END LOOP;
+
+            -- The transition tables are only visible to statements executed by the trigger function itself.
+            EXECUTE log_field_changes_statement(array_to_string(entries, ' UNION ALL '));
+
+            RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+        END;
+        $log_modified_trigger$ LANGUAGE plpgsql;
+
+        CREATE FUNCTION os_first_call_in_transaction(flag TEXT) RETURNS boolean AS $first_call$
+        -- Returns true only for the first call with this flag in the current transaction.
+        BEGIN
+            IF current_setting(flag, true) = 'on' THEN
+                RETURN FALSE;
+            END IF;
+            PERFORM set_config(flag, 'on', true);
+            RETURN TRUE;
+        END;
+        $first_call$ LANGUAGE plpgsql;
+
+        CREATE FUNCTION notify_transaction_end() RETURNS trigger AS $notify_trigger$
+        -- Queued only once per transaction by the WHEN condition of the notify_transaction_end trigger.
+        -- The transaction id and the changes logged so far are send via os_notify:
+        -- {"xactId":1,"changes":[{"fqid":"speaker/1","fields":null,"operation":"insert"}]}
+        -- Changes exceeding one payload are split into chunks, which additionally carry "chunk" and "chunks".
+        -- If more than max_chunks are needed, only {"xactId":1} is send and the changes must be read
+        -- from os_notify_log_t.
+        DECLARE
+            max_payload CONSTANT INTEGER := 7900;  -- pg_notify payloads must be shorter than 8000 bytes
+            max_chunks CONSTANT INTEGER := 8;
+            header TEXT := '{"xactId":' || pg_current_xact_id();
+            change TEXT;
+            chunk TEXT := '';
+            chunks TEXT[] := '{}';
+            i INTEGER;
+        BEGIN
+            -- Changes made after this call, e.g. after SET CONSTRAINTS ALL IMMEDIATE, queue another notify.
+            PERFORM set_config('os.notify_queued', 'off', true);
+            FOR change IN
+                SELECT jsonb_build_object('operation', operation, 'fqid', fqid, 'fields', updated_fields)::text
+                FROM os_notify_log_t
+                WHERE xact_id = pg_current_xact_id() AND timestamp = now()
+                ORDER BY id
+            LOOP
+                -- 64 bytes reserved for header and chunk numbers
+                IF chunk <> '' AND octet_length(chunk) + octet_length(change) + 64 > max_payload THEN
+                    chunks := chunks || chunk;
+                    chunk := '';
+                END IF;
+                IF octet_length(change) + 64 > max_payload OR cardinality(chunks) >= max_chunks THEN
+                    chunks := NULL;
+                    EXIT;
+                END IF;
+                chunk := chunk || CASE WHEN chunk = '' THEN '' ELSE ',' END || change;
+            END LOOP;
+
+            IF chunks IS NULL THEN
+                PERFORM pg_notify('os_notify', header || '}');
+            ELSIF cardinality(chunks) = 0 THEN
+                PERFORM pg_notify('os_notify', header || ',"changes":[' || chunk || ']}');
+            ELSE
+                chunks := chunks || chunk;
+                FOR i IN 1..cardinality(chunks) LOOP
+                    PERFORM pg_notify(
+                        'os_notify',
+                        header || ',"chunk":' || i || ',"chunks":' || cardinality(chunks)
+                        || ',"changes":[' || chunks[i] || ']}'
+                    );
+                END LOOP;
+            END IF;
+
+            RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+        END;
+        $notify_trigger$ LANGUAGE plpgsql;
+
+        -- Fired by the log entries themselves, so the changes of all statements are logged when
+        -- the deferred trigger runs, also with staged log entries flushed at commit.
+        CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE ON os_notify_log_t
+        DEFERRABLE INITIALLY DEFERRED FOR EACH ROW
+        WHEN (os_first_call_in_transaction('os.notify_queued'))
+        EXECUTE FUNCTION notify_transaction_end();
+    """)
+    FILE_TEMPLATE_LOG_WRITE = dedent("""
+        -- Log write procedures
+
         CREATE OR REPLACE PROCEDURE log_field_change(
             operation_var TEXT,
             fqid_var TEXT,
@@ -1444,7 +2974,7 @@ class Helper:
         BEGIN
             INSERT INTO os_notify_log_t (operation, fqid, xact_id, timestamp, updated_fields)
             VALUES (operation_var, fqid_var, pg_current_xact_id(), now(), fields)
-            ON CONFLICT (operation, fqid, xact_id) DO UPDATE SET updated_fields = (
+            ON CONFLICT (operation, fqid, xact_id, timestamp) DO UPDATE SET updated_fields = (
                 SELECT ARRAY(
                     SELECT DISTINCT e
                     FROM unnest(COALESCE(os_notify_log_t.updated_fields, '{}'::varchar[])) AS e
@@ -1456,120 +2986,290 @@ class Helper:
         END;
         $log_field_change$ LANGUAGE plpgsql;
 
-        CREATE FUNCTION log_modified_models() RETURNS trigger AS $log_modified_trigger$
-        DECLARE
-            escaped_table_name varchar;
-            operation_var TEXT;
-            fqid_var TEXT;
-            updated_fields_var varchar(63)[];
-            old_hstore hstore;
-            new_hstore hstore;
+        CREATE OR REPLACE FUNCTION log_field_changes_statement(
+            entries_query TEXT
+        ) RETURNS TEXT AS
+        $log_field_changes_statement$
+        -- Returns the statement writing the entries of entries_query. The query returns the columns
+        -- operation, fqid and fields, where fields is NULL for inserts and deletes.
+        -- Entries are merged per operation and fqid before the upsert.
         BEGIN
-            escaped_table_name := TG_ARGV[0];
-            operation_var := LOWER(TG_OP);
+            RETURN format(
+                'INSERT INTO os_notify_log_t (operation, fqid, xact_id, timestamp, updated_fields)
+                SELECT operation, fqid, pg_current_xact_id(), now(),
+                    CASE WHEN bool_or(fields IS NOT NULL) THEN
+                        COALESCE(array_agg(DISTINCT field) FILTER (WHERE field IS NOT NULL), ''{}'')
+                    END
+                FROM (%s) AS entries LEFT JOIN LATERAL unnest(fields) AS field ON TRUE
+                GROUP BY operation, fqid
+                ON CONFLICT (operation, fqid, xact_id, timestamp) DO UPDATE SET updated_fields = (
+                    SELECT ARRAY(
+                        SELECT DISTINCT e
+                        FROM unnest(COALESCE(os_notify_log_t.updated_fields, ''{}''::varchar[])) AS e
+                        UNION
+                        SELECT DISTINCT e
+                        FROM unnest(COALESCE(EXCLUDED.updated_fields, ''{}''::varchar[])) AS e
+                    )
+                )',
+                entries_query
+            );
+        END;
+        $log_field_changes_statement$ LANGUAGE plpgsql;
 
-            -- Determine fqid (use OLD for deletes)
-            fqid_var := escaped_table_name || '/' || NEW.id;
-            IF (TG_OP = 'DELETE') THEN
-                fqid_var := escaped_table_name || '/' || OLD.id;
-            END IF;
+    """)
+    FILE_TEMPLATE_LOG_WRITE_STAGED = dedent("""
+        -- Log write procedures staging the changes of a transaction
 
-            updated_fields_var := NULL;
-            IF (TG_OP = 'UPDATE') THEN
-                old_hstore := hstore(OLD);
-                new_hstore := hstore(NEW);
-                updated_fields_var := akeys((new_hstore - old_hstore) || (old_hstore - new_hstore));
-            END IF;
+        -- No index, the entries of a transaction are merged once by flush_notify_log().
+        CREATE UNLOGGED TABLE os_notify_log_staging_t (
+            xact_id xid8 NOT NULL,
+            operation varchar(32),
+            fqid varchar(256) NOT NULL,
+            updated_fields varchar(63)[]
+        );
 
-            CALL log_field_change(operation_var, fqid_var, updated_fields_var);
+        CREATE OR REPLACE PROCEDURE log_field_change(
+            operation_var TEXT,
+            fqid_var TEXT,
+            fields TEXT[]
+        ) AS
+        $log_field_change$
+        BEGIN
+            INSERT INTO os_notify_log_staging_t (xact_id, operation, fqid, updated_fields)
+            VALUES (pg_current_xact_id(), operation_var, fqid_var, fields);
+        END;
+        $log_field_change$ LANGUAGE plpgsql;
 
-            RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+        CREATE OR REPLACE FUNCTION log_field_changes_statement(
+            entries_query TEXT
+        ) RETURNS TEXT AS
+        $log_field_changes_statement$
+        -- Returns the statement writing the entries of entries_query. The query returns the columns
+        -- operation, fqid and fields, where fields is NULL for inserts and deletes.
+        BEGIN
+            RETURN format(
+                'INSERT INTO os_notify_log_staging_t (xact_id, operation, fqid, updated_fields)
+                SELECT pg_current_xact_id(), operation, fqid, fields FROM (%s) AS entries',
+                entries_query
+            );
         END;
-        $log_modified_trigger$ LANGUAGE plpgsql;
+        $log_field_changes_statement$ LANGUAGE plpgsql;
 
-        CREATE FUNCTION notify_transaction_end() RETURNS trigger AS $notify_trigger$
-        DECLARE
-            payload TEXT;
-            body_content_text TEXT;
+        CREATE FUNCTION flush_notify_log() RETURNS trigger AS $flush_notify_log$
         BEGIN
-            -- Running the trigger for the first time in a transaction creates the table and after committing the transaction the table is dropped.
-            -- Every next run of the trigger in this transaction raises a notice that the table exists. Setting the log_min_messages to notice increases the noise because of such messages.
-            CREATE LOCAL TEMPORARY TABLE
-            IF NOT EXISTS tbl_notify_counter_tx_once (
-                "id" integer NOT NULL PRIMARY KEY GENERATED ALWAYS AS IDENTITY
-            ) ON COMMIT DROP;
+            -- Entries staged after this flush, e.g. by other deferred triggers, queue the next one.
+            PERFORM set_config('os.notify_log_flush_queued', 'off', true);
+            WITH staged AS (
+                DELETE FROM os_notify_log_staging_t
+                WHERE xact_id = pg_current_xact_id()
+                RETURNING operation, fqid, updated_fields
+            )
+            INSERT INTO os_notify_log_t (operation, fqid, xact_id, timestamp, updated_fields)
+            SELECT operation, fqid, pg_current_xact_id(), now(),
+                CASE WHEN bool_or(updated_fields IS NOT NULL) THEN
+                    COALESCE(array_agg(DISTINCT field) FILTER (WHERE field IS NOT NULL), '{}')
+                END
+            FROM staged LEFT JOIN LATERAL unnest(updated_fields) AS field ON TRUE
+            GROUP BY operation, fqid
+            ON CONFLICT (operation, fqid, xact_id, timestamp) DO UPDATE SET updated_fields = (
+                SELECT ARRAY(
+                    SELECT DISTINCT e
+                    FROM unnest(COALESCE(os_notify_log_t.updated_fields, '{}'::varchar[])) AS e
+                    UNION
+                    SELECT DISTINCT e
+                    FROM unnest(COALESCE(EXCLUDED.updated_fields, '{}'::varchar[])) AS e
+                )
+            );
+            RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+        END;
+        $flush_notify_log$ LANGUAGE plpgsql;
 
-            -- If running for the first time, the transaction id is send via os_notify.
-            IF NOT EXISTS (SELECT * FROM tbl_notify_counter_tx_once) THEN
-                INSERT INTO tbl_notify_counter_tx_once DEFAULT VALUES;
-                payload := '{"xactId":' ||
-                    pg_current_xact_id() ||
-                    '}';
-                PERFORM pg_notify('os_notify', payload);
-            END IF;
+        -- The WHEN condition of a constraint trigger is evaluated immediately, so only the
+        -- first staged row of a transaction queues the deferred flush.
+        CREATE CONSTRAINT TRIGGER tr_flush_notify_log AFTER INSERT ON os_notify_log_staging_t
+        DEFERRABLE INITIALLY DEFERRED FOR EACH ROW
+        WHEN (os_first_call_in_transaction('os.notify_log_flush_queued'))
+        EXECUTE FUNCTION flush_notify_log();
 
-            RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+    """)
+    FILE_TEMPLATE_SEQUENCE_COUNTERS = dedent("""
+        -- Partitioned sequences kept in one counter table
+
+        CREATE TABLE os_sequence_counter_t (
+            table_name varchar(63),
+            column_name varchar(63),
+            scope_id integer,
+            last_value integer NOT NULL,
+            PRIMARY KEY (table_name, column_name, scope_id)
+        );
+
+        CREATE FUNCTION reserve_sequence_numbers(
+            table_name_var TEXT,
+            column_name_var TEXT,
+            scope_id_var INTEGER,
+            amount INTEGER,
+            min_value INTEGER DEFAULT 0
+        ) RETURNS INTEGER AS $reserve_sequence_numbers$
+        -- Reserves the next amount numbers of the sequence given by table, column and scope
+        -- and returns the last of them, the first one is the result - amount + 1.
+        -- The counter is raised to min_value, if that is bigger.
+        -- A bulk insert reserves its numbers with one call, e.g.
+        -- SELECT reserve_sequence_numbers('motion_t', 'sequential_number', 1, 100);
+        DECLARE
+            last_value_var INTEGER;
+        BEGIN
+            INSERT INTO os_sequence_counter_t AS c (table_name, column_name, scope_id, last_value)
+            VALUES (table_name_var, column_name_var, scope_id_var, GREATEST(amount, min_value))
+            ON CONFLICT (table_name, column_name, scope_id)
+            DO UPDATE SET last_value = GREATEST(c.last_value + amount, min_value)
+            RETURNING c.last_value INTO last_value_var;
+            RETURN last_value_var;
         END;
-        $notify_trigger$ LANGUAGE plpgsql;
+        $reserve_sequence_numbers$ LANGUAGE plpgsql;
 
-        CREATE OR REPLACE FUNCTION log_modified_related_models()
-        RETURNS trigger AS $log_modified_related_trigger$
+        CREATE FUNCTION generate_sequence_from_counter()
+        RETURNS trigger
+        AS $sequences_trigger$
+        -- Writes the next number of the counter given by depend_field of NEW to actual_column.
+        -- In case a number is given in actual_column of the NEW record that is used
+        -- and the counter increased if necessary.
+        -- Usage with 3 parameters IN TRIGGER DEFINITION:
+        -- table_name: table this is treated for
+        -- actual_column: column that will be filled with the actual value
+        -- depend_field: field that differentiates the sequences. usually meeting_id
         DECLARE
-            fqid_var TEXT;
-            ref_column TEXT;
-            fk_field TEXT;
-            foreign_table TEXT;
-            foreign_id TEXT;
-            i INTEGER := 0;
+            table_name TEXT := TG_ARGV[0];
+            actual_column TEXT := TG_ARGV[1];
+            depend_field TEXT := TG_ARGV[2];
+            new_hstore hstore := hstore(NEW);
+            sequence_value INTEGER;
         BEGIN
+            sequence_value := new_hstore -> actual_column;
+            IF sequence_value IS NULL THEN
+                sequence_value := reserve_sequence_numbers(table_name, actual_column, (new_hstore -> depend_field)::integer, 1);
+                RETURN populate_record(NEW, format('%s=>%s',actual_column, sequence_value)::hstore);
+            END IF;
+            PERFORM reserve_sequence_numbers(table_name, actual_column, (new_hstore -> depend_field)::integer, 0, sequence_value);
+            RETURN NEW;
+        END;
+        $sequences_trigger$
+        LANGUAGE plpgsql;
+    """)
+    FILE_TEMPLATE_LOGICAL_REPLICATION = dedent("""
+        -- Logical replication
 
-            WHILE i < TG_NARGS LOOP
-                foreign_table := TG_ARGV[i];
-                ref_column := TG_ARGV[i+1];
-                fk_field := TG_ARGV[i+2];
+        -- The tables are added with their log arguments, see Helper.get_replication_definition.
+        -- os_notify_log_t still receives the entries of the log_triggers defined in the models.
+        CREATE PUBLICATION os_changes FOR TABLE os_notify_log_t
+        WITH (publish = 'insert, update, delete', publish_via_partition_root = true);
 
-                IF (TG_OP = 'DELETE') THEN
-                    EXECUTE format('SELECT ($1).%I', ref_column) INTO foreign_id USING OLD;
-                ELSE
-                    EXECUTE format('SELECT ($1).%I', ref_column) INTO foreign_id USING NEW;
-                END IF;
+        -- Since PostgreSQL 18 a full replica identity must not contain unpublished generated columns.
+        -- Before, generated columns can't be published and are calculated by the decoder.
+        DO $$
+        BEGIN
+            IF current_setting('server_version_num')::integer >= 180000 THEN
+                ALTER PUBLICATION os_changes SET (publish_generated_columns = stored);
+            END IF;
+        END $$;
 
-                IF foreign_id IS NOT NULL THEN
-                    fqid_var := foreign_table || '/' || foreign_id;
-                    CALL log_field_change('update', fqid_var, ARRAY[fk_field]);
-                END IF;
+        -- The arguments log_modified_models would get as trigger on table_name:
+        -- collection followed by groups of foreign collection, fk column, foreign field, value column.
+        CREATE TABLE os_log_replication_t (
+            table_name varchar(63) PRIMARY KEY,
+            log_arguments varchar[] NOT NULL
+        );
 
-                --when update there must be a notification for the old foreign_fqid
-                IF (TG_OP = 'UPDATE') THEN
-                    EXECUTE format('SELECT ($1).%I', ref_column) INTO foreign_id USING OLD;
-                    IF foreign_id IS NOT NULL THEN
-                        fqid_var := foreign_table || '/' || foreign_id;
-                        CALL log_field_change('update', fqid_var, ARRAY[fk_field]);
-                    END IF;
-                END IF;
+        CREATE FUNCTION notify_replicated_transaction() RETURNS trigger AS $notify_replicated_transaction$
+        -- The changes of the published tables aren't written to os_notify_log_t, so
+        -- notify_transaction_end isn't fired by them. The consumers of os_notify are woken
+        -- up with {"xactId":1} as if the changes needed too many chunks and read the
+        -- changes from the replication slot. PostgreSQL sends equal payloads of a
+        -- transaction only once.
+        BEGIN
+            PERFORM pg_notify('os_notify', '{"xactId":' || pg_current_xact_id() || '}');
+            RETURN NULL;
+        END;
+        $notify_replicated_transaction$ LANGUAGE plpgsql;
 
-                i := i + 3;
+        CREATE PROCEDURE set_replica_identity_full(table_name regclass) AS $set_replica_identity_full$
+        -- Old rows are needed to find the changed fields and references. The replica identity
+        -- is not inherited, so it is set on all partitions of a partitioned table, too.
+        DECLARE
+            part regclass;
+        BEGIN
+            FOR part IN SELECT table_name UNION SELECT relid FROM pg_partition_tree(table_name) LOOP
+                EXECUTE format('ALTER TABLE %s REPLICA IDENTITY FULL', part);
             END LOOP;
+        END;
+        $set_replica_identity_full$ LANGUAGE plpgsql;
+    """)
+    FILE_TEMPLATE_LIST_PARTITIONS = dedent("""
+        -- List partitions
 
-            RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+        CREATE FUNCTION create_list_partition(table_name TEXT, partition_value INTEGER)
+        RETURNS void AS $create_list_partition$
+        -- Creates the partition for partition_value of a table with partition_by method list,
+        -- e.g. when a meeting is created. Fails, if the default partition contains rows with this value.
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES IN (%L)',
+                table_name || '_p' || partition_value,
+                table_name,
+                partition_value
+            );
+            -- keeps the replica identity of published tables, see --logical-replication
+            IF (SELECT relreplident FROM pg_class WHERE oid = table_name::regclass) = 'f' THEN
+                EXECUTE format('ALTER TABLE %I REPLICA IDENTITY FULL', table_name || '_p' || partition_value);
+            END IF;
+            -- keeps the storage parameters of the default partition, see storage in the collection yml
+            IF (SELECT reloptions FROM pg_class WHERE oid = (table_name || '_pdefault')::regclass) IS NOT NULL THEN
+                EXECUTE format(
+                    'ALTER TABLE %I SET (%s)',
+                    table_name || '_p' || partition_value,
+                    (SELECT array_to_string(reloptions, ', ') FROM pg_class WHERE oid = (table_name || '_pdefault')::regclass)
+                );
+            END IF;
         END;
-        $log_modified_related_trigger$ LANGUAGE plpgsql;
+        $create_list_partition$ LANGUAGE plpgsql;
     """)
-    FILE_TEMPLATE_CONSTANT_TRIGGERS = dedent("""
-        -- Validation triggers
+    FILE_TEMPLATE_STORAGE = dedent("""
+        -- Storage
 
-        CREATE OR REPLACE FUNCTION is_timezone( tz TEXT ) RETURNS BOOLEAN as $$
-        DECLARE
-            is_valid BOOLEAN;
+        CREATE PROCEDURE set_column_compression(table_name regclass, column_name TEXT, compression_method TEXT)
+        AS $set_column_compression$
+        -- Sets the compression method of a column, see storage in the collection yml.
+        -- Keeps the default compression, if the server is built without the method, e.g. lz4.
         BEGIN
-            IF tz IS NULL THEN
-                RETURN TRUE;
+            IF compression_method <> 'default' AND compression_method <> ALL (
+                SELECT unnest(enumvals) FROM pg_settings WHERE name = 'default_toast_compression'
+            ) THEN
+                RAISE NOTICE 'Compression method % is not supported by the server, %.% keeps the default compression',
+                    compression_method, table_name, column_name;
+                RETURN;
             END IF;
+            EXECUTE format('ALTER TABLE %s ALTER COLUMN %I SET COMPRESSION %s', table_name, column_name, compression_method);
+        END;
+        $set_column_compression$ LANGUAGE plpgsql;
+    """)
+    FILE_TEMPLATE_CONSTANT_TRIGGERS = dedent("""
+        -- Validation triggers
 
-            SELECT EXISTS (SELECT 1 FROM pg_timezone_names WHERE name=tz) INTO is_valid;
-            RETURN is_valid;
+        CREATE PROCEDURE create_is_timezone_function() AS $create_is_timezone_function$
+        -- Creates is_timezone(tz) with the names of pg_timezone_names as array literal, so the
+        -- check constraints don't read the time zone database for every row.
+        -- Call it again after an update of the time zone database of the server.
+        BEGIN
+            EXECUTE format(
+                'CREATE OR REPLACE FUNCTION is_timezone( tz TEXT ) RETURNS BOOLEAN AS %1$L LANGUAGE sql IMMUTABLE',
+                format(
+                    'SELECT tz IS NULL OR tz = ANY (%L::text[])',
+                    (SELECT array_agg(name ORDER BY name) FROM pg_timezone_names)
+                )
+            );
         END;
-        $$ language plpgsql STABLE;
+        $create_is_timezone_function$ LANGUAGE plpgsql;
+
+        CALL create_is_timezone_function();
 
         CREATE FUNCTION check_unique_ids_pair()
         RETURNS trigger
@@ -1891,6 +3591,138 @@ class Helper:
         $check_equals_meeting_id_for_meeting$ LANGUAGE plpgsql;
 
         """)
+    FILE_TEMPLATE_RELATION_LISTS = dedent("""
+        -- Relation list functions
+
+        CREATE FUNCTION maintain_relation_lists()
+        RETURNS trigger AS $maintain_relation_lists_trigger$
+        -- Statement level trigger keeping the materialized relation lists up to date.
+        -- The changed pairs of owner id and list value are read from the transition
+        -- tables old_table and new_table and merged into the relation list tables.
+        -- Expects groups of 4 parameters:
+        -- 0. relation_list_table – table holding the materialized relation list
+        -- 1. list_column – column of the relation list in `relation_list_table`
+        -- 2. fk_column – column in the triggered table referencing the list owner
+        -- 3. value_column – column in the triggered table holding the list value
+        DECLARE
+            relation_list_table TEXT;
+            list_column TEXT;
+            fk_column TEXT;
+            value_column TEXT;
+            old_pairs TEXT;
+            new_pairs TEXT;
+            removed_pairs TEXT;
+            added_pairs TEXT;
+            i INTEGER := 0;
+        BEGIN
+            WHILE i < TG_NARGS LOOP
+                relation_list_table := TG_ARGV[i];
+                list_column := TG_ARGV[i+1];
+                fk_column := TG_ARGV[i+2];
+                value_column := TG_ARGV[i+3];
+
+                old_pairs := format('SELECT %1$I AS owner_id, %2$I AS value FROM old_table WHERE %1$I IS NOT NULL', fk_column, value_column);
+                new_pairs := format('SELECT %1$I AS owner_id, %2$I AS value FROM new_table WHERE %1$I IS NOT NULL', fk_column, value_column);
+                removed_pairs := old_pairs;
+                added_pairs := new_pairs;
+                IF (TG_OP = 'UPDATE') THEN
+                    -- pairs found in both transition tables are left untouched
+                    removed_pairs := old_pairs || ' EXCEPT ' || new_pairs;
+                    added_pairs := new_pairs || ' EXCEPT ' || old_pairs;
+                END IF;
+
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    EXECUTE format(
+                        'UPDATE %1$I AS rl SET %2$I = (
+                            SELECT array_agg(e ORDER BY e) FROM unnest(rl.%2$I) AS e WHERE e <> ALL (changes.removed_values)
+                        )
+                        FROM (SELECT owner_id, array_agg(value) AS removed_values FROM (%3$s) AS removed GROUP BY owner_id) AS changes
+                        WHERE rl.id = changes.owner_id',
+                        relation_list_table,
+                        list_column,
+                        removed_pairs
+                    );
+                END IF;
+
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    EXECUTE format(
+                        'INSERT INTO %1$I AS rl (id, %2$I)
+                        SELECT owner_id, array_agg(value ORDER BY value) FROM (%3$s) AS added GROUP BY owner_id
+                        ON CONFLICT (id) DO UPDATE SET %2$I = (
+                            SELECT array_agg(DISTINCT e ORDER BY e) FROM unnest(rl.%2$I || EXCLUDED.%2$I) AS e
+                        )',
+                        relation_list_table,
+                        list_column,
+                        added_pairs
+                    );
+                END IF;
+
+                i := i + 4;
+            END LOOP;
+
+            RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+        END;
+        $maintain_relation_lists_trigger$ LANGUAGE plpgsql;
+        """)
+    FILE_TEMPLATE_MATERIALIZED_FIELDS = dedent("""
+        -- Materialized field functions
+
+        CREATE FUNCTION maintain_materialized_fields()
+        RETURNS trigger AS $maintain_materialized_fields_trigger$
+        -- Statement level trigger recalculating the materialized sql fields of the models
+        -- affected by the rows changed in the transition tables old_table and new_table.
+        -- Expects groups of 3 parameters:
+        -- 0. function – generated function recalculating the field for an array of ids
+        -- 1. id_sql – expression selecting the id of the affected model from a changed row r
+        -- 2. update_condition – only updated rows with o (old) and n (new) fulfilling it
+        --    are considered, e.g. for the on_columns of a log_trigger, may be empty
+        DECLARE
+            rows_sql TEXT;
+            ids INTEGER[];
+            i INTEGER := 0;
+        BEGIN
+            WHILE i < TG_NARGS LOOP
+                IF (TG_OP = 'INSERT') THEN
+                    rows_sql := 'SELECT * FROM new_table';
+                ELSIF (TG_OP = 'DELETE') THEN
+                    rows_sql := 'SELECT * FROM old_table';
+                ELSIF (TG_ARGV[i+2] = '') THEN
+                    rows_sql := 'SELECT * FROM old_table UNION ALL SELECT * FROM new_table';
+                ELSE
+                    rows_sql := format(
+                        'SELECT o.* FROM old_table o JOIN new_table n ON n.id = o.id WHERE %1$s
+                        UNION ALL SELECT n.* FROM old_table o JOIN new_table n ON n.id = o.id WHERE %1$s',
+                        TG_ARGV[i+2]
+                    );
+                END IF;
+                EXECUTE format(
+                    'SELECT array_agg(DISTINCT id) FROM (SELECT %s AS id FROM (%s) AS r) AS affected WHERE id IS NOT NULL',
+                    TG_ARGV[i+1],
+                    rows_sql
+                ) INTO ids;
+                -- no recursion for updates of the materialized column itself
+                IF ids IS NOT NULL THEN
+                    EXECUTE format('SELECT %I($1)', TG_ARGV[i]) USING ids;
+                END IF;
+                i := i + 3;
+            END LOOP;
+
+            RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+        END;
+        $maintain_materialized_fields_trigger$ LANGUAGE plpgsql;
+        """)
+    MATERIALIZED_FIELD_FUNCTION_TEMPLATE = string.Template(dedent("""
+        CREATE FUNCTION ${function_name}(ids INTEGER[])
+        RETURNS VOID AS $$materialized_field$$
+        -- Recalculates ${own_table}.${field} of the given ids, see maintain_materialized_fields
+        UPDATE ${own_table} AS target SET ${field} = calculated.value
+        FROM (
+            SELECT ${letter}.id, ${expression} AS value
+            FROM ${own_table} ${letter} WHERE ${letter}.id = ANY(ids)
+        ) AS calculated
+        WHERE target.id = calculated.id AND target.${field} IS DISTINCT FROM calculated.value;
+        $$materialized_field$$ LANGUAGE sql;
+        """))
     LOG_CALCULATED_ID_ARRAY_TRIGGER_FUNCTION_TEMPLATE = string.Template(dedent("""
             CREATE OR REPLACE FUNCTION log_${trigger_type}_modified_calculated_id_array_field()
             RETURNS trigger AS $$log_modified_calculated_id_array_field_trigger$$
@@ -1951,6 +3783,125 @@ class Helper:
             END;
             $$log_modified_calculated_id_array_field_trigger$$ LANGUAGE plpgsql;
         """))
+    CLONE_MEETING_FUNCTION_TEMPLATE = string.Template(dedent("""
+        CREATE FUNCTION clone_meeting(source_meeting_id INTEGER, target_committee_id INTEGER)
+        RETURNS INTEGER AS $$clone_meeting$$
+        -- Copies the meeting with all its models into the committee and returns the id of the copy.
+        -- Every table is copied with one INSERT ... SELECT, the new ids are drawn from the id
+        -- sequences in advance and all references to copied models are mapped to them.
+        -- The mediafiles owned by the meeting are copied, too, but not the history entries.
+        -- References to models outside of the meeting, e.g. users and mediafiles of the
+        -- organization, are kept, unique fields without relation, e.g. external_id, are left empty.
+        -- Session state like the present users isn't copied.
+        -- All foreign keys are deferred, so the tables don't need to be copied in dependency order.
+        -- The log triggers run once per statement and the notify once per transaction.
+        DECLARE
+            new_meeting_id INTEGER;
+        BEGIN
+            CREATE TEMPORARY TABLE IF NOT EXISTS os_clone_id_map_t (
+                collection varchar(32),
+                old_id integer,
+                new_id integer,
+                PRIMARY KEY (collection, old_id)
+            ) ON COMMIT DROP;
+            TRUNCATE os_clone_id_map_t;
+
+            ${id_maps}
+            ANALYZE os_clone_id_map_t;
+            SELECT new_id INTO new_meeting_id FROM os_clone_id_map_t WHERE collection = 'meeting';
+            IF new_meeting_id IS NULL THEN
+                RAISE EXCEPTION 'Meeting % does not exist', source_meeting_id;
+            END IF;
+
+            ${copies}
+            RETURN new_meeting_id;
+        END;
+        $$clone_meeting$$ LANGUAGE plpgsql;
+    """))
+    GET_MODELS_FUNCTION_TEMPLATE = string.Template(dedent("""
+        CREATE FUNCTION get_models(fqids TEXT[], fields TEXT[] DEFAULT NULL)
+        RETURNS TABLE (fqid TEXT, data JSONB) AS $$get_models$$
+        -- Returns the models of fqids with the given fields, one row per existing model.
+        -- The fqids are grouped by collection and every view is read once with only the
+        -- requested columns, so relation lists not asked for aren't calculated.
+        -- Without fields all fields are returned, unknown fields are ignored.
+        DECLARE
+            collection_var TEXT;
+            ids INTEGER[];
+            columns TEXT[];
+        BEGIN
+            FOR collection_var, ids IN
+                SELECT split_part(f, '/', 1), array_agg(DISTINCT split_part(f, '/', 2)::integer)
+                FROM unnest(fqids) AS f
+                GROUP BY 1
+            LOOP
+                columns := CASE collection_var
+                    ${columns}
+                END;
+                IF columns IS NULL THEN
+                    RAISE EXCEPTION 'Unknown collection %', collection_var;
+                END IF;
+                IF fields IS NOT NULL THEN
+                    columns := ARRAY(SELECT c FROM unnest(columns) AS c WHERE c = 'id' OR c = ANY(fields));
+                END IF;
+                RETURN QUERY EXECUTE format(
+                    'SELECT %L || ''/'' || m.id, to_jsonb(m) FROM (SELECT %s FROM %I WHERE id = ANY($$1)) AS m',
+                    collection_var,
+                    (SELECT string_agg(quote_ident(c), ', ') FROM unnest(columns) AS c),
+                    collection_var
+                ) USING ids;
+            END LOOP;
+        END;
+        $$get_models$$ LANGUAGE plpgsql STABLE;
+    """))
+    EXPORT_MEETING_FUNCTION_TEMPLATE = string.Template(
+        dedent("""
+        CREATE FUNCTION export_meeting(exported_meeting_id INTEGER)
+        RETURNS SETOF TEXT AS $$export_meeting$$
+        -- Returns the meeting with all models owned by it as newline-delimited JSON,
+        -- one row {"fqid": "motion/1", "fields": {...}} per model.
+        -- The fields are read from the tables, the relation lists calculated in the views are
+        -- aggregated once per table and meeting and joined.
+        -- The function is a single stable SQL query and inlined by the planner, so its rows
+        -- are streamed to a cursor, e.g. DECLARE export CURSOR FOR SELECT * FROM export_meeting(1);
+    """)
+        + "${selects}"
+        + dedent("""
+        $$export_meeting$$ LANGUAGE sql STABLE;
+    """)
+    )
+    DELETE_MEETING_FUNCTION_TEMPLATE = string.Template(dedent("""
+        CREATE FUNCTION delete_meeting(deleted_meeting_id INTEGER)
+        RETURNS VOID AS $$delete_meeting$$
+        -- Deletes the meeting with all models owned by it.
+        -- Every table is deleted with one DELETE, referencing tables before the referenced ones.
+        -- While deleting, the not null triggers of the relations and the log triggers are skipped
+        -- via the row of the transaction in os_deleting_meeting_t, which only this function
+        -- writes, and os.deleting_meeting. Only the deletion of the meeting and the changed relations of
+        -- models, which aren't deleted themselves, e.g. users, the committee or mediafiles of the
+        -- organization, are logged.
+        -- References from models outside of the meeting to deleted models are set to NULL before.
+        DECLARE
+            sequence_name TEXT;
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM meeting_t WHERE id = deleted_meeting_id) THEN
+                RAISE EXCEPTION 'Meeting % does not exist', deleted_meeting_id;
+            END IF;
+
+            ${detaches}
+
+            INSERT INTO os_deleting_meeting_t (xact_id, meeting_id) VALUES (pg_current_xact_id(), deleted_meeting_id);
+            PERFORM set_config('os.deleting_meeting', 'on', true);
+            EXECUTE log_field_changes_statement(format($$entries$$
+                ${entries}
+            $$entries$$, deleted_meeting_id));
+
+            ${deletes}
+            PERFORM set_config('os.deleting_meeting', 'off', true);
+            DELETE FROM os_deleting_meeting_t WHERE xact_id = pg_current_xact_id();
+        END;
+        $$delete_meeting$$ LANGUAGE plpgsql;
+    """))
     NOT_NULL_TRIGGER_FUNCTION_TEMPLATE = string.Template(dedent("""
             CREATE FUNCTION check_not_null_for_${trigger_type}() RETURNS trigger AS $$not_null_trigger$$
             ${docstring}
@@ -1980,8 +3931,105 @@ class Helper:
                 END IF;
                 RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
             END;
-            $$not_null_trigger$$ language plpgsql;
+            $$not_null_trigger$$ language plpgsql;
+        """))
+    STATIC_NOT_NULL_TRIGGER_FUNCTION_TEMPLATE = string.Template(dedent("""
+            CREATE FUNCTION ${function_name}() RETURNS trigger AS $$not_null_trigger$$
+            DECLARE
+                own_id_var INTEGER := ${own_id};
+            BEGIN${exists_check}
+                IF ${condition} THEN
+                    RAISE EXCEPTION 'Trigger %: NOT NULL CONSTRAINT VIOLATED for ${own_collection}/%/${own_column}${foreign_message}', TG_NAME, own_id_var${foreign_id};
+                END IF;
+                RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+            END;
+            $$not_null_trigger$$ LANGUAGE plpgsql;
+        """))
+    STATIC_NOT_NULL_EXISTS_CHECK_TEMPLATE = string.Template("""
+                IF NOT EXISTS (SELECT 1 FROM ${query_relation} WHERE id = own_id_var) THEN
+                    -- if the earlier referenced row was deleted (in the same transaction) we can quit.
+                    RETURN NULL;
+                END IF;""")
+    STATIC_PREVENT_UPDATES_FUNCTION_TEMPLATE = string.Template(dedent("""
+            CREATE FUNCTION ${function_name}() RETURNS trigger AS $$constant_field_trigger$$
+            BEGIN
+                IF OLD.${constant_column} IS DISTINCT FROM NEW.${constant_column} THEN
+                    RAISE EXCEPTION 'Constant value constraint violated for ${collection}/%: ${constant_column} can not be updated.', NEW.id;
+                END IF;
+                RETURN NEW;
+            END;
+            $$constant_field_trigger$$ LANGUAGE plpgsql;
+        """))
+    STATIC_UNIQUE_IDS_PAIR_FUNCTION_TEMPLATE = string.Template(dedent("""
+            CREATE FUNCTION ${function_name}() RETURNS trigger AS $$unique_ids_pair_trigger$$
+            -- Guards against mirrored duplicates by skipping one of the pairs.
+            BEGIN
+                IF (NEW.${base_column_name}_1 > NEW.${base_column_name}_2) THEN
+                    RETURN NULL;
+                END IF;
+                RETURN NEW;
+            END;
+            $$unique_ids_pair_trigger$$ LANGUAGE plpgsql;
+        """))
+    STATIC_CHECK_EQUALS_FUNCTION_TEMPLATE = string.Template(dedent("""
+            CREATE FUNCTION ${function_name}() RETURNS trigger AS $$check_equals_trigger$$
+            DECLARE
+                own_id_var INTEGER;
+                own_equal_val TEXT;
+                foreign_id_var INTEGER;
+                foreign_equal_val TEXT;
+            BEGIN
+                ${fetch_values}
+                PERFORM raise_equality_exception_conditionally('${check_column}', '${ref_column}', '${own_collection}', own_id_var, own_equal_val, '${foreign_collection}', foreign_id_var, foreign_equal_val);
+                RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored
+            END;
+            $$check_equals_trigger$$ LANGUAGE plpgsql;
+        """))
+    STATIC_SEQUENCE_COUNTER_FUNCTION_TEMPLATE = string.Template(dedent("""
+            CREATE FUNCTION ${function_name}() RETURNS trigger AS $$sequences_trigger$$
+            BEGIN
+                IF NEW.${actual_field} IS NULL THEN
+                    NEW.${actual_field} := reserve_sequence_numbers('${table_name}', '${actual_field}', NEW.${depend_field}, 1);
+                ELSE
+                    PERFORM reserve_sequence_numbers('${table_name}', '${actual_field}', NEW.${depend_field}, 0, NEW.${actual_field});
+                END IF;
+                RETURN NEW;
+            END;
+            $$sequences_trigger$$ LANGUAGE plpgsql;
         """))
+    # a row level trigger calling a function generated for it, with its comment
+    STATIC_ROW_TRIGGER_REGEX = re.compile(
+        r"(?:-- definition trigger [^\n]*\n)?"
+        r"CREATE (?P<constraint>CONSTRAINT )?TRIGGER (?P<name>\w+) (?P<timing>BEFORE|AFTER) (?P<events>.+?) ON (?P<table>\w+)(?: INITIALLY DEFERRED)?\n"
+        r"FOR EACH ROW (?:WHEN \((?P<when>.*)\) )?EXECUTE FUNCTION (?P<function>fn_\w+)\(\);\n"
+    )
+    STATIC_TRIGGER_FUNCTION_REGEX = re.compile(
+        r"CREATE FUNCTION (?P<function>fn_\w+)\(\) RETURNS trigger AS \$(?P<tag>\w+)\$\n"
+        r"(?P<body>.*?)\n\$(?P=tag)\$ LANGUAGE plpgsql;\n",
+        re.DOTALL,
+    )
+    TRIGGER_DEFINITION_REGEX = re.compile(
+        r"CREATE (?:CONSTRAINT )?TRIGGER \w+ (?:BEFORE|AFTER) (?P<events>.+?) ON (?P<table>\w+)\b"
+        r"[^;]*?FOR EACH (?P<level>ROW|STATEMENT)"
+    )
+    OPERATIONS = ("INSERT", "UPDATE", "DELETE")
+    CONSOLIDATED_TRIGGER_TEMPLATE = string.Template(
+        dedent("""
+        CREATE FUNCTION ${function_name}() RETURNS trigger AS $$consolidated_trigger$$
+        -- Runs the checks of the row level triggers of ${table}, each in a block labeled with
+        -- the name of the trigger.
+        BEGIN
+    """)
+        + "${branches}"
+        + dedent("""\
+            ${result}
+        END;
+        $$consolidated_trigger$$ LANGUAGE plpgsql;
+
+        CREATE ${constraint}TRIGGER ${trigger_name} ${timing} ${events} ON ${table}${deferred}
+        FOR EACH ROW ${when}EXECUTE FUNCTION ${function_name}();
+    """)
+    )
     ENUM_DEFINITION_TEMPLATE = string.Template(
         "CREATE TYPE ${name} AS ENUM (${values});\n\n"
     )
@@ -2020,7 +4068,7 @@ class Helper:
                 CONSTRAINT ${pk_constraint_name} PRIMARY KEY (${list_of_keys})
             );
             CREATE INDEX ${index_1} ON ${table_name} (${field1});
-            CREATE INDEX ${index_2} ON ${table_name} (${field2});
+            CREATE INDEX ${index_2} ON ${table_name} (${field2}, ${field1});
         """))
     INTERMEDIATE_TABLE_G_M_RELATION_TEMPLATE = string.Template(dedent("""
             CREATE TABLE ${table_name} (
@@ -2029,21 +4077,19 @@ class Helper:
                     CONSTRAINT ${fk_name} REFERENCES ${own_table_name}(${own_table_ref_column})
                     ON DELETE CASCADE
                     INITIALLY DEFERRED,
-                ${own_table_column} varchar(100)
-                    CONSTRAINT ${required_constraint_name_2} NOT NULL,
+                ${own_table_column_lines}
             ${foreign_table_ref_lines}
-                CONSTRAINT ${valid_constraint_name} CHECK (split_part(${own_table_column}, '/', 1) IN ${tuple_of_foreign_table_names}),
-                CONSTRAINT ${unique_constraint_name} UNIQUE (${own_table_name_with_ref_column}, ${own_table_column})
+            ${constraint_lines}
             );
             CREATE INDEX ${index_1} ON ${table_name} (${own_table_name_with_ref_column});
-            CREATE INDEX ${index_2} ON ${table_name} (${own_table_column});
+            CREATE INDEX ${index_2} ON ${table_name} (${own_table_columns});
             ${content_field_indices}
         """))
     GM_FOREIGN_TABLE_LINE_TEMPLATE = string.Template(
         indent(
             dedent("""\
             ${gm_content_field} integer
-                CONSTRAINT ${constraint_name} GENERATED ALWAYS AS (CASE WHEN split_part(${own_table_column}, '/', 1) = '${foreign_view_name}' THEN cast(split_part(${own_table_column}, '/', 2) AS INTEGER) ELSE null END) STORED
+                CONSTRAINT ${constraint_name} GENERATED ALWAYS AS (${generated_expression}) STORED
                 CONSTRAINT ${fk_name} REFERENCES ${foreign_table_name}(id)
                 ON DELETE CASCADE
                 INITIALLY DEFERRED,"""),
@@ -2051,7 +4097,7 @@ class Helper:
         )
     )
     GM_INDEX_LINE_TEMPLATE = string.Template(
-        "CREATE INDEX ${index} ON ${table_name} (${gm_content_field});"
+        "CREATE INDEX ${index} ON ${table_name} (${gm_content_field}, ${own_table_name_with_ref_column});"
     )
 
     RELATION_LIST_AGENDA = dedent("""
@@ -2098,11 +4144,55 @@ class Helper:
         return f"\nCREATE TABLE {HelperGetNames.get_table_name(table_name)} (\n"
 
     @staticmethod
-    def get_table_body_end(code: str) -> str:
+    def get_table_body_end(
+        code: str,
+        partition: dict[str, Any] | None = None,
+        storage: dict[str, Any] | None = None,
+    ) -> str:
         code = code[:-2] + "\n"  # last attribute line without ",", but with "\n"
-        code += ");\n\n"
+        if partition:
+            # the storage parameters are set on the partitions
+            code += f") PARTITION BY {partition['method'].upper()} ({partition['column']});\n\n"
+        else:
+            code += f"){Helper.get_storage_parameters(storage)};\n\n"
+        return code
+
+    @staticmethod
+    def get_storage_parameters(storage: dict[str, Any] | None) -> str:
+        if not storage:
+            return ""
+        parameters = ", ".join(
+            f"{parameter} = {str(value).lower() if isinstance(value, bool) else value}"
+            for parameter, value in storage.items()
+        )
+        return f" WITH ({parameters})"
+
+    @staticmethod
+    def get_partitions(
+        table_name: str,
+        partition: dict[str, Any],
+        storage: dict[str, Any] | None = None,
+    ) -> str:
+        table_name = HelperGetNames.get_table_name(table_name)
+        parameters = Helper.get_storage_parameters(storage)
+        if partition["method"] == "list":
+            # create_list_partition copies the storage parameters of the default partition
+            partition_name = HelperGetNames.get_partition_name(table_name, "default")
+            return f"CREATE TABLE {partition_name} PARTITION OF {table_name} DEFAULT{parameters};\n"
+        code = ""
+        for remainder in range(partition["partitions"]):
+            partition_name = HelperGetNames.get_partition_name(table_name, remainder)
+            code += f"CREATE TABLE {partition_name} PARTITION OF {table_name} FOR VALUES WITH (MODULUS {partition['partitions']}, REMAINDER {remainder}){parameters};\n"
         return code
 
+    @staticmethod
+    def get_column_compressions(table_name: str, compression: dict[str, str]) -> str:
+        table_name = HelperGetNames.get_table_name(table_name)
+        return "".join(
+            f"CALL set_column_compression('{table_name}', '{fname}', '{method}');\n"
+            for fname, method in compression.items()
+        )
+
     @staticmethod
     def get_view_head(table_name: str) -> str:
         return f"\nCREATE VIEW {HelperGetNames.get_view_name(table_name)} AS SELECT *"
@@ -2120,16 +4210,414 @@ class Helper:
         return code
 
     @staticmethod
-    def get_notify_trigger(table_name: str) -> str:
-        trigger_name = HelperGetNames.get_notify_trigger_name(table_name)
+    def get_relation_list_view_column(table_name: str, fname: str) -> str:
+        """
+        Reads the materialized relation list with a subquery, a join would make the view
+        of the collection not updatable.
+        """
+        return (
+            f"(select rl.{fname} from {HelperGetNames.get_relation_list_table_name(table_name)} rl"
+            f" where rl.id = {Helper.get_table_letter(table_name)}.id) as {fname},\n"
+        )
+
+    @staticmethod
+    def get_base_view(table_name: str) -> str:
+        return f"\nCREATE VIEW {HelperGetNames.get_base_view_name(table_name)} AS SELECT * FROM {HelperGetNames.get_table_name(table_name)} {Helper.get_table_letter(table_name)};\n\n"
+
+    @staticmethod
+    def get_relation_list_table(table_name: str, code: str) -> str:
         own_table = HelperGetNames.get_table_name(table_name)
-        escaped_table_name = "'" + table_name + "'"
-        code = f"CREATE TRIGGER {trigger_name} AFTER INSERT OR UPDATE OR DELETE ON {own_table}\n"
-        code += f"FOR EACH ROW EXECUTE FUNCTION log_modified_models({escaped_table_name});\n"
-        code += f"CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON {own_table}\n"
-        code += "DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();\n"
+        relation_list_table = HelperGetNames.get_relation_list_table_name(table_name)
+        fk_name = HelperGetNames.get_fk_constraint_name(
+            relation_list_table, "id", own_table, "id"
+        )
+        code = (
+            f"    id integer PRIMARY KEY CONSTRAINT {fk_name} REFERENCES {own_table} (id) ON DELETE CASCADE INITIALLY DEFERRED,\n"
+            + code
+        )
+        return (
+            f"CREATE TABLE {relation_list_table} (\n{Helper.get_table_body_end(code)}\n"
+        )
+
+    @staticmethod
+    def get_relation_list_triggers(
+        source_table: str, relation_lists: list[tuple[str, str, str, str]]
+    ) -> str:
+        arguments = ", ".join(
+            f"'{relation_list_table}', '{column}', '{fk_column}', '{value_column}'"
+            for relation_list_table, column, fk_column, value_column in relation_lists
+        )
+        code = ""
+        for operation, transition_tables in (
+            ("INSERT", "NEW TABLE AS new_table"),
+            ("UPDATE", "OLD TABLE AS old_table NEW TABLE AS new_table"),
+            ("DELETE", "OLD TABLE AS old_table"),
+        ):
+            trigger_name = HelperGetNames.get_relation_list_trigger_name(
+                source_table, operation
+            )
+            code += (
+                f"CREATE TRIGGER {trigger_name} AFTER {operation} ON {source_table}\n"
+            )
+            code += f"REFERENCING {transition_tables}\n"
+            code += f"FOR EACH STATEMENT EXECUTE FUNCTION maintain_relation_lists({arguments});\n"
+        return code
+
+    @staticmethod
+    def get_materialized_field_triggers(
+        source_table: str, groups: list[tuple[tuple[str, ...], str, str, str]]
+    ) -> str:
+        code = ""
+        for operation, transition_tables in (
+            ("INSERT", "NEW TABLE AS new_table"),
+            ("UPDATE", "OLD TABLE AS old_table NEW TABLE AS new_table"),
+            ("DELETE", "OLD TABLE AS old_table"),
+        ):
+            arguments = ", ".join(
+                ", ".join(
+                    "'" + argument.replace("'", "''") + "'"
+                    for argument in (function_name, id_sql, update_condition)
+                )
+                for operations, function_name, id_sql, update_condition in groups
+                if operation in operations
+            )
+            if not arguments:
+                continue
+            trigger_name = HelperGetNames.get_materialized_field_trigger_name(
+                source_table, operation
+            )
+            code += (
+                f"CREATE TRIGGER {trigger_name} AFTER {operation} ON {source_table}\n"
+            )
+            code += f"REFERENCING {transition_tables}\n"
+            code += f"FOR EACH STATEMENT EXECUTE FUNCTION maintain_materialized_fields({arguments});\n"
+        return code
+
+    @staticmethod
+    def get_consolidated_row_triggers(
+        code_blocks: list[str],
+    ) -> tuple[list[str], str]:
+        """
+        Removes the row level triggers calling a function generated for a single trigger
+        and these functions from the code blocks. Returns the blocks and the definitions
+        of one trigger per table, timing, operation and WHEN condition, whose function runs
+        the bodies of the removed functions in the order the triggers would have fired.
+        """
+        code = "".join(code_blocks)
+        bodies = {
+            match["function"]: match["body"]
+            for match in Helper.STATIC_TRIGGER_FUNCTION_REGEX.finditer(code)
+        }
+        # (table, timing, constraint, operation, when) to (trigger, update columns, body)
+        groups: dict[tuple[str, str, bool, str, str], list[tuple[str, str, str]]] = (
+            defaultdict(list)
+        )
+        for match in Helper.STATIC_ROW_TRIGGER_REGEX.finditer(code):
+            for event in match["events"].split(" OR "):
+                operation, _, columns = event.partition(" OF ")
+                groups[
+                    (
+                        match["table"],
+                        match["timing"],
+                        bool(match["constraint"]),
+                        operation,
+                        match["when"] or "",
+                    )
+                ].append((match["name"], columns, bodies[match["function"]]))
+        blocks = [
+            re.sub(
+                r"\n{3,}",
+                "\n\n",
+                Helper.STATIC_ROW_TRIGGER_REGEX.sub(
+                    "", Helper.STATIC_TRIGGER_FUNCTION_REGEX.sub("", block)
+                ),
+            )
+            for block in code_blocks
+        ]
+
+        consolidated = ""
+        for (table, timing, constraint, operation, when), members in sorted(
+            groups.items()
+        ):
+            trigger_name = HelperGetNames.get_consolidated_trigger_name(
+                table, timing, operation, bool(when)
+            )
+            function_name = HelperGetNames.get_trigger_function_name(trigger_name)
+            update_columns: list[str] = []
+            branches = ""
+            for name, columns, body in sorted(members):
+                block = Helper.get_consolidated_block(name, timing, body)
+                if columns:
+                    column_list = columns.split(", ")
+                    update_columns.extend(column_list)
+                    condition = " OR ".join(
+                        f"OLD.{column} IS DISTINCT FROM NEW.{column}"
+                        for column in column_list
+                    )
+                    block = f"IF {condition} THEN\n{indent(block, '    ')}\nEND IF;"
+                branches += indent(block, "    ") + "\n"
+            events = operation
+            # if a member fires on every update, so does the consolidated trigger
+            if update_columns and all(columns for _, columns, _ in members):
+                events += f" OF {', '.join(dict.fromkeys(update_columns))}"
+            if timing == "BEFORE":
+                result = "RETURN OLD;" if operation == "DELETE" else "RETURN NEW;"
+            else:
+                result = "RETURN NULL;  -- returning NULL because AFTER TRIGGER return value is ignored"
+            consolidated += Helper.CONSOLIDATED_TRIGGER_TEMPLATE.substitute(
+                {
+                    "function_name": function_name,
+                    "trigger_name": trigger_name,
+                    "table": table,
+                    "branches": branches,
+                    "result": result,
+                    "constraint": "CONSTRAINT " if constraint else "",
+                    "timing": timing,
+                    "events": events,
+                    "deferred": " INITIALLY DEFERRED" if constraint else "",
+                    "when": f"WHEN ({when}) " if when else "",
+                }
+            )
+        return blocks, consolidated
+
+    @staticmethod
+    def get_consolidated_block(trigger_name: str, timing: str, body: str) -> str:
+        """
+        Returns the body of the function of a single trigger as block labeled with the
+        trigger name. RETURN NULL of AFTER triggers leaves the block, the final RETURN is
+        done by the consolidated function. Error messages keep the name of the trigger.
+        """
+        body = body.replace("TG_NAME", f"'{trigger_name}'")
+        final = "RETURN NEW;" if timing == "BEFORE" else "RETURN NULL;"
+        body = re.sub(rf"\n[ ]*{final}[^\n]*\nEND;$", "\nEND;", body)
+        if timing == "AFTER":
+            body = re.sub(r"RETURN NULL;[^\n]*", f"EXIT {trigger_name};", body)
+        return f"<<{trigger_name}>>\n{body}"
+
+    @staticmethod
+    def get_sql_field_expression(fname: str, sql: str) -> str:
+        """Returns the sql of the field without the column alias of the view"""
+        return re.sub(rf"\s+AS\s+{fname}\s*$", "", sql, flags=re.IGNORECASE)
+
+    @staticmethod
+    def get_static_trigger_function(
+        trigger_name: str, template: string.Template, subst: dict[str, str]
+    ) -> tuple[str, str]:
+        """
+        Returns the definition of the function generated for the trigger and its call.
+        """
+        function_name = HelperGetNames.get_trigger_function_name(trigger_name)
+        return (
+            template.substitute({"function_name": function_name, **subst}),
+            f"{function_name}()",
+        )
+
+    @staticmethod
+    def get_static_not_null_function(
+        trigger_name: str,
+        own_collection: str,
+        own_column: str,
+        condition: str,
+        own_id: str = "NEW.id",
+        query_relation: str = "",
+        foreign_collection: str = "",
+        foreign_id: str = "",
+        foreign_column: str = "",
+    ) -> tuple[str, str]:
+        subst = {
+            "own_collection": own_collection,
+            "own_column": own_column,
+            "condition": condition,
+            "own_id": own_id,
+            "exists_check": "",
+            "foreign_message": "",
+            "foreign_id": "",
+        }
+        if query_relation:
+            subst["exists_check"] = (
+                Helper.STATIC_NOT_NULL_EXISTS_CHECK_TEMPLATE.substitute(
+                    {"query_relation": query_relation}
+                )
+            )
+        if foreign_collection:
+            subst["foreign_message"] = (
+                f" from relationship before {foreign_collection}/%/{foreign_column}"
+            )
+            subst["foreign_id"] = f", {foreign_id}"
+        return Helper.get_static_trigger_function(
+            trigger_name, Helper.STATIC_NOT_NULL_TRIGGER_FUNCTION_TEMPLATE, subst
+        )
+
+    @staticmethod
+    def get_check_equals_function_calls(
+        own_trigger_name: str,
+        foreign_trigger_name: str,
+        own_collection: str,
+        foreign_collection: str,
+        ref_column: str,
+        check_column: str,
+    ) -> tuple[str, str, str]:
+        """
+        Returns the function definitions and the calls for the triggers checking
+        equal fields on the own and on the foreign table.
+        """
+        if not OPTIONS.get("static_trigger_functions"):
+            call = f"check_equals('{own_collection}', '{foreign_collection}', '{ref_column}', '{check_column}', %s)"
+            return "", call % "FALSE", call % "TRUE"
+        subst = {
+            "check_column": check_column,
+            "ref_column": ref_column,
+            "own_collection": own_collection,
+            "foreign_collection": foreign_collection,
+        }
+        own_definition, own_call = Helper.get_static_trigger_function(
+            own_trigger_name,
+            Helper.STATIC_CHECK_EQUALS_FUNCTION_TEMPLATE,
+            {
+                **subst,
+                "fetch_values": dedent(
+                    f"""\
+                    own_id_var := NEW.id;
+                    own_equal_val := NEW.{check_column};
+                    foreign_id_var := NEW.{ref_column};
+                    SELECT {check_column} FROM {foreign_collection} WHERE id = foreign_id_var INTO foreign_equal_val;"""
+                ).replace("\n", "\n    "),
+            },
+        )
+        foreign_definition, foreign_call = Helper.get_static_trigger_function(
+            foreign_trigger_name,
+            Helper.STATIC_CHECK_EQUALS_FUNCTION_TEMPLATE,
+            {
+                **subst,
+                "fetch_values": dedent(
+                    f"""\
+                    foreign_id_var := NEW.id;
+                    foreign_equal_val := NEW.{check_column};
+                    SELECT id, {check_column} FROM {own_collection} WHERE {ref_column} = foreign_id_var INTO own_id_var, own_equal_val;"""
+                ).replace("\n", "\n    "),
+            },
+        )
+        return own_definition + foreign_definition, own_call, foreign_call
+
+    @staticmethod
+    def get_notify_trigger(table_name: str, log_related_arguments: str = "") -> str:
+        return Helper.get_log_triggers(
+            HelperGetNames.get_table_name(table_name),
+            table_name,
+            f"'{table_name}'{log_related_arguments}",
+        )
+
+    @staticmethod
+    def get_log_triggers(source_table: str, name_part: str, arguments: str) -> str:
+        """
+        Statement level log triggers, one per operation because transition tables
+        are restricted to triggers with a single event.
+        With logical_replication the table is published instead and the arguments
+        are stored for the decoder.
+        """
+        arguments = GenerateCodeBlocks.register_log_arguments(source_table, arguments)
+        if OPTIONS.get("logical_replication"):
+            return Helper.get_replication_definition(source_table, name_part, arguments)
+        code = ""
+        for operation, transition_tables in (
+            ("INSERT", "NEW TABLE AS new_table"),
+            ("UPDATE", "OLD TABLE AS old_table NEW TABLE AS new_table"),
+            ("DELETE", "OLD TABLE AS old_table"),
+        ):
+            trigger_name = HelperGetNames.get_notify_trigger_name(name_part, operation)
+            code += (
+                f"CREATE TRIGGER {trigger_name} AFTER {operation} ON {source_table}\n"
+            )
+            code += f"REFERENCING {transition_tables}\n"
+            code += f"FOR EACH STATEMENT WHEN ({Helper.NOT_DELETING_MEETING})\n"
+            code += f"EXECUTE FUNCTION log_modified_models({arguments});\n"
+        return code
+
+    @staticmethod
+    def get_indexed_columns(code: str) -> set[tuple[str, str]]:
+        """
+        Returns (table, column) for the leading column of every index, primary key
+        and unique constraint created in code.
+        """
+        indexed: set[tuple[str, str]] = set()
+        key_with_columns = re.compile(
+            r"\b(?:PRIMARY KEY|UNIQUE)\b(?: NULLS NOT DISTINCT)? ?\((\w+)"
+        )
+        table = column = ""
+        for line in code.splitlines():
+            statement = line.strip()
+            if match := re.match(
+                r"CREATE (?:UNLOGGED )?TABLE (?:IF NOT EXISTS )?(\w+) \(", statement
+            ):
+                table = match[1]
+            elif line.startswith(")"):
+                table = ""
+            elif match := re.match(
+                r"CREATE (?:UNIQUE )?INDEX \w+ ON (\w+)(?: USING \w+)? \((\w+)",
+                statement,
+            ):
+                indexed.add((match[1], match[2]))
+            elif match := re.match(r"ALTER TABLE (\w+) ADD CONSTRAINT \w+ ", statement):
+                if key := key_with_columns.search(statement):
+                    indexed.add((match[1], key[1]))
+            elif table:
+                if (match := re.match(r" {4}(\w+) ", line)) and match[1] not in (
+                    "CONSTRAINT",
+                    "PRIMARY",
+                    "UNIQUE",
+                ):
+                    column = match[1]
+                if key := key_with_columns.search(line):
+                    indexed.add((table, key[1]))
+                elif re.search(r"\b(?:PRIMARY KEY|UNIQUE)\b", line):
+                    indexed.add((table, column))
+        return indexed
+
+    @staticmethod
+    def get_replication_definition(
+        source_table: str, name_part: str, arguments: str
+    ) -> str:
+        code = f"CALL set_replica_identity_full('{source_table}');\n"
+        code += f"ALTER PUBLICATION os_changes ADD TABLE {source_table};\n"
+        code += "INSERT INTO os_log_replication_t (table_name, log_arguments)\n"
+        code += f"VALUES ('{source_table}', ARRAY[{arguments}]::varchar[]);\n"
+        trigger_name = HelperGetNames.get_notify_trigger_name(name_part, "notify")
+        code += f"CREATE TRIGGER {trigger_name} AFTER INSERT OR UPDATE OR DELETE ON {source_table}\n"
+        code += f"FOR EACH STATEMENT WHEN ({Helper.NOT_DELETING_MEETING})\n"
+        code += "EXECUTE FUNCTION notify_replicated_transaction();\n"
         return code
 
+    @staticmethod
+    def get_clone_id(collection: str, column: str) -> str:
+        """id of the copy of the referenced model, if clone_meeting copies it, else the original one"""
+        return f"COALESCE((SELECT new_id FROM os_clone_id_map_t WHERE collection = '{collection}' AND old_id = t.{column}), t.{column})"
+
+    @staticmethod
+    def get_clone_generic_id(column: str) -> str:
+        """fqid of the copy of the referenced model, if clone_meeting copies it, else the original one"""
+        if OPTIONS.get("typed_generic_relations"):
+            collection_column, model_id_column = Helper.get_generic_stored_columns(
+                column
+            )
+            return (
+                f"t.{collection_column}, COALESCE((SELECT new_id FROM os_clone_id_map_t"
+                f" WHERE collection = t.{collection_column}::text AND old_id = t.{model_id_column}), t.{model_id_column})"
+            )
+        collection = f"split_part(t.{column}, '/', 1)"
+        return (
+            f"COALESCE({collection} || '/' || (SELECT new_id FROM os_clone_id_map_t"
+            f" WHERE collection = {collection} AND old_id = split_part(t.{column}, '/', 2)::integer), t.{column})"
+        )
+
+    @staticmethod
+    def get_log_related_arguments(
+        foreign_table: str, fk_column: str, updated_field: str, value_column: str
+    ) -> str:
+        """arguments of log_modified_models for logging the related models"""
+        return (
+            f", '{foreign_table}', '{fk_column}', '{updated_field}', '{value_column}'"
+        )
+
     @staticmethod
     def get_alter_table_final_code(code: str) -> str:
         return f"-- Alter table final relation commands\n{code}\n\n"
@@ -2214,7 +4702,49 @@ class Helper:
             HelperGetNames.get_generated_always_as_constraint_name(
                 own_table, generic_fname
             ),
-            f"GENERATED ALWAYS AS (CASE WHEN split_part({own_column}, '/', 1) = '{foreign_table}' THEN cast(split_part({own_column}, '/', 2) AS INTEGER) ELSE null END) STORED",
+            f"GENERATED ALWAYS AS ({Helper.get_generic_id_expression(own_column, foreign_table)}) STORED",
+        )
+
+    @staticmethod
+    def get_generic_id_expression(own_column: str, foreign_table: str) -> str:
+        """id of the generic relation own_column, if it references foreign_table, else null"""
+        if OPTIONS.get("typed_generic_relations"):
+            collection_column = HelperGetNames.get_generic_collection_column(own_column)
+            model_id_column = HelperGetNames.get_generic_model_id_column(own_column)
+            return f"CASE WHEN {collection_column} = '{foreign_table}' THEN {model_id_column} ELSE null END"
+        return f"CASE WHEN split_part({own_column}, '/', 1) = '{foreign_table}' THEN cast(split_part({own_column}, '/', 2) AS INTEGER) ELSE null END"
+
+    @staticmethod
+    def get_generic_stored_columns(own_column: str) -> list[str]:
+        """columns storing the generic relation own_column"""
+        if OPTIONS.get("typed_generic_relations"):
+            return [
+                HelperGetNames.get_generic_collection_column(own_column),
+                HelperGetNames.get_generic_model_id_column(own_column),
+            ]
+        return [own_column]
+
+    @staticmethod
+    def get_generic_value_expression(table: str, value_column: str) -> str:
+        """
+        value of a logged relation, the fqid for the id column of a gm-table
+        with typed_generic_relations
+        """
+        if (
+            OPTIONS.get("typed_generic_relations")
+            and table.startswith("gm_")
+            and (own_column := value_column.removesuffix("_model_id")) != value_column
+        ):
+            return Helper.get_generic_fqid_expression(own_column)
+        return value_column
+
+    @staticmethod
+    def get_generic_fqid_expression(own_column: str, alias: str = "") -> str:
+        """fqid of the generic relation own_column with typed_generic_relations"""
+        prefix = f"{alias}." if alias else ""
+        return (
+            f"{prefix}{HelperGetNames.get_generic_collection_column(own_column)}::text"
+            f" || '/' || {prefix}{HelperGetNames.get_generic_model_id_column(own_column)}"
         )
 
     @classmethod
@@ -2222,7 +4752,26 @@ class Helper:
         cls, table: str, fields: list[str], strict: bool
     ) -> str:
         strict_definition = " NULLS NOT DISTINCT" if strict else ""
-        return f"    CONSTRAINT {HelperGetNames.get_unique_constraint_name(table, fields)} UNIQUE{strict_definition} ({', '.join(fields)}),\n"
+        columns = [
+            column
+            for field in fields
+            for column in GenerateCodeBlocks.get_stored_columns(table, field)
+        ]
+        return f"    CONSTRAINT {HelperGetNames.get_unique_constraint_name(table, fields)} UNIQUE{strict_definition} ({', '.join(columns)}),\n"
+
+    @staticmethod
+    def get_constant_definitions() -> str:
+        """
+        Returns the functions independent of the collections. With typed_generic_relations
+        the changed collection and id columns of a generic relation are logged as its field.
+        """
+        if not OPTIONS.get("typed_generic_relations"):
+            return Helper.FILE_TEMPLATE_CONSTANT_DEFINITIONS
+        fields = "akeys((hstore(n) - hstore(o)) || (hstore(o) - hstore(n)))"
+        return Helper.FILE_TEMPLATE_CONSTANT_DEFINITIONS.replace(
+            f"{fields}::varchar(63)[] AS fields",
+            f"ARRAY(SELECT DISTINCT regexp_replace(k, ''_id_(collection|model_id)$'', ''_id'') FROM unnest({fields}) AS k)::varchar(63)[] AS fields",
+        )
 
     @staticmethod
     def get_enum_types_definitions() -> str:
@@ -2248,7 +4797,7 @@ class Helper:
     ) -> str:
         FOREIGN_KEY_TABLE_CONSTRAINT_TEMPLATE = string.Template(
             "ALTER TABLE ${own_table} ADD CONSTRAINT ${fk_name} FOREIGN KEY(${own_column}) REFERENCES ${foreign_table}(${fk_column})${initially_deferred}${delete_action}${update_action};\n"
-            "CREATE INDEX ${index} ON ${own_table} (${own_column});\n"
+            "CREATE INDEX ${index} ON ${own_table} (${own_column}, id);\n"
         )
 
         if initially_deferred:
@@ -2284,24 +4833,6 @@ class Helper:
                 raise Exception(f"{action} is not a valid action mode")
         return ""
 
-    @staticmethod
-    def get_foreign_key_notify_trigger(
-        table_name: str,
-        foreign_table: str,
-        ref_column: str,
-        updated_field: str,
-        fk_columns: list[str] | str,
-        initially_deferred: bool = False,
-        delete_action: str = "",
-        update_action: str = "",
-    ) -> str:
-        trigger_name = HelperGetNames.get_notify_related_trigger_name(
-            table_name, ref_column
-        )
-        own_table = HelperGetNames.get_table_name(table_name)
-        return f"""CREATE TRIGGER {trigger_name} AFTER INSERT OR UPDATE OF {ref_column} OR DELETE ON {own_table}
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{ref_column}', '{updated_field}');\n"""
-
     @staticmethod
     def get_log_calculated_id_array_trigger_definition(
         view_name: str,
@@ -2310,7 +4841,7 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{r
     ) -> str:
         TRIGGER_TEMPLATE = string.Template(dedent("""\
             CREATE TRIGGER ${trigger_name} ${trigger_operations} ON ${on_table}
-            FOR EACH ROW EXECUTE FUNCTION log_${trigger_type}_modified_calculated_id_array_field('${view_name}', '${log_collection_id_column}', '${log_collection_id_sql}', '${log_field}', '${log_value_column}', '${log_value_sql}');
+            FOR EACH ROW ${when}EXECUTE FUNCTION log_${trigger_type}_modified_calculated_id_array_field('${view_name}', '${log_collection_id_column}', '${log_collection_id_sql}', '${log_field}', '${log_value_column}', '${log_value_sql}');
             """))
         processed_tables: dict[str, int] = {}
         parts: list[str] = []
@@ -2338,6 +4869,25 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{r
                     view_name, log_field, on_table, bool(on_columns), unique_index
                 )
             )
+            if not GenerateCodeBlocks.register_calculated_log_path(
+                on_table,
+                (
+                    *(
+                        log_trigger.get(attr) or ""
+                        for attr in [
+                            "log_collection_id_column",
+                            "log_collection_id_sql",
+                            "log_value_column",
+                            "log_value_sql",
+                        ]
+                    ),
+                    on_columns or "",
+                    view_name,
+                    log_field,
+                ),
+                (trigger_name_iu, trigger_name_ud),
+            ):
+                continue
 
             subst_common = {
                 **subst_base,
@@ -2357,6 +4907,7 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{r
                 "trigger_type": "iu",
                 "trigger_name": trigger_name_iu,
                 "trigger_operations": f"BEFORE INSERT{trigger_columns_iu}",
+                "when": "",
             }
 
             subst_ud = {
@@ -2364,6 +4915,8 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{r
                 "trigger_type": "ud",
                 "trigger_name": trigger_name_ud,
                 "trigger_operations": f"AFTER{trigger_columns_ud} DELETE",
+                # logged by delete_meeting itself
+                "when": f"WHEN ({Helper.NOT_DELETING_MEETING}) ",
             }
 
             parts.append(TRIGGER_TEMPLATE.substitute(subst_iu))
@@ -2445,6 +4998,9 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{r
         foreign_table_ref_lines = []
         indices_lines = []
         own_table_column = own_table_field.intermediate_column
+        own_table_name_with_ref_column = (
+            HelperGetNames.get_own_table_name_with_ref_column(own_table_field)
+        )
         intermediate_field_to_foreign_table_field: dict[str, TableFieldType] = {}
         for foreign_table_field in foreign_table_fields:
             foreign_table_name = foreign_table_field.table
@@ -2458,10 +5014,11 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{r
                 gm_table_name, gm_content_field, foreign_table_name, "id"
             )
             subst_dict = {
-                "own_table_column": own_table_column,
+                "generated_expression": Helper.get_generic_id_expression(
+                    own_table_column, foreign_table_name
+                ),
                 "fk_name": fk_idx[0],
                 "foreign_table_name": HelperGetNames.get_table_name(foreign_table_name),
-                "foreign_view_name": foreign_table_name,
                 "gm_content_field": gm_content_field,
                 "constraint_name": HelperGetNames.get_generated_always_as_constraint_name(
                     own_table_field.table, own_table_column
@@ -2476,14 +5033,45 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{r
                         "index": fk_idx[1],
                         "table_name": gm_table_name,
                         "gm_content_field": gm_content_field,
+                        "own_table_name_with_ref_column": own_table_name_with_ref_column,
                     }
                 )
             )
 
-        own_table_name = HelperGetNames.get_table_name(own_table_field.table)
-        own_table_name_with_ref_column = (
-            HelperGetNames.get_own_table_name_with_ref_column(own_table_field)
+        constraint_lines = []
+        if OPTIONS.get("typed_generic_relations"):
+            own_table_columns = [
+                HelperGetNames.get_generic_collection_column(own_table_column),
+                HelperGetNames.get_generic_model_id_column(own_table_column),
+            ]
+            enum_type = HelperGetNames.get_enum_name_for_column(
+                own_table_field.table, own_table_column
+            )
+            InternalHelper.ENUMS[enum_type] = [
+                foreign_table_field.table
+                for foreign_table_field in foreign_table_fields
+            ]
+            column_types = [enum_type, "integer"]
+        else:
+            own_table_columns = [own_table_column]
+            column_types = ["varchar(100)"]
+            constraint_name = HelperGetNames.get_generic_valid_constraint_name(
+                own_table_field.table, own_table_column
+            )
+            constraint_lines.append(
+                f"    CONSTRAINT {constraint_name} CHECK (split_part({own_table_column}, '/', 1) IN {joined_table_names}),"
+            )
+        constraint_name = HelperGetNames.get_generic_unique_constraint_name(
+            own_table_name_with_ref_column, own_table_column
         )
+        constraint_lines.append(
+            f"    CONSTRAINT {constraint_name} UNIQUE ({own_table_name_with_ref_column}, {', '.join(own_table_columns)})"
+        )
+        own_table_column_lines = "\n    ".join(
+            f"{column} {column_type}\n        CONSTRAINT {HelperGetNames.get_required_constraint_name(gm_table_name, column)} NOT NULL,"
+            for column, column_type in zip(own_table_columns, column_types)
+        )
+        own_table_name = HelperGetNames.get_table_name(own_table_field.table)
         fk_idx = HelperGetNames.get_fk_and_index_name(
             gm_table_name,
             own_table_name_with_ref_column,
@@ -2501,21 +5089,13 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{r
                     gm_table_name, own_table_column
                 ),
                 "own_table_ref_column": own_table_field.ref_column,
-                "own_table_column": own_table_column,
-                "tuple_of_foreign_table_names": joined_table_names,
+                "own_table_column_lines": own_table_column_lines,
+                "own_table_columns": ", ".join(own_table_columns),
                 "foreign_table_ref_lines": "\n".join(foreign_table_ref_lines),
+                "constraint_lines": "\n".join(constraint_lines),
                 "required_constraint_name_1": HelperGetNames.get_required_constraint_name(
                     gm_table_name, own_table_name_with_ref_column
                 ),
-                "required_constraint_name_2": HelperGetNames.get_required_constraint_name(
-                    gm_table_name, own_table_column
-                ),
-                "valid_constraint_name": HelperGetNames.get_generic_valid_constraint_name(
-                    own_table_field.table, own_table_column
-                ),
-                "unique_constraint_name": HelperGetNames.get_generic_unique_constraint_name(
-                    own_table_name_with_ref_column, own_table_column
-                ),
                 "content_field_indices": "\n".join(indices_lines),
             }
         )
@@ -2543,31 +5123,16 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}', '{r
         nm_table_name = HelperGetNames.get_nm_table_name(
             own_table_field, foreign_table_field
         )
-        table_name = HelperGetNames.get_table_name(nm_table_name)
-        trigger_name = HelperGetNames.get_notify_trigger_name(table_name)
-
-        return f"""
-CREATE TRIGGER {trigger_name} AFTER INSERT OR UPDATE OR DELETE ON {nm_table_name}
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{own_table_field.table}','{field1}','{own_table_field.column}','{foreign_table_field.table}','{field2}','{foreign_table_field.column}');
-CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON {nm_table_name}
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-"""
-
-    @staticmethod
-    def get_trigger_for_generic_relation(
-        table_name: str,
-        generic_plain_field_name: str,
-        updated_field: str,
-        foreign_table: str,
-    ) -> str:
-        trigger_name = HelperGetNames.get_notify_related_trigger_name(
-            foreign_table, generic_plain_field_name
+        arguments = "''"
+        arguments += Helper.get_log_related_arguments(
+            own_table_field.table, field1, own_table_field.column, field2
+        )
+        arguments += Helper.get_log_related_arguments(
+            foreign_table_field.table, field2, foreign_table_field.column, field1
+        )
+        return "\n" + Helper.get_log_triggers(
+            nm_table_name, HelperGetNames.get_table_name(nm_table_name), arguments
         )
-        own_table_name = HelperGetNames.get_table_name(table_name)
-        return f"""
-CREATE TRIGGER {trigger_name} AFTER INSERT OR UPDATE OF {generic_plain_field_name} OR DELETE ON {own_table_name}
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}','{generic_plain_field_name}','{updated_field}');
-"""
 
     @staticmethod
     def get_trigger_for_generic_intermediate_table(
@@ -2575,26 +5140,31 @@ FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{foreign_table}','{ge
     ) -> str:
 
         gm_table_name = HelperGetNames.get_gm_table_name(own_table_field)
-        trigger_text = ""
-
+        own_table_name_with_ref_column = (
+            f"{own_table_field.table}_{own_table_field.ref_column}"
+        )
+        value_column = own_table_field.intermediate_column
+        if OPTIONS.get("typed_generic_relations"):
+            # only the id is compared, rows of gm-tables aren't updated
+            value_column = HelperGetNames.get_generic_model_id_column(value_column)
+        arguments = "''"
+        arguments += Helper.get_log_related_arguments(
+            own_table_field.table,
+            own_table_name_with_ref_column,
+            own_table_field.column,
+            value_column,
+        )
         for foreign_table_field in foreign_table_fields:
             gm_content_field = HelperGetNames.get_gm_content_field(
                 own_table_field.intermediate_column, foreign_table_field.table
             )
-            trigger_name = HelperGetNames.get_notify_gm_related_trigger_name(
-                gm_content_field, gm_table_name
-            )
-            own_table_name_with_ref_column = (
-                f"{own_table_field.table}_{own_table_field.ref_column}"
+            arguments += Helper.get_log_related_arguments(
+                foreign_table_field.table,
+                gm_content_field,
+                foreign_table_field.column,
+                own_table_name_with_ref_column,
             )
-            trigger_text += f"""
-CREATE TRIGGER {trigger_name} AFTER INSERT OR UPDATE OF {gm_content_field} OR DELETE ON {gm_table_name}
-FOR EACH ROW EXECUTE FUNCTION log_modified_related_models('{own_table_field.table}','{own_table_name_with_ref_column}','{own_table_field.column}','{foreign_table_field.table}','{gm_content_field}','{foreign_table_field.column}');
-"""
-        trigger_text += f"""CREATE CONSTRAINT TRIGGER notify_transaction_end AFTER INSERT OR UPDATE OR DELETE ON {gm_table_name}
-DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_end();
-"""
-        return trigger_text
+        return "\n" + Helper.get_log_triggers(gm_table_name, gm_table_name, arguments)
 
     @staticmethod
     def get_initials(
@@ -2711,6 +5281,15 @@ DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION notify_transaction_e
         )
         return f"""    CONSTRAINT {constraint_name} CHECK (split_part({own_column}, '/', 1) IN ('{"','".join(foreign_tables)}')),\n"""
 
+    @staticmethod
+    def get_generic_pair_constraint(
+        collection: str, own_column: str, collection_column: str, model_id_column: str
+    ) -> str:
+        constraint_name = HelperGetNames.get_generic_pair_constraint_name(
+            collection, own_column
+        )
+        return f"    CONSTRAINT {constraint_name} CHECK (({collection_column} IS NULL) = ({model_id_column} IS NULL)),\n"
+
     @staticmethod
     def prefix_error(method_or_str: str, table_name: str, fname: str) -> str:
         return f"    {table_name}/{fname}: {method_or_str}"
@@ -2832,12 +5411,111 @@ FIELD_TYPES: dict[str, dict[str, Any]] = {
 }
 
 
-def main() -> None:
+def main() -> int:
     """
     Main entry point for this script to generate the schema_relational.sql from the collections files.
     """
 
-    _, checksum = InternalHelper.read_models_yml()
+    parser = argparse.ArgumentParser(
+        description="Generates the relational schema from the collections files."
+    )
+    parser.add_argument(
+        "--destination",
+        type=Path,
+        default=DESTINATION,
+        help="file the schema is written to (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--collections",
+        type=Path,
+        default=DEFAULT_COLLECTIONS_DIR,
+        help="directory of the collections files (default: the collections of this repository)",
+    )
+    parser.add_argument(
+        "--materialize-relation-lists",
+        action="store_true",
+        help="store back-relation lists in rl_* tables maintained by triggers instead of calculating them in the views",
+    )
+    parser.add_argument(
+        "--base-views",
+        action="store_true",
+        help="additionally create a <collection>_base view per collection without the calculated relation lists",
+    )
+    parser.add_argument(
+        "--stage-notify-log",
+        action="store_true",
+        help="collect the changes of a transaction in an unindexed staging table and write them to os_notify_log_t once at commit",
+    )
+    parser.add_argument(
+        "--sequence-counters",
+        action="store_true",
+        help="keep the numbers of sequence_scope fields in the counter table os_sequence_counter_t instead of a sequence per scope",
+    )
+    parser.add_argument(
+        "--static-trigger-functions",
+        action="store_true",
+        help="generate a function with static SQL per trigger for not null, constant, unique ids pair, equal fields and sequence counter checks",
+    )
+    parser.add_argument(
+        "--consolidated-triggers",
+        action="store_true",
+        help="run the row level checks of a table in one trigger per timing and operation, implies --static-trigger-functions",
+    )
+    parser.add_argument(
+        "--composite-equal-fields",
+        action="store_true",
+        help="enforce equal_fields of 1:x relations with composite foreign keys instead of triggers where both tables have the column",
+    )
+    parser.add_argument(
+        "--typed-generic-relations",
+        action="store_true",
+        help="store generic relations as a collection enum and an integer id instead of a fqid string, the views still return the fqid",
+    )
+    parser.add_argument(
+        "--index-audit",
+        action="store_true",
+        help="list the columns looked up by views and triggers without an index starting with them",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="fail with exit code 1 if the index audit finds columns without index, implies --index-audit",
+    )
+    parser.add_argument(
+        "--trigger-report",
+        action="store_true",
+        help="list per table the triggers fired by an insert, update and delete of a row and the related fields logged",
+    )
+    parser.add_argument(
+        "--logical-replication",
+        action="store_true",
+        help="publish the tables in the publication os_changes for src/pgoutput_decoder.py instead of creating the log_modified_models triggers",
+    )
+    args = parser.parse_args()
+    if args.typed_generic_relations and args.materialize_relation_lists:
+        parser.error(
+            "--typed-generic-relations can't be combined with --materialize-relation-lists"
+        )
+    destination = args.destination.resolve()
+    OPTIONS.update(
+        {
+            "materialize_relation_lists": args.materialize_relation_lists,
+            "base_views": args.base_views,
+            "stage_notify_log": args.stage_notify_log,
+            "sequence_counters": args.sequence_counters,
+            "static_trigger_functions": args.static_trigger_functions
+            or args.consolidated_triggers,
+            "consolidated_triggers": args.consolidated_triggers,
+            "composite_equal_fields": args.composite_equal_fields,
+            "typed_generic_relations": args.typed_generic_relations,
+            "logical_replication": args.logical_replication,
+            "index_audit": args.index_audit or args.strict,
+            "strict": args.strict,
+            "trigger_report": args.trigger_report,
+        }
+    )
+
+    _, checksum = InternalHelper.read_models_yml(collections_dir=str(args.collections))
 
     (
         enum_definitions,
@@ -2857,15 +5535,18 @@ def main() -> None:
         create_trigger_unique_ids_pair_code,
         create_trigger_equal_fields_code,
         create_trigger_notify_code,
+        create_trigger_relation_lists_code,
+        create_trigger_materialized_fields_code,
+        create_trigger_consolidated_code,
         errors,
     ) = GenerateCodeBlocks.generate_the_code()
-    with open(DESTINATION, "w") as dest:
+    with open(destination, "w") as dest:
         dest.write(Helper.FILE_TEMPLATE_HEADER)
         dest.write("-- MODELS_YML_CHECKSUM = " + repr(checksum) + "\n")
         dest.write("\n\n-- ENUM definitions\n")
         dest.write(enum_definitions)
         dest.write("\n\n-- Function and meta table definitions\n")
-        dest.write(Helper.FILE_TEMPLATE_CONSTANT_DEFINITIONS)
+        dest.write(Helper.get_constant_definitions())
         dest.write(pre_code)
         dest.write("\n\n-- Table definitions\n")
         dest.write(table_name_code)
@@ -2901,6 +5582,25 @@ def main() -> None:
             "\n\n-- Create triggers checking equal_fields settings in relations\n"
         )
         dest.write(create_trigger_equal_fields_code)
+        if create_trigger_consolidated_code:
+            dest.write(
+                "\n\n-- Create triggers running all row level checks of a table\n"
+            )
+            dest.write(create_trigger_consolidated_code)
+        if create_trigger_relation_lists_code:
+            dest.write(
+                "\n\n-- Create triggers maintaining materialized relation lists\n"
+            )
+            dest.write(create_trigger_relation_lists_code)
+        if create_trigger_materialized_fields_code:
+            dest.write("\n\n-- Create triggers maintaining materialized sql fields\n")
+            dest.write(create_trigger_materialized_fields_code)
+        dest.write("\n\n-- Meeting functions\n")
+        dest.write(GenerateCodeBlocks.get_clone_meeting_function())
+        dest.write(GenerateCodeBlocks.get_delete_meeting_function())
+        dest.write(GenerateCodeBlocks.get_export_meeting_function())
+        dest.write("\n\n-- Read functions\n")
+        dest.write(GenerateCodeBlocks.get_models_function())
         dest.write(Helper.RELATION_LIST_AGENDA)
         dest.write("/*\n")
         dest.write(final_info_code)
@@ -2917,11 +5617,46 @@ def main() -> None:
                 f"\n/*   Missing handling for collections _meta attributes: {', '.join(missing_handled_collections_meta_attributes)} */"
             )
     if errors:
-        print(f"Models file {DESTINATION} created with {len(errors)} errors/warnings\n")
+        print(f"Models file {destination} created with {len(errors)} errors/warnings\n")
         print("".join(errors))
     else:
-        print(f"Models file {DESTINATION} successfully created.")
+        print(f"Models file {destination} successfully created.")
+    if OPTIONS.get("index_audit"):
+        missing_indexes = GenerateCodeBlocks.get_index_audit(
+            pre_code + table_name_code + im_table_code + alter_table_code
+        )
+        if missing_indexes:
+            print(f"Index audit: {len(missing_indexes)} lookups without index")
+            print("".join(missing_indexes))
+            if OPTIONS.get("strict"):
+                return 1
+        else:
+            print("Index audit: all lookups are indexed.")
+    if OPTIONS.get("trigger_report"):
+        print(
+            "Trigger report: row+statement level triggers fired per operation and table"
+        )
+        print(
+            "".join(
+                GenerateCodeBlocks.get_trigger_report(
+                    Helper.get_constant_definitions()
+                    + pre_code
+                    + create_trigger_partitioned_sequences_code
+                    + create_trigger_1_1_relation_not_null_code
+                    + create_trigger_1_n_relation_not_null_code
+                    + create_trigger_n_m_relation_not_null_code
+                    + create_trigger_prevent_updates_code
+                    + create_trigger_unique_ids_pair_code
+                    + create_trigger_notify_code
+                    + create_trigger_equal_fields_code
+                    + create_trigger_consolidated_code
+                    + create_trigger_relation_lists_code
+                    + create_trigger_materialized_fields_code
+                )
+            )
+        )
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -15,6 +15,22 @@ DEFAULT_COLLECTION_META = os.path.join(ROOT, "collection-meta.yml")
 DEFAULT_COLLECTIONS_DIR = os.path.join(ROOT, "collections")
 PERMISSIONS_SOURCE = os.path.join(ROOT, "permission.yml")
 
+# table storage parameters of PostgreSQL allowed in the storage attribute of a collection
+STORAGE_PARAMETER_REGEX = re.compile(
+    r"^(fillfactor|toast_tuple_target|parallel_workers|vacuum_index_cleanup"
+    r"|(toast\.)?(autovacuum_\w+|vacuum_truncate|log_autovacuum_min_duration))$"
+)
+# types with variable length, which are stored with TOAST compression
+COMPRESSIBLE_TYPES = (
+    "string",
+    "text",
+    "HTMLStrict",
+    "HTMLPermissive",
+    "JSON",
+    "string[]",
+    "text[]",
+)
+
 
 def build_models_yaml_content(meta_file: str, collections_dir: str) -> bytes:
     result = {}
@@ -150,6 +166,12 @@ class HelperGetNames:
         """gets the name of a view. Its the collection name in quotes"""
         return f'"{table_name}"'
 
+    @staticmethod
+    @max_length
+    def get_base_view_name(table_name: str) -> str:
+        """gets the name of the view restricted to the table columns"""
+        return f'"{table_name}_base"'
+
     @staticmethod
     @max_length
     def get_nm_table_name(own: TableFieldType, foreign: TableFieldType) -> str:
@@ -168,6 +190,12 @@ class HelperGetNames:
         """
         return f"gm_{table_field.table}_{table_field.column}_t"
 
+    @staticmethod
+    @max_length
+    def get_relation_list_table_name(table_name: str) -> str:
+        """gets the name of the table holding the materialized relation lists of a collection"""
+        return f"rl_{HelperGetNames.get_table_name(table_name)}"
+
     @staticmethod
     @max_length
     def get_field_in_n_m_relation_list(
@@ -194,6 +222,24 @@ class HelperGetNames:
         """gets the name of a generic valid constraint"""
         return f"valid_{table_name}_{fname}_part1"
 
+    @staticmethod
+    @max_length
+    def get_generic_collection_column(fname: str) -> str:
+        """Gets the column holding the collection of a generic relation with typed_generic_relations"""
+        return f"{fname}_collection"
+
+    @staticmethod
+    @max_length
+    def get_generic_model_id_column(fname: str) -> str:
+        """Gets the column holding the id of a generic relation with typed_generic_relations"""
+        return f"{fname}_model_id"
+
+    @staticmethod
+    @max_length
+    def get_generic_pair_constraint_name(table_name: str, fname: str) -> str:
+        """gets the name of the constraint setting collection and id of a generic relation together"""
+        return f"pair_{table_name}_{fname}"
+
     @staticmethod
     @max_length
     def get_generic_unique_constraint_name(
@@ -280,6 +326,29 @@ class HelperGetNames:
         """gets the name of a foreign key constraint."""
         return f"fk_{own_table}_{own_column}_{foreign_table}_{fk_column}"
 
+    @staticmethod
+    @max_length
+    def get_composite_fk_constraint_name(
+        own_table: str,
+        own_column: str,
+        equal_field: str,
+        foreign_table: str,
+    ) -> str:
+        """gets the name of a foreign key constraint including an equal field."""
+        return f"fk_{own_table}_{own_column}_{equal_field}_{foreign_table}"
+
+    @staticmethod
+    @max_length
+    def get_composite_unique_constraint_name(table: str, equal_field: str) -> str:
+        """gets the name of the unique constraint referenced by composite foreign keys."""
+        return f"unique_{table}_id_{equal_field}"
+
+    @staticmethod
+    @max_length
+    def get_partition_name(table_name: str, suffix: str | int) -> str:
+        """gets the name of a partition of a partitioned table"""
+        return f"{table_name}_p{suffix}"
+
     @staticmethod
     @max_length
     def get_index_name(
@@ -394,23 +463,45 @@ class HelperGetNames:
 
     @staticmethod
     @max_length
-    def get_notify_trigger_name(table_name: str) -> str:
-        """gets the name of the trigger for logging changes on models"""
-        return f"tr_log_{table_name}"
+    def get_notify_trigger_name(table_name: str, operation: str) -> str:
+        """gets the name of the trigger for logging changes on models and related models"""
+        return f"tr_log_{operation[0].lower()}_{table_name}"
+
+    @staticmethod
+    @max_length
+    def get_trigger_function_name(trigger_name: str) -> str:
+        """gets the name of the function generated for a single trigger"""
+        return f"fn_{trigger_name}"
 
     @staticmethod
     @max_length
-    def get_notify_related_trigger_name(table_name: str, column_name: str) -> str:
-        """gets the name of the trigger for logging changes on related models"""
-        return f"tr_log_{table_name}_{column_name}"
+    def get_relation_list_trigger_name(table_name: str, operation: str) -> str:
+        """gets the name of the trigger maintaining materialized relation lists"""
+        return f"tr_rl_{operation[0].lower()}_{table_name}"
 
     @staticmethod
     @max_length
-    def get_notify_gm_related_trigger_name(
-        gm_content_field: str, gm_table_name: str
+    def get_consolidated_trigger_name(
+        table_name: str, timing: str, operation: str, when: bool
     ) -> str:
-        """gets the name of the trigger for logging changes on g:m-tables"""
-        return f"tr_log_{gm_content_field}_{gm_table_name}"
+        """
+        gets the name of the trigger running all row level checks of a table for one
+        timing and operation, suffix _w for the one with a WHEN condition
+        """
+        prefix = "tr_before" if timing == "BEFORE" else "tr_check"
+        return f"{prefix}_{operation[0].lower()}_{table_name}{'_w' if when else ''}"
+
+    @staticmethod
+    @max_length
+    def get_materialized_field_function_name(table_name: str, fname: str) -> str:
+        """gets the name of the function recalculating a materialized sql field"""
+        return f"mf_{table_name}_{fname}"
+
+    @staticmethod
+    @max_length
+    def get_materialized_field_trigger_name(table_name: str, operation: str) -> str:
+        """gets the name of the trigger recalculating materialized sql fields"""
+        return f"tr_mf_{operation[0].lower()}_{table_name}"
 
     @staticmethod
     @max_length
@@ -551,6 +642,112 @@ class InternalHelper:
         if to_long:
             raise Exception("\n".join(to_long))
 
+    @staticmethod
+    def check_storage(
+        collection: str, storage: Any, fields: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, str], list[str]]:
+        """
+        Returns the storage parameters and the compression methods per field of the
+        storage attribute of the collection and the errors found in it.
+        """
+        if not isinstance(storage, dict):
+            return (
+                {},
+                {},
+                [
+                    f"Collection '{collection}': attribute storage must be a dict of storage parameters."
+                ],
+            )
+        parameters = dict(storage)
+        compression = parameters.pop("compression", {})
+        errors = []
+        for parameter, value in parameters.items():
+            if not STORAGE_PARAMETER_REGEX.match(parameter):
+                errors.append(
+                    f"Collection '{collection}': unknown storage parameter '{parameter}'."
+                )
+            elif not isinstance(value, (bool, int, float)):
+                errors.append(
+                    f"Collection '{collection}': storage parameter '{parameter}' must be a number or boolean."
+                )
+        if not isinstance(compression, dict):
+            errors.append(
+                f"Collection '{collection}': storage compression must be a dict of field names and methods."
+            )
+            return parameters, {}, errors
+        for field_name, method in compression.items():
+            field = fields.get(field_name)
+            if (
+                not field
+                or field["type"] not in COMPRESSIBLE_TYPES
+                or field.get("calculated")
+                or field.get("sql")
+            ):
+                errors.append(
+                    f"Collection '{collection}': storage compression field '{field_name}' must be a stored field of type {', '.join(COMPRESSIBLE_TYPES)}."
+                )
+            if method not in ("pglz", "lz4", "default"):
+                errors.append(
+                    f"Collection '{collection}': storage compression of '{field_name}' must be pglz, lz4 or default."
+                )
+        return parameters, compression, errors
+
+    @staticmethod
+    def check_partition_by(
+        collection: str,
+        partition: Any,
+        fields: dict[str, Any],
+        meta: dict[str, Any],
+    ) -> tuple[dict[str, Any] | None, list[str]]:
+        """
+        Returns the partition_by attribute normalized to a dict with the keys column, method
+        and partitions and the reasons, why PostgreSQL can't partition the table.
+        meta contains the unique_together attributes of the collection.
+        """
+        if isinstance(partition, str):
+            partition = {"column": partition}
+        if not isinstance(partition, dict) or not set(partition).issubset(
+            {"column", "method", "partitions"}
+        ):
+            return None, [
+                f"Collection '{collection}': attribute partition_by must be a field name or a dict with column, method and partitions."
+            ]
+        partition = {"method": "hash", "partitions": 8, **partition}
+        errors = []
+        column = partition.get("column")
+        if column not in fields or not fields[column].get("required"):
+            errors.append(
+                f"Collection '{collection}': partition_by column '{column}' must be a required field."
+            )
+        if partition["method"] not in ("hash", "list"):
+            errors.append(
+                f"Collection '{collection}': partition_by method must be 'hash' or 'list'."
+            )
+        if not isinstance(partition["partitions"], int) or partition["partitions"] < 1:
+            errors.append(
+                f"Collection '{collection}': partition_by partitions must be a positive number."
+            )
+        for field_name, field in fields.items():
+            # A foreign key can only reference a partitioned table with the partition key.
+            # A relation without reference is stored as foreign key of the other table.
+            if field.get("type") in ("relation-list", "generic-relation-list") or (
+                field.get("type") == "relation" and not field.get("reference")
+            ):
+                errors.append(
+                    f"Collection '{collection}' can not be partitioned, because field '{field_name}' is referenced by another table."
+                )
+            if field.get("unique"):
+                errors.append(
+                    f"Collection '{collection}' can not be partitioned, because the unique field '{field_name}' doesn't include the partition key."
+                )
+        for attr in ("unique_together", "unique_together_strict"):
+            for constraint in meta.get(attr, []):
+                if column not in [name.strip() for name in constraint.split(",")]:
+                    errors.append(
+                        f"Collection '{collection}': constraint '{constraint}' of {attr} must include the partition_by column '{column}'."
+                    )
+        return partition, errors
+
     @staticmethod
     def get_field_definition_from_to(to: str) -> tuple[str, str, dict[str, Any]]:
         try:
@@ -0,0 +1,257 @@
+import re
+import struct
+from typing import Any, TypedDict
+
+import psycopg
+from psycopg.rows import tuple_row
+
+
+class LogEntry(TypedDict):
+    """One entry as written to os_notify_log_t by log_modified_models"""
+
+    operation: str
+    fqid: str
+    updated_fields: list[str] | None
+
+
+class LogTransaction(TypedDict):
+    """The merged log entries of one committed transaction"""
+
+    xid: int
+    commit_lsn: int
+    entries: list[LogEntry]
+
+
+class Relation(TypedDict):
+    name: str
+    columns: list[str]
+    # generated generic columns: (column, source column, collection)
+    generated: list[tuple[str, str, str]]
+
+
+Row = dict[str, str | None]
+
+
+class PgOutputDecoder:
+    """
+    Decodes the pgoutput messages (protocol version 1) of the publication os_changes
+    created by generate_sql_schema.py --logical-replication into the entries
+    log_modified_models would have written to os_notify_log_t.
+    Feed every message of the replication stream to decode(). At the commit of
+    a transaction its entries are returned, merged per operation and fqid.
+    The xid is the 32 bit transaction id of the WAL, not the xid8 of pg_current_xact_id().
+    """
+
+    NOTIFY_LOG_TABLE = "os_notify_log_t"
+    # columns of a generic relation stored with --typed-generic-relations
+    TYPED_GENERIC_COLUMN_REGEX = re.compile(r"_id_(collection|model_id)$")
+
+    def __init__(self, log_arguments: dict[str, list[str]]) -> None:
+        """log_arguments: table name to log_modified_models arguments, see os_log_replication_t"""
+        self.log_arguments = log_arguments
+        self.relations: dict[int, Relation] = {}
+        self.xid = 0
+        self.entries: dict[tuple[str, str], set[str] | None] = {}
+
+    @classmethod
+    def from_connection(cls, connection: psycopg.Connection) -> "PgOutputDecoder":
+        with connection.cursor(row_factory=tuple_row) as curs:
+            rows = curs.execute(
+                "SELECT table_name, log_arguments FROM os_log_replication_t"
+            ).fetchall()
+        return cls({table_name: log_arguments for table_name, log_arguments in rows})
+
+    def decode(self, message: bytes) -> LogTransaction | None:
+        reader = MessageReader(message)
+        match reader.read_char():
+            case "B":
+                reader.read_int64()  # final lsn
+                reader.read_int64()  # commit timestamp
+                self.xid = reader.read_int32()
+                self.entries = {}
+            case "C":
+                reader.read_int8()  # flags
+                commit_lsn = reader.read_int64()
+                return {
+                    "xid": self.xid,
+                    "commit_lsn": commit_lsn,
+                    "entries": [
+                        {
+                            "operation": operation,
+                            "fqid": fqid,
+                            "updated_fields": (
+                                None if fields is None else sorted(fields)
+                            ),
+                        }
+                        for (operation, fqid), fields in self.entries.items()
+                    ],
+                }
+            case "R":
+                self.read_relation(reader)
+            case "I":
+                relation = self.relations[reader.read_int32()]
+                reader.read_char()  # N
+                self.log_row_change(relation, None, self.read_tuple(reader, relation))
+            case "U":
+                relation = self.relations[reader.read_int32()]
+                old = None
+                if reader.read_char() in "KO":
+                    old = self.read_tuple(reader, relation)
+                    reader.read_char()  # N
+                new = self.read_tuple(reader, relation, old)
+                self.log_row_change(relation, old, new)
+            case "D":
+                relation = self.relations[reader.read_int32()]
+                reader.read_char()  # K or O
+                self.log_row_change(relation, self.read_tuple(reader, relation), None)
+            # origin, type, truncate and logical decoding messages are not logged
+        return None
+
+    def read_relation(self, reader: "MessageReader") -> None:
+        oid = reader.read_int32()
+        reader.read_string()  # namespace
+        name = reader.read_string()
+        reader.read_int8()  # replica identity
+        columns = []
+        for _ in range(reader.read_int16()):
+            reader.read_int8()  # flags
+            columns.append(reader.read_string())
+            reader.read_int32()  # type oid
+            reader.read_int32()  # type modifier
+        # Generated columns are not published, but used as fk columns of generic relations:
+        # <source column>_<collection>_id holds the id, if the source column references collection.
+        # With --typed-generic-relations the source column is stored as <source column>_collection
+        # and <source column>_model_id.
+        generated = []
+        arguments = self.log_arguments.get(name, [])
+        for i in range(1, len(arguments), 4):
+            foreign_collection, fk_column = arguments[i], arguments[i + 1]
+            if fk_column in columns:
+                continue
+            suffix = f"_{foreign_collection}_id"
+            if not fk_column.endswith(suffix):
+                raise Exception(
+                    f"Column {fk_column} of {name} is neither published nor a generated generic column"
+                )
+            generated.append(
+                (fk_column, fk_column.removesuffix(suffix), foreign_collection)
+            )
+        self.relations[oid] = {"name": name, "columns": columns, "generated": generated}
+
+    @staticmethod
+    def read_tuple(
+        reader: "MessageReader", relation: Relation, old: Row | None = None
+    ) -> Row:
+        row: Row = {}
+        for i in range(reader.read_int16()):
+            column = relation["columns"][i]
+            kind = reader.read_char()
+            if kind == "n":
+                row[column] = None
+            elif kind == "u":
+                # unchanged toasted value, only send with the old row
+                row[column] = old.get(column) if old else None
+            else:
+                row[column] = reader.read_bytes(reader.read_int32()).decode()
+        for column, source_column, collection in relation["generated"]:
+            if source_column in row:
+                collection_name, _, id_ = (row.get(source_column) or "").partition("/")
+            else:
+                collection_name = row.get(f"{source_column}_collection") or ""
+                id_ = row.get(f"{source_column}_model_id") or ""
+            row[column] = str(int(id_)) if collection_name == collection else None
+        return row
+
+    def log_row_change(
+        self, relation: Relation, old: Row | None, new: Row | None
+    ) -> None:
+        if relation["name"] == self.NOTIFY_LOG_TABLE:
+            # written by the log_triggers of the models, taken over as they are
+            row = new or {}
+            fields = row.get("updated_fields")
+            self.add_entry(
+                row.get("operation") or "",
+                row.get("fqid") or "",
+                None if fields is None else set(parse_text_array(fields)),
+            )
+            return
+        if (arguments := self.log_arguments.get(relation["name"])) is None:
+            return
+        if collection := arguments[0]:
+            if old is None and new is not None:
+                self.add_entry("insert", f"{collection}/{new['id']}", None)
+            elif new is None and old is not None:
+                self.add_entry("delete", f"{collection}/{old['id']}", None)
+            elif new is not None and old is not None:
+                changed = {
+                    self.TYPED_GENERIC_COLUMN_REGEX.sub("_id", column)
+                    for column in old.keys() | new.keys()
+                    if old.get(column) != new.get(column)
+                }
+                self.add_entry("update", f"{collection}/{new['id']}", changed)
+        for i in range(1, len(arguments), 4):
+            foreign_collection, fk_column, foreign_field, value_column = arguments[
+                i : i + 4
+            ]
+            old_pair = (old[fk_column], old[value_column]) if old else None
+            new_pair = (new[fk_column], new[value_column]) if new else None
+            if old_pair == new_pair:
+                continue
+            for pair in (old_pair, new_pair):
+                if pair and pair[0] is not None:
+                    self.add_entry(
+                        "update", f"{foreign_collection}/{pair[0]}", {foreign_field}
+                    )
+
+    def add_entry(self, operation: str, fqid: str, fields: set[str] | None) -> None:
+        key = (operation, fqid)
+        if fields is None:
+            self.entries.setdefault(key, None)
+        elif (known := self.entries.get(key)) is not None:
+            known.update(fields)
+        else:
+            self.entries[key] = set(fields)
+
+
+class MessageReader:
+    """Reads the network byte order values of a pgoutput message"""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.offset = 0
+
+    def read(self, format: str) -> Any:
+        value = struct.unpack_from(format, self.data, self.offset)[0]
+        self.offset += struct.calcsize(format)
+        return value
+
+    def read_int8(self) -> int:
+        return self.read("!b")
+
+    def read_int16(self) -> int:
+        return self.read("!h")
+
+    def read_int32(self) -> int:
+        return self.read("!I")
+
+    def read_int64(self) -> int:
+        return self.read("!Q")
+
+    def read_char(self) -> str:
+        return self.read_bytes(1).decode()
+
+    def read_bytes(self, length: int) -> bytes:
+        value = self.data[self.offset : self.offset + length]
+        self.offset += length
+        return value
+
+    def read_string(self) -> str:
+        end = self.data.index(b"\0", self.offset)
+        value = self.data[self.offset : end].decode()
+        self.offset = end + 1
+        return value
+
+
+def parse_text_array(value: str) -> list[str]:
+    """Parses the text output of a one-dimensional array of field names"""
+    return [item.strip('"') for item in value[1:-1].split(",") if item]
@@ -13,6 +13,7 @@ from .helper_get_names import (
     DEFAULT_COLLECTIONS_DIR,
     KEYSEPARATOR,
     PERMISSIONS_SOURCE,
+    InternalHelper,
 )
 
 MAX_FIELD_NAME_LENGTH = 63
@@ -26,6 +27,8 @@ COLLECTIONFIELD_REGEX = re.compile(f"^{_collection_regex}{KEYSEPARATOR}{_field_r
 
 DECIMAL_REGEX = re.compile(r"^-?(\d|[1-9]\d+)\.\d{6}$")
 COLOR_REGEX = re.compile(r"^#[0-9a-f]{6}$")
+# tables used in the sql of fields
+TABLE_NAME_REGEX = re.compile(r"\b([a-z][a-z0-9_]*_t)\b")
 
 
 RELATION_TYPES = (
@@ -174,6 +177,14 @@ class Checker:
             for attr, values in data.items():
                 if attr in ["unique_together", "unique_together_strict"]:
                     self.check_unique_together(collection, values, attr)
+                elif attr == "partition_by":
+                    self.check_partition_by(collection, values)
+                elif attr == "storage":
+                    self.check_storage(collection, values)
+                elif attr == "materialize" and not isinstance(values, bool):
+                    self.errors.append(
+                        f"Collection '{collection}': attribute materialize must be a boolean."
+                    )
         self.check_permissions()
 
     def check_field(
@@ -220,6 +231,10 @@ class Checker:
                 return
 
         if field.get("calculated"):
+            if "materialize" in field:
+                self.errors.append(
+                    f"{collectionfield}: calculated fields are computed by the backend and can't be materialized."
+                )
             return
 
         if scope_field_name := field.get("sequence_scope", ""):
@@ -330,8 +345,9 @@ class Checker:
                 valid_attributes.append("enum")
             valid_attributes.extend(("deferred", "sql"))
             if field.get("sql"):
-                valid_attributes.append("log_triggers")
+                valid_attributes.extend(("log_triggers", "materialize"))
                 self.check_log_triggers(collectionfield, field)
+                self.check_materialize(collection, collectionfield, field)
             if "default" in field and field_name == "organization_id":
                 # added as a workaround to allow defaulting to the ONE_ORGANIZATION
                 print(f"Default in {collection}/{field_name} temporarily allowed.")
@@ -376,6 +392,18 @@ class Checker:
                     f"Some fields from the constraint '{attr_name}' don't exist in the collection '{collection}': {', '.join(invalid_field_names)}."
                 )
 
+    def check_storage(self, collection: str, storage: Any) -> None:
+        _, _, errors = InternalHelper.check_storage(
+            collection, storage, self.models[collection]
+        )
+        self.errors.extend(errors)
+
+    def check_partition_by(self, collection: str, partition: Any) -> None:
+        _, errors = InternalHelper.check_partition_by(
+            collection, partition, self.models[collection], self.meta_data[collection]
+        )
+        self.errors.extend(errors)
+
     def check_permissions(self) -> None:
         permissions_path = Path(PERMISSIONS_SOURCE)
         group_permissions = set(self.models["group"]["permissions"]["items"]["enum"])
@@ -665,6 +693,45 @@ class Checker:
                         f"{base_error_message}: attribute '{attr}' is invalid."
                     )
 
+    def check_materialize(
+        self, collection: str, collectionfield: str, field: dict[str, Any]
+    ) -> None:
+        """
+        Checks that a materialized sql field is recalculated for every table its sql
+        depends on, i.e. that every table used in the sql is the on_table of a log_trigger.
+        """
+        materialize = field.get(
+            "materialize", self.meta_data[collection].get("materialize", False)
+        )
+        if not isinstance(materialize, bool):
+            self.errors.append(
+                f"Invalid value for 'materialize' of {collectionfield}: must be a boolean."
+            )
+            return
+        if not materialize:
+            return
+        log_triggers = field.get("log_triggers")
+        if not isinstance(log_triggers, list):
+            return  # reported by check_log_triggers
+        on_tables = {
+            log_trigger.get("on_table")
+            for log_trigger in log_triggers
+            if isinstance(log_trigger, dict)
+        }
+        for table in sorted(set(TABLE_NAME_REGEX.findall(field["sql"])) - on_tables):
+            self.errors.append(
+                f"{collectionfield} can't be materialized: its sql depends on '{table}', which isn't the on_table of a log_trigger."
+            )
+        for log_trigger in log_triggers:
+            if (
+                isinstance(log_trigger, dict)
+                and log_trigger.get("on_table") == f"{collection}_t"
+                and not log_trigger.get("on_columns")
+            ):
+                self.errors.append(
+                    f"{collectionfield} can't be materialized: the log_trigger on its own table must define 'on_columns'."
+                )
+
     def validate_enum(self, collectionfield: str, enum: Any) -> list[str] | None:
         """
         Checks that the given `enum` value is valid. If `enum` is a name of a valid
@@ -1,22 +1,40 @@
+import hashlib
 import os
-from collections.abc import Callable
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
 from unittest import TestCase
 
 import psycopg
+import yaml
 from psycopg import sql
 from psycopg.types.json import Jsonb
 
 from src.db_utils import DbUtils
+from src.helper_get_names import DEFAULT_COLLECTIONS_DIR
 from src.python_sql import Table
 
 # ADMIN_USERNAME = "admin"
 # ADMIN_PASSWORD = "admin"
 
 
+# schema databases generated with options in this test run
+GENERATED_SCHEMA_DBS: set[str] = set()
+
+
 class BaseTestCase(TestCase):
     temporary_template_db = "openslides_template"
     work_on_test_db = "openslides_test"
     db_connection: psycopg.Connection
+    # options of src/generate_sql_schema.py, the schema database DATABASE_NAME is used without
+    generator_options: tuple[str, ...] = ()
+    # attributes merged into a copy of the collections files before generating, e.g.
+    # {"meeting": {"fields": {"user_ids": {"materialize": True}}}}
+    collection_updates: dict[str, dict[str, Any]] = {}
 
     # id's of pre loaded rows, see method populate_database
     meeting1_id = 0
@@ -48,9 +66,95 @@ class BaseTestCase(TestCase):
         except Exception as e:
             raise Exception(f"Cannot connect to postgres: {e.message}")
 
+    @classmethod
+    def generate_schema(cls, destination: Path, *options: str) -> str:
+        """writes the schema generated with options to destination and returns the output"""
+        return subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "src.generate_sql_schema",
+                *options,
+                "--destination",
+                str(destination),
+            ],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+    @staticmethod
+    def write_collections(directory: Path, updates: dict[str, dict[str, Any]]) -> None:
+        """copies the collections files to directory and merges the updates into them"""
+
+        def merge(data: dict[str, Any], update: dict[str, Any]) -> None:
+            for key, value in update.items():
+                if isinstance(value, dict) and isinstance(data.get(key), dict):
+                    merge(data[key], value)
+                else:
+                    data[key] = value
+
+        directory.mkdir()
+        for collection_file in Path(DEFAULT_COLLECTIONS_DIR).glob("*.yml"):
+            data = yaml.safe_load(collection_file.read_text())
+            merge(data, updates.get(collection_file.stem, {}))
+            (directory / collection_file.name).write_text(
+                yaml.safe_dump(data, allow_unicode=True, sort_keys=False)
+            )
+
+    @classmethod
+    def get_schema_db(
+        cls,
+        generator_options: tuple[str, ...] | None = None,
+        collection_updates: dict[str, dict[str, Any]] | None = None,
+    ) -> str:
+        """
+        Returns the name of the database with the schema of the generator_options and
+        collection_updates, by default the ones of the class, which is generated and
+        loaded once per test run.
+        """
+        if generator_options is None:
+            generator_options = cls.generator_options
+        if collection_updates is None:
+            collection_updates = cls.collection_updates
+        if not generator_options and not collection_updates:
+            return os.environ["DATABASE_NAME"]
+        db_name = (
+            "openslides_schema_"
+            + hashlib.md5(
+                repr((generator_options, collection_updates)).encode()
+            ).hexdigest()[:8]
+        )
+        if db_name in GENERATED_SCHEMA_DBS:
+            return db_name
+        with tempfile.TemporaryDirectory() as directory:
+            schema_file = Path(directory) / "schema.sql"
+            options = generator_options
+            if collection_updates:
+                collections_dir = Path(directory) / "collections"
+                cls.write_collections(collections_dir, collection_updates)
+                options += ("--collections", str(collections_dir))
+            cls.generate_schema(schema_file, *options)
+            cls.set_db_connection("postgres", True)
+            with cls.db_connection:
+                cls.db_connection.execute(
+                    sql.SQL("DROP DATABASE IF EXISTS {} (FORCE);").format(
+                        sql.Identifier(db_name)
+                    )
+                )
+                cls.db_connection.execute(
+                    sql.SQL("CREATE DATABASE {};").format(sql.Identifier(db_name))
+                )
+            cls.set_db_connection(db_name)
+            with cls.db_connection:
+                cls.db_connection.execute(schema_file.read_text())
+        GENERATED_SCHEMA_DBS.add(db_name)
+        return db_name
+
     @classmethod
     def setup_class(cls) -> None:
-        env = os.environ
+        schema_db = cls.get_schema_db()
         cls.set_db_connection("postgres", True)
         with cls.db_connection:
             with cls.db_connection.cursor() as curs:
@@ -66,7 +170,7 @@ class BaseTestCase(TestCase):
                         "CREATE DATABASE {db_to_create} TEMPLATE {template_db};"
                     ).format(
                         db_to_create=sql.Identifier(cls.temporary_template_db),
-                        template_db=sql.Identifier(env["DATABASE_NAME"]),
+                        template_db=sql.Identifier(schema_db),
                     )
                 )
         cls.set_db_connection(cls.temporary_template_db)
@@ -114,6 +218,45 @@ class BaseTestCase(TestCase):
 
         self.set_db_connection(self.work_on_test_db)
 
+    @contextmanager
+    def populated_database(
+        self, *generator_options: str
+    ) -> Iterator[psycopg.Connection]:
+        """
+        Yields a connection to a database populated like the test database, but with the
+        schema generated with generator_options, e.g. to compare the behaviour of the
+        schema of the class with the one without options.
+        """
+        connection = self.db_connection
+        schema_db = self.get_schema_db(generator_options, {})
+        db_name = f"{self.work_on_test_db}_compare"
+        self.set_db_connection("postgres", autocommit=True)
+        with self.db_connection:
+            for statement in (
+                "DROP DATABASE IF EXISTS {} (FORCE);",
+                "CREATE DATABASE {} TEMPLATE {};",
+            ):
+                self.db_connection.execute(
+                    sql.SQL(statement).format(
+                        sql.Identifier(db_name),
+                        sql.Identifier(schema_db),
+                    )
+                )
+        self.set_db_connection(db_name)
+        try:
+            self.populate_database()
+            yield self.db_connection
+        finally:
+            self.db_connection.close()
+            self.set_db_connection("postgres", autocommit=True)
+            with self.db_connection:
+                self.db_connection.execute(
+                    sql.SQL("DROP DATABASE IF EXISTS {} (FORCE);").format(
+                        sql.Identifier(db_name)
+                    )
+                )
+            type(self).db_connection = connection
+
     @classmethod
     def populate_database(cls) -> None:
         """do something like setting initial_data.json"""
@@ -142,7 +285,6 @@ class BaseTestCase(TestCase):
                         "legal_notice": '<a href="http://www.openslides.org">OpenSlides</a> is a free web based presentation and assembly system for visualizing and controlling agenda, motions and elections of an assembly.',
                         "login_text": "Good Morning!",
                         "default_language": "en",
-                        "genders": ["male", "female", "diverse", "non-binary"],
                         "enable_electronic_voting": True,
                         "enable_chat": True,
                         "reset_password_verbose_errors": True,
@@ -187,7 +329,6 @@ class BaseTestCase(TestCase):
                         "password": "316af7b2ddc20ead599c38541fbe87e9a9e4e960d4017d6e59de188b41b2758flD5BVZAZ8jLy4nYW9iomHcnkXWkfk3PgBjeiTSxjGG7+fBjMBxsaS1vIiAMxYh+K38l0gDW4wcP+i8tgoc4UBg==",
                         "default_password": "admin",
                         "can_change_own_password": True,
-                        "gender": "male",
                         "default_vote_weight": "1.000000",
                         "organization_management_level": "superadmin",
                     }
@@ -810,12 +951,7 @@ class BaseTestCase(TestCase):
                 "agenda_number_prefix": "TOP",
                 "motions_default_workflow_id": result["simple_workflow_id"],
                 "motions_default_amendment_workflow_id": result["complex_workflow_id"],
-                "motions_default_statute_amendment_workflow_id": result[
-                    "complex_workflow_id"
-                ],
                 "motions_recommendations_by": "ABK",
-                "motions_statute_recommendations_by": "",
-                "motions_statutes_enabled": True,
                 "motions_amendments_of_amendments": True,
                 "motions_amendments_prefix": "-\u00c4",
                 "motions_supporters_min_amount": 1,
@@ -0,0 +1,57 @@
+from typing import Any
+
+from tests.base import BaseTestCase
+
+
+class BaseViewsTests(BaseTestCase):
+    generator_options = ("--base-views",)
+
+    def columns(self, relation: str) -> list[str]:
+        with self.db_connection.cursor() as curs:
+            return [
+                row["column_name"]
+                for row in curs.execute(
+                    """SELECT column_name FROM information_schema.columns
+                    WHERE table_name = %s ORDER BY ordinal_position""",
+                    (relation,),
+                )
+            ]
+
+    def fetch_all(self, query: str, *params: Any) -> list[Any]:
+        with self.db_connection.cursor() as curs:
+            return curs.execute(query, params).fetchall()
+
+    def test_columns_of_table(self) -> None:
+        for collection in ("meeting", "motion", "tag", "user"):
+            assert self.columns(f"{collection}_base") == self.columns(f"{collection}_t")
+        # the calculated relation lists are only in the full view
+        assert "tag_ids" in self.columns("meeting")
+        assert "tag_ids" not in self.columns("meeting_base")
+
+    def test_write_through(self) -> None:
+        with self.db_connection.cursor() as curs:
+            tag_id = curs.execute(
+                "INSERT INTO tag_base (name, meeting_id) VALUES ('tag', %s) RETURNING id",
+                (self.meeting1_id,),
+            ).fetchone()["id"]
+            self.db_connection.commit()
+            curs.execute(
+                "UPDATE tag_base SET name = 'renamed' WHERE id = %s", (tag_id,)
+            )
+            # the log triggers of the table fire for writes through the view
+            logged = curs.execute(
+                """SELECT fqid, updated_fields FROM os_notify_log_t
+                WHERE xact_id = pg_current_xact_id() AND operation = 'update'"""
+            ).fetchall()
+        self.db_connection.commit()
+        assert {"fqid": f"tag/{tag_id}", "updated_fields": ["name"]} in logged
+        assert self.fetch_all("SELECT name FROM tag_t WHERE id = %s", tag_id) == [
+            {"name": "renamed"}
+        ]
+        assert self.fetch_all(
+            "SELECT tag_ids FROM meeting WHERE id = %s", self.meeting1_id
+        ) == [{"tag_ids": [tag_id]}]
+        with self.db_connection.cursor() as curs:
+            curs.execute("DELETE FROM tag_base WHERE id = %s", (tag_id,))
+        self.db_connection.commit()
+        assert self.fetch_all("SELECT id FROM tag_t WHERE id = %s", tag_id) == []
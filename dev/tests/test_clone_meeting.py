@@ -0,0 +1,161 @@
+from typing import Any
+
+from src.helper_get_names import HelperGetNames, InternalHelper
+from tests.base import BaseTestCase
+
+
+class CloneMeetingTests(BaseTestCase):
+    # session state and references from models outside of the meeting
+    not_cloned = {
+        ("meeting", "present_user_ids"),
+        ("meeting", "default_meeting_for_committee_id"),
+    }
+
+    def setUp(self) -> None:
+        super().setUp()
+        if not InternalHelper.MODELS:
+            InternalHelper.read_models_yml()
+        with self.db_connection.cursor() as curs:
+            meeting_user_id = curs.execute(
+                "INSERT INTO meeting_user_t (user_id, meeting_id) VALUES (%s, %s) RETURNING id",
+                (self.user1_id, self.meeting1_id),
+            ).fetchone()["id"]
+            curs.execute(
+                "INSERT INTO nm_group_meeting_user_ids_meeting_user_t (group_id, meeting_user_id) VALUES (%s, %s)",
+                (self.groupM1_admin_id, meeting_user_id),
+            )
+            curs.execute(
+                "INSERT INTO nm_meeting_present_user_ids_user_t (meeting_id, user_id) VALUES (%s, %s)",
+                (self.meeting1_id, self.user1_id),
+            )
+        self.db_connection.commit()
+
+    def meeting_rows(self, meeting_id: int) -> dict[str, list[dict[str, Any]]]:
+        """rows of the views of all collections with a meeting_id ordered by id"""
+        rows = {}
+        with self.db_connection.cursor() as curs:
+            rows["meeting"] = curs.execute(
+                "SELECT * FROM meeting WHERE id = %s", (meeting_id,)
+            ).fetchall()
+            for collection, model in InternalHelper.MODELS.items():
+                if "meeting_id" in model.get("fields", {}) and collection != "meeting":
+                    rows[collection] = curs.execute(
+                        f"SELECT * FROM {HelperGetNames.get_view_name(collection)} WHERE meeting_id = %s ORDER BY id",
+                        (meeting_id,),
+                    ).fetchall()
+        return rows
+
+    def map_value(
+        self,
+        fdata: dict[str, Any],
+        value: Any,
+        id_map: dict[tuple[str, int], int],
+    ) -> Any:
+        """value of a field of the source meeting as expected in the clone"""
+        if value is None:
+            return None
+        if fdata["type"] in ("relation", "relation-list"):
+            foreign = fdata["to"].split("/")[0]
+            ids = [
+                id_map.get((foreign, id_), id_)
+                for id_ in (value if isinstance(value, list) else [value])
+            ]
+            return ids if isinstance(value, list) else ids[0]
+        if fdata["type"] in ("generic-relation", "generic-relation-list"):
+            fqids = []
+            for fqid in value if isinstance(value, list) else [value]:
+                foreign, id_ = fqid.split("/")
+                fqids.append(f"{foreign}/{id_map.get((foreign, int(id_)), id_)}")
+            return fqids if isinstance(value, list) else fqids[0]
+        return value
+
+    def test_clone_equals_source(self) -> None:
+        with self.db_connection.cursor() as curs:
+            new_meeting_id = curs.execute(
+                "SELECT clone_meeting(%s, %s) AS id",
+                (self.meeting1_id, self.committee1_id),
+            ).fetchone()["id"]
+        self.db_connection.commit()
+        source = self.meeting_rows(self.meeting1_id)
+        clone = self.meeting_rows(new_meeting_id)
+        # the copies get new ids in the order of the source ids
+        id_map = {
+            (collection, source_row["id"]): clone_row["id"]
+            for collection, source_rows in source.items()
+            for source_row, clone_row in zip(source_rows, clone[collection])
+        }
+        assert {collection: len(rows) for collection, rows in clone.items()} == {
+            collection: len(rows) for collection, rows in source.items()
+        }
+        assert len(source["group"]) == 3 and len(source["meeting_user"]) == 1
+        for collection, source_rows in source.items():
+            fields = InternalHelper.MODELS[collection]["fields"]
+            for source_row, clone_row in zip(source_rows, clone[collection]):
+                for fname, value in source_row.items():
+                    if fname not in fields:
+                        continue
+                    if (collection, fname) in self.not_cloned:
+                        expected = None
+                    elif fname == "id":
+                        expected = id_map[(collection, value)]
+                    elif (
+                        fields[fname].get("unique")
+                        and "relation" not in fields[fname]["type"]
+                    ):
+                        expected = None
+                    else:
+                        expected = self.map_value(fields[fname], value, id_map)
+                    assert (
+                        clone_row[fname] == expected
+                    ), f"{collection}/{clone_row['id']}/{fname}"
+        assert source["meeting"][0]["present_user_ids"] == [self.user1_id]
+        assert clone["meeting"][0]["present_user_ids"] is None
+        with self.db_connection.cursor() as curs:
+            user = curs.execute(
+                'SELECT meeting_ids, is_present_in_meeting_ids FROM "user" WHERE id = %s',
+                (self.user1_id,),
+            ).fetchone()
+        assert user["meeting_ids"] == [self.meeting1_id, new_meeting_id]
+        assert user["is_present_in_meeting_ids"] == [self.meeting1_id]
+
+    def test_clone_owned_mediafiles(self) -> None:
+        with self.db_connection.cursor() as curs:
+            directory_id = curs.execute(
+                "INSERT INTO mediafile_t (title, is_directory, owner_id) VALUES ('folder', true, %s) RETURNING id",
+                (f"meeting/{self.meeting1_id}",),
+            ).fetchone()["id"]
+            file_id = curs.execute(
+                "INSERT INTO mediafile_t (title, parent_id, owner_id) VALUES ('logo', %s, %s) RETURNING id",
+                (directory_id, f"meeting/{self.meeting1_id}"),
+            ).fetchone()["id"]
+            curs.execute(
+                "INSERT INTO meeting_mediafile_t (mediafile_id, meeting_id, is_public) VALUES (%s, %s, true), (%s, %s, true)",
+                (directory_id, self.meeting1_id, file_id, self.meeting1_id),
+            )
+            new_meeting_id = curs.execute(
+                "SELECT clone_meeting(%s, %s) AS id",
+                (self.meeting1_id, self.committee1_id),
+            ).fetchone()["id"]
+        self.db_connection.commit()
+        with self.db_connection.cursor() as curs:
+            curs.execute("SELECT delete_meeting(%s)", (self.meeting1_id,))
+        self.db_connection.commit()
+        with self.db_connection.cursor() as curs:
+            mediafiles = curs.execute(
+                "SELECT id, title, parent_id, owner_id, meeting_mediafile_ids FROM mediafile ORDER BY id"
+            ).fetchall()
+            meeting_mediafiles = curs.execute(
+                "SELECT id, mediafile_id FROM meeting_mediafile WHERE meeting_id = %s ORDER BY id",
+                (new_meeting_id,),
+            ).fetchall()
+        assert [mediafile["title"] for mediafile in mediafiles] == ["folder", "logo"]
+        new_directory, new_file = mediafiles
+        assert new_directory["id"] not in (directory_id, file_id)
+        assert new_directory["owner_id"] == f"meeting/{new_meeting_id}"
+        assert new_file["owner_id"] == f"meeting/{new_meeting_id}"
+        assert new_file["parent_id"] == new_directory["id"]
+        assert [row["mediafile_id"] for row in meeting_mediafiles] == [
+            new_directory["id"],
+            new_file["id"],
+        ]
+        assert new_file["meeting_mediafile_ids"] == [meeting_mediafiles[1]["id"]]
@@ -0,0 +1,70 @@
+import psycopg
+import pytest
+
+from tests.base import BaseTestCase
+
+CONSTRAINT = "fk_chat_message_t_chat_group_id_meeting_id_chat_group_t"
+
+
+class CompositeEqualFieldsTests(BaseTestCase):
+    generator_options = ("--composite-equal-fields",)
+
+    def setUp(self) -> None:
+        super().setUp()
+        with self.db_connection.cursor() as curs:
+            self.meeting2_id = curs.execute(
+                "SELECT clone_meeting(%s, %s) AS id",
+                (self.meeting1_id, self.committee1_id),
+            ).fetchone()["id"]
+            self.chat_group_ids = {
+                meeting_id: curs.execute(
+                    "INSERT INTO chat_group_t (name, meeting_id) VALUES ('chat', %s) RETURNING id",
+                    (meeting_id,),
+                ).fetchone()["id"]
+                for meeting_id in (self.meeting1_id, self.meeting2_id)
+            }
+        self.db_connection.commit()
+
+    def insert_chat_message(
+        self, curs: psycopg.Cursor, chat_group_id: int, meeting_id: int
+    ) -> int:
+        return curs.execute(
+            """INSERT INTO chat_message_t (content, created, chat_group_id, meeting_id)
+            VALUES ('hello', now(), %s, %s) RETURNING id""",
+            (chat_group_id, meeting_id),
+        ).fetchone()["id"]
+
+    def test_checked_by_foreign_key(self) -> None:
+        with self.db_connection.cursor() as curs:
+            functions = [
+                row["proname"]
+                for row in curs.execute(
+                    """SELECT p.proname FROM pg_trigger t JOIN pg_proc p ON p.oid = t.tgfoid
+                    WHERE t.tgrelid = 'chat_message_t'::regclass AND p.proname = 'check_equals'"""
+                )
+            ]
+        self.db_connection.commit()
+        assert functions == []
+
+    def test_valid_reference(self) -> None:
+        with self.db_connection.cursor() as curs:
+            message_ids = {
+                meeting_id: self.insert_chat_message(curs, chat_group_id, meeting_id)
+                for meeting_id, chat_group_id in self.chat_group_ids.items()
+            }
+        self.db_connection.commit()
+        with self.db_connection.cursor() as curs:
+            for meeting_id, chat_group_id in self.chat_group_ids.items():
+                assert curs.execute(
+                    "SELECT chat_message_ids FROM chat_group WHERE id = %s",
+                    (chat_group_id,),
+                ).fetchone()["chat_message_ids"] == [message_ids[meeting_id]]
+
+    def test_other_meeting_rejected(self) -> None:
+        with self.db_connection.cursor() as curs:
+            self.insert_chat_message(
+                curs, self.chat_group_ids[self.meeting2_id], self.meeting1_id
+            )
+            with pytest.raises(psycopg.errors.ForeignKeyViolation) as e:
+                self.db_connection.commit()
+        assert e.value.diag.constraint_name == CONSTRAINT
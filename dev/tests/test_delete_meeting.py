@@ -0,0 +1,93 @@
+import psycopg
+
+from tests.base import BaseTestCase
+
+
+class DeleteMeetingTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        with self.db_connection.cursor() as curs:
+            self.mediafile_ids = {}
+            for owner_id in (
+                f"organization/{self.organization_id}",
+                f"meeting/{self.meeting1_id}",
+            ):
+                self.mediafile_ids[owner_id.split("/")[0]] = curs.execute(
+                    "INSERT INTO mediafile_t (title, owner_id) VALUES ('logo', %s) RETURNING id",
+                    (owner_id,),
+                ).fetchone()["id"]
+                curs.execute(
+                    "INSERT INTO meeting_mediafile_t (mediafile_id, meeting_id, is_public) VALUES (%s, %s, true)",
+                    (self.mediafile_ids[owner_id.split("/")[0]], self.meeting1_id),
+                )
+        self.db_connection.commit()
+
+    def delete_meeting(self) -> set[tuple[str, str, tuple[str, ...] | None]]:
+        """deletes meeting1 and returns the logged (operation, fqid, updated_fields)"""
+        with self.db_connection.cursor() as curs:
+            curs.execute("SELECT delete_meeting(%s)", (self.meeting1_id,))
+            rows = curs.execute(
+                "SELECT operation, fqid, updated_fields FROM os_notify_log_t WHERE xact_id = pg_current_xact_id()"
+            ).fetchall()
+        self.db_connection.commit()
+        return {
+            (
+                row["operation"],
+                row["fqid"],
+                tuple(row["updated_fields"]) if row["updated_fields"] else None,
+            )
+            for row in rows
+        }
+
+    def test_related_models_logged_per_row(self) -> None:
+        logged = self.delete_meeting()
+        self.assertIn(("delete", f"meeting/{self.meeting1_id}", None), logged)
+        organization_mediafile = f"mediafile/{self.mediafile_ids['organization']}"
+        self.assertIn(
+            ("update", organization_mediafile, ("meeting_mediafile_ids",)), logged
+        )
+        meeting_mediafile = f"mediafile/{self.mediafile_ids['meeting']}"
+        self.assertFalse([entry for entry in logged if entry[1] == meeting_mediafile])
+        with self.db_connection.cursor() as curs:
+            self.assertEqual(
+                curs.execute(
+                    "SELECT id, meeting_mediafile_ids FROM mediafile WHERE id = ANY(%s)",
+                    (list(self.mediafile_ids.values()),),
+                ).fetchall(),
+                [
+                    {
+                        "id": self.mediafile_ids["organization"],
+                        "meeting_mediafile_ids": None,
+                    }
+                ],
+            )
+
+    def test_setting_doesnt_skip_triggers(self) -> None:
+        with self.db_connection.cursor() as curs:
+            curs.execute("SELECT set_config('os.deleting_meeting', 'on', false)")
+            xact_id = curs.execute(
+                "UPDATE theme_t SET name = 'renamed' WHERE id = %s RETURNING pg_current_xact_id() AS xact_id",
+                (self.theme1_id,),
+            ).fetchone()["xact_id"]
+            self.db_connection.commit()
+            self.assertEqual(
+                curs.execute(
+                    "SELECT operation, fqid FROM os_notify_log_t WHERE xact_id = %s",
+                    (xact_id,),
+                ).fetchall(),
+                [{"operation": "update", "fqid": f"theme/{self.theme1_id}"}],
+            )
+            curs.execute(
+                "UPDATE projector_t SET used_as_default_projector_for_topic_in_meeting_id = NULL WHERE meeting_id = %s",
+                (self.meeting1_id,),
+            )
+            with self.assertRaisesRegex(psycopg.errors.RaiseException, "Trigger"):
+                self.db_connection.commit()
+
+    def test_no_notices(self) -> None:
+        notices: list[str] = []
+        self.db_connection.add_notice_handler(
+            lambda diagnostic: notices.append(diagnostic.message_primary)
+        )
+        self.delete_meeting()
+        self.assertEqual(notices, [])
@@ -0,0 +1,45 @@
+import json
+from io import StringIO
+
+from src.export_meeting import MeetingExport
+from src.python_sql import Table
+from tests.base import BaseTestCase
+
+meeting_v = Table("meeting")
+
+
+class ExportMeetingTests(BaseTestCase):
+    def test_models_equal_views(self) -> None:
+        models = {
+            model["fqid"]: model["fields"]
+            for model in MeetingExport(self.db_connection, itersize=2).models(
+                self.meeting1_id
+            )
+        }
+        with self.db_connection.cursor() as curs:
+            meeting = curs.execute(
+                *meeting_v.select(where=meeting_v.id == self.meeting1_id)
+            ).fetchone()
+            groups = curs.execute(
+                'SELECT * FROM "group" WHERE meeting_id = %s', (self.meeting1_id,)
+            ).fetchall()
+        exported_meeting = models[f"meeting/{self.meeting1_id}"]
+        for fname in ("group_ids", "projector_ids", "motion_workflow_ids", "user_ids"):
+            assert exported_meeting[fname] == meeting[fname]
+        assert exported_meeting["default_group_id"] == self.groupM1_default_id
+        for group in groups:
+            exported_group = models[f"group/{group['id']}"]
+            assert exported_group["meeting_user_ids"] == group["meeting_user_ids"]
+            assert (
+                exported_group["default_group_for_meeting_id"]
+                == group["default_group_for_meeting_id"]
+            )
+        assert f"user/{self.user1_id}" not in models
+
+    def test_write_ndjson(self) -> None:
+        destination = StringIO()
+        count = MeetingExport(self.db_connection).write(self.meeting1_id, destination)
+        lines = destination.getvalue().splitlines()
+        assert len(lines) == count
+        assert json.loads(lines[0])["fqid"] == f"meeting/{self.meeting1_id}"
+        assert all(json.loads(line)["fields"]["id"] for line in lines)
@@ -0,0 +1,40 @@
+import psycopg
+import pytest
+
+from tests.base import BaseTestCase
+
+
+class GetModelsTests(BaseTestCase):
+    def test_get_models_with_fields(self) -> None:
+        with self.db_connection.cursor() as curs:
+            rows = curs.execute(
+                "SELECT fqid, data FROM get_models(%s, %s) ORDER BY fqid",
+                (
+                    [
+                        f"meeting/{self.meeting1_id}",
+                        f"group/{self.groupM1_admin_id}",
+                        "group/0",
+                    ],
+                    ["name", "admin_group_id", "unknown"],
+                ),
+            ).fetchall()
+        assert rows == [
+            {
+                "fqid": f"group/{self.groupM1_admin_id}",
+                "data": {"id": self.groupM1_admin_id, "name": "Admin"},
+            },
+            {
+                "fqid": f"meeting/{self.meeting1_id}",
+                "data": {
+                    "id": self.meeting1_id,
+                    "name": "OpenSlides Demo",
+                    "admin_group_id": self.groupM1_admin_id,
+                },
+            },
+        ]
+
+    def test_get_models_unknown_collection(self) -> None:
+        with pytest.raises(psycopg.DatabaseError) as e:
+            with self.db_connection.cursor() as curs:
+                curs.execute("SELECT * FROM get_models(ARRAY['unknown/1'])")
+        assert "Unknown collection unknown" in str(e)
@@ -0,0 +1,48 @@
+import io
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.generate_sql_schema import OPTIONS, Helper, main
+
+get_indexed_columns = Helper.get_indexed_columns
+
+
+class IndexAuditTests(TestCase):
+    def generate(self, *options: str) -> tuple[int, str, bool]:
+        """runs the generator and returns its exit code, output and if the schema was written"""
+        with tempfile.TemporaryDirectory() as directory:
+            destination = Path(directory) / "schema.sql"
+            output = io.StringIO()
+            with patch.object(
+                sys,
+                "argv",
+                ["generate_sql_schema", *options, "--destination", str(destination)],
+            ), patch.dict(OPTIONS), redirect_stdout(output):
+                exit_code = main()
+            return exit_code, output.getvalue(), destination.exists()
+
+    def test_all_lookups_indexed(self) -> None:
+        exit_code, output, written = self.generate("--strict")
+        assert exit_code == 0
+        assert "Index audit: all lookups are indexed." in output
+        assert written
+
+    def test_missing_index(self) -> None:
+        # as if the index of the foreign key tag_t.meeting_id weren't generated
+        with patch.object(
+            Helper,
+            "get_indexed_columns",
+            lambda code: get_indexed_columns(code) - {("tag_t", "meeting_id")},
+        ):
+            audit = self.generate("--index-audit")
+            strict = self.generate("--strict")
+        for exit_code, output, written in (audit, strict):
+            assert "Index audit: 1 lookups without index" in output
+            assert "    tag_t.meeting_id used by view meeting.tag_ids" in output
+            assert written
+        assert audit[0] == 0
+        assert strict[0] == 1
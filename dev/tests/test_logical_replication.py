@@ -0,0 +1,137 @@
+from collections.abc import Callable
+
+import psycopg
+import pytest
+
+from src.pgoutput_decoder import PgOutputDecoder
+from tests.base import BaseTestCase
+
+SLOT = "os_changes_test"
+
+Entries = set[tuple[str, str, tuple[str, ...] | None]]
+
+
+class LogicalReplicationTests(BaseTestCase):
+    generator_options = ("--logical-replication",)
+
+    def setUp(self) -> None:
+        super().setUp()
+        with self.db_connection.cursor() as curs:
+            wal_level = curs.execute("SHOW wal_level").fetchone()["wal_level"]
+        self.db_connection.commit()
+        if wal_level != "logical":
+            pytest.skip("the server needs wal_level = logical")
+        self.db_connection.execute(
+            "SELECT pg_create_logical_replication_slot(%s, 'pgoutput')", (SLOT,)
+        )
+        self.db_connection.commit()
+
+    def tearDown(self) -> None:
+        # a database with a replication slot can't be dropped
+        self.db_connection.rollback()
+        self.db_connection.execute(
+            "SELECT pg_drop_replication_slot(slot_name) FROM pg_replication_slots WHERE slot_name = %s",
+            (SLOT,),
+        )
+        self.db_connection.commit()
+
+    def decoded(self) -> list[Entries]:
+        """the entries per transaction decoded from the replication slot"""
+        decoder = PgOutputDecoder.from_connection(self.db_connection)
+        transactions = []
+        with self.db_connection.cursor() as curs:
+            for row in curs.execute(
+                """SELECT data FROM pg_logical_slot_get_binary_changes(%s, NULL, NULL,
+                'proto_version', '1', 'publication_names', 'os_changes')""",
+                (SLOT,),
+            ).fetchall():
+                if transaction := decoder.decode(row["data"]):
+                    transactions.append(
+                        {
+                            (
+                                entry["operation"],
+                                entry["fqid"],
+                                (
+                                    tuple(entry["updated_fields"])
+                                    if entry["updated_fields"] is not None
+                                    else None
+                                ),
+                            )
+                            for entry in transaction["entries"]
+                        }
+                    )
+        self.db_connection.commit()
+        return transactions
+
+    def logged_by_triggers(
+        self, transactions: list[Callable[[psycopg.Cursor], None]]
+    ) -> list[Entries]:
+        """
+        Runs the transactions with the schema generated without options and returns
+        their entries in os_notify_log_t.
+        """
+        logged = []
+        with self.populated_database() as connection:
+            for write in transactions:
+                with connection.transaction():
+                    with connection.cursor() as curs:
+                        write(curs)
+                        rows = curs.execute(
+                            """SELECT operation, fqid, updated_fields FROM os_notify_log_t
+                            WHERE xact_id = pg_current_xact_id()"""
+                        ).fetchall()
+                logged.append(
+                    {
+                        (
+                            row["operation"],
+                            row["fqid"],
+                            (
+                                tuple(sorted(row["updated_fields"]))
+                                if row["updated_fields"] is not None
+                                else None
+                            ),
+                        )
+                        for row in rows
+                    }
+                )
+        return logged
+
+    def test_decoded_as_logged_by_triggers(self) -> None:
+        def rename_theme(curs: psycopg.Cursor) -> None:
+            curs.execute(
+                "UPDATE theme_t SET name = 'renamed' WHERE id = %s", (self.theme1_id,)
+            )
+
+        def tag_committee(curs: psycopg.Cursor) -> None:
+            curs.execute(
+                "INSERT INTO organization_tag_t (name, color) VALUES ('a', '#ffffff')"
+            )
+            curs.execute(
+                """INSERT INTO gm_organization_tag_tagged_ids_t (organization_tag_id, tagged_id)
+                SELECT max(id), %s FROM organization_tag_t""",
+                (f"committee/{self.committee1_id}",),
+            )
+
+        def add_user(curs: psycopg.Cursor) -> None:
+            # meeting.user_ids is logged by the log_triggers of the calculated field
+            curs.execute(
+                "INSERT INTO meeting_user_t (user_id, meeting_id) VALUES (%s, %s)",
+                (self.user1_id, self.meeting1_id),
+            )
+            curs.execute(
+                """INSERT INTO nm_group_meeting_user_ids_meeting_user_t (group_id, meeting_user_id)
+                SELECT %s, max(id) FROM meeting_user_t""",
+                (self.groupM1_default_id,),
+            )
+
+        def untag_committee(curs: psycopg.Cursor) -> None:
+            curs.execute("DELETE FROM gm_organization_tag_tagged_ids_t")
+
+        transactions = [rename_theme, tag_committee, add_user, untag_committee]
+        for write in transactions:
+            with self.db_connection.transaction():
+                with self.db_connection.cursor() as curs:
+                    write(curs)
+        decoded = self.decoded()
+        assert len(decoded) == len(transactions)
+        assert decoded == self.logged_by_triggers(transactions)
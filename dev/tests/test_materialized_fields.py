@@ -0,0 +1,35 @@
+from tests.base import BaseTestCase
+
+
+class MaterializedFieldTests(BaseTestCase):
+    collection_updates = {
+        "meeting": {"fields": {"user_ids": {"materialize": True}}},
+        "user": {"fields": {"meeting_ids": {"materialize": True}}},
+    }
+
+    def test_meeting_user_ids_maintained(self) -> None:
+        with self.db_connection.cursor() as curs:
+            meeting_user_id = curs.execute(
+                "INSERT INTO meeting_user_t (user_id, meeting_id) VALUES (%s, %s) RETURNING id",
+                (self.user1_id, self.meeting1_id),
+            ).fetchone()["id"]
+            assert curs.execute(
+                "SELECT user_ids FROM meeting_t WHERE id = %s", (self.meeting1_id,)
+            ).fetchone()["user_ids"] == [self.user1_id]
+            assert curs.execute(
+                'SELECT meeting_ids FROM "user" WHERE id = %s', (self.user1_id,)
+            ).fetchone()["meeting_ids"] == [self.meeting1_id]
+
+            curs.execute("DELETE FROM meeting_user_t WHERE id = %s", (meeting_user_id,))
+            assert (
+                curs.execute(
+                    "SELECT user_ids FROM meeting_t WHERE id = %s", (self.meeting1_id,)
+                ).fetchone()["user_ids"]
+                is None
+            )
+            assert (
+                curs.execute(
+                    'SELECT meeting_ids FROM "user" WHERE id = %s', (self.user1_id,)
+                ).fetchone()["meeting_ids"]
+                is None
+            )
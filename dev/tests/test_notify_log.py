@@ -0,0 +1,250 @@
+import json
+import os
+from datetime import timedelta
+
+import psycopg
+
+from tests.base import BaseTestCase
+
+
+def connect(db_name: str, autocommit: bool = False) -> psycopg.Connection:
+    """additional connection to the test database, e.g. for a concurrent transaction"""
+    env = os.environ
+    return psycopg.connect(
+        f"dbname='{db_name}' user='{env['DATABASE_USER']}' host='{env['DATABASE_HOST']}' password='{env['PGPASSWORD']}'",
+        autocommit=autocommit,
+        row_factory=psycopg.rows.dict_row,
+    )
+
+
+class OsChangesSinceTests(BaseTestCase):
+    def rename_theme(self, name: str) -> None:
+        with self.db_connection.transaction():
+            with self.db_connection.cursor() as curs:
+                curs.execute(
+                    "UPDATE theme_t SET name = %s WHERE id = %s",
+                    (name, self.theme1_id),
+                )
+
+    def changes_since(
+        self, last_xact_id: int | None, max_transactions: int = 100
+    ) -> list[dict]:
+        with self.db_connection.transaction():
+            with self.db_connection.cursor() as curs:
+                return curs.execute(
+                    "SELECT xact_id::text::bigint AS xact_id, changes FROM os_changes_since(%s::text::xid8, %s)",
+                    (last_xact_id, max_transactions),
+                ).fetchall()
+
+    def test_batches(self) -> None:
+        for name in ("first", "second", "third"):
+            self.rename_theme(name)
+        all_rows = self.changes_since(None)
+        batches = []
+        last_xact_id = None
+        while rows := self.changes_since(last_xact_id, 2):
+            assert len(rows) <= 2
+            batches.append(rows)
+            last_xact_id = rows[-1]["xact_id"]
+        assert [row for rows in batches for row in rows] == all_rows
+        xact_ids = [row["xact_id"] for row in all_rows]
+        assert xact_ids == sorted(set(xact_ids))
+        assert [row["changes"] for row in all_rows[-3:]] == [
+            [
+                {
+                    "operation": "update",
+                    "fqid": f"theme/{self.theme1_id}",
+                    "fields": ["name"],
+                }
+            ]
+        ] * 3
+
+    def test_running_transaction_held_back(self) -> None:
+        last_xact_id = self.changes_since(None)[-1]["xact_id"]
+        with connect(self.work_on_test_db) as connection:
+            with connection.cursor() as curs:
+                running_xact_id = curs.execute(
+                    "UPDATE theme_t SET name = 'running' WHERE id = %s RETURNING pg_current_xact_id()::text::bigint AS xact_id",
+                    (self.theme1_id,),
+                ).fetchone()["xact_id"]
+            # committed after the running transaction started, but held back behind it
+            self.db_connection.execute(
+                "INSERT INTO organization_tag_t (name, color) VALUES ('later', '#ffffff')"
+            )
+            self.db_connection.commit()
+            assert self.changes_since(last_xact_id) == []
+            connection.commit()
+        rows = self.changes_since(last_xact_id)
+        assert rows[0]["xact_id"] == running_xact_id
+        assert rows[0]["changes"] == [
+            {
+                "operation": "update",
+                "fqid": f"theme/{self.theme1_id}",
+                "fields": ["name"],
+            }
+        ]
+        assert len(rows) == 2 and rows[1]["xact_id"] > running_xact_id
+
+
+class NotifyTransactionEndTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.listener = connect(self.work_on_test_db, autocommit=True)
+        self.listener.execute("LISTEN os_notify")
+
+    def tearDown(self) -> None:
+        self.listener.close()
+
+    def received(self) -> list[dict]:
+        return [
+            json.loads(notify.payload)
+            for notify in self.listener.notifies(timeout=1)
+            if notify.channel == "os_notify"
+        ]
+
+    def insert_tags(self, curs: psycopg.Cursor, names: list[str]) -> list[int]:
+        return [
+            row["id"]
+            for row in curs.execute(
+                "INSERT INTO organization_tag_t (name, color) SELECT unnest(%s::text[]), '#ffffff' RETURNING id",
+                (names,),
+            ).fetchall()
+        ]
+
+    def test_one_payload(self) -> None:
+        with self.db_connection.transaction():
+            with self.db_connection.cursor() as curs:
+                (tag_id,) = self.insert_tags(curs, ["tag"])
+        (payload,) = self.received()
+        assert set(payload) == {"xactId", "changes"}
+        assert {
+            "operation": "insert",
+            "fqid": f"organization_tag/{tag_id}",
+            "fields": None,
+        } in payload["changes"]
+
+    def test_chunks(self) -> None:
+        with self.db_connection.transaction():
+            with self.db_connection.cursor() as curs:
+                tag_ids = self.insert_tags(curs, [f"tag{i}" for i in range(200)])
+        payloads = self.received()
+        assert len(payloads) > 1
+        assert {payload["xactId"] for payload in payloads} == {payloads[0]["xactId"]}
+        assert [payload["chunk"] for payload in payloads] == list(
+            range(1, len(payloads) + 1)
+        )
+        assert {payload["chunks"] for payload in payloads} == {len(payloads)}
+        assert all(
+            len(json.dumps(payload, separators=(",", ":"))) < 8000
+            for payload in payloads
+        )
+        fqids = {
+            change["fqid"] for payload in payloads for change in payload["changes"]
+        }
+        assert {f"organization_tag/{tag_id}" for tag_id in tag_ids} <= fqids
+
+    def test_xact_id_only_if_too_many_chunks(self) -> None:
+        with self.db_connection.transaction():
+            with self.db_connection.cursor() as curs:
+                self.insert_tags(curs, [f"tag{i}" for i in range(2000)])
+        (payload,) = self.received()
+        assert set(payload) == {"xactId"}
+
+    def test_notify_again_after_set_constraints_immediate(self) -> None:
+        with self.db_connection.transaction():
+            with self.db_connection.cursor() as curs:
+                (first_id,) = self.insert_tags(curs, ["first"])
+                curs.execute("SET CONSTRAINTS ALL IMMEDIATE")
+                (second_id,) = self.insert_tags(curs, ["second"])
+                curs.execute("SET CONSTRAINTS ALL DEFERRED")
+        first, second = self.received()
+        assert first["xactId"] == second["xactId"]
+        first_fqids = {change["fqid"] for change in first["changes"]}
+        second_fqids = {change["fqid"] for change in second["changes"]}
+        assert f"organization_tag/{first_id}" in first_fqids
+        assert f"organization_tag/{second_id}" not in first_fqids
+        assert f"organization_tag/{second_id}" in second_fqids
+
+
+class MaintainNotifyLogPartitionsTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        with self.db_connection.cursor() as curs:
+            self.expired = curs.execute(
+                "SELECT 'os_notify_log_t_p' || to_char(now() - interval '10 days', 'YYYYMMDD') AS name"
+            ).fetchone()["name"]
+            curs.execute(f"""CREATE TABLE {self.expired} PARTITION OF os_notify_log_t
+                FOR VALUES FROM (date_trunc('day', now() - interval '10 days'))
+                TO (date_trunc('day', now() - interval '9 days'))""")
+            curs.execute(
+                """INSERT INTO os_notify_log_t (operation, fqid, xact_id, timestamp)
+                VALUES ('update', 'theme/1', '1', now() - interval '10 days'),
+                    ('update', 'theme/1', '2', now() - interval '20 days')"""
+            )
+        self.db_connection.commit()
+
+    def maintain(self, lock_wait: str = "1s") -> list[str]:
+        """calls the maintenance and returns the remaining expired partitions"""
+        with self.db_connection.cursor() as curs:
+            curs.execute(
+                "SELECT maintain_notify_log_partitions(lock_wait => %s::interval)",
+                (lock_wait,),
+            )
+            self.db_connection.commit()
+            return [
+                row["relname"]
+                for row in curs.execute(
+                    """SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = 'os_notify_log_t'::regclass AND c.relname = %s""",
+                    (self.expired,),
+                )
+            ]
+
+    def test_expired_partition_dropped(self) -> None:
+        assert self.maintain() == []
+        with self.db_connection.cursor() as curs:
+            assert (
+                curs.execute("SELECT to_regclass(%s)", (self.expired,)).fetchone()[
+                    "to_regclass"
+                ]
+                is None
+            )
+            # the default partition falls back to a deletion row by row
+            assert (
+                curs.execute(
+                    "SELECT count(*) FROM os_notify_log_t WHERE timestamp < now() - interval '7 days'"
+                ).fetchone()["count"]
+                == 0
+            )
+
+    def test_locked_partition_skipped(self) -> None:
+        with connect(self.work_on_test_db) as connection:
+            connection.execute("SELECT count(*) FROM os_notify_log_t")
+            assert self.maintain("10ms") == [self.expired]
+            connection.commit()
+        assert self.maintain() == []
+
+    def test_partitions_independent_of_time_zone(self) -> None:
+        for time_zone in ("Pacific/Kiritimati", "Pacific/Niue", "UTC"):
+            with self.db_connection.cursor() as curs:
+                curs.execute("SELECT set_config('TimeZone', %s, false)", (time_zone,))
+            self.maintain()
+        with self.db_connection.cursor() as curs:
+            curs.execute("SET TimeZone = 'UTC'")
+            partitions = curs.execute(
+                """SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) AS bound
+                FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'os_notify_log_t'::regclass AND c.relname <> 'os_notify_log_t_pdefault'
+                ORDER BY c.relname"""
+            ).fetchall()
+            today = curs.execute(
+                "SELECT (now() AT TIME ZONE 'UTC')::date AS day"
+            ).fetchone()["day"]
+        days = [today + timedelta(days=i) for i in range(4)]
+        assert [row["relname"] for row in partitions] == [
+            f"os_notify_log_t_p{day:%Y%m%d}" for day in days
+        ]
+        assert [row["bound"] for row in partitions] == [
+            f"FOR VALUES FROM ('{day} 00:00:00+00') TO ('{day + timedelta(days=1)} 00:00:00+00')"
+            for day in days
+        ]
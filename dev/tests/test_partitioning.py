@@ -0,0 +1,111 @@
+import psycopg
+import pytest
+
+from tests.base import BaseTestCase
+
+
+class PartitionByTests(BaseTestCase):
+    collection_updates = {
+        "vote": {"partition_by": "meeting_id"},
+        "chat_message": {"partition_by": {"column": "meeting_id", "method": "list"}},
+    }
+
+    def setUp(self) -> None:
+        super().setUp()
+        with self.db_connection.cursor() as curs:
+            self.meeting2_id = curs.execute(
+                "SELECT clone_meeting(%s, %s) AS id",
+                (self.meeting1_id, self.committee1_id),
+            ).fetchone()["id"]
+            self.option_ids = {
+                meeting_id: curs.execute(
+                    "INSERT INTO option_t (meeting_id) VALUES (%s) RETURNING id",
+                    (meeting_id,),
+                ).fetchone()["id"]
+                for meeting_id in (self.meeting1_id, self.meeting2_id)
+            }
+            self.chat_group_ids = {
+                meeting_id: curs.execute(
+                    "INSERT INTO chat_group_t (name, meeting_id) VALUES ('chat', %s) RETURNING id",
+                    (meeting_id,),
+                ).fetchone()["id"]
+                for meeting_id in (self.meeting1_id, self.meeting2_id)
+            }
+        self.db_connection.commit()
+
+    def insert_vote(self, curs: psycopg.Cursor, meeting_id: int) -> int:
+        return curs.execute(
+            """INSERT INTO vote_t (weight, value, user_token, option_id, meeting_id)
+            VALUES (1, 'Y', 'token', %s, %s) RETURNING id""",
+            (self.option_ids[meeting_id], meeting_id),
+        ).fetchone()["id"]
+
+    def test_partitioned_tables(self) -> None:
+        with self.db_connection.cursor() as curs:
+            partitions = {
+                row["parent"]: row["count"]
+                for row in curs.execute(
+                    """SELECT i.inhparent::regclass::text AS parent, count(*)
+                    FROM pg_inherits i
+                    WHERE i.inhparent IN ('vote_t'::regclass, 'chat_message_t'::regclass)
+                    GROUP BY 1"""
+                )
+            }
+        # the cloned meeting got a list partition of its own
+        assert partitions == {"vote_t": 8, "chat_message_t": 2}
+
+    def test_inserts_and_foreign_key_lookups(self) -> None:
+        with self.db_connection.cursor() as curs:
+            vote_ids = {
+                meeting_id: self.insert_vote(curs, meeting_id)
+                for meeting_id in (self.meeting1_id, self.meeting2_id)
+            }
+            message_id = curs.execute(
+                """INSERT INTO chat_message_t (content, created, chat_group_id, meeting_id)
+                VALUES ('hello', now(), %s, %s) RETURNING id""",
+                (self.chat_group_ids[self.meeting2_id], self.meeting2_id),
+            ).fetchone()["id"]
+        self.db_connection.commit()
+        with self.db_connection.cursor() as curs:
+            for meeting_id, vote_id in vote_ids.items():
+                assert curs.execute(
+                    "SELECT vote_ids FROM option WHERE id = %s",
+                    (self.option_ids[meeting_id],),
+                ).fetchone()["vote_ids"] == [vote_id]
+                assert curs.execute(
+                    "SELECT vote_ids FROM meeting WHERE id = %s", (meeting_id,)
+                ).fetchone()["vote_ids"] == [vote_id]
+            assert curs.execute(
+                "SELECT chat_message_ids FROM chat_group WHERE id = %s",
+                (self.chat_group_ids[self.meeting2_id],),
+            ).fetchone()["chat_message_ids"] == [message_id]
+            assert (
+                curs.execute(
+                    "SELECT tableoid::regclass::text AS partition FROM chat_message_t WHERE id = %s",
+                    (message_id,),
+                ).fetchone()["partition"]
+                == f"chat_message_t_p{self.meeting2_id}"
+            )
+            with pytest.raises(psycopg.errors.ForeignKeyViolation):
+                curs.execute(
+                    """INSERT INTO vote_t (weight, value, user_token, option_id, meeting_id)
+                    VALUES (1, 'Y', 'token', 0, %s)""",
+                    (self.meeting1_id,),
+                )
+                self.db_connection.commit()
+
+    def test_ids_unique(self) -> None:
+        with self.db_connection.cursor() as curs:
+            vote_ids = [
+                self.insert_vote(curs, meeting_id)
+                for meeting_id in (self.meeting1_id, self.meeting2_id) * 10
+            ]
+        self.db_connection.commit()
+        assert len(set(vote_ids)) == len(vote_ids)
+        with self.db_connection.cursor() as curs:
+            with pytest.raises(psycopg.errors.GeneratedAlways):
+                curs.execute(
+                    """INSERT INTO vote_t (id, weight, value, user_token, option_id, meeting_id)
+                    VALUES (%s, 1, 'Y', 'token', %s, %s)""",
+                    (vote_ids[0], self.option_ids[self.meeting2_id], self.meeting2_id),
+                )
@@ -0,0 +1,188 @@
+import struct
+from typing import Any
+from unittest import TestCase
+
+from src.pgoutput_decoder import PgOutputDecoder
+
+LOG_ARGUMENTS = {
+    "topic_t": ["topic", "meeting", "meeting_id", "topic_ids", "id"],
+    "agenda_item_t": [
+        "agenda_item",
+        "topic",
+        "content_object_id_topic_id",
+        "agenda_item_id",
+        "id",
+    ],
+    "nm_group_t": ["", "user", "user_id", "group_ids", "group_id"],
+}
+
+
+def string(value: str) -> bytes:
+    return value.encode() + b"\0"
+
+
+def relation(oid: int, name: str, columns: list[str]) -> bytes:
+    message = b"R" + struct.pack("!I", oid) + string("public") + string(name)
+    message += struct.pack("!bh", ord("f"), len(columns))
+    for column in columns:
+        message += struct.pack("!b", 0) + string(column) + struct.pack("!Ii", 25, -1)
+    return message
+
+
+def tuple_data(values: list[Any]) -> bytes:
+    data = struct.pack("!h", len(values))
+    for value in values:
+        if value is None:
+            data += b"n"
+        elif value == "unchanged":
+            data += b"u"
+        else:
+            encoded = str(value).encode()
+            data += b"t" + struct.pack("!I", len(encoded)) + encoded
+    return data
+
+
+def begin(xid: int) -> bytes:
+    return b"B" + struct.pack("!QQI", 100, 0, xid)
+
+
+def commit() -> bytes:
+    return b"C" + struct.pack("!bQQQ", 0, 100, 101, 0)
+
+
+def insert(oid: int, values: list[Any]) -> bytes:
+    return b"I" + struct.pack("!I", oid) + b"N" + tuple_data(values)
+
+
+def update(oid: int, old: list[Any], new: list[Any]) -> bytes:
+    return (
+        b"U" + struct.pack("!I", oid) + b"O" + tuple_data(old) + b"N" + tuple_data(new)
+    )
+
+
+def delete(oid: int, values: list[Any]) -> bytes:
+    return b"D" + struct.pack("!I", oid) + b"O" + tuple_data(values)
+
+
+class PgOutputDecoderTest(TestCase):
+    def setUp(self) -> None:
+        self.decoder = PgOutputDecoder(LOG_ARGUMENTS)
+        for message in (
+            relation(1, "topic_t", ["id", "title", "meeting_id"]),
+            # content_object_id_topic_id is generated and not published
+            relation(2, "agenda_item_t", ["id", "content_object_id"]),
+            relation(3, "nm_group_t", ["user_id", "group_id"]),
+            relation(
+                4, "os_notify_log_t", ["id", "operation", "fqid", "updated_fields"]
+            ),
+        ):
+            self.decoder.decode(message)
+
+    def decode_transaction(self, *messages: bytes) -> list[Any]:
+        self.assertIsNone(self.decoder.decode(begin(7)))
+        for message in messages:
+            self.assertIsNone(self.decoder.decode(message))
+        transaction = self.decoder.decode(commit())
+        assert transaction
+        self.assertEqual(transaction["xid"], 7)
+        return [
+            (entry["operation"], entry["fqid"], entry["updated_fields"])
+            for entry in transaction["entries"]
+        ]
+
+    def test_insert(self) -> None:
+        self.assertEqual(
+            self.decode_transaction(insert(1, [5, "Topic", 1])),
+            [("insert", "topic/5", None), ("update", "meeting/1", ["topic_ids"])],
+        )
+
+    def test_delete(self) -> None:
+        self.assertEqual(
+            self.decode_transaction(delete(1, [5, "Topic", 1])),
+            [("delete", "topic/5", None), ("update", "meeting/1", ["topic_ids"])],
+        )
+
+    def test_update_without_reference_change(self) -> None:
+        self.assertEqual(
+            self.decode_transaction(update(1, [5, "Old", 1], [5, "unchanged", 1])),
+            [("update", "topic/5", [])],
+        )
+        self.assertEqual(
+            self.decode_transaction(update(1, [5, "Old", 1], [5, "New", 1])),
+            [("update", "topic/5", ["title"])],
+        )
+
+    def test_update_moving_reference(self) -> None:
+        self.assertEqual(
+            self.decode_transaction(update(1, [5, "Topic", 1], [5, "Topic", 2])),
+            [
+                ("update", "topic/5", ["meeting_id"]),
+                ("update", "meeting/1", ["topic_ids"]),
+                ("update", "meeting/2", ["topic_ids"]),
+            ],
+        )
+
+    def test_generated_generic_column(self) -> None:
+        self.assertEqual(
+            self.decode_transaction(
+                insert(2, [3, "topic/5"]),
+                update(2, [3, "topic/5"], [3, "motion/5"]),
+            ),
+            [
+                ("insert", "agenda_item/3", None),
+                ("update", "topic/5", ["agenda_item_id"]),
+                (
+                    "update",
+                    "agenda_item/3",
+                    ["content_object_id", "content_object_id_topic_id"],
+                ),
+            ],
+        )
+
+    def test_typed_generic_columns(self) -> None:
+        self.decoder.decode(
+            relation(
+                5,
+                "agenda_item_t",
+                ["id", "content_object_id_collection", "content_object_id_model_id"],
+            )
+        )
+        self.assertEqual(
+            self.decode_transaction(
+                insert(5, [3, "topic", 5]),
+                update(5, [3, "topic", 5], [3, "motion", 5]),
+            ),
+            [
+                ("insert", "agenda_item/3", None),
+                ("update", "topic/5", ["agenda_item_id"]),
+                (
+                    "update",
+                    "agenda_item/3",
+                    ["content_object_id", "content_object_id_topic_id"],
+                ),
+            ],
+        )
+
+    def test_intermediate_table(self) -> None:
+        self.assertEqual(
+            self.decode_transaction(insert(3, [1, 2]), insert(3, [2, 2])),
+            [("update", "user/1", ["group_ids"]), ("update", "user/2", ["group_ids"])],
+        )
+
+    def test_merge_and_notify_log_entries(self) -> None:
+        self.assertEqual(
+            self.decode_transaction(
+                update(1, [5, "Old", 1], [5, "New", 1]),
+                insert(4, [1, "update", "topic/5", "{agenda_item_id}"]),
+                insert(4, [2, "update", "meeting/1", '{"topic_ids",user_ids}']),
+            ),
+            [
+                ("update", "topic/5", ["agenda_item_id", "title"]),
+                ("update", "meeting/1", ["topic_ids", "user_ids"]),
+            ],
+        )
+
+    def test_unknown_generated_column(self) -> None:
+        decoder = PgOutputDecoder({"x_t": ["x", "topic", "other", "x_ids", "id"]})
+        with self.assertRaises(Exception):
+            decoder.decode(relation(1, "x_t", ["id"]))
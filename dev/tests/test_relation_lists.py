@@ -0,0 +1,136 @@
+from typing import Any
+
+from tests.base import BaseTestCase
+
+
+class MaterializedRelationListTests(BaseTestCase):
+    generator_options = ("--materialize-relation-lists",)
+
+    def fetch(self, query: str, *params: Any) -> Any:
+        with self.db_connection.cursor() as curs:
+            return curs.execute(query, params).fetchone()
+
+    def projection_ids(self, projector_id: int) -> dict[str, Any]:
+        """relation list of the view and the one calculated from projection_t"""
+        return {
+            "view": self.fetch(
+                "SELECT current_projection_ids FROM projector WHERE id = %s",
+                projector_id,
+            )["current_projection_ids"],
+            "calculated": self.fetch(
+                "SELECT array_agg(id ORDER BY id) AS ids FROM projection_t WHERE current_projector_id = %s",
+                projector_id,
+            )["ids"],
+        }
+
+    def test_lists_follow_insert_update_delete(self) -> None:
+        with self.db_connection.cursor() as curs:
+            projector1_id, projector2_id = (
+                row["id"]
+                for row in curs.execute(
+                    "SELECT id FROM projector_t WHERE meeting_id = %s ORDER BY id",
+                    (self.meeting1_id,),
+                )
+            )
+            projection1_id, projection2_id = (
+                row["id"]
+                for row in curs.execute(
+                    """INSERT INTO projection_t (current_projector_id, content_object_id, meeting_id)
+                    VALUES (%s, %s, %s), (%s, %s, %s) RETURNING id""",
+                    (projector1_id, f"meeting/{self.meeting1_id}", self.meeting1_id)
+                    * 2,
+                ).fetchall()
+            )
+        self.db_connection.commit()
+        assert self.projection_ids(projector1_id) == {
+            "view": [projection1_id, projection2_id],
+            "calculated": [projection1_id, projection2_id],
+        }
+
+        with self.db_connection.cursor() as curs:
+            curs.execute(
+                "UPDATE projection_t SET current_projector_id = %s WHERE id = %s",
+                (projector2_id, projection1_id),
+            )
+        self.db_connection.commit()
+        assert self.projection_ids(projector1_id) == {
+            "view": [projection2_id],
+            "calculated": [projection2_id],
+        }
+        assert self.projection_ids(projector2_id) == {
+            "view": [projection1_id],
+            "calculated": [projection1_id],
+        }
+
+        with self.db_connection.cursor() as curs:
+            curs.execute("DELETE FROM projection_t WHERE id = %s", (projection2_id,))
+        self.db_connection.commit()
+        assert self.projection_ids(projector1_id)["view"] in ([], None)
+        assert self.projection_ids(projector2_id)["view"] == [projection1_id]
+
+    def test_generic_list_follows_intermediate_table(self) -> None:
+        with self.db_connection.cursor() as curs:
+            tag_id = curs.execute(
+                "INSERT INTO organization_tag_t (name, color) VALUES ('a', '#ffffff') RETURNING id"
+            ).fetchone()["id"]
+            curs.execute(
+                "INSERT INTO gm_organization_tag_tagged_ids_t (organization_tag_id, tagged_id) VALUES (%s, %s), (%s, %s)",
+                (
+                    tag_id,
+                    f"meeting/{self.meeting1_id}",
+                    tag_id,
+                    f"committee/{self.committee1_id}",
+                ),
+            )
+        self.db_connection.commit()
+        assert sorted(
+            self.fetch("SELECT tagged_ids FROM organization_tag WHERE id = %s", tag_id)[
+                "tagged_ids"
+            ]
+        ) == [f"committee/{self.committee1_id}", f"meeting/{self.meeting1_id}"]
+        assert self.fetch(
+            "SELECT organization_tag_ids FROM meeting WHERE id = %s", self.meeting1_id
+        )["organization_tag_ids"] == [tag_id]
+
+        with self.db_connection.cursor() as curs:
+            curs.execute(
+                "DELETE FROM gm_organization_tag_tagged_ids_t WHERE tagged_id = %s",
+                (f"meeting/{self.meeting1_id}",),
+            )
+        self.db_connection.commit()
+        assert self.fetch(
+            "SELECT tagged_ids FROM organization_tag WHERE id = %s", tag_id
+        )["tagged_ids"] == [f"committee/{self.committee1_id}"]
+        assert self.fetch(
+            "SELECT organization_tag_ids FROM meeting WHERE id = %s", self.meeting1_id
+        )["organization_tag_ids"] in ([], None)
+
+    def test_write_through_views(self) -> None:
+        with self.db_connection.cursor() as curs:
+            tag_id = curs.execute(
+                "INSERT INTO tag (name, meeting_id) VALUES ('a', %s) RETURNING id",
+                (self.meeting1_id,),
+            ).fetchone()["id"]
+            curs.execute("UPDATE tag SET name = 'b' WHERE id = %s", (tag_id,))
+            curs.execute(
+                "UPDATE projector SET name = 'renamed' WHERE meeting_id = %s",
+                (self.meeting1_id,),
+            )
+        self.db_connection.commit()
+        assert self.fetch("SELECT name FROM tag WHERE id = %s", tag_id)["name"] == "b"
+        assert self.fetch(
+            "SELECT tag_ids FROM meeting WHERE id = %s", self.meeting1_id
+        )["tag_ids"] == [tag_id]
+        assert (
+            self.fetch(
+                "SELECT count(*) FROM projector WHERE name = 'renamed' AND current_projection_ids IS NULL"
+            )["count"]
+            == 2
+        )
+
+        with self.db_connection.cursor() as curs:
+            curs.execute("DELETE FROM tag WHERE id = %s", (tag_id,))
+        self.db_connection.commit()
+        assert self.fetch(
+            "SELECT tag_ids FROM meeting WHERE id = %s", self.meeting1_id
+        )["tag_ids"] in ([], None)
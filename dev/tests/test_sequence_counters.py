@@ -0,0 +1,109 @@
+import threading
+
+import psycopg
+
+from tests.base import BaseTestCase
+from tests.test_notify_log import connect
+
+
+class SequenceCountersTests(BaseTestCase):
+    generator_options = ("--sequence-counters",)
+
+    def insert_motion_block(
+        self,
+        curs: psycopg.Cursor,
+        meeting_id: int,
+        sequential_number: int | None = None,
+    ) -> int:
+        """inserts a motion block with its list of speakers and returns its number"""
+        block = curs.execute(
+            """INSERT INTO motion_block_t (title, meeting_id, sequential_number)
+            VALUES ('block', %s, %s) RETURNING id, sequential_number""",
+            (meeting_id, sequential_number),
+        ).fetchone()
+        curs.execute(
+            "INSERT INTO list_of_speakers_t (content_object_id, meeting_id) VALUES (%s, %s)",
+            (f"motion_block/{block['id']}", meeting_id),
+        )
+        return block["sequential_number"]
+
+    def sequential_numbers(self, meeting_id: int) -> list[int]:
+        with self.db_connection.cursor() as curs:
+            numbers = [
+                row["sequential_number"]
+                for row in curs.execute(
+                    "SELECT sequential_number FROM motion_block_t WHERE meeting_id = %s ORDER BY sequential_number",
+                    (meeting_id,),
+                )
+            ]
+        self.db_connection.commit()
+        return numbers
+
+    def test_concurrent_inserts(self) -> None:
+        with self.db_connection.cursor() as curs:
+            meeting2_id = curs.execute(
+                "SELECT clone_meeting(%s, %s) AS id",
+                (self.meeting1_id, self.committee1_id),
+            ).fetchone()["id"]
+        self.db_connection.commit()
+        numbers: dict[str, list[int]] = {"first": [], "second": []}
+        with connect(self.work_on_test_db) as first, connect(
+            self.work_on_test_db
+        ) as second:
+            with first.cursor() as curs:
+                numbers["first"].append(
+                    self.insert_motion_block(curs, self.meeting1_id)
+                )
+
+            def insert_concurrently() -> None:
+                # waits for the lock on the counter row of the first transaction
+                with second.cursor() as curs:
+                    for meeting_id in (self.meeting1_id, meeting2_id):
+                        numbers["second"].append(
+                            self.insert_motion_block(curs, meeting_id)
+                        )
+                second.commit()
+
+            thread = threading.Thread(target=insert_concurrently)
+            thread.start()
+            with first.cursor() as curs:
+                for meeting_id in (meeting2_id, self.meeting1_id):
+                    numbers["first"].append(self.insert_motion_block(curs, meeting_id))
+            first.commit()
+            thread.join()
+        assert numbers == {"first": [1, 1, 2], "second": [3, 2]}
+        with connect(self.work_on_test_db) as rolled_back:
+            with rolled_back.cursor() as curs:
+                self.insert_motion_block(curs, self.meeting1_id)
+            rolled_back.rollback()
+        with self.db_connection.cursor() as curs:
+            # the number of the rolled back transaction is given again
+            assert self.insert_motion_block(curs, self.meeting1_id) == 4
+        self.db_connection.commit()
+        assert self.sequential_numbers(self.meeting1_id) == [1, 2, 3, 4]
+        assert self.sequential_numbers(meeting2_id) == [1, 2]
+
+    def test_counter_after_deletes(self) -> None:
+        with self.db_connection.cursor() as curs:
+            for _ in range(3):
+                self.insert_motion_block(curs, self.meeting1_id)
+        self.db_connection.commit()
+        with self.db_connection.cursor() as curs:
+            curs.execute(
+                """DELETE FROM list_of_speakers_t WHERE content_object_id_motion_block_id IN (
+                    SELECT id FROM motion_block_t WHERE meeting_id = %s AND sequential_number > 1)""",
+                (self.meeting1_id,),
+            )
+            curs.execute(
+                "DELETE FROM motion_block_t WHERE meeting_id = %s AND sequential_number > 1",
+                (self.meeting1_id,),
+            )
+        self.db_connection.commit()
+        with self.db_connection.cursor() as curs:
+            # deleted numbers are not given again
+            assert self.insert_motion_block(curs, self.meeting1_id) == 4
+            # a given number raises the counter
+            assert self.insert_motion_block(curs, self.meeting1_id, 10) == 10
+            assert self.insert_motion_block(curs, self.meeting1_id) == 11
+        self.db_connection.commit()
+        assert self.sequential_numbers(self.meeting1_id) == [1, 4, 10, 11]
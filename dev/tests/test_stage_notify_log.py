@@ -0,0 +1,112 @@
+import psycopg
+
+from tests.base import BaseTestCase
+
+Entries = set[tuple[str, str, tuple[str, ...] | None]]
+
+
+class StageNotifyLogTests(BaseTestCase):
+    generator_options = ("--stage-notify-log",)
+
+    def write(self, curs: psycopg.Cursor) -> None:
+        """changes the theme twice and creates and deletes a tag"""
+        curs.execute(
+            "UPDATE theme_t SET name = 'renamed' WHERE id = %s", (self.theme1_id,)
+        )
+        curs.execute(
+            "UPDATE theme_t SET accent_500 = '#000000' WHERE id = %s",
+            (self.theme1_id,),
+        )
+        curs.execute(
+            "INSERT INTO tag_t (name, meeting_id) VALUES ('tag', %s)",
+            (self.meeting1_id,),
+        )
+        curs.execute("DELETE FROM tag_t WHERE name = 'tag'")
+
+    def logged(self, connection: psycopg.Connection, xact_id: int) -> Entries:
+        with connection.cursor() as curs:
+            rows = curs.execute(
+                """SELECT operation, fqid, updated_fields FROM os_notify_log_t
+                WHERE xact_id = %s::text::xid8""",
+                (xact_id,),
+            ).fetchall()
+        connection.commit()
+        return {
+            (
+                row["operation"],
+                row["fqid"],
+                (
+                    tuple(sorted(row["updated_fields"]))
+                    if row["updated_fields"] is not None
+                    else None
+                ),
+            )
+            for row in rows
+        }
+
+    def staged_count(self) -> int:
+        with self.db_connection.cursor() as curs:
+            return curs.execute(
+                "SELECT count(*) FROM os_notify_log_staging_t"
+            ).fetchone()["count"]
+
+    def run_write(self, connection: psycopg.Connection) -> int:
+        """
+        Commits the write, a flush inside of the transaction and a later change of the
+        theme, which must be merged with the flushed entry, and returns the xact_id.
+        """
+        with connection.cursor() as curs:
+            self.write(curs)
+            curs.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            curs.execute(
+                "UPDATE theme_t SET accent_100 = '#ffffff' WHERE id = %s",
+                (self.theme1_id,),
+            )
+            xact_id = curs.execute(
+                "SELECT pg_current_xact_id()::text::bigint AS xact_id"
+            ).fetchone()["xact_id"]
+        connection.commit()
+        return xact_id
+
+    def test_flushed_at_commit(self) -> None:
+        with self.db_connection.cursor() as curs:
+            self.write(curs)
+            xact_id = curs.execute(
+                "SELECT pg_current_xact_id()::text::bigint AS xact_id"
+            ).fetchone()["xact_id"]
+            assert (
+                curs.execute(
+                    "SELECT count(*) FROM os_notify_log_t WHERE xact_id = pg_current_xact_id()"
+                ).fetchone()["count"]
+                == 0
+            )
+        assert self.staged_count() > 0
+        self.db_connection.commit()
+        assert self.staged_count() == 0
+        self.db_connection.commit()
+        assert (
+            "update",
+            f"theme/{self.theme1_id}",
+            ("accent_500", "name"),
+        ) in self.logged(self.db_connection, xact_id)
+
+    def test_discarded_on_rollback(self) -> None:
+        with self.db_connection.cursor() as curs:
+            self.write(curs)
+            xact_id = curs.execute(
+                "SELECT pg_current_xact_id()::text::bigint AS xact_id"
+            ).fetchone()["xact_id"]
+        self.db_connection.rollback()
+        assert self.staged_count() == 0
+        self.db_connection.commit()
+        assert self.logged(self.db_connection, xact_id) == set()
+
+    def test_merged_as_without_staging(self) -> None:
+        logged = self.logged(self.db_connection, self.run_write(self.db_connection))
+        assert (
+            "update",
+            f"theme/{self.theme1_id}",
+            ("accent_100", "accent_500", "name"),
+        ) in logged
+        with self.populated_database() as connection:
+            assert logged == self.logged(connection, self.run_write(connection))
@@ -0,0 +1,30 @@
+from tests.base import BaseTestCase
+
+
+class StorageTests(BaseTestCase):
+    def test_table_options(self) -> None:
+        with self.db_connection.cursor() as curs:
+            reloptions = curs.execute(
+                "SELECT reloptions FROM pg_class WHERE oid = 'projector_t'::regclass"
+            ).fetchone()["reloptions"]
+        assert sorted(reloptions) == [
+            "autovacuum_analyze_scale_factor=0.02",
+            "autovacuum_vacuum_scale_factor=0.05",
+            "fillfactor=70",
+        ]
+
+    def test_column_compression(self) -> None:
+        with self.db_connection.cursor() as curs:
+            lz4_supported = curs.execute(
+                """SELECT 'lz4' = ANY(enumvals) AS supported FROM pg_settings
+                WHERE name = 'default_toast_compression'"""
+            ).fetchone()["supported"]
+            compressions = {
+                row["attname"]: row["attcompression"]
+                for row in curs.execute(
+                    """SELECT attname, attcompression FROM pg_attribute
+                    WHERE attrelid = 'motion_t'::regclass AND attname IN ('text', 'title')"""
+                )
+            }
+        # without lz4 the column keeps the default compression
+        assert compressions == {"text": "l" if lz4_supported else "", "title": ""}
@@ -0,0 +1,125 @@
+import re
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.generate_sql_schema import GenerateCodeBlocks
+from tests.base import BaseTestCase
+
+REPORT_LINE_REGEX = re.compile(
+    r"^\s+(\w+): insert (\d+)\+(\d+), update (\d+)\+(\d+), delete (\d+)\+(\d+), (\d+) related fields logged$",
+    re.MULTILINE,
+)
+USER_IDS_LOG_TRIGGER = {
+    "on_table": "meeting_user_t",
+    "log_collection_id_column": "meeting_id",
+    "log_value_column": "user_id",
+}
+
+
+class TriggerReportTests(BaseTestCase):
+    # the log path of meeting.user_ids is given twice
+    collection_updates = {
+        "meeting": {
+            "fields": {
+                "user_ids": {"log_triggers": [USER_IDS_LOG_TRIGGER] * 2},
+            }
+        }
+    }
+
+    def report(self, collection_updates: dict) -> dict[str, list[int]]:
+        """
+        Returns per table the row and statement level triggers of insert, update
+        and delete and the related fields logged from --trigger-report.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            collections_dir = Path(directory) / "collections"
+            self.write_collections(collections_dir, collection_updates)
+            output = self.generate_schema(
+                Path(directory) / "schema.sql",
+                "--trigger-report",
+                "--collections",
+                str(collections_dir),
+            )
+        return {
+            match[1]: [int(count) for count in match.groups()[1:]]
+            for match in REPORT_LINE_REGEX.finditer(output)
+        }
+
+    def test_report_lists_fired_triggers(self) -> None:
+        report = self.report(self.collection_updates)
+        with self.db_connection.cursor() as curs:
+            # tgtype bits: 1 row level, 4 insert, 8 delete, 16 update
+            triggers = {
+                row["table_name"]: [
+                    row["insert_row"],
+                    row["insert_statement"],
+                    row["update_row"],
+                    row["update_statement"],
+                    row["delete_row"],
+                    row["delete_statement"],
+                ]
+                for row in curs.execute("""SELECT tgrelid::regclass::text AS table_name,
+                        count(*) FILTER (WHERE tgtype & 5 = 5) AS insert_row,
+                        count(*) FILTER (WHERE tgtype & 5 = 4) AS insert_statement,
+                        count(*) FILTER (WHERE tgtype & 17 = 17) AS update_row,
+                        count(*) FILTER (WHERE tgtype & 17 = 16) AS update_statement,
+                        count(*) FILTER (WHERE tgtype & 9 = 9) AS delete_row,
+                        count(*) FILTER (WHERE tgtype & 9 = 8) AS delete_statement
+                    FROM pg_trigger JOIN pg_class c ON c.oid = tgrelid
+                    -- the partitions get clones of the triggers of the partitioned table
+                    WHERE NOT tgisinternal AND NOT c.relispartition GROUP BY 1""")
+            }
+        assert {table: counts[:6] for table, counts in report.items()} == triggers
+        # user, meeting and the vote delegation logged by log_modified_models and
+        # meeting.user_ids, user.meeting_ids, committee.user_ids and user.committee_ids
+        # by the log triggers of the calculated fields
+        assert report["meeting_user_t"][6] == 7
+
+    def test_repeated_log_path_emitted_once(self) -> None:
+        assert self.report(self.collection_updates) == self.report({})
+        with self.db_connection.cursor() as curs:
+            assert (
+                [row["tgname"] for row in curs.execute("""SELECT tgname FROM pg_trigger
+                    WHERE tgrelid = 'meeting_user_t'::regclass AND tgname LIKE 'tr_log_%%_meeting_user_ids_%%'
+                    ORDER BY tgname""")]
+                == [
+                    "tr_log_d_meeting_user_ids_from_meeting_user_t",
+                    "tr_log_i_meeting_user_ids_from_meeting_user_t",
+                ]
+            )
+
+
+class RedundantLogPathTests(TestCase):
+    def test_calculated_path_logged_by_foreign_key(self) -> None:
+        # a calculated meeting.tag_ids logged like the foreign key tag_t.meeting_id
+        path = ("meeting_id", "", "id", "", "", "meeting", "tag_ids")
+        with patch.object(
+            GenerateCodeBlocks,
+            "log_arguments",
+            {"tag_t": ["tag", "meeting", "meeting_id", "tag_ids", "id"]},
+        ), patch.object(GenerateCodeBlocks, "calculated_log_paths", {}):
+            assert GenerateCodeBlocks.register_calculated_log_path(
+                "tag_t", path, ("tr_i", "tr_d")
+            )
+            assert not GenerateCodeBlocks.register_calculated_log_path(
+                "tag_t", path, ("tr_i2", "tr_d2")
+            )
+            assert GenerateCodeBlocks.get_redundant_calculated_log_triggers() == [
+                "tr_i",
+                "tr_d",
+            ]
+
+    def test_calculated_path_with_other_columns_kept(self) -> None:
+        # the calculated field also changes with tag_t.name
+        path = ("meeting_id", "", "id", "", "name", "meeting", "tag_ids")
+        with patch.object(
+            GenerateCodeBlocks,
+            "log_arguments",
+            {"tag_t": ["tag", "meeting", "meeting_id", "tag_ids", "id"]},
+        ), patch.object(GenerateCodeBlocks, "calculated_log_paths", {}):
+            GenerateCodeBlocks.register_calculated_log_path(
+                "tag_t", path, ("tr_i", "tr_d")
+            )
+            assert GenerateCodeBlocks.get_redundant_calculated_log_triggers() == []
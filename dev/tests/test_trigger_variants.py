@@ -0,0 +1,153 @@
+from collections.abc import Callable
+from typing import Any
+
+import psycopg
+
+from tests.base import BaseTestCase
+
+Write = Callable[[psycopg.Cursor], Any]
+
+
+class TriggerComparison:
+    """
+    Runs the same transactions with the schema of the class and the one without
+    options, which must give the same log entries and errors.
+    """
+
+    meeting2_id = 2
+
+    def run_transactions(self, connection: psycopg.Connection) -> list[Any]:
+        """
+        Returns per transaction its log entries and the values returned by the writes
+        or the error class and message, if it failed.
+        """
+        results: list[Any] = []
+        for write in self.transactions():
+            try:
+                with connection.cursor() as curs:
+                    returned = write(curs)
+                    logged = curs.execute(
+                        """SELECT operation, fqid, updated_fields FROM os_notify_log_t
+                        WHERE xact_id = pg_current_xact_id() ORDER BY operation, fqid"""
+                    ).fetchall()
+                connection.commit()
+                results.append((returned, logged))
+            except psycopg.Error as e:
+                connection.rollback()
+                results.append((type(e).__name__, e.diag.message_primary))
+        return results
+
+    def transactions(self) -> list[Write]:
+        meeting1_id = self.meeting1_id  # type: ignore[attr-defined]
+        group_id = self.groupM1_default_id  # type: ignore[attr-defined]
+
+        def insert_motion_block(curs: psycopg.Cursor, meeting_id: int) -> int:
+            return curs.execute(
+                "INSERT INTO motion_block_t (title, meeting_id) VALUES ('block', %s) RETURNING id",
+                (meeting_id,),
+            ).fetchone()["id"]
+
+        def clone(curs: psycopg.Cursor) -> Any:
+            return curs.execute(
+                "SELECT clone_meeting(%s, %s) AS id",
+                (meeting1_id, self.committee1_id),  # type: ignore[attr-defined]
+            ).fetchone()
+
+        def motion_blocks(curs: psycopg.Cursor) -> Any:
+            for meeting_id in (meeting1_id, self.meeting2_id, meeting1_id):
+                block_id = insert_motion_block(curs, meeting_id)
+                curs.execute(
+                    "INSERT INTO list_of_speakers_t (content_object_id, meeting_id) VALUES (%s, %s)",
+                    (f"motion_block/{block_id}", meeting_id),
+                )
+            return curs.execute(
+                "SELECT id, sequential_number, list_of_speakers_id FROM motion_block ORDER BY id"
+            ).fetchall()
+
+        def motion_block_without_list_of_speakers(curs: psycopg.Cursor) -> Any:
+            return insert_motion_block(curs, meeting1_id)
+
+        def update_and_delete(curs: psycopg.Cursor) -> Any:
+            tag_id = curs.execute(
+                "INSERT INTO tag_t (name, meeting_id) VALUES ('tag', %s) RETURNING id",
+                (meeting1_id,),
+            ).fetchone()["id"]
+            curs.execute("UPDATE tag_t SET name = 'renamed' WHERE id = %s", (tag_id,))
+            curs.execute("DELETE FROM tag_t WHERE id = %s", (tag_id,))
+
+        def update_constant(curs: psycopg.Cursor) -> Any:
+            curs.execute(
+                "UPDATE motion_block_t SET meeting_id = %s WHERE meeting_id = %s",
+                (self.meeting2_id, meeting1_id),
+            )
+
+        def group_of_other_meeting(curs: psycopg.Cursor) -> Any:
+            meeting_user_id = curs.execute(
+                "INSERT INTO meeting_user_t (user_id, meeting_id) VALUES (%s, %s) RETURNING id",
+                (self.user1_id, self.meeting2_id),  # type: ignore[attr-defined]
+            ).fetchone()["id"]
+            curs.execute(
+                "INSERT INTO nm_group_meeting_user_ids_meeting_user_t (group_id, meeting_user_id) VALUES (%s, %s)",
+                (group_id, meeting_user_id),
+            )
+
+        def remove_default_projector(curs: psycopg.Cursor) -> Any:
+            curs.execute(
+                "UPDATE projector_t SET used_as_default_projector_for_topic_in_meeting_id = NULL WHERE meeting_id = %s",
+                (meeting1_id,),
+            )
+
+        return [
+            clone,
+            motion_blocks,
+            motion_block_without_list_of_speakers,
+            update_and_delete,
+            update_constant,
+            group_of_other_meeting,
+            remove_default_projector,
+        ]
+
+    def test_same_log_entries_and_errors(self) -> None:
+        results = self.run_transactions(self.db_connection)  # type: ignore[attr-defined]
+        # every transaction except the valid ones failed
+        assert [isinstance(result[0], str) for result in results] == [
+            False,
+            False,
+            True,
+            False,
+            True,
+            True,
+            True,
+        ]
+        with self.populated_database() as connection:  # type: ignore[attr-defined]
+            assert results == self.run_transactions(connection)
+
+
+class ConsolidatedTriggersTests(TriggerComparison, BaseTestCase):
+    generator_options = ("--consolidated-triggers",)
+
+
+class StaticTriggerFunctionsTests(TriggerComparison, BaseTestCase):
+    generator_options = ("--static-trigger-functions",)
+
+    def test_generic_functions_replaced(self) -> None:
+        with self.db_connection.cursor() as curs:
+            functions = {
+                row["proname"]
+                for row in curs.execute(
+                    "SELECT DISTINCT p.proname FROM pg_trigger t JOIN pg_proc p ON p.oid = t.tgfoid"
+                )
+            }
+        assert any(function.startswith("fn_") for function in functions)
+        assert not functions & {
+            "check_not_null_for_1_1",
+            "check_not_null_for_1_n",
+            "check_not_null_for_n_m",
+            "prevent_updates",
+            "check_unique_ids_pair",
+            "check_equals",
+        }
+
+
+class StaticSequenceCounterFunctionsTests(TriggerComparison, BaseTestCase):
+    generator_options = ("--static-trigger-functions", "--sequence-counters")
@@ -0,0 +1,149 @@
+from typing import Any
+
+import psycopg
+import pytest
+
+from tests.base import BaseTestCase
+
+
+class TypedGenericRelationTests(BaseTestCase):
+    generator_options = ("--typed-generic-relations",)
+
+    def fetch(self, query: str, *params: Any) -> Any:
+        with self.db_connection.cursor() as curs:
+            return curs.execute(query, params).fetchone()
+
+    def insert_mediafile(self, collection: str, model_id: int) -> int:
+        with self.db_connection.cursor() as curs:
+            return curs.execute(
+                """INSERT INTO mediafile_t (title, owner_id_collection, owner_id_model_id)
+                VALUES ('logo', %s, %s) RETURNING id""",
+                (collection, model_id),
+            ).fetchone()["id"]
+
+    def test_generic_relation(self) -> None:
+        meeting_mediafile_id = self.insert_mediafile("meeting", self.meeting1_id)
+        organization_mediafile_id = self.insert_mediafile(
+            "organization", self.organization_id
+        )
+        self.db_connection.commit()
+        assert (
+            self.fetch(
+                """SELECT owner_id_meeting_id, owner_id_organization_id
+            FROM mediafile_t WHERE id = %s""",
+                meeting_mediafile_id,
+            )
+            == {
+                "owner_id_meeting_id": self.meeting1_id,
+                "owner_id_organization_id": None,
+            }
+        )
+        assert self.fetch(
+            "SELECT owner_id FROM mediafile WHERE id = %s", organization_mediafile_id
+        ) == {"owner_id": f"organization/{self.organization_id}"}
+        assert self.fetch(
+            "SELECT mediafile_ids FROM meeting WHERE id = %s", self.meeting1_id
+        ) == {"mediafile_ids": [meeting_mediafile_id]}
+        assert self.fetch(
+            "SELECT mediafile_ids FROM organization WHERE id = %s", self.organization_id
+        ) == {"mediafile_ids": [organization_mediafile_id]}
+
+    def test_generic_relation_list(self) -> None:
+        with self.db_connection.cursor() as curs:
+            tag_id = curs.execute(
+                "INSERT INTO organization_tag_t (name, color) VALUES ('a', '#ffffff') RETURNING id"
+            ).fetchone()["id"]
+            curs.execute(
+                """INSERT INTO gm_organization_tag_tagged_ids_t
+                (organization_tag_id, tagged_id_collection, tagged_id_model_id)
+                VALUES (%s, 'meeting', %s), (%s, 'committee', %s)""",
+                (tag_id, self.meeting1_id, tag_id, self.committee1_id),
+            )
+        self.db_connection.commit()
+        assert (
+            self.fetch(
+                """SELECT tagged_id_meeting_id, tagged_id_committee_id
+            FROM gm_organization_tag_tagged_ids_t WHERE tagged_id_collection = 'meeting'"""
+            )
+            == {
+                "tagged_id_meeting_id": self.meeting1_id,
+                "tagged_id_committee_id": None,
+            }
+        )
+        assert sorted(
+            self.fetch("SELECT tagged_ids FROM organization_tag WHERE id = %s", tag_id)[
+                "tagged_ids"
+            ]
+        ) == [f"committee/{self.committee1_id}", f"meeting/{self.meeting1_id}"]
+        assert self.fetch(
+            "SELECT organization_tag_ids FROM committee WHERE id = %s",
+            self.committee1_id,
+        ) == {"organization_tag_ids": [tag_id]}
+
+    def test_update_logged_as_field(self) -> None:
+        with self.db_connection.cursor() as curs:
+            option_id = curs.execute(
+                "INSERT INTO option_t (meeting_id) VALUES (%s) RETURNING id",
+                (self.meeting1_id,),
+            ).fetchone()["id"]
+            self.db_connection.commit()
+            curs.execute(
+                """UPDATE option_t SET content_object_id_collection = 'user',
+                content_object_id_model_id = %s WHERE id = %s""",
+                (self.user1_id, option_id),
+            )
+            logged = curs.execute(
+                """SELECT fqid, updated_fields FROM os_notify_log_t
+                WHERE xact_id = pg_current_xact_id() AND operation = 'update'"""
+            ).fetchall()
+        self.db_connection.commit()
+        # as without the option, the generated columns are logged, too
+        assert {
+            "fqid": f"option/{option_id}",
+            "updated_fields": ["content_object_id", "content_object_id_user_id"],
+        } in logged
+        assert self.fetch(
+            "SELECT content_object_id FROM option WHERE id = %s", option_id
+        ) == {"content_object_id": f"user/{self.user1_id}"}
+
+    def test_pair_checked(self) -> None:
+        with self.db_connection.cursor() as curs:
+            with pytest.raises(psycopg.errors.CheckViolation):
+                curs.execute(
+                    "INSERT INTO option_t (meeting_id, content_object_id_collection) VALUES (%s, 'user')",
+                    (self.meeting1_id,),
+                )
+        self.db_connection.rollback()
+        with self.db_connection.cursor() as curs:
+            with pytest.raises(psycopg.errors.InvalidTextRepresentation):
+                curs.execute(
+                    """INSERT INTO option_t (meeting_id, content_object_id_collection, content_object_id_model_id)
+                    VALUES (%s, 'topic', 1)""",
+                    (self.meeting1_id,),
+                )
+
+    def test_delete_meeting(self) -> None:
+        meeting_mediafile_id = self.insert_mediafile("meeting", self.meeting1_id)
+        organization_mediafile_id = self.insert_mediafile(
+            "organization", self.organization_id
+        )
+        with self.db_connection.cursor() as curs:
+            curs.execute(
+                """INSERT INTO meeting_mediafile_t (mediafile_id, meeting_id, is_public)
+                VALUES (%s, %s, true), (%s, %s, true)""",
+                (
+                    meeting_mediafile_id,
+                    self.meeting1_id,
+                    organization_mediafile_id,
+                    self.meeting1_id,
+                ),
+            )
+            self.db_connection.commit()
+            curs.execute("SELECT delete_meeting(%s)", (self.meeting1_id,))
+        self.db_connection.commit()
+        with self.db_connection.cursor() as curs:
+            assert curs.execute(
+                "SELECT id, meeting_mediafile_ids FROM mediafile"
+            ).fetchall() == [
+                {"id": organization_mediafile_id, "meeting_mediafile_ids": None}
+            ]